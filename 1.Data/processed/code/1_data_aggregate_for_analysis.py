@@ -1,77 +1,34 @@
 import pandas as pd
 import numpy as np
-import re
+import os
+from contextlib import nullcontext
 
 # 지역별 분석을 위한 데이터 전처리 함수
-def preprocess_for_district_analysis(df, results):
+# 자치구/학교유형은 2.Feature/code/district_resolver.py 로 해석
+# - 자치구: ADRCD_CD 코드 표 조회 → 없으면 주소(SCHUL_ADRES, 없으면 ADRCD_NM)의 고유값만 정규식 한 번으로 해석 (실행 간 메모)
+# - 학교유형: SCHUL_KND_SC_CODE 고유 코드 단위 매핑
+# qualify=None 이면 시도가 둘 이상일 때 자치구에 시도를 붙임 ("부산광역시 중구", 같은 이름의 구가 합쳐지지 않도록)
+def preprocess_for_district_analysis(df, results, qualify=None):
     # 지역 정보 추출
     if 'ADRCD_NM' in df.columns:
         results['지역'] = df['ADRCD_NM']
 
-    # 주소가 있는 경우 자치구 추출
     if 'SCHUL_ADRES' in df.columns:
         results['주소'] = df['SCHUL_ADRES']
-        results['자치구'] = df['SCHUL_ADRES'].apply(extract_district)
-    else:
-        # 주소 정보가 없을 경우 지역명에서 추출 시도
-        if 'ADRCD_NM' in df.columns:
-            results['자치구'] = df['ADRCD_NM'].apply(lambda x: x if pd.notna(x) and '구' in x else "정보 없음")
-        else:
-            results['자치구'] = "정보 없음"
+
+    # 자치구 추출 (해석할 수 없으면 "정보 없음")
+    results['자치구'] = district_labels(resolve_regions(df), qualify=qualify)
 
     # 학교유형 정보 추출
     if 'SCHUL_KND_SC_CODE' in df.columns:
-        results['학교유형'] = df['SCHUL_KND_SC_CODE'].apply(extract_school_type)
+        results['학교유형'] = pd.Series(decode_school_types(df['SCHUL_KND_SC_CODE'].to_numpy()), index=df.index)
 
     return results
 
-# 주소에서 자치구 추출 함수
-def extract_district(address):
-    if pd.isna(address):
-        return "정보 없음"
-
-    # 서울특별시 OO구 형태의 주소에서 구 추출
-    district_match = re.search(r'서울특별시\s+(\S+구)', address)
-    if district_match:
-        return district_match.group(1)
-    else:
-        return "정보 없음"
-
-# 학교유형 추출 함수
-def extract_school_type(code):
-    if pd.isna(code):
-        return "정보 없음"
-
-    code = str(code)
-    if code == '2':
-        return '초등학교'
-    elif code == '3':
-        return '중학교'
-    elif code == '4':
-        return '고등학교'
-    else:
-        return '기타'
-
-
 # 지역별 공기질 분석 함수
 def analyze_district_air_quality(results):
-    # 자치구별 종합 통계
-    district_stats = results.groupby('자치구').agg({
-        '종합_점수': ['mean', 'median', 'std', 'count'],
-        'PM10_교실_최대값': ['mean', 'median', 'max'],
-        'PM2.5_최대값': ['mean', 'median', 'max'],
-        'CO2_최대값': ['mean', 'median', 'max'],
-        '부적합_항목수': ['mean', 'sum']
-    })
-
-    # 컬럼명 정리
-    district_stats.columns = [
-        '종합점수_평균', '종합점수_중앙값', '종합점수_표준편차', '학교수',
-        'PM10_평균', 'PM10_중앙값', 'PM10_최대값',
-        'PM2.5_평균', 'PM2.5_중앙값', 'PM2.5_최대값',
-        'CO2_평균', 'CO2_중앙값', 'CO2_최대값',
-        '부적합항목_평균', '부적합항목_총합'
-    ]
+    # 자치구별 종합 통계 (학교유형/기간별 분석과 공유하는 집계 큐브에서 조회)
+    district_stats = get_aggregation_cube(results)[('자치구',)].copy()
 
     # 종합점수 기준으로 정렬
     district_stats = district_stats.sort_values('종합점수_평균', ascending=False)
@@ -99,12 +56,13 @@ def analyze_district_air_quality(results):
 
 
 # 메인 함수: 데이터 분석 및 결과 출력 (지역별 분석 추가)
-def analyze_school_air_quality(data_file):
-    # 데이터 로드
-    df = pd.read_csv(data_file)
+# regulation: air_quality_standards 에 등록된 규정 (평가 구간과 권고 기준값에 모두 사용)
+def analyze_school_air_quality(data_file, regulation=DEFAULT_REGULATION):
+    # 데이터 로드 (내용이 같은 파일은 2.Feature/code/env_data_cache.py 의 캐시에서 파싱 없이 로드)
+    df = load_env_data(data_file, clean=False)
 
-    # 공기질 평가
-    results = evaluate_air_quality(df)
+    # 공기질 평가 (컬럼 단위 벡터 연산, evaluate_air_quality 와 같은 결과)
+    results = evaluate_air_quality_fast(df, regulation)
 
     # 지역별 분석을 위한 데이터 전처리
     results = preprocess_for_district_analysis(df, results)
@@ -121,27 +79,381 @@ def analyze_school_air_quality(data_file):
     print("지역별 종합 분석 수행 중...")
     district_analysis = analyze_district_air_quality(results)
 
-    # 권고사항 생성
-    recommendations = generate_recommendations(results)
+    # 권고사항 생성 (규칙 테이블 기반 벡터 연산, 학교 × 발동 규칙 한 행씩의 long-form: 학교명, 학교코드, rule_id, severity, message)
+    recommendations = generate_recommendations_long(results, regulation)
 
-    # 결과 저장
-    results.to_csv('학교별_공기질_평가_결과.csv', index=False, encoding='utf-8-sig')
-    recommendations.to_csv('학교별_공기질_개선_권고사항.csv', index=False, encoding='utf-8-sig')
-    save_district_results(district_analysis)
+    # 결과 저장 (2.Feature/code/result_sinks.py: 임시 파일에 쓴 뒤 교체, 서로 다른 파일은 동시에 저장)
+    export_school_results(results, recommendations, district_analysis)
+    print(f"자치구별 분석 결과가 '{DISTRICT_WORKBOOK}' 파일로 저장되었습니다.")
 
     print(f"분석 완료. 총 {len(df)}개 학교의 공기질 평가 결과가 저장되었습니다.")
     return results, recommendations, district_analysis
 
 # 자치구별 결과를 파일로 저장하는 함수
 def save_district_results(district_analysis, filename='자치구별_공기질_분석결과.xlsx'):
-    # Excel 파일로 저장
-    with pd.ExcelWriter(filename, engine='openpyxl') as writer:
-        district_analysis['district_stats'].to_excel(writer, sheet_name='자치구별_종합통계')
-        district_analysis['district_grades'].to_excel(writer, sheet_name='자치구별_등급분포')
-        district_analysis['top5_worst'].to_excel(writer, sheet_name='공기질_하위5개_자치구')
-        district_analysis['top5_best'].to_excel(writer, sheet_name='공기질_상위5개_자치구')
+    # Excel 파일로 저장 (openpyxl write-only 모드로 행을 바로 흘려 쓰므로 통합 문서 전체를 메모리에 만들지 않음)
+    write_workbook({sheet: district_analysis[key] for key, sheet in DISTRICT_SHEETS.items()}, filename)
 
     print(f"자치구별 분석 결과가 '{filename}' 파일로 저장되었습니다.")
 
+# 스트리밍 집계 대상 지표: (히스토그램 하한, 상한, 구간 폭)
+# 히스토그램은 중앙값 근사(스케치)용이며, 상한을 넘는 값은 마지막 구간에 포함
+STREAM_METRICS = {
+    '종합_점수': (0, 6, 0.01),
+    'PM10_교실_최대값': (0, 1000, 0.5),
+    'PM2.5_최대값': (0, 500, 0.25),
+    'CO2_최대값': (0, 10000, 5),
+    '부적합_항목수': (0, 8, 1),
+}
+
+# 학교수 집계 기준 지표
+STREAM_METRICS_COUNT_KEY = '종합_점수'
+
+# 함수: 평가 결과 일부(청크)로부터 자치구별 부분 집계 생성
+# 부분 집계끼리는 merge_district_aggregates 로 순서와 무관하게 합칠 수 있음
+def partial_district_aggregate(results):
+    valid = results['자치구'].notna()
+    results = results[valid]
+    district_codes, districts = pd.factorize(results['자치구'])
+
+    stats = {}
+    hists = {}
+    for metric, (low, high, width) in STREAM_METRICS.items():
+        values = pd.to_numeric(results[metric], errors='coerce').to_numpy(dtype=float)
+        has_value = ~np.isnan(values)
+        grouped = pd.Series(values).groupby(district_codes)
+
+        stats[(metric, 'count')] = grouped.count()
+        stats[(metric, 'sum')] = grouped.sum()
+        stats[(metric, 'sumsq')] = pd.Series(values ** 2).groupby(district_codes).sum()
+        stats[(metric, 'max')] = grouped.max()
+
+        # 자치구 × 구간 히스토그램 (bincount 한 번으로 계산)
+        n_bins = int(round((high - low) / width))
+        bins = np.clip(((values[has_value] - low) // width).astype(int), 0, n_bins - 1)
+        counts = np.bincount(district_codes[has_value] * n_bins + bins, minlength=len(districts) * n_bins)
+        hists[metric] = pd.DataFrame(counts.reshape(len(districts), n_bins), index=districts)
+
+    stats = pd.DataFrame(stats)
+    stats.index = districts[stats.index]
+
+    grades = pd.crosstab(results['자치구'], results['종합_등급'])
+
+    return {'stats': stats, 'hists': hists, 'grades': grades}
+
+# 함수: 두 부분 집계를 병합 (합계/제곱합/건수/히스토그램은 더하고 최대값은 최대)
+def merge_district_aggregates(left, right):
+    if left is None:
+        return right
+    if right is None:
+        return left
+
+    stats = pd.concat([left['stats'], right['stats']])
+    agg_funcs = {col: ('max' if col[1] == 'max' else 'sum') for col in stats.columns}
+    stats = stats.groupby(level=0).agg(agg_funcs)
+
+    hists = {
+        metric: pd.concat([left['hists'][metric], right['hists'][metric]]).groupby(level=0).sum()
+        for metric in STREAM_METRICS
+    }
+    grades = pd.concat([left['grades'], right['grades']]).fillna(0).groupby(level=0).sum().astype(int)
+
+    return {'stats': stats, 'hists': hists, 'grades': grades}
+
+# 함수: 히스토그램 스케치에서 중앙값 근사 (구간 내 선형 보간)
+def approximate_median(hist, metric):
+    low, high, width = STREAM_METRICS[metric]
+    counts = hist.to_numpy(dtype=float)
+    totals = counts.sum(axis=1)
+    cumulative = counts.cumsum(axis=1)
+
+    medians = np.full(len(hist), np.nan)
+    for i in np.flatnonzero(totals > 0):
+        half = totals[i] / 2
+        bin_idx = np.searchsorted(cumulative[i], half, side='left')
+        before = cumulative[i, bin_idx - 1] if bin_idx > 0 else 0
+        medians[i] = low + (bin_idx + (half - before) / counts[i, bin_idx]) * width
+
+    return pd.Series(medians, index=hist.index)
+
+# 함수: 병합된 집계로부터 analyze_district_air_quality 와 같은 형식의 결과 생성
+def finalize_district_aggregate(aggregate):
+    stats = aggregate['stats']
+    district_stats = pd.DataFrame(index=stats.index)
+
+    def mean(metric):
+        return stats[(metric, 'sum')] / stats[(metric, 'count')].replace(0, np.nan)
+
+    def std(metric):
+        n = stats[(metric, 'count')]
+        var = (stats[(metric, 'sumsq')] - stats[(metric, 'sum')] ** 2 / n.replace(0, np.nan)) / (n - 1).where(n > 1)
+        return np.sqrt(var.clip(lower=0))
+
+    def median(metric):
+        return approximate_median(aggregate['hists'][metric], metric).reindex(stats.index)
+
+    district_stats['종합점수_평균'] = mean('종합_점수')
+    district_stats['종합점수_중앙값'] = median('종합_점수')
+    district_stats['종합점수_표준편차'] = std('종합_점수')
+    district_stats['학교수'] = stats[('종합_점수', 'count')].astype(int)
+    for metric, name in [('PM10_교실_최대값', 'PM10'), ('PM2.5_최대값', 'PM2.5'), ('CO2_최대값', 'CO2')]:
+        district_stats[f'{name}_평균'] = mean(metric)
+        district_stats[f'{name}_중앙값'] = median(metric)
+        district_stats[f'{name}_최대값'] = stats[(metric, 'max')]
+    district_stats['부적합항목_평균'] = mean('부적합_항목수')
+    district_stats['부적합항목_총합'] = stats[('부적합_항목수', 'sum')].astype(int)
+    district_stats.index.name = '자치구'
+
+    # 종합점수 기준으로 정렬 후 학교수가 충분한 자치구만 필터링
+    district_stats = district_stats.sort_values('종합점수_평균', ascending=False)
+    district_stats = district_stats[district_stats['학교수'] >= 3]
+
+    # 자치구별 공기질 등급 분포
+    grades = aggregate['grades']
+    district_grades = grades.div(grades.sum(axis=1), axis=0) * 100
+
+    return {
+        'district_stats': district_stats,
+        'district_grades': district_grades,
+        'top5_worst': district_stats.head(5),
+        'top5_best': district_stats.sort_values('종합점수_평균').head(5)
+    }
+
+# 함수: 원본 파일 전체에 시도가 둘 이상 있는지 확인 (지역 컬럼만 청크 단위로 읽고, 둘째 시도가 나오면 중단)
+def has_multiple_sido(data_file, chunksize=100000):
+    sidos = set()
+    for chunk in pd.read_csv(data_file, chunksize=chunksize,
+                             usecols=lambda column: column in ('SCHUL_ADRES', 'ADRCD_CD', 'ADRCD_NM')):
+        sidos.update(resolve_regions(chunk)['시도'].dropna().unique())
+        if len(sidos) > 1:
+            return True
+    return False
+
+# 메인 함수 (스트리밍 모드): 원본 파일을 청크 단위로 읽어 자치구별 통계를 고정 메모리로 산출
+# results_file 을 지정하면 학교별 평가 결과를 청크마다 이어서 저장 (확장자로 csv/parquet/arrow 형식 선택)
+# 시도 구분 여부를 청크마다 판단하면 청크 사이에 자치구 라벨이 달라지므로, qualify=None 이면 파일 전체 기준으로 먼저 결정
+def analyze_school_air_quality_streaming(data_file, chunksize=100000, results_file=None, qualify=None):
+    aggregate = None
+    total_rows = 0
+    if qualify is None:
+        qualify = has_multiple_sido(data_file, chunksize)
+
+    # with 로 열어야 중간에 예외가 나도 싱크가 abort 되어 임시 파일/열린 writer 가 남지 않음
+    with (open_sink(results_file) if results_file is not None else nullcontext()) as results_sink:
+        for i, chunk in enumerate(pd.read_csv(data_file, chunksize=chunksize)):
+            chunk_results = evaluate_air_quality_fast(chunk)
+            chunk_results = preprocess_for_district_analysis(chunk, chunk_results, qualify=qualify)
+
+            aggregate = merge_district_aggregates(aggregate, partial_district_aggregate(chunk_results))
+
+            if results_sink is not None:
+                results_sink.write(chunk_results)
+
+            total_rows += len(chunk)
+            print(f"{i + 1}번째 청크 처리 완료 (누적 {total_rows}개 학교)")
+
+    district_analysis = finalize_district_aggregate(aggregate)
+
+    print(f"스트리밍 분석 완료. 총 {total_rows}개 학교의 자치구별 통계가 산출되었습니다.")
+    return district_analysis, aggregate
+
+# 메인 함수 (병렬 모드): 연도/학기 샤드별 평가를 프로세스 풀에서 실행한 뒤 결과를 결합
+# 샤드 분할/결합은 2.Feature/code/parallel_evaluation.py 의 evaluate_in_parallel 사용
+def analyze_school_air_quality_parallel(data_file, max_workers=None, regulation=DEFAULT_REGULATION):
+    # 데이터 로드 (내용이 같은 파일은 2.Feature/code/env_data_cache.py 의 캐시에서 파싱 없이 로드)
+    df = load_env_data(data_file, clean=False)
+
+    # 공기질 평가 및 권고사항 생성 (샤드 병렬 처리, 원래 행 순서로 결합, 권고사항은 long-form 사용)
+    results, _, recommendations = evaluate_in_parallel(df, max_workers=max_workers, regulation=regulation)
+
+    # 지역별 분석을 위한 데이터 전처리 및 종합 분석
+    results = preprocess_for_district_analysis(df, results)
+    district_analysis = analyze_district_air_quality(results)
+
+    # 결과 저장 (2.Feature/code/result_sinks.py: 임시 파일에 쓴 뒤 교체, 서로 다른 파일은 동시에 저장)
+    export_school_results(results, recommendations, district_analysis)
+    print(f"자치구별 분석 결과가 '{DISTRICT_WORKBOOK}' 파일로 저장되었습니다.")
+
+    print(f"병렬 분석 완료. 총 {len(df)}개 학교의 공기질 평가 결과가 저장되었습니다.")
+    return results, recommendations, district_analysis
+
+# 함수: 집계에서 부분 집계를 차감 (학교 결과 갱신/삭제 시 기존 값 제거용)
+# 최대값은 차감할 수 없으므로 refresh_district_max 로 해당 자치구만 다시 계산
+def subtract_district_aggregate(aggregate, partial):
+    stats = aggregate['stats'].copy()
+    for col in stats.columns:
+        if col[1] != 'max':
+            stats[col] = stats[col].sub(partial['stats'][col], fill_value=0)
+
+    hists = {
+        metric: aggregate['hists'][metric].sub(partial['hists'][metric], fill_value=0)
+        for metric in STREAM_METRICS
+    }
+    grades = aggregate['grades'].sub(partial['grades'], fill_value=0)
+
+    # 학교가 모두 빠진 자치구 제거
+    remaining = stats[(STREAM_METRICS_COUNT_KEY, 'count')] > 0
+    remaining_districts = stats.index[remaining]
+    return {
+        'stats': stats.loc[remaining_districts],
+        'hists': {metric: hist.reindex(remaining_districts) for metric, hist in hists.items()},
+        'grades': grades.reindex(remaining_districts).fillna(0)
+    }
+
+
+# 함수: 지정한 자치구들의 최대값을 저장된 학교별 결과로부터 다시 계산
+def refresh_district_max(aggregate, results, districts):
+    stats = aggregate['stats']
+    districts = [d for d in districts if d in stats.index]
+    if len(districts) == 0:
+        return aggregate
+
+    subset = results[results['자치구'].isin(districts)]
+    for metric in STREAM_METRICS:
+        district_max = pd.to_numeric(subset[metric], errors='coerce').groupby(subset['자치구']).max()
+        stats.loc[districts, (metric, 'max')] = district_max.reindex(districts).to_numpy()
+
+    return aggregate
+
+# 함수: 원본 행 지문(fingerprint) 계산 - 같은 내용이면 같은 값
+def fingerprint_rows(df):
+    return pd.util.hash_pandas_object(df[sorted(df.columns)], index=False)
+
+# 함수: 증분 갱신용 학교 키 (학교코드 + 조사기간)
+def make_school_keys(df):
+    key_columns = [col for col in ['SCHUL_CODE', 'SEM_STR'] if col in df.columns]
+    return df[key_columns].astype(str).agg('|'.join, axis=1)
+
+# 메인 함수 (증분 모드): 새로 추가되었거나 원본 행이 바뀐 학교만 다시 평가
+# - state_file: 이전 실행의 지문/학교별 결과/자치구 집계를 저장하는 파일
+# - 자치구 통계는 기존 집계에서 변경 전 값을 빼고 변경 후 값을 더하는 방식으로 갱신
+# - 반환되는 changelog 에는 신규/삭제 학교와 종합_등급이 바뀐 학교가 기록됨
+def analyze_school_air_quality_incremental(data_file, state_file='공기질_증분_상태.pkl'):
+    df = load_env_data(data_file, clean=False)
+    df.index = make_school_keys(df)
+    df = df[~df.index.duplicated(keep='last')]
+    fingerprints = fingerprint_rows(df)
+
+    if os.path.exists(state_file):
+        state = pd.read_pickle(state_file)
+    else:
+        state = {'fingerprints': pd.Series(dtype='uint64'), 'results': None, 'aggregate': None}
+
+    old_fingerprints = state['fingerprints']
+    old_results = state['results']
+
+    common = fingerprints.index.intersection(old_fingerprints.index)
+    changed = common[fingerprints[common].to_numpy() != old_fingerprints[common].to_numpy()]
+    added = fingerprints.index.difference(old_fingerprints.index)
+    removed = old_fingerprints.index.difference(fingerprints.index)
+    print(f"신규 {len(added)}개, 변경 {len(changed)}개, 삭제 {len(removed)}개 학교 (변경 없음 {len(common) - len(changed)}개)")
+
+    # 변경/신규 학교만 다시 평가 (시도 구분 여부는 다시 평가하는 일부가 아니라 전체 학교 기준으로 결정)
+    rescore_keys = changed.append(added)
+    rescore_df = df.loc[rescore_keys]
+    qualify = resolve_regions(df)['시도'].nunique() > 1
+    new_results = preprocess_for_district_analysis(rescore_df, evaluate_air_quality_fast(rescore_df), qualify=qualify)
+
+    # 자치구 집계 증분 갱신: 변경 전 값 차감 → 변경 후 값 추가
+    aggregate = state['aggregate']
+    outdated_keys = changed.append(removed)
+    outdated = old_results.loc[outdated_keys] if old_results is not None else None
+    if aggregate is not None and len(outdated_keys) > 0:
+        aggregate = subtract_district_aggregate(aggregate, partial_district_aggregate(outdated))
+    if len(new_results) > 0:
+        aggregate = merge_district_aggregates(aggregate, partial_district_aggregate(new_results))
+
+    # 학교별 결과 갱신 (현재 원본의 행 순서 유지)
+    if old_results is not None:
+        kept = old_results.drop(index=outdated_keys)
+        results = pd.concat([kept, new_results]).loc[df.index]
+    else:
+        results = new_results.loc[df.index]
+
+    touched = set(new_results['자치구'])
+    if outdated is not None:
+        touched |= set(outdated['자치구'])
+    aggregate = refresh_district_max(aggregate, results, touched)
+
+    # 종합_등급 변경 이력
+    before = old_results[['학교명', '자치구', '종합_점수', '종합_등급']] if old_results is not None else \
+        pd.DataFrame(columns=['학교명', '자치구', '종합_점수', '종합_등급'])
+    after = results[['학교명', '자치구', '종합_점수', '종합_등급']]
+    changelog = before.join(after, how='outer', lsuffix='_이전', rsuffix='_신규')
+    changelog = changelog.loc[changelog.index.isin(changed.append(added).append(removed))]
+    changelog = changelog[changelog['종합_등급_이전'].astype(object) != changelog['종합_등급_신규'].astype(object)]
+    changelog['변경유형'] = np.where(changelog.index.isin(added), '신규',
+                                 np.where(changelog.index.isin(removed), '삭제', '등급 변경'))
+    changelog.index.name = '학교키'
+
+    state = {'fingerprints': fingerprints, 'results': results, 'aggregate': aggregate}
+    pd.to_pickle(state, state_file)
+
+    district_analysis = finalize_district_aggregate(aggregate)
+    print(f"증분 분석 완료. {len(rescore_keys)}개 학교 재평가, 등급 변경 {len(changelog)}건")
+    return results, district_analysis, changelog
+
+# 함수: analyze_school_air_quality 의 단계 DAG 정의 (2.Feature/code/pipeline_runner.py 의 make_stage 사용)
+# load → evaluate → preprocess 이후 시각화/자치구 통계/권고사항은 results 에만 의존하므로 동시에 실행되고,
+# export 는 세 결과가 모두 준비되면 저장만 수행 (시각화는 pyplot 을 쓰므로 exclusive 로 메인 스레드에서 실행)
+# 캐시 키에는 단계가 호출하는 모듈 소스가 자동으로 들어가고, 실행 중에 바뀔 수 있는 값(정제 버전, 기준 레지스트리, 규정 이름)은 depends 로 추가
+def build_school_air_quality_stages(output_dir='.', formats=('csv',), regulation=DEFAULT_REGULATION):
+    def load(data_file):
+        return load_env_data(data_file, clean=False)
+
+    def evaluate(df):
+        return evaluate_air_quality_fast(df, regulation)
+
+    def preprocess(df, raw_results):
+        # 캐시된 평가 결과가 바뀌지 않도록 복사본에 지역 정보 추가
+        return preprocess_for_district_analysis(df, raw_results.copy())
+
+    def visualize(results):
+        print("학교별/지역별 공기질 분석 결과 시각화 중...")
+        visualize_results(results)
+        visualize_district_analysis(results)
+
+    def district_stats(results):
+        return analyze_district_air_quality(results)
+
+    def recommend(results):
+        return generate_recommendations_long(results, regulation)
+
+    def export(results, recommendations, district_analysis):
+        export_school_results(results, recommendations, district_analysis, output_dir, formats=formats)
+
+    return [
+        make_stage('load', load, ['data_file'], ['df'], depends=[CLEANING_VERSION]),
+        make_stage('evaluate', evaluate, ['df'], ['raw_results'], depends=[POLLUTANT_STANDARDS, regulation]),
+        make_stage('preprocess', preprocess, ['df', 'raw_results'], ['results']),
+        make_stage('visualize', visualize, ['results'], exclusive=True),
+        make_stage('district_stats', district_stats, ['results'], ['district_analysis']),
+        make_stage('recommendations', recommend, ['results'], ['recommendations'], depends=[POLLUTANT_STANDARDS, regulation]),
+        make_stage('export', export, ['results', 'recommendations', 'district_analysis']),
+    ]
+
+# 메인 함수 (단계 DAG 모드): 단계별 출력을 입력 지문 기준으로 캐시하고, 독립 단계는 동시에 실행
+# - from_stage='export' 또는 only=['export']: 저장 형식만 바뀐 경우 평가/시각화 없이 캐시된 결과로 저장만 다시 수행
+# - args 에 '--from export' 같은 명령행 문자열을 주면 parse_pipeline_args 로 해석
+def analyze_school_air_quality_pipeline(data_file=None, from_stage=None, only=None, output_dir='.',
+                                        formats=('csv',), max_workers=None, cache_dir=PIPELINE_CACHE_DIR, args=None,
+                                        regulation=DEFAULT_REGULATION):
+    stages = build_school_air_quality_stages(output_dir, formats, regulation)
+    if args is not None:
+        parsed = parse_pipeline_args(args.split() if isinstance(args, str) else args)
+        if parsed.list:
+            describe_pipeline(stages)
+            return None
+        data_file = parsed.data_file or data_file
+        from_stage = parsed.from_stage or from_stage
+        only = parsed.only or only
+        max_workers = parsed.workers or max_workers
+        cache_dir = None if parsed.no_cache else cache_dir
+
+    values = run_pipeline(stages, {'data_file': data_file}, cache_dir=cache_dir, from_stage=from_stage,
+                          only=only, max_workers=max_workers)
+    return values.get('results'), values.get('recommendations'), values.get('district_analysis')
+
 # 사용 예시
+# 단계 DAG 모드 (내보내기만 다시 실행): analyze_school_air_quality_pipeline(data_file, only=['export'])
 results, recommendations = analyze_school_air_quality('/content/서울특별시_국공립_초중고_환경위생관리현황.csv')
@@ -0,0 +1,151 @@
+import hashlib
+from collections import OrderedDict
+
+import numpy as np
+import pandas as pd
+
+# 지표별 집계 방식 (analyze_district_air_quality 등에서 공통으로 쓰던 agg 블록)
+CUBE_AGGREGATIONS = {
+    '종합_점수': ['mean', 'median', 'std', 'count'],
+    'PM10_교실_최대값': ['mean', 'median', 'max'],
+    'PM2.5_최대값': ['mean', 'median', 'max'],
+    'CO2_최대값': ['mean', 'median', 'max'],
+    '부적합_항목수': ['mean', 'sum']
+}
+
+# 집계 결과 컬럼명 (CUBE_AGGREGATIONS 순서와 동일)
+CUBE_COLUMN_NAMES = [
+    '종합점수_평균', '종합점수_중앙값', '종합점수_표준편차', '학교수',
+    'PM10_평균', 'PM10_중앙값', 'PM10_최대값',
+    'PM2.5_평균', 'PM2.5_중앙값', 'PM2.5_최대값',
+    'CO2_평균', 'CO2_중앙값', 'CO2_최대값',
+    '부적합항목_평균', '부적합항목_총합'
+]
+
+# 기본 그룹 조합
+GROUPING_SETS = [
+    ('자치구',),
+    ('학교유형',),
+    ('조사기간',),
+    ('자치구', '학교유형'),
+    ('자치구', '조사기간'),
+]
+
+# 최근에 만든 큐브 캐시 {데이터 지문: 큐브}
+_CUBE_CACHE_SIZE = 8
+_cube_cache = OrderedDict()
+
+
+# 함수: 큐브 입력 데이터 지문 (키 컬럼 + 지표 컬럼 내용 기준)
+def _cube_fingerprint(results, columns, grouping_sets):
+    digest = hashlib.sha1(pd.util.hash_pandas_object(results[columns], index=False).to_numpy().tobytes())
+    digest.update(repr(grouping_sets).encode('utf-8'))
+    return digest.hexdigest()
+
+
+# 함수: 모든 그룹 조합의 통계를 한 번에 계산하는 집계 큐브 생성
+# - 키 컬럼은 한 번만 정수 코드로 변환 (결측은 -1)
+# - 건수/합계/제곱합/최대값은 가장 세밀한 셀(모든 키 조합) 단위로 한 번만 집계한 뒤 각 그룹 조합으로 롤업
+# - 중앙값은 분해할 수 없으므로 그룹 조합마다 정수 코드 기준으로 계산
+# 반환값: {그룹 조합 튜플: CUBE_COLUMN_NAMES 컬럼을 가진 DataFrame}
+def build_aggregation_cube(results, grouping_sets=GROUPING_SETS):
+    grouping_sets = [tuple(s) for s in grouping_sets if all(col in results.columns for col in s)]
+    key_columns = sorted({col for s in grouping_sets for col in s})
+    metrics = list(CUBE_AGGREGATIONS)
+    median_metrics = [metric for metric, funcs in CUBE_AGGREGATIONS.items() if 'median' in funcs]
+
+    codes = {}
+    uniques = {}
+    for col in key_columns:
+        codes[col], uniques[col] = pd.factorize(results[col], sort=True)
+
+    values = pd.DataFrame({metric: pd.to_numeric(results[metric], errors='coerce').to_numpy()
+                           for metric in metrics})
+    squares = values ** 2
+    squares.columns = [f'{metric}__sq' for metric in metrics]
+
+    # 1. 가장 세밀한 셀 단위 집계 (데이터 전체를 한 번만 순회)
+    cell_values = pd.concat([values, squares], axis=1)
+    cells = cell_values.groupby([codes[col] for col in key_columns]).agg(['count', 'sum', 'max'])
+    cells.index.names = key_columns
+
+    cube = {}
+    for grouping_set in grouping_sets:
+        # 2. 셀 집계를 그룹 조합 단위로 롤업 (키에 결측(-1)이 있는 셀 제외)
+        valid_cells = np.ones(len(cells), dtype=bool)
+        for col in grouping_set:
+            valid_cells &= cells.index.get_level_values(col) >= 0
+        rolled = cells[valid_cells].groupby(level=list(grouping_set)).agg(
+            {col: ('max' if col[1] == 'max' else 'sum') for col in cells.columns})
+
+        # 3. 중앙값 (그룹 조합별 계산)
+        valid_rows = np.ones(len(values), dtype=bool)
+        for col in grouping_set:
+            valid_rows &= codes[col] >= 0
+        medians = values.loc[valid_rows, median_metrics].groupby(
+            [codes[col][valid_rows] for col in grouping_set]).median()
+        medians.index.names = list(grouping_set)
+
+        stats = {}
+        for metric, funcs in CUBE_AGGREGATIONS.items():
+            count = rolled[(metric, 'count')]
+            total = rolled[(metric, 'sum')]
+            for func in funcs:
+                if func == 'mean':
+                    stats[(metric, func)] = total / count.where(count > 0)
+                elif func == 'median':
+                    stats[(metric, func)] = medians[metric].reindex(rolled.index)
+                elif func == 'std':
+                    sq_total = rolled[(f'{metric}__sq', 'sum')]
+                    var = (sq_total - total ** 2 / count.where(count > 0)) / (count - 1).where(count > 1)
+                    stats[(metric, func)] = np.sqrt(var.clip(lower=0))
+                elif func == 'count':
+                    stats[(metric, func)] = count
+                elif func == 'max':
+                    stats[(metric, func)] = rolled[(metric, 'max')]
+                elif func == 'sum':
+                    stats[(metric, func)] = total
+
+        set_stats = pd.DataFrame(stats)
+        set_stats.columns = CUBE_COLUMN_NAMES
+
+        # 4. 정수 코드를 원래 키 값으로 복원
+        if len(grouping_set) == 1:
+            col = grouping_set[0]
+            set_stats.index = pd.Index(uniques[col].take(set_stats.index.to_numpy()), name=col)
+        else:
+            set_stats.index = pd.MultiIndex.from_arrays(
+                [uniques[col].take(set_stats.index.get_level_values(col).to_numpy()) for col in grouping_set],
+                names=list(grouping_set))
+        cube[grouping_set] = set_stats
+
+    return cube
+
+
+# 함수: 집계 큐브 조회 (같은 내용의 데이터에 대해서는 캐시된 큐브 재사용)
+def get_aggregation_cube(results, grouping_sets=GROUPING_SETS):
+    grouping_sets = [tuple(s) for s in grouping_sets if all(col in results.columns for col in s)]
+    columns = sorted({col for s in grouping_sets for col in s}) + list(CUBE_AGGREGATIONS)
+    key = _cube_fingerprint(results, columns, grouping_sets)
+
+    if key in _cube_cache:
+        _cube_cache.move_to_end(key)
+        return _cube_cache[key]
+
+    cube = build_aggregation_cube(results, grouping_sets)
+    _cube_cache[key] = cube
+    if len(_cube_cache) > _CUBE_CACHE_SIZE:
+        _cube_cache.popitem(last=False)
+
+    return cube
+
+
+# 함수: 큐브에서 2차원 피벗 테이블 조회 (pivot_table(aggfunc='mean') 대체)
+# rows/columns 로 특정 행/열 값만 선택 가능
+def cube_pivot(cube, index, columns, value, rows=None, cols=None):
+    pivot = cube[(index, columns)][value].unstack(columns)
+    if rows is not None:
+        pivot = pivot.loc[pivot.index.isin(rows)]
+    if cols is not None:
+        pivot = pivot.loc[:, pivot.columns.isin(cols)]
+    return pivot.dropna(how='all').dropna(axis=1, how='all')
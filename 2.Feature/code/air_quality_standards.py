@@ -0,0 +1,160 @@
+import copy
+from bisect import bisect_left
+
+import numpy as np
+import pandas as pd
+
+# 오염물질별 단계 구간 정의 (학교보건법 기준)
+# - bounds: 단계 경계값 (값 <= 경계값 이면 해당 단계, 마지막 단계는 상한 없음)
+# - labels/scores: 단계명과 점수 (len(bounds) + 1 개)
+# - thresholds: 권고사항/시각화에 쓰는 기준값 (limit: 적합 기준, advisory: 권고 기준)
+POLLUTANT_STANDARDS = {
+    '학교보건법': {
+        'PM10': {
+            'name': '미세먼지(PM10)', 'unit': 'μg/㎥',
+            'bounds': [30, 50, 65, 75, 150],
+            'labels': ["좋음", "보통(민감군 안전)", "보통(민감군 주의)", "보통(모두 주의)", "나쁨", "매우 나쁨"],
+            'scores': [1, 2, 3, 4, 5, 6],
+            'thresholds': {'limit': 75, 'caution': 65, 'advisory': 50}
+        },
+        'PM2.5': {
+            'name': '초미세먼지(PM2.5)', 'unit': 'μg/㎥',
+            'bounds': [15, 25, 35, 50, 75],
+            'labels': ["좋음", "보통(민감군 안전)", "보통(민감군 주의)", "나쁨", "매우 나쁨", "위험"],
+            'scores': [1, 2, 3, 4, 5, 6],
+            'thresholds': {'limit': 35, 'advisory': 25}
+        },
+        'CO2': {
+            'name': '이산화탄소(CO2)', 'unit': 'ppm',
+            'bounds': [700, 1000, 1500],
+            'labels': ["좋음", "보통", "주의", "나쁨"],
+            'scores': [1, 2, 3, 4],
+            'thresholds': {'limit': 1500, 'advisory': 1000}
+        },
+        'CO': {
+            'name': '일산화탄소(CO)', 'unit': 'ppm',
+            'bounds': [2, 5, 10],
+            'labels': ["좋음", "보통", "주의", "나쁨"],
+            'scores': [1, 2, 3, 4],
+            'thresholds': {'limit': 10, 'advisory': 5}
+        },
+        'NO2': {
+            'name': '이산화질소(NO2)', 'unit': 'ppm',
+            'bounds': [0.03, 0.05, 0.1],
+            'labels': ["좋음", "보통", "주의", "나쁨"],
+            'scores': [1, 2, 3, 4],
+            'thresholds': {'limit': 0.05, 'advisory': 0.03}
+        },
+        'O3': {
+            'name': '오존(O3)', 'unit': 'ppm',
+            'bounds': [0.03, 0.06, 0.1],
+            'labels': ["좋음", "보통", "주의", "나쁨"],
+            'scores': [1, 2, 3, 4],
+            'thresholds': {'limit': 0.06, 'advisory': 0.03}
+        },
+    }
+}
+
+NO_DATA_LABEL = "데이터 없음"
+
+# 종합 등급 구간 (종합 점수 < 경계값 이면 해당 등급, 0점은 평가 불가)
+OVERALL_GRADE_BOUNDS = [2, 3, 4, 5]
+OVERALL_GRADE_LABELS = ["매우 좋음", "좋음", "보통", "주의 필요", "위험"]
+OVERALL_GRADE_NO_DATA = "평가 불가 (데이터 부족)"
+
+DEFAULT_REGULATION = '학교보건법'
+
+# 컴파일된 분류기 캐시 {(규정, 오염물질): 분류 함수}
+_compiled_classifiers = {}
+
+
+# 함수: 규정 변형 등록 (기준 규정을 복사한 뒤 지정한 항목만 덮어씀)
+def register_regulation(name, overrides, base=DEFAULT_REGULATION):
+    standards = copy.deepcopy(POLLUTANT_STANDARDS[base])
+
+    for pollutant, fields in overrides.items():
+        spec = standards.setdefault(pollutant, {})
+        for key, value in fields.items():
+            if key == 'thresholds':
+                spec.setdefault('thresholds', {}).update(value)
+            else:
+                spec[key] = value
+
+        if len(spec['labels']) != len(spec['bounds']) + 1 or len(spec['scores']) != len(spec['labels']):
+            raise ValueError(f"{name}/{pollutant}: 단계명/점수 개수는 경계값 개수 + 1 이어야 합니다.")
+
+    POLLUTANT_STANDARDS[name] = standards
+
+    # 같은 이름으로 재등록된 경우 이전 분류기 제거
+    for key in [key for key in _compiled_classifiers if key[0] == name]:
+        del _compiled_classifiers[key]
+
+    return standards
+
+
+# 함수: 오염물질 기준 조회
+def get_standard(pollutant, regulation=DEFAULT_REGULATION):
+    if regulation not in POLLUTANT_STANDARDS:
+        raise KeyError(f"등록되지 않은 규정입니다: {regulation}")
+    return POLLUTANT_STANDARDS[regulation][pollutant]
+
+
+# 함수: 오염물질별 배치 분류기 컴파일 (np.searchsorted 기반, O(n log k))
+# 반환된 함수는 값 배열을 받아 (단계 코드, 점수) 배열을 돌려줌. 결측값의 단계 코드는 -1, 점수는 0
+def compile_classifier(pollutant, regulation=DEFAULT_REGULATION):
+    key = (regulation, pollutant)
+    if key in _compiled_classifiers:
+        return _compiled_classifiers[key]
+
+    spec = get_standard(pollutant, regulation)
+    bounds = np.asarray(spec['bounds'], dtype=float)
+    # 마지막 칸은 결측값(-1 코드)용 점수
+    scores = np.asarray(list(spec['scores']) + [0], dtype=int)
+
+    def classify(values):
+        values = np.asarray(values, dtype=float)
+        missing = np.isnan(values)
+        codes = np.where(missing, -1, np.searchsorted(bounds, values, side='left'))
+        return codes, scores[codes]
+
+    _compiled_classifiers[key] = classify
+    return classify
+
+
+# 함수: 단계 코드 배열을 단계명 배열로 변환
+def band_labels(codes, pollutant, regulation=DEFAULT_REGULATION):
+    labels = np.array(list(get_standard(pollutant, regulation)['labels']) + [NO_DATA_LABEL], dtype=object)
+    return labels[np.asarray(codes)]
+
+
+# 함수: 컬럼 전체를 한 번에 분류하여 (단계명, 점수) 반환
+def classify_column(values, pollutant, regulation=DEFAULT_REGULATION):
+    codes, scores = compile_classifier(pollutant, regulation)(values)
+    return band_labels(codes, pollutant, regulation), scores
+
+
+# 함수: 단일 값 분류 (evaluate_pm10 등 기존 스칼라 함수용)
+def evaluate_band(pollutant, value, regulation=DEFAULT_REGULATION):
+    if pd.isna(value) or value == "":
+        return NO_DATA_LABEL, 0
+
+    spec = get_standard(pollutant, regulation)
+    code = bisect_left(spec['bounds'], float(value))
+    return spec['labels'][code], spec['scores'][code]
+
+
+# 함수: 종합 점수 배열을 종합 등급 배열로 변환
+def classify_overall_grade(total_scores):
+    total_scores = np.asarray(total_scores, dtype=float)
+    labels = np.array(OVERALL_GRADE_LABELS + [OVERALL_GRADE_NO_DATA], dtype=object)
+    codes = np.searchsorted(np.asarray(OVERALL_GRADE_BOUNDS, dtype=float), total_scores, side='right')
+    return labels[np.where(total_scores == 0, len(OVERALL_GRADE_LABELS), codes)]
+
+
+# WHO 대기질 가이드라인(24시간 평균 AQG 수준)을 적합 기준으로 쓰는 변형
+# 출처: WHO global air quality guidelines (2021), 24-hour AQG level - PM10 45μg/㎥, PM2.5 15μg/㎥
+# WHO 가이드라인은 기준이 하나뿐이므로 주의/권고 기준도 같은 값으로 둠 (권고사항은 기준 초과 메시지만 발동)
+register_regulation('WHO', {
+    'PM10': {'thresholds': {'limit': 45, 'caution': 45, 'advisory': 45}},
+    'PM2.5': {'thresholds': {'limit': 15, 'advisory': 15}},
+})
@@ -0,0 +1,57 @@
+import numpy as np
+import pandas as pd
+
+from benchmark_utils import assert_same_frames, check_equivalence_on_seeds, compare_timings, make_synthetic_values
+from evaluate_air_quality import evaluate_air_quality, evaluate_air_quality_fast
+
+# 측정 항목별 (측정값 컬럼, 적합성 컬럼, 합성 데이터 생성 범위)
+SYNTHETIC_ITEMS = [
+    ('MNUT_DST_RSLT_NMVL', 'MNUT_DST_STB_YN', 0, 200),
+    ('GMNSM_MNUT_DST_RSLT_NMVL', 'GMNSM_MNUT_DST_STB_YN', 0, 200),
+    ('ULTRA_DST_RSLT_NMVL', 'ULTRA_DST_STB_YN', 0, 100),
+    ('CO2_RSLT_NMVL', 'CO2_STB_YN', 300, 2500),
+    ('CO_RSLT_NMVL', 'CO_STB_YN', 0, 15),
+    ('NO2_RSLT_NMVL', 'NO2_STB_YN', 0, 0.15),
+    ('O3_RSLT_NMVL', 'O3_STB_YN', 0, 0.15),
+]
+
+
+# 함수: 환경위생관리현황 형식의 합성 데이터 생성
+def make_synthetic_env_data(n_rows, seed=0):
+    rng = np.random.default_rng(seed)
+
+    data = {
+        'SCHUL_NM': [f"학교{i}" for i in range(n_rows)],
+        'SCHUL_CODE': [f"S{i:09d}" for i in range(n_rows)],
+    }
+
+    for value_col, yn_col, low, high in SYNTHETIC_ITEMS:
+        for suffix in ['', '_2', '_3']:
+            # 결측 및 '해당없음'/'미실시' 텍스트 혼입
+            data[f"{value_col}{suffix}"] = make_synthetic_values(rng, n_rows, low, high, missing_rate=0.2,
+                                                                 text_rates={'해당없음': 0.03, '미실시': 0.02})
+
+        data[yn_col] = rng.choice(['적합', '부적합', '해당없음', '미실시', '', np.nan], n_rows,
+                                  p=[0.7, 0.1, 0.1, 0.04, 0.03, 0.03])
+
+    return pd.DataFrame(data)
+
+
+# 함수: 기존 evaluate_air_quality 결과(골든)와 벡터 버전 결과 비교
+def check_equivalence(df):
+    assert_same_frames(evaluate_air_quality(df), evaluate_air_quality_fast(df))
+    return True
+
+
+# 함수: 1천/1만/10만 행 기준 실행 시간 비교
+def benchmark(sizes=(1000, 10000, 100000), repeat=1):
+    return compare_timings(make_synthetic_env_data, evaluate_air_quality, evaluate_air_quality_fast, sizes, repeat)
+
+
+if __name__ == "__main__":
+    print("=== 골든 결과 비교 ===")
+    check_equivalence_on_seeds(check_equivalence, make_synthetic_env_data)
+    print("evaluate_air_quality 와 evaluate_air_quality_fast 결과 일치")
+
+    print("\n=== 실행 시간 비교 ===")
+    benchmark()
@@ -0,0 +1,100 @@
+import numpy as np
+import pandas as pd
+
+from benchmark_utils import assert_same_frames, check_equivalence_on_seeds, compare_timings, make_synthetic_values
+from nmvl_merge import find_substance_pairs, merge_nmvl_columns
+
+# 3_data_nmvl.ipynb 의 data_to_use.csv 와 같은 물질 구성
+# (물질, 합성 데이터 생성 범위, NMVL 결측 비율, NMVL_2 결측 비율)
+SYNTHETIC_SUBSTANCES = [
+    ('AIR_BACT', 0, 800, 0.02, 0.78),
+    ('FALL_BACT', 0, 5, 0.39, 0.89),
+    ('MITE', 0, 50, 0.05, 0.93),
+    ('RN', 0, 150, 0.09, 0.94),
+    ('O3', 0, 0.06, 0.02, 0.79),
+    ('ASBESTOS', 0, 0.01, 0.47, 0.95),
+]
+
+
+# 함수: NMVL / NMVL_2 컬럼 쌍이 있는 합성 데이터 생성 (네 가지 병합 경우가 모두 나오도록 결측 혼입)
+def make_synthetic_nmvl_data(n_rows, seed=0):
+    rng = np.random.default_rng(seed)
+
+    data = {'SCHUL_NM': [f"학교{i}" for i in range(n_rows)]}
+    for substance, low, high, *missing_rates in SYNTHETIC_SUBSTANCES:
+        for suffix, missing_rate in zip(['_RSLT_NMVL', '_RSLT_NMVL_2'], missing_rates):
+            data[f"{substance}{suffix}"] = make_synthetic_values(rng, n_rows, low, high, missing_rate=missing_rate)
+
+    return pd.DataFrame(data)
+
+
+# 함수: 3_data_nmvl.ipynb 의 기존 행 단위 병합 (출력문만 제거, 비교 기준)
+def merge_nmvl_columns_reference(df):
+    df_merged = df.copy()
+    merge_statistics = []
+
+    for pair in find_substance_pairs(df):
+        nmvl_col, nmvl_2_col, merged_col = pair['nmvl'], pair['nmvl_2'], pair['merged']
+        df_merged[merged_col] = np.nan
+        both_available = only_nmvl = only_nmvl_2 = both_missing = 0
+
+        for idx in df.index:
+            nmvl_val = df.loc[idx, nmvl_col]
+            nmvl_2_val = df.loc[idx, nmvl_2_col]
+
+            if pd.notna(nmvl_val) and pd.notna(nmvl_2_val):
+                df_merged.loc[idx, merged_col] = (nmvl_val + nmvl_2_val) / 2
+                both_available += 1
+            elif pd.notna(nmvl_val) and pd.isna(nmvl_2_val):
+                df_merged.loc[idx, merged_col] = nmvl_val
+                only_nmvl += 1
+            elif pd.isna(nmvl_val) and pd.notna(nmvl_2_val):
+                df_merged.loc[idx, merged_col] = nmvl_2_val
+                only_nmvl_2 += 1
+            else:
+                both_missing += 1
+
+        data_merged_temp = df_merged[merged_col].dropna()
+        if len(data_merged_temp) > 0:
+            missing_mask = df_merged[merged_col].isna()
+            df_merged.loc[missing_mask, merged_col] = data_merged_temp.mean()
+
+        merge_statistics.append({
+            'substance': pair['substance'],
+            'both_available': both_available,
+            'only_nmvl': only_nmvl,
+            'only_nmvl_2': only_nmvl_2,
+            'both_missing': both_missing,
+            'total': len(df)
+        })
+
+    return df_merged, merge_statistics
+
+
+# 함수: 기존 행 단위 병합 결과(골든)와 벡터 버전 결과 비교
+def check_equivalence(df):
+    expected, expected_stats = merge_nmvl_columns_reference(df)
+    actual, actual_stats = merge_nmvl_columns(df, verbose=False)
+
+    assert expected_stats == actual_stats, "merge_statistics 가 다릅니다."
+    assert_same_frames(expected, actual)
+    return True
+
+
+# 함수: 벡터 버전 병합 (출력문 없이, 시간 비교용)
+def merge_nmvl_columns_quiet(df):
+    return merge_nmvl_columns(df, verbose=False)
+
+
+# 함수: 행 수별 실행 시간 비교
+def benchmark(sizes=(1000, 10000, 50000), repeat=1):
+    return compare_timings(make_synthetic_nmvl_data, merge_nmvl_columns_reference, merge_nmvl_columns_quiet, sizes, repeat)
+
+
+if __name__ == "__main__":
+    print("=== 골든 결과 비교 ===")
+    check_equivalence_on_seeds(check_equivalence, make_synthetic_nmvl_data)
+    print("기존 merge_nmvl_columns 와 벡터 버전 결과 일치")
+
+    print("\n=== 실행 시간 비교 ===")
+    benchmark()
@@ -0,0 +1,62 @@
+import time
+
+import numpy as np
+import pandas as pd
+
+# benchmark_*.py 공통 도구
+# - 합성 측정값 컬럼 생성
+# - 기존(골든) 구현과 벡터 구현의 결과 비교 (assert 기반)
+# - 행 수별 실행 시간 비교
+
+
+# 함수: 합성 측정값 컬럼 생성 (missing_rate 비율로 결측, text_rates 의 {문자열: 비율} 로 텍스트 혼입)
+def make_synthetic_values(rng, n_rows, low, high, missing_rate=0.0, text_rates=None):
+    values = rng.uniform(low, high, n_rows).round(3)
+    if text_rates:
+        values = values.astype(object)
+    values[rng.random(n_rows) < missing_rate] = np.nan
+    for text, rate in (text_rates or {}).items():
+        values[rng.random(n_rows) < rate] = text
+    return values
+
+
+# 함수: 기존 결과(골든)와 새 결과가 같은지 확인 (다르면 AssertionError)
+def assert_same_frames(expected, actual):
+    assert list(expected.columns) == list(actual.columns), "컬럼 구성이 다릅니다."
+    pd.testing.assert_frame_equal(expected, actual, check_dtype=False)
+
+
+# 함수: 여러 시드의 합성 데이터로 check(df) 실행
+def check_equivalence_on_seeds(check, make_data, n_rows=2000, seeds=range(3)):
+    for seed in seeds:
+        check(make_data(n_rows, seed=seed))
+    return True
+
+
+# 함수: func(*args) 평균 실행 시간 (초)
+def time_call(func, *args, repeat=1):
+    start = time.perf_counter()
+    for _ in range(repeat):
+        func(*args)
+    return (time.perf_counter() - start) / repeat
+
+
+# 함수: 행 수별 기존 구현 / 벡터 구현 실행 시간 비교
+def compare_timings(make_data, reference, fast, sizes, repeat=1):
+    rows = []
+
+    for n_rows in sizes:
+        df = make_data(n_rows)
+        reference_time = time_call(reference, df, repeat=repeat)
+        fast_time = time_call(fast, df, repeat=repeat)
+
+        rows.append({
+            '행수': n_rows,
+            '기존(초)': reference_time,
+            '벡터(초)': fast_time,
+            '속도향상(배)': reference_time / fast_time
+        })
+        print(f"{n_rows:>7}행: 기존 {reference_time:.3f}초, 벡터 {fast_time:.4f}초 "
+              f"({reference_time / fast_time:.1f}배)")
+
+    return pd.DataFrame(rows)
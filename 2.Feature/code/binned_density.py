@@ -0,0 +1,133 @@
+import numpy as np
+import pandas as pd
+from matplotlib import colormaps
+from matplotlib.colors import LogNorm
+
+# 행 수가 이보다 많으면 점 산점도 대신 구간 밀도 산점도 행렬 사용
+BINNED_SCATTER_THRESHOLD = 5000
+DEFAULT_BINS = 60
+# 축 범위 (극단값 때문에 격자가 한쪽으로 몰리지 않도록 분위수 기준)
+DEFAULT_RANGE_QUANTILES = (0.001, 0.999)
+HUE_PALETTE = 'tab10'
+
+
+# 함수: 컬럼별 균등 구간 경계 계산
+def _bin_edges(values, bins, range_quantiles):
+    valid = values[~np.isnan(values)]
+    if len(valid) == 0:
+        return np.linspace(0, 1, bins + 1)
+
+    low, high = np.quantile(valid, range_quantiles)
+    if high <= low:
+        low, high = low - 0.5, high + 0.5
+    return np.linspace(low, high, bins + 1)
+
+
+# 함수: 값 배열을 구간 번호로 변환 (범위 밖/결측은 -1)
+def _bin_index(values, edges):
+    bins = len(edges) - 1
+    with np.errstate(invalid='ignore'):
+        index = np.floor((values - edges[0]) / (edges[-1] - edges[0]) * bins)
+    index = np.where(values == edges[-1], bins - 1, index)
+    inside = (index >= 0) & (index < bins)
+    return np.where(inside, index, -1).astype(np.intp)
+
+
+# 함수: 산점도 행렬용 구간 집계 (행 수와 무관한 크기의 격자만 남김)
+# - 대각선: 컬럼별 1차원 히스토그램 [색상 그룹 × 구간]
+# - 그 외: 컬럼 쌍별 2차원 히스토그램 [색상 그룹 × x 구간 × y 구간], np.bincount 한 번으로 집계
+# hue 를 주면 그룹별로 따로 집계 (hue_levels 로 대상 그룹과 순서 지정 가능, 그 외 그룹은 제외)
+def binned_pair_grid(df, columns, bins=DEFAULT_BINS, hue=None, hue_levels=None,
+                     range_quantiles=DEFAULT_RANGE_QUANTILES):
+    columns = list(columns)
+    values = df[columns].apply(pd.to_numeric, errors='coerce').to_numpy(dtype=float)
+
+    if hue is None:
+        hue_codes = np.zeros(len(df), dtype=np.intp)
+        hue_levels = [None]
+    else:
+        if hue_levels is None:
+            hue_levels = df[hue].value_counts().index.tolist()
+        hue_levels = list(hue_levels)
+        hue_codes = pd.Index(hue_levels).get_indexer(df[hue])
+
+    n_hue = len(hue_levels)
+    edges = {col: _bin_edges(values[:, i], bins, range_quantiles) for i, col in enumerate(columns)}
+    index = {col: _bin_index(values[:, i], edges[col]) for i, col in enumerate(columns)}
+
+    hist1d = {}
+    for col in columns:
+        keep = (hue_codes >= 0) & (index[col] >= 0)
+        hist1d[col] = np.bincount(hue_codes[keep] * bins + index[col][keep],
+                                  minlength=n_hue * bins).reshape(n_hue, bins)
+
+    hist2d = {}
+    for i, x_col in enumerate(columns):
+        for y_col in columns[i + 1:]:
+            keep = (hue_codes >= 0) & (index[x_col] >= 0) & (index[y_col] >= 0)
+            flat = (hue_codes[keep] * bins + index[x_col][keep]) * bins + index[y_col][keep]
+            hist2d[(x_col, y_col)] = np.bincount(flat, minlength=n_hue * bins * bins).reshape(n_hue, bins, bins)
+
+    return {
+        'columns': columns, 'bins': bins, 'edges': edges,
+        'hue': hue, 'hue_levels': hue_levels,
+        'hist1d': hist1d, 'hist2d': hist2d,
+        'n_rows': int(len(df))
+    }
+
+
+# 함수: 그룹별 2차원 히스토그램을 하나의 RGBA 이미지로 합성
+# 각 칸의 색은 그룹 색을 건수로 가중 평균, 투명도는 전체 건수의 로그 밀도
+def _blend_hue_density(counts, colors):
+    total = counts.sum(axis=0)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        rgb = np.einsum('hxy,hc->xyc', counts, colors) / total[..., None]
+    alpha = np.log1p(total) / np.log1p(total.max()) if total.max() > 0 else np.zeros_like(total, dtype=float)
+    image = np.dstack([np.nan_to_num(rgb), alpha])
+    # imshow 는 [행=y, 열=x] 순서
+    return image.transpose(1, 0, 2)
+
+
+# 함수: 구간 집계 결과로 산점도 행렬 그리기 (격자 크기만큼만 그리므로 행 수와 무관)
+# hue 가 없으면 로그 색상 밀도, 있으면 그룹 색 합성 밀도 + 그룹별 히스토그램
+def draw_binned_scatter_matrix(fig, grid, cmap='viridis'):
+    columns = grid['columns']
+    edges = grid['edges']
+    n = len(columns)
+    hue_levels = grid['hue_levels']
+    colors = np.asarray(colormaps[HUE_PALETTE].colors)[np.arange(len(hue_levels)) % 10][:, :3]
+
+    for row, y_col in enumerate(columns):
+        for col, x_col in enumerate(columns):
+            ax = fig.add_subplot(n, n, row * n + col + 1)
+
+            if row == col:
+                for h, level in enumerate(hue_levels):
+                    ax.stairs(grid['hist1d'][x_col][h], edges[x_col], fill=grid['hue'] is not None, alpha=0.5,
+                              color=colors[h] if grid['hue'] is not None else None, label=level)
+            else:
+                if (x_col, y_col) in grid['hist2d']:
+                    counts = grid['hist2d'][(x_col, y_col)]
+                else:
+                    counts = grid['hist2d'][(y_col, x_col)].transpose(0, 2, 1)
+
+                extent = [edges[x_col][0], edges[x_col][-1], edges[y_col][0], edges[y_col][-1]]
+                if grid['hue'] is None:
+                    total = counts.sum(axis=0).T
+                    if total.max() > 0:
+                        ax.pcolormesh(edges[x_col], edges[y_col], np.ma.masked_equal(total, 0),
+                                      cmap=cmap, norm=LogNorm(vmin=1, vmax=total.max()))
+                else:
+                    ax.imshow(_blend_hue_density(counts, colors), origin='lower', extent=extent,
+                              aspect='auto', interpolation='nearest')
+
+            if row == n - 1:
+                ax.set_xlabel(x_col)
+            else:
+                ax.tick_params(labelbottom=False)
+            if col == 0:
+                ax.set_ylabel(y_col)
+
+    if grid['hue'] is not None:
+        handles = [fig.axes[0].patches[h] for h in range(len(hue_levels))] if fig.axes[0].patches else []
+        fig.legend(handles, [str(level) for level in hue_levels], title=grid['hue'], loc='upper right')
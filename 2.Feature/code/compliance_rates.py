@@ -0,0 +1,90 @@
+import numpy as np
+import pandas as pd
+
+from evaluate_air_quality import AIR_QUALITY_ITEMS, SUITABILITY_CATEGORIES
+
+# 적합성 컬럼과 표시용 항목명 (예: 'PM10_교실_적합성' -> 'PM10(교실)')
+COMPLIANCE_ITEMS = [
+    (f'{prefix}_적합성', prefix.replace('_', '(') + ')' if '_' in prefix else prefix)
+    for prefix, _, _, _ in AIR_QUALITY_ITEMS
+]
+
+# 95% 신뢰구간용 z 값
+WILSON_Z = 1.959963984540054
+
+
+# 함수: Wilson 점수 신뢰구간 (성공 수 k, 시행 수 n 배열) -> (하한, 상한), n = 0 이면 NaN
+def wilson_interval(k, n, z=WILSON_Z):
+    k = np.asarray(k, dtype=float)
+    n = np.asarray(n, dtype=float)
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        p = k / n
+        denom = 1 + z ** 2 / n
+        center = (p + z ** 2 / (2 * n)) / denom
+        half = z * np.sqrt(p * (1 - p) / n + z ** 2 / (4 * n ** 2)) / denom
+
+    lower = np.where(n > 0, np.clip(center - half, 0, 1), np.nan)
+    upper = np.where(n > 0, np.clip(center + half, 0, 1), np.nan)
+    return lower, upper
+
+
+# 함수: 그룹별 항목별 적합/부적합/데이터 없음 건수와 부적합률 계산
+# - 그룹 키는 한 번만 정수 코드로 변환하고, 항목마다 np.bincount 한 번으로 (그룹 × 상태) 건수를 집계
+# - 부적합률(%) = 부적합 / (적합 + 부적합) * 100, 평가 건수가 0 이면 0
+# - ci=True 이면 Wilson 신뢰구간(%) 컬럼 추가
+# 반환값: [by, '항목', '적합', '부적합', '데이터 없음', '평가수', '부적합률(%)'(, 하한/상한)] 형식의 긴 테이블
+def compliance_counts(results, by, groups=None, items=COMPLIANCE_ITEMS, ci=False, z=WILSON_Z):
+    items = [(col, label) for col, label in items if col in results.columns]
+
+    group_codes, group_values = pd.factorize(results[by], sort=True)
+    if groups is not None:
+        # 지정한 그룹만, 지정한 순서대로 (데이터에 없는 그룹은 건수 0)
+        group_values = pd.Index(groups)
+        group_codes = group_values.get_indexer(results[by])
+    n_groups = len(group_values)
+    in_group = group_codes >= 0
+    group_codes = group_codes[in_group]
+
+    n_status = len(SUITABILITY_CATEGORIES)
+    frames = []
+    for col, label in items:
+        # 상태 코드: 0 적합, 1 부적합, 2 데이터 없음 (그 외 값)
+        status = np.asarray(results[col], dtype=object)[in_group]
+        status_codes = np.full(len(status), n_status - 1)
+        status_codes[status == SUITABILITY_CATEGORIES[0]] = 0
+        status_codes[status == SUITABILITY_CATEGORIES[1]] = 1
+
+        counts = np.bincount(group_codes * n_status + status_codes,
+                             minlength=n_groups * n_status).reshape(n_groups, n_status)
+
+        frame = pd.DataFrame(counts, columns=SUITABILITY_CATEGORIES)
+        frame.insert(0, '항목', label)
+        frame.insert(0, by, group_values)
+        frames.append(frame)
+
+    table = pd.concat(frames, ignore_index=True)
+    suitable = table[SUITABILITY_CATEGORIES[0]].to_numpy()
+    unsuitable = table[SUITABILITY_CATEGORIES[1]].to_numpy()
+    evaluated = suitable + unsuitable
+
+    table['평가수'] = evaluated
+    with np.errstate(divide='ignore', invalid='ignore'):
+        table['부적합률(%)'] = np.where(evaluated > 0, unsuitable / evaluated * 100, 0.0)
+
+    if ci:
+        lower, upper = wilson_interval(unsuitable, evaluated, z)
+        table['부적합률_하한(%)'] = lower * 100
+        table['부적합률_상한(%)'] = upper * 100
+
+    return table
+
+
+# 함수: 그룹 × 항목 부적합률 행렬 (히트맵/막대그래프용)
+# value 로 '부적합률(%)', '부적합률_하한(%)', '평가수' 등 compliance_counts 의 컬럼 선택
+def compliance_rate_matrix(results, by, groups=None, items=COMPLIANCE_ITEMS, value='부적합률(%)'):
+    table = compliance_counts(results, by, groups=groups, items=items, ci=True)
+    labels = [label for col, label in items if col in results.columns]
+
+    matrix = table.pivot(index=by, columns='항목', values=value)
+    return matrix.reindex(index=table[by].unique(), columns=labels)
@@ -0,0 +1,183 @@
+import os
+import re
+import threading
+
+import numpy as np
+import pandas as pd
+
+from env_data_cache import DEFAULT_CACHE_DIR
+
+# 주소 해석 규칙이 바뀌면 올려야 하는 버전 (메모 파일 이름에 포함되어 이전 결과를 쓰지 않음)
+RESOLVER_VERSION = '1'
+DISTRICT_CACHE_DIR = os.path.join(DEFAULT_CACHE_DIR, 'district_resolver')
+ADDRESS_MEMO_PATH = os.path.join(DISTRICT_CACHE_DIR, f"address_regions_v{RESOLVER_VERSION}.csv")
+CODE_MEMO_PATH = os.path.join(DISTRICT_CACHE_DIR, f"sigungu_codes_v{RESOLVER_VERSION}.csv")
+
+UNKNOWN_LABEL = "정보 없음"
+
+# 시도 코드 (ADRCD_CD 앞 2자리) → 시도
+SIDO_CODES = {
+    '11': '서울특별시', '26': '부산광역시', '27': '대구광역시', '28': '인천광역시', '29': '광주광역시',
+    '30': '대전광역시', '31': '울산광역시', '36': '세종특별자치시', '41': '경기도', '42': '강원특별자치도',
+    '43': '충청북도', '44': '충청남도', '45': '전북특별자치도', '46': '전라남도', '47': '경상북도',
+    '48': '경상남도', '50': '제주특별자치도', '51': '강원특별자치도', '52': '전북특별자치도',
+}
+# 주소에 쓰이는 시도 이름 (옛 이름, 줄임말 포함) → 표준 시도 이름
+SIDO_ALIASES = {
+    **{name: name for name in SIDO_CODES.values()},
+    '강원도': '강원특별자치도', '전라북도': '전북특별자치도', '제주도': '제주특별자치도',
+    '서울': '서울특별시', '서울시': '서울특별시', '부산': '부산광역시', '대구': '대구광역시', '인천': '인천광역시',
+    '광주': '광주광역시', '대전': '대전광역시', '울산': '울산광역시', '세종': '세종특별자치시', '경기': '경기도',
+    '강원': '강원특별자치도', '충북': '충청북도', '충남': '충청남도', '전북': '전북특별자치도', '전남': '전라남도',
+    '경북': '경상북도', '경남': '경상남도', '제주': '제주특별자치도',
+}
+# 시군구가 없는 시도 (시도 이름을 시군구로 사용)
+SIDO_WITHOUT_SIGUNGU = {'세종특별자치시'}
+
+# 시군구 코드 (ADRCD_CD 앞 5자리) → 시군구, 서울 자치구는 고정 표
+# 그 밖의 시도는 주소로 해석한 결과에서 코드별 시군구를 학습해 CODE_MEMO_PATH 에 누적
+SIGUNGU_CODES = {
+    '11110': '종로구', '11140': '중구', '11170': '용산구', '11200': '성동구', '11215': '광진구',
+    '11230': '동대문구', '11260': '중랑구', '11290': '성북구', '11305': '강북구', '11320': '도봉구',
+    '11350': '노원구', '11380': '은평구', '11410': '서대문구', '11440': '마포구', '11470': '양천구',
+    '11500': '강서구', '11530': '구로구', '11545': '금천구', '11560': '영등포구', '11590': '동작구',
+    '11620': '관악구', '11650': '서초구', '11680': '강남구', '11710': '송파구', '11740': '강동구',
+}
+
+# 주소 패턴: 시도 (긴 이름 우선) + 시군구 ("수원시 장안구" 같은 시 + 구, 또는 시/군/구 하나)
+ADDRESS_PATTERN = (r'(?:^|[\s(])(?P<시도>' + '|'.join(map(re.escape, sorted(SIDO_ALIASES, key=len, reverse=True)))
+                   + r')\s+(?P<시군구>\S+시\s+\S+구|\S+[시군구])?')
+
+# 학교급 코드 → 학교유형 (2/02: 초등, 3/03: 중등, 4/04: 고등), 그 밖의 코드는 기타
+SCHOOL_TYPE_NAMES = {2: '초등학교', 3: '중학교', 4: '고등학교'}
+SCHOOL_TYPE_OTHER = '기타'
+
+_memo_lock = threading.Lock()
+_memos = {}  # {메모 파일 경로: {키: (시도, 시군구)}}
+
+
+# 함수: 메모 파일 로드 (프로세스 안에서는 한 번만 읽음)
+def _load_memo(path):
+    if path not in _memos:
+        memo = {}
+        if path is not None and os.path.exists(path):
+            table = pd.read_csv(path, encoding='utf-8-sig', dtype=str, keep_default_na=False)
+            memo = {key: (sido or np.nan, sigungu or np.nan)
+                    for key, sido, sigungu in table[['키', '시도', '시군구']].itertuples(index=False)}
+        _memos[path] = memo
+    return _memos[path]
+
+
+# 함수: 메모에 새 항목 추가 후 파일 끝에 새 행만 이어서 저장 (청크마다 전체를 다시 쓰지 않음)
+# 새 파일이면 헤더와 BOM 을 함께 쓰고, 행들은 write 한 번으로 붙여 중간에 끊긴 줄이 남지 않게 함
+# 같은 키가 여러 번 기록되어도 _load_memo 에서 마지막 값이 남음
+def _update_memo(path, new_items):
+    memo = _load_memo(path)
+    memo.update(new_items)
+    if path is not None and new_items:
+        os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+        table = pd.DataFrame([(key, sido, sigungu) for key, (sido, sigungu) in new_items.items()],
+                             columns=['키', '시도', '시군구'])
+        is_new = not os.path.exists(path) or os.path.getsize(path) == 0
+        with open(path, 'a', encoding='utf-8-sig' if is_new else 'utf-8', newline='') as handle:
+            handle.write(table.fillna('').to_csv(index=False, header=is_new))
+
+
+# 함수: 주소 정규화 (앞뒤 공백 제거, 연속 공백은 하나로)
+def normalize_addresses(addresses):
+    return pd.Series(addresses, dtype=object).str.strip().str.replace(r'\s+', ' ', regex=True)
+
+
+# 함수: 주소 목록 → (시도, 시군구) DataFrame (str.extract 한 번)
+def parse_addresses(addresses):
+    regions = pd.Series(addresses, dtype=object).str.extract(ADDRESS_PATTERN)
+    regions['시도'] = regions['시도'].map(SIDO_ALIASES)
+    no_sigungu = regions['시도'].isin(SIDO_WITHOUT_SIGUNGU) & regions['시군구'].isna()
+    regions.loc[no_sigungu, '시군구'] = regions.loc[no_sigungu, '시도']
+    return regions
+
+
+# 함수: 주소 → (시도, 시군구), 고유 주소만 해석하고 결과는 실행 간에도 메모 (memo_path=None 이면 파일 저장 없이 프로세스 안에서만)
+def resolve_addresses(addresses, memo_path=ADDRESS_MEMO_PATH):
+    codes, uniques = pd.factorize(pd.Series(addresses, dtype=object))
+    keys = normalize_addresses(uniques).tolist()
+    with _memo_lock:
+        memo = _load_memo(memo_path)
+        missing = list(dict.fromkeys(key for key in keys if key not in memo))
+        if missing:
+            parsed = parse_addresses(missing)
+            _update_memo(memo_path, dict(zip(missing, zip(parsed['시도'], parsed['시군구']))))
+        unique_regions = [memo[key] for key in keys]
+
+    sido = np.array([region[0] for region in unique_regions] + [np.nan], dtype=object)
+    sigungu = np.array([region[1] for region in unique_regions] + [np.nan], dtype=object)
+    return pd.DataFrame({'시도': sido[codes], '시군구': sigungu[codes]})  # codes == -1 → 마지막 NaN
+
+
+# 함수: ADRCD_CD → 시군구 코드 (앞 5자리, 숫자/실수/문자열 모두 허용)
+def sigungu_code_prefixes(codes):
+    return pd.Series(codes, dtype=object).astype(str).str.extract(r'^\s*(\d{5})', expand=False)
+
+
+# 함수: 시군구 코드 → (시도, 시군구) (고정 표 + 학습된 메모)
+def resolve_codes(prefixes, memo_path=CODE_MEMO_PATH):
+    prefixes = pd.Series(prefixes, dtype=object)
+    with _memo_lock:
+        learned = dict(_load_memo(memo_path))
+    sigungu = prefixes.map(SIGUNGU_CODES).fillna(prefixes.map({k: v[1] for k, v in learned.items()}))
+    sido = prefixes.str[:2].map(SIDO_CODES).where(sigungu.notna())
+    return pd.DataFrame({'시도': sido.to_numpy(dtype=object), '시군구': sigungu.to_numpy(dtype=object)})
+
+
+# 함수: 학교별 (시도, 시군구) 해석
+# 1. ADRCD_CD 가 있고 코드 표(고정 + 학습)에 있으면 바로 조회
+# 2. 나머지는 주소(address_column, 없으면 name_column)를 고유값 단위로 해석 (메모 사용)
+# 3. 코드와 주소가 모두 있는 행에서 코드별 시군구를 학습해 다음 실행부터 1 로 처리
+# 반환값: df 와 같은 인덱스의 DataFrame [시도, 시군구]
+def resolve_regions(df, address_column='SCHUL_ADRES', code_column='ADRCD_CD', name_column='ADRCD_NM',
+                    address_memo_path=ADDRESS_MEMO_PATH, code_memo_path=CODE_MEMO_PATH):
+    regions = pd.DataFrame({'시도': np.full(len(df), np.nan, dtype=object),
+                            '시군구': np.full(len(df), np.nan, dtype=object)})
+    prefixes = None
+    if code_column in df.columns:
+        prefixes = sigungu_code_prefixes(df[code_column].to_numpy())
+        regions = resolve_codes(prefixes, code_memo_path)
+
+    source = address_column if address_column in df.columns else name_column
+    unresolved = regions['시군구'].isna().to_numpy()
+    if source in df.columns and unresolved.any():
+        parsed = resolve_addresses(df[source].to_numpy()[unresolved], address_memo_path)
+        regions.loc[unresolved, ['시도', '시군구']] = parsed.to_numpy()
+
+        if prefixes is not None:
+            learnable = pd.DataFrame({'코드': prefixes.to_numpy()[unresolved], '시도': parsed['시도'],
+                                      '시군구': parsed['시군구']}).dropna().drop_duplicates('코드')
+            learnable = learnable[~learnable['코드'].isin(list(SIGUNGU_CODES))]
+            if len(learnable):
+                with _memo_lock:
+                    _update_memo(code_memo_path, {code: (sido, sigungu) for code, sido, sigungu
+                                                  in learnable.itertuples(index=False)})
+
+    regions.index = df.index
+    return regions
+
+
+# 함수: 자치구 라벨 (해석 실패는 UNKNOWN_LABEL)
+# qualify=True 이면 "부산광역시 중구" 처럼 시도를 붙임 (전국 데이터에서 같은 이름의 구를 구분)
+# qualify=None 이면 시도가 둘 이상일 때만 붙임
+def district_labels(regions, qualify=None):
+    if qualify is None:
+        qualify = regions['시도'].nunique() > 1
+    labels = regions['시군구']
+    if qualify:
+        labels = regions['시도'] + ' ' + labels
+    return labels.fillna(UNKNOWN_LABEL)
+
+
+# 함수: 학교급 코드 → 학교유형 (고유 코드 단위 범주 매핑, 결측은 UNKNOWN_LABEL)
+def decode_school_types(codes):
+    codes, uniques = pd.factorize(pd.Series(codes, dtype=object))
+    numbers = pd.to_numeric(pd.Series(uniques, dtype=object).astype(str).str.strip(), errors='coerce')
+    labels = [SCHOOL_TYPE_NAMES.get(int(number), SCHOOL_TYPE_OTHER)
+              if pd.notna(number) and float(number).is_integer() else SCHOOL_TYPE_OTHER for number in numbers]
+    return np.array(labels + [UNKNOWN_LABEL], dtype=object)[codes]
@@ -0,0 +1,88 @@
+import hashlib
+import json
+import os
+
+import pandas as pd
+
+from env_data_preprocessing import CLEANING_VERSION, clean_result_columns
+
+try:
+    import pyarrow.feather as feather
+except ImportError:  # pyarrow 가 없으면 캐시 없이 매번 파싱
+    feather = None
+
+DEFAULT_CACHE_DIR = os.path.join(os.path.expanduser('~'), '.cache', 'seoul_education_proj')
+
+
+# 원본 파일 내용 해시 계산 함수 (대용량 파일도 고정 메모리로 처리)
+def file_content_hash(path, chunk_size=1 << 20):
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(chunk_size), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+# 캐시 키 생성 함수: 파일 내용 해시 + 정제 코드 버전 + 읽기 옵션
+def make_cache_key(path, clean=True, read_options=None):
+    key_source = {
+        'content': file_content_hash(path),
+        'cleaning_version': CLEANING_VERSION if clean else None,
+        'read_options': read_options or {},
+    }
+    return hashlib.sha256(json.dumps(key_source, sort_keys=True, default=str).encode('utf-8')).hexdigest()
+
+
+# 캐시 파일 이름 접두어: 파일 이름 + 원본 절대 경로 해시 + 정제 여부
+# 다른 폴더의 같은 이름 파일(processed/ 와 processed/환경위생/ 등)이 서로의 캐시를 지우지 않도록 경로 해시로 구분
+def cache_file_prefix(path, clean=True):
+    stem = os.path.splitext(os.path.basename(path))[0]
+    path_hash = hashlib.sha256(os.path.abspath(path).encode('utf-8')).hexdigest()[:8]
+    return f"{stem}_{path_hash}_{'clean' if clean else 'raw'}_"
+
+
+# 원본 CSV 로드 함수 (캐시 사용)
+# - clean=True 이면 측정값 컬럼을 clean_result_columns 로 정제한 결과를 캐시
+# - 같은 내용의 파일을 다시 읽으면 CSV 파싱 없이 Feather(Arrow IPC) 파일을 메모리 매핑으로 로드
+# - 파일 내용이나 CLEANING_VERSION 이 바뀌면 키가 달라져 자동으로 새로 파싱
+def load_env_data(path, clean=True, cache_dir=DEFAULT_CACHE_DIR, encoding='utf-8-sig', **read_csv_kwargs):
+    read_options = dict(read_csv_kwargs, encoding=encoding)
+
+    if feather is None or cache_dir is None:
+        df = pd.read_csv(path, **read_options)
+        return clean_result_columns(df) if clean else df
+
+    key = make_cache_key(path, clean, read_options)
+    prefix = cache_file_prefix(path, clean)
+    cache_path = os.path.join(cache_dir, f"{prefix}{key[:16]}.feather")
+
+    if os.path.exists(cache_path):
+        print(f"캐시 사용: {cache_path}")
+        return feather.read_table(cache_path, memory_map=True).to_pandas()
+
+    df = pd.read_csv(path, **read_options)
+    if clean:
+        df = clean_result_columns(df)
+
+    os.makedirs(cache_dir, exist_ok=True)
+    prune_cache(cache_dir, prefix)
+
+    # 임시 파일에 쓴 뒤 교체하여 중단 시에도 손상된 캐시가 남지 않도록 처리
+    tmp_path = cache_path + '.tmp'
+    try:
+        feather.write_feather(df.reset_index(drop=True), tmp_path, compression='uncompressed')
+        os.replace(tmp_path, cache_path)
+        print(f"캐시 저장: {cache_path}")
+    except Exception as e:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        print(f"캐시 저장 실패 ({e}). 캐시 없이 진행합니다.")
+
+    return df
+
+
+# 같은 원본 파일(같은 경로)의 이전 버전 캐시 삭제 함수 (prefix 는 cache_file_prefix 의 반환값)
+def prune_cache(cache_dir, prefix):
+    for name in os.listdir(cache_dir):
+        if name.startswith(prefix) and name.endswith('.feather'):
+            os.remove(os.path.join(cache_dir, name))
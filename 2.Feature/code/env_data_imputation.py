@@ -0,0 +1,80 @@
+import numpy as np
+import pandas as pd
+
+# 대체 출처 라벨 (그룹 수준은 그룹 컬럼 이름, 전체 평균은 GLOBAL_LEVEL_LABEL)
+OBSERVED_LABEL = '원본'
+GLOBAL_LEVEL_LABEL = '전체'
+UNFILLED_LABEL = '미대체'
+
+
+# 함수: 대체 수준 이름 (None → 전체 평균, 컬럼 목록 → '+' 로 연결)
+def level_label(level):
+    if level is None:
+        return GLOBAL_LEVEL_LABEL
+    if isinstance(level, (list, tuple)):
+        return '+'.join(str(key) for key in level)
+    return str(level)
+
+
+# 함수: 그룹 키를 행별 정수 코드로 변환 (키가 결측인 행은 -1)
+def _level_codes(df, level):
+    keys = list(level) if isinstance(level, (list, tuple)) else [level]
+    if len(keys) == 1:
+        codes, groups = pd.factorize(df[keys[0]])
+        return codes, len(groups)
+
+    codes = df.groupby(keys, sort=False, dropna=True).ngroup()
+    codes = codes.fillna(-1).to_numpy(dtype=np.intp)
+    return codes, int(codes.max()) + 1
+
+
+# 함수: 계층적 그룹 평균 대체 (예: 자치구 → 공시년도 10년 그룹 → 전체 평균)
+# - levels: 순서대로 적용할 그룹 수준 목록 (컬럼 이름, 컬럼 이름 목록, 전체 평균은 None)
+# - 수준마다 대상 컬럼 전체를 한 번의 다중 컬럼 groupby 로 평균 내고, 아직 결측인 칸만 벡터 연산으로 채움
+# - 각 수준의 평균은 앞 수준까지 채운 값 기준 (노트북의 fillna 를 차례로 적용한 것과 같은 결과)
+# - 그룹 키가 결측인 행은 해당 수준에서 채우지 않고 다음 수준으로 넘김
+# 반환값: (대체된 DataFrame, 칸별 대체 출처 DataFrame [원본 / 수준 이름 / 미대체])
+def impute_hierarchical(df, columns, levels):
+    columns = list(columns)
+    values = df[columns].to_numpy(dtype=float, copy=True)
+
+    # 출처 코드: 0 = 원본, k + 1 = k 번째 수준, len(levels) + 1 = 미대체
+    unfilled_code = len(levels) + 1
+    source = np.where(np.isnan(values), unfilled_code, 0).astype(np.int8)
+
+    for k, level in enumerate(levels):
+        missing = np.isnan(values)
+        if not missing.any():
+            break
+
+        if level is None:
+            # 값이 하나도 없는 컬럼의 전체 평균은 NaN (채우지 않음)
+            counts = (~missing).sum(axis=0)
+            means = np.where(counts > 0, np.nansum(values, axis=0) / np.maximum(counts, 1), np.nan)
+            fill = np.broadcast_to(means, values.shape)
+        else:
+            codes, n_groups = _level_codes(df, level)
+            in_group = codes >= 0
+            group_means = (pd.DataFrame(values[in_group]).groupby(codes[in_group]).mean()
+                           .reindex(np.arange(n_groups)).to_numpy())
+            fill = np.full(values.shape, np.nan)
+            fill[in_group] = group_means[codes[in_group]]
+
+        filled = missing & ~np.isnan(fill)
+        values[filled] = fill[filled]
+        source[filled] = k + 1
+
+    imputed = df.copy()
+    imputed[columns] = values
+
+    labels = [OBSERVED_LABEL] + [level_label(level) for level in levels] + [UNFILLED_LABEL]
+    provenance = pd.DataFrame(
+        {col: pd.Categorical.from_codes(source[:, i], categories=labels) for i, col in enumerate(columns)},
+        index=df.index
+    )
+    return imputed, provenance
+
+
+# 함수: 컬럼별 대체 출처 건수 요약 (컬럼 × [원본, 수준별, 미대체])
+def imputation_summary(provenance):
+    return pd.DataFrame({col: provenance[col].value_counts(sort=False) for col in provenance.columns}).T
@@ -0,0 +1,125 @@
+import numpy as np
+import pandas as pd
+
+# 정제 규칙이 바뀌면 올려야 하는 버전 (env_data_cache 의 캐시 키에 포함됨)
+CLEANING_VERSION = '2'
+
+# 측정값 컬럼 접미어 (1차, 2차, 3차 결과치)
+RESULT_SUFFIXES = ('_RSLT_NMVL', '_RSLT_NMVL_2', '_RSLT_NMVL_3')
+
+# 측정값 컬럼의 특수 문자열 (앞뒤 공백 제거 후 비교)
+NOT_APPLICABLE_VALUES = ['해당없음', '해당 없음', '해당사항없음']
+NOT_MEASURED_VALUES = ['미실시', '정보없음', '정보 없음', '', '-']
+
+# 특수 문자열 → 값 (전처리용: "해당없음" → 0, "미실시"/"정보없음" → NaN)
+CLEANING_SENTINELS = {**{value: 0.0 for value in NOT_APPLICABLE_VALUES},
+                      **{value: np.nan for value in NOT_MEASURED_VALUES}}
+# 공기질 평가용: "해당없음" 도 측정값 없음으로 보고 제외 (process_multiple_values 와 같은 규칙)
+EVALUATION_SENTINELS = {value: np.nan for value in NOT_APPLICABLE_VALUES + NOT_MEASURED_VALUES}
+
+# 적합성(STB_YN) 컬럼에서 데이터 없음으로 보는 값
+SUITABILITY_NO_DATA_VALUES = ["", "해당없음", "미실시"]
+
+# 파싱 리포트의 기본 분류 (특수 문자열별 건수는 그 사이에 추가)
+PARSE_NUMBER = '숫자'
+PARSE_MISSING = '결측'
+PARSE_INVALID = '변환실패'
+
+
+# 텍스트 정제 및 수치 변환 함수
+def clean_numeric_value(value):
+    if pd.isna(value):
+        return np.nan
+
+    value_str = str(value).strip()
+
+    # "해당없음" → 0
+    if value_str in ['해당없음', '해당 없음', '해당사항없음']:
+        return 0
+
+    # "미실시", "정보없음" → NaN
+    if value_str in ['미실시', '정보없음', '정보 없음', '', '-']:
+        return np.nan
+
+    # 숫자 추출
+    try:
+        return float(value_str)
+    except:
+        return np.nan
+
+
+# 측정값 컬럼 목록 조회 함수
+def find_result_columns(df):
+    return [col for col in df.columns if col.endswith(RESULT_SUFFIXES)]
+
+
+# 함수: 측정값 컬럼 전체를 한 번에 수치 변환
+# - 문자열이 섞인 컬럼들은 값을 모두 모아 고유값 단위로 특수 문자열 조회 + pd.to_numeric 을 한 번만 수행
+#   (비용이 셀 수가 아니라 서로 다른 문자열 수에 비례), 이미 숫자형인 컬럼은 그대로 사용
+# - sentinels: {특수 문자열: 대체 값} (전처리는 CLEANING_SENTINELS, 평가는 EVALUATION_SENTINELS)
+# 반환값: (수치 DataFrame, 컬럼별 분류 건수 리포트 [숫자, 결측, 특수 문자열별, 변환실패])
+def parse_result_columns(df, columns=None, sentinels=CLEANING_SENTINELS):
+    columns = find_result_columns(df) if columns is None else list(columns)
+    sentinel_labels = list(sentinels)
+    sentinel_values = np.array([sentinels[label] for label in sentinel_labels], dtype=float)
+    report_labels = [PARSE_NUMBER, PARSE_MISSING] + sentinel_labels + [PARSE_INVALID]
+    invalid_code = len(report_labels) - 1
+
+    n_rows = len(df)
+    values = np.empty((n_rows, len(columns)))
+    categories = np.empty((n_rows, len(columns)), dtype=np.int16)
+
+    text_positions = []
+    for i, col in enumerate(columns):
+        if pd.api.types.is_numeric_dtype(df[col]) and not pd.api.types.is_bool_dtype(df[col]):
+            values[:, i] = df[col].to_numpy(dtype=float)
+            categories[:, i] = np.isnan(values[:, i])  # 0: 숫자, 1: 결측
+        else:
+            text_positions.append(i)
+
+    if text_positions:
+        stacked = np.concatenate([df[columns[i]].to_numpy(dtype=object) for i in text_positions])
+
+        # 1. 숫자로 바로 변환되는 셀은 pd.to_numeric 한 번으로 처리
+        flat_values = pd.to_numeric(stacked, errors='coerce').astype(float)
+        missing = pd.isna(stacked)
+        flat_categories = missing.astype(np.int16)  # 0: 숫자, 1: 결측
+
+        # 2. 남은 문자열은 고유값 단위로 특수 문자열 조회 (공백 제거 후 숫자가 되는 값은 숫자로 인정)
+        text = np.isnan(flat_values) & ~missing
+        codes, uniques = pd.factorize(stacked[text])
+        unique_text = pd.Series(uniques, dtype=object).astype(str).str.strip()
+        sentinel_index = pd.Index(sentinel_labels).get_indexer(unique_text)
+        numbers = pd.to_numeric(unique_text.where(sentinel_index < 0), errors='coerce').to_numpy(dtype=float)
+
+        is_sentinel = sentinel_index >= 0
+        unique_values = np.where(is_sentinel, sentinel_values[np.where(is_sentinel, sentinel_index, 0)], numbers)
+        unique_categories = np.where(is_sentinel, 2 + sentinel_index, np.where(np.isnan(numbers), invalid_code, 0))
+        flat_values[text] = unique_values[codes]
+        flat_categories[text] = unique_categories[codes]
+
+        values[:, text_positions] = flat_values.reshape(len(text_positions), n_rows).T
+        categories[:, text_positions] = flat_categories.reshape(len(text_positions), n_rows).T
+
+    # 컬럼별 분류 건수 (bincount 한 번)
+    n_labels = len(report_labels)
+    column_index = np.broadcast_to(np.arange(len(columns)), categories.shape)
+    counts = np.bincount((column_index * n_labels + categories).ravel(), minlength=len(columns) * n_labels)
+    report = pd.DataFrame(counts.reshape(len(columns), n_labels), index=pd.Index(columns, name='컬럼'),
+                          columns=report_labels)
+
+    parsed = pd.DataFrame(values, index=df.index, columns=columns)
+    return parsed, report
+
+
+# 측정값 컬럼 전체 정제 함수 (parse_result_columns 로 모든 컬럼을 한 번에 변환)
+# report=True 이면 (정제된 DataFrame, 컬럼별 특수 문자열 리포트) 반환
+def clean_result_columns(df, columns=None, report=False):
+    df = df.copy()
+    parsed, parse_report = parse_result_columns(df, columns, CLEANING_SENTINELS)
+    if len(parsed.columns):
+        df[list(parsed.columns)] = parsed
+
+    if report:
+        return df, parse_report
+    return df
@@ -1,103 +1,54 @@
 import pandas as pd
 import numpy as np
 
-# 함수: 미세먼지(PM10) 단계 평가
-def evaluate_pm10(value):
-    if pd.isna(value) or value == "":
-        return "데이터 없음", 0
+from air_quality_standards import (DEFAULT_REGULATION, NO_DATA_LABEL, OVERALL_GRADE_LABELS,
+                                   OVERALL_GRADE_NO_DATA, classify_column, classify_overall_grade,
+                                   evaluate_band, get_standard)
+from env_data_preprocessing import EVALUATION_SENTINELS, SUITABILITY_NO_DATA_VALUES, parse_result_columns
+
+# 단계 경계값/단계명/점수는 air_quality_standards.POLLUTANT_STANDARDS 에서 일괄 관리
+
+# 평가 항목 (결과 접두어, 측정값 컬럼, 적합성 컬럼, 오염물질 기준 키)
+AIR_QUALITY_ITEMS = [
+    ('PM10_교실', 'MNUT_DST_RSLT_NMVL', 'MNUT_DST_STB_YN', 'PM10'),
+    ('PM10_체육관', 'GMNSM_MNUT_DST_RSLT_NMVL', 'GMNSM_MNUT_DST_STB_YN', 'PM10'),
+    ('PM2.5', 'ULTRA_DST_RSLT_NMVL', 'ULTRA_DST_STB_YN', 'PM2.5'),
+    ('CO2', 'CO2_RSLT_NMVL', 'CO2_STB_YN', 'CO2'),
+    ('CO', 'CO_RSLT_NMVL', 'CO_STB_YN', 'CO'),
+    ('NO2', 'NO2_RSLT_NMVL', 'NO2_STB_YN', 'NO2'),
+    ('O3', 'O3_RSLT_NMVL', 'O3_STB_YN', 'O3'),
+]
+
+SUITABILITY_CATEGORIES = ["적합", "부적합", "데이터 없음"]
+
+# compact_results 에서도 float64 로 유지하는 컬럼
+# 권고 규칙이 기준값과 비교하고 메시지에 찍는 농도, 종합 등급 구간과 비교하는 종합_점수
+# (float32 로 줄이면 149.7 → 149.6 처럼 출력이 바뀌고 기준값 경계의 값이 다른 구간으로 넘어갈 수 있음)
+COMPACT_FLOAT64_COLUMNS = ['PM10_교실_최대값', 'PM2.5_최대값', 'CO2_최대값', '종합_점수']
 
-    value = float(value)
-    if value <= 30:
-        return "좋음", 1
-    elif value <= 50:
-        return "보통(민감군 안전)", 2
-    elif value <= 65:
-        return "보통(민감군 주의)", 3
-    elif value <= 75:
-        return "보통(모두 주의)", 4
-    elif value <= 150:
-        return "나쁨", 5
-    else:
-        return "매우 나쁨", 6
+# 함수: 미세먼지(PM10) 단계 평가
+def evaluate_pm10(value, regulation=DEFAULT_REGULATION):
+    return evaluate_band('PM10', value, regulation)
 
 # 함수: 초미세먼지(PM2.5) 단계 평가
-def evaluate_pm25(value):
-    if pd.isna(value) or value == "":
-        return "데이터 없음", 0
-
-    value = float(value)
-    if value <= 15:
-        return "좋음", 1
-    elif value <= 25:
-        return "보통(민감군 안전)", 2
-    elif value <= 35:
-        return "보통(민감군 주의)", 3
-    elif value <= 50:
-        return "나쁨", 4
-    elif value <= 75:
-        return "매우 나쁨", 5
-    else:
-        return "위험", 6
+def evaluate_pm25(value, regulation=DEFAULT_REGULATION):
+    return evaluate_band('PM2.5', value, regulation)
 
 # 함수: 이산화탄소(CO2) 단계 평가
-def evaluate_co2(value):
-    if pd.isna(value) or value == "":
-        return "데이터 없음", 0
-
-    value = float(value)
-    if value <= 700:
-        return "좋음", 1
-    elif value <= 1000:
-        return "보통", 2
-    elif value <= 1500:
-        return "주의", 3
-    else:
-        return "나쁨", 4
+def evaluate_co2(value, regulation=DEFAULT_REGULATION):
+    return evaluate_band('CO2', value, regulation)
 
 # 함수: 일산화탄소(CO) 단계 평가
-def evaluate_co(value):
-    if pd.isna(value) or value == "":
-        return "데이터 없음", 0
-
-    value = float(value)
-    if value <= 2:
-        return "좋음", 1
-    elif value <= 5:
-        return "보통", 2
-    elif value <= 10:
-        return "주의", 3
-    else:
-        return "나쁨", 4
+def evaluate_co(value, regulation=DEFAULT_REGULATION):
+    return evaluate_band('CO', value, regulation)
 
 # 함수: 이산화질소(NO2) 단계 평가
-def evaluate_no2(value):
-    if pd.isna(value) or value == "":
-        return "데이터 없음", 0
-
-    value = float(value)
-    if value <= 0.03:
-        return "좋음", 1
-    elif value <= 0.05:
-        return "보통", 2
-    elif value <= 0.1:
-        return "주의", 3
-    else:
-        return "나쁨", 4
+def evaluate_no2(value, regulation=DEFAULT_REGULATION):
+    return evaluate_band('NO2', value, regulation)
 
 # 함수: 오존(O3) 단계 평가
-def evaluate_o3(value):
-    if pd.isna(value) or value == "":
-        return "데이터 없음", 0
-
-    value = float(value)
-    if value <= 0.03:
-        return "좋음", 1
-    elif value <= 0.06:
-        return "보통", 2
-    elif value <= 0.1:
-        return "주의", 3
-    else:
-        return "나쁨", 4
+def evaluate_o3(value, regulation=DEFAULT_REGULATION):
+    return evaluate_band('O3', value, regulation)
 
 # 함수: 적합성 여부(Y/N) 평가
 def evaluate_suitability(yn_value):
@@ -233,3 +184,122 @@ def evaluate_air_quality(df):
         lambda x: sum(x == "부적합"), axis=1)
 
     return results
+
+# 함수: 다중 측정값 처리 (컬럼 단위 벡터 연산)
+def process_multiple_values_vectorized(df, base_col, use_max=True):
+    cols = [col for col in [f"{base_col}", f"{base_col}_2", f"{base_col}_3"] if col in df.columns]
+    if len(cols) == 0:
+        return pd.Series(np.nan, index=df.index)
+
+    # 숫자로 변환할 수 없는 값('해당없음' 등)은 NaN 처리 후 제외
+    values = pd.concat([pd.to_numeric(df[col], errors='coerce') for col in cols], axis=1)
+
+    if use_max:
+        return values.max(axis=1)  # 최대값 사용 (보수적 접근)
+    else:
+        return values.mean(axis=1)  # 평균값 사용
+
+# 함수: 적합성 여부(Y/N) 컬럼 일괄 평가
+def evaluate_suitability_vectorized(series):
+    no_data = series.isna() | series.isin(SUITABILITY_NO_DATA_VALUES)
+    return np.where(no_data, "데이터 없음", np.where(series == '적합', "적합", "부적합")).astype(object)
+
+# 함수: 통합 공기질 평가 (컬럼 단위 벡터 연산 버전)
+# evaluate_air_quality 와 동일한 결과를 행 단위 apply/iterrows 없이 계산
+# regulation: air_quality_standards 에 등록된 규정명 (단계 구간 변형 선택)
+# compact: True 이면 compact_results 로 범주형/저정밀 dtype 결과 반환
+def evaluate_air_quality_fast(df, regulation=DEFAULT_REGULATION, compact=False):
+    results = pd.DataFrame(index=df.index)
+    results['학교명'] = df['SCHUL_NM'] if 'SCHUL_NM' in df.columns else df.index
+    results['학교코드'] = df['SCHUL_CODE'] if 'SCHUL_CODE' in df.columns else df.index
+
+    # 모든 측정값 컬럼을 한 번에 수치 변환 ('해당없음'/'미실시' 등은 NaN 처리 후 제외)
+    value_columns = [f"{value_col}{suffix}" for _, value_col, _, _ in AIR_QUALITY_ITEMS
+                     for suffix in ['', '_2', '_3'] if f"{value_col}{suffix}" in df.columns]
+    values, _ = parse_result_columns(df, value_columns, EVALUATION_SENTINELS)
+
+    for prefix, value_col, yn_col, pollutant in AIR_QUALITY_ITEMS:
+        max_values = process_multiple_values_vectorized(values, value_col, True)
+        stages, scores = classify_column(max_values, pollutant, regulation)
+
+        results[f'{prefix}_최대값'] = max_values
+        results[f'{prefix}_단계'] = stages
+        results[f'{prefix}_점수'] = scores
+        results[f'{prefix}_적합성'] = evaluate_suitability_vectorized(df[yn_col])
+
+    # 종합 평가 (가중 평균 점수) - evaluate_air_quality 와 같은 가중치/순서로 누적
+    weights = {
+        'PM10_교실_점수': 0.25,
+        'PM2.5_점수': 0.25,
+        'CO2_점수': 0.15,
+        'CO_점수': 0.1,
+        'NO2_점수': 0.1,
+        'O3_점수': 0.15
+    }
+
+    weighted_sum = np.zeros(len(results))
+    weight_sum = np.zeros(len(results))
+    data_count = np.zeros(len(results), dtype=int)
+
+    for col, weight in weights.items():
+        scores = results[col].to_numpy(dtype=float)
+        present = scores > 0
+        weighted_sum += np.where(present, scores * weight, 0.0)
+        weight_sum += np.where(present, weight, 0.0)
+        data_count += present
+
+    results['데이터_존재_항목수'] = data_count
+
+    # 최소 3개 이상의 데이터가 있는 경우에만 종합 점수 계산
+    valid = (data_count >= 3) & (weight_sum > 0)
+    results['종합_점수'] = np.where(valid, weighted_sum / np.where(valid, weight_sum, 1.0), 0.0)
+
+    # 종합 등급 평가
+    results['종합_등급'] = classify_overall_grade(results['종합_점수'])
+
+    # 부적합 항목 집계
+    unsuitable_columns = ['PM10_교실_적합성', 'PM10_체육관_적합성', 'PM2.5_적합성',
+                          'CO2_적합성', 'CO_적합성', 'NO2_적합성', 'O3_적합성']
+
+    results['부적합_항목수'] = (results[unsuitable_columns] == "부적합").sum(axis=1)
+
+    if compact:
+        results = compact_results(results, regulation)
+
+    return results
+
+# 함수: 평가 결과 압축 (단계/적합성/등급 → 고정 순서 범주형, 점수 → int8, 농도 → float32)
+# 농도의 float32 변환은 손실 압축 (유효숫자 약 7자리) - 권고/등급 기준과 비교하는 COMPACT_FLOAT64_COLUMNS 는 float64 유지
+# 절감된 메모리 정보는 results.attrs['memory_report'] 에 저장
+def compact_results(results, regulation=DEFAULT_REGULATION, verbose=True):
+    before = results.memory_usage(deep=True).sum()
+    compact = results.copy()
+
+    for prefix, _, _, pollutant in AIR_QUALITY_ITEMS:
+        stage_categories = list(get_standard(pollutant, regulation)['labels']) + [NO_DATA_LABEL]
+        if f'{prefix}_최대값' not in COMPACT_FLOAT64_COLUMNS:
+            compact[f'{prefix}_최대값'] = compact[f'{prefix}_최대값'].astype('float32')
+        compact[f'{prefix}_단계'] = pd.Categorical(compact[f'{prefix}_단계'],
+                                                  categories=stage_categories, ordered=True)
+        compact[f'{prefix}_점수'] = compact[f'{prefix}_점수'].astype('int8')
+        compact[f'{prefix}_적합성'] = pd.Categorical(compact[f'{prefix}_적합성'],
+                                                   categories=SUITABILITY_CATEGORIES)
+
+    compact['데이터_존재_항목수'] = compact['데이터_존재_항목수'].astype('int8')
+    compact['종합_등급'] = pd.Categorical(compact['종합_등급'],
+                                      categories=OVERALL_GRADE_LABELS + [OVERALL_GRADE_NO_DATA], ordered=True)
+    compact['부적합_항목수'] = compact['부적합_항목수'].astype('int8')
+
+    after = compact.memory_usage(deep=True).sum()
+    compact.attrs['memory_report'] = {
+        'before_bytes': int(before),
+        'after_bytes': int(after),
+        'saved_bytes': int(before - after),
+        'saved_ratio': float((before - after) / before) if before > 0 else 0.0
+    }
+
+    if verbose:
+        print(f"평가 결과 메모리: {before / 1024 ** 2:.2f}MB → {after / 1024 ** 2:.2f}MB "
+              f"({(before - after) / 1024 ** 2:.2f}MB 절감, {compact.attrs['memory_report']['saved_ratio'] * 100:.1f}%)")
+
+    return compact
@@ -0,0 +1,646 @@
+import hashlib
+import json
+import os
+import shutil
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import matplotlib
+import numpy as np
+import pandas as pd
+import seaborn as sns
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
+
+from aggregation_cube import cube_pivot, get_aggregation_cube
+from binned_density import BINNED_SCATTER_THRESHOLD, binned_pair_grid, draw_binned_scatter_matrix
+from air_quality_standards import DEFAULT_REGULATION, OVERALL_GRADE_LABELS, OVERALL_GRADE_NO_DATA, get_standard
+from compliance_rates import COMPLIANCE_ITEMS, compliance_counts, compliance_rate_matrix
+from env_data_cache import DEFAULT_CACHE_DIR
+from grouped_correlation import bootstrap_correlation_ci, grouped_correlation
+
+# 그림 사양(spec) 형식: 데이터 조각 + 그림 종류 + 라벨을 담은 dict
+# - name: 출력 파일명 (확장자 제외), kind: RENDERERS 의 키
+# - data: 그림에 필요한 최소한의 DataFrame/Series (프로세스 간 전달되므로 집계된 값 위주)
+# - title/xlabel/ylabel, figsize, hlines: [(y, 색, 선 스타일, 범례)], options: 종류별 추가 설정
+DEFAULT_FIGSIZE = (14, 8)
+DEFAULT_FORMATS = ('png',)
+MANIFEST_NAME = 'manifest.json'
+
+# 작업 프로세스에 적용할 기본 matplotlib 설정 (한글 폰트는 rc 인자로 지정)
+DEFAULT_RC = {'axes.unicode_minus': False}
+
+# 렌더링된 그림 캐시 (키: 데이터 조각 해시 + 그림 설정 해시)
+FIGURE_CACHE_DIR = os.path.join(DEFAULT_CACHE_DIR, 'figures')
+FIGURE_CACHE_MAX_BYTES = 512 * 1024 * 1024
+FIGURE_CACHE_MAX_ENTRIES = 5000
+# 그리기 함수가 바뀌면 올려서 이전 캐시를 무효화
+RENDER_VERSION = '1'
+
+
+# 함수: 그림 사양 생성
+def make_spec(name, kind, data, title='', xlabel=None, ylabel=None, figsize=DEFAULT_FIGSIZE, hlines=None, **options):
+    return {
+        'name': name, 'kind': kind, 'data': data,
+        'title': title, 'xlabel': xlabel, 'ylabel': ylabel,
+        'figsize': figsize, 'hlines': hlines or [], 'options': options
+    }
+
+
+# 함수: 기준선 목록 생성 (적합 기준, 권고 기준, 서울시 평균)
+def _reference_lines(standard, seoul_avg=None, avg_fmt='.2f'):
+    unit = standard['unit']
+    thresholds = standard['thresholds']
+    lines = [(thresholds['limit'], 'red', '--', f"적합 기준({thresholds['limit']}{unit})")]
+    if 'advisory' in thresholds and thresholds['advisory'] != thresholds['limit']:
+        lines.append((thresholds['advisory'], 'orange', '--', f"권고 기준({thresholds['advisory']}{unit})"))
+    if seoul_avg is not None and pd.notna(seoul_avg):
+        lines.append((seoul_avg, 'green', '-.', f"서울시 평균: {seoul_avg:{avg_fmt}}{unit}"))
+    return lines
+
+
+# 그림 종류별 그리기 함수 (fig, spec) -> None
+def _draw_bar(fig, spec):
+    ax = fig.add_subplot()
+    series = spec['data']
+    options = spec['options']
+
+    low, high = options.get('cmap_range', (0.3, 0.9))
+    colors = matplotlib.colormaps[options.get('cmap', 'YlOrRd')](np.linspace(low, high, len(series)))
+    ax.bar(np.arange(len(series)), series.to_numpy(dtype=float), color=colors)
+    ax.set_xticks(np.arange(len(series)))
+    ax.set_xticklabels(series.index, rotation=45, ha='right', fontsize=12)
+    ax.grid(axis='y', linestyle='--', alpha=0.7)
+
+    if 'annotate' in options:
+        offset = options.get('annotate_offset', 0)
+        for i, v in enumerate(series):
+            if pd.notna(v):
+                ax.text(i, v + offset, f"{v:{options['annotate']}}", ha='center', fontsize=11)
+
+
+def _draw_stacked_bar(fig, spec):
+    ax = fig.add_subplot()
+    spec['data'].plot(kind='bar', stacked=True, ax=ax, color=spec['options'].get('colors'),
+                      colormap=spec['options'].get('colormap'))
+    ax.tick_params(axis='x', labelrotation=45)
+    for label in ax.get_xticklabels():
+        label.set_ha('right')
+    ax.legend(title=spec['options'].get('legend_title'), fontsize=12)
+    ax.grid(axis='y', linestyle='--', alpha=0.3)
+
+
+def _draw_box(fig, spec):
+    ax = fig.add_subplot()
+    options = spec['options']
+    sns.boxplot(x=options['x'], y=options['y'], data=spec['data'], palette=options.get('palette'), ax=ax)
+    if options.get('rotate_xticks'):
+        ax.tick_params(axis='x', labelrotation=45)
+    ax.grid(axis='y', linestyle='--', alpha=0.7)
+
+
+def _draw_violin(fig, spec):
+    ax = fig.add_subplot()
+    options = spec['options']
+    sns.violinplot(x=options['x'], y=options['y'], data=spec['data'], palette=options.get('palette'), ax=ax)
+    ax.grid(axis='y', linestyle='--', alpha=0.7)
+
+
+def _draw_grouped_bar(fig, spec):
+    ax = fig.add_subplot()
+    options = spec['options']
+    sns.barplot(x=options['x'], y=options['y'], hue=options['hue'], data=spec['data'],
+                palette=options.get('palette'), ax=ax)
+    ax.legend(title=options['hue'], fontsize=12)
+    ax.grid(axis='y', linestyle='--', alpha=0.7)
+
+
+def _draw_heatmap(fig, spec):
+    ax = fig.add_subplot()
+    options = spec['options']
+    matrix = spec['data']
+    mask = np.triu(np.ones_like(matrix, dtype=bool)) if options.get('triangle') else None
+    sns.heatmap(matrix, mask=mask, annot=True, fmt=options.get('fmt', '.2f'), cmap=options.get('cmap', 'YlOrRd'),
+                vmin=options.get('vmin'), vmax=options.get('vmax'), square=options.get('square', False),
+                linewidths=.5, cbar_kws={'label': options['cbar_label']} if 'cbar_label' in options else None, ax=ax)
+
+
+def _draw_scatter_panels(fig, spec):
+    # data: {패널 제목: (x 배열, y 배열)}, 패널마다 산점도 + 1차 회귀선
+    panels = spec['data']
+    for i, (panel_title, (x, y)) in enumerate(panels.items()):
+        ax = fig.add_subplot(1, len(panels), i + 1)
+        ax.scatter(x, y, alpha=0.7)
+        valid = ~(np.isnan(x) | np.isnan(y))
+        if valid.sum() >= 2:
+            slope, intercept = np.polyfit(x[valid], y[valid], 1)
+            grid = np.linspace(x[valid].min(), x[valid].max(), 50)
+            ax.plot(grid, slope * grid + intercept, color='red')
+        ax.set_title(panel_title, fontsize=12)
+        ax.set_xlabel(spec['xlabel'] or '')
+        ax.set_ylabel(spec['ylabel'] or '')
+        ax.grid(True, alpha=0.3)
+
+
+def _draw_scatter_matrix(fig, spec):
+    # 산점도 행렬 (대각선은 히스토그램), hue 가 있으면 그룹별 색상
+    data = spec['data']
+    options = spec['options']
+    columns = options['columns']
+    hue = options.get('hue')
+    groups = list(data.groupby(hue, sort=False)) if hue else [(None, data)]
+    n = len(columns)
+
+    for row, y_col in enumerate(columns):
+        for col, x_col in enumerate(columns):
+            ax = fig.add_subplot(n, n, row * n + col + 1)
+            for group_name, group in groups:
+                if row == col:
+                    ax.hist(group[x_col].dropna(), bins=30, alpha=0.6, label=group_name)
+                else:
+                    ax.scatter(group[x_col], group[y_col], s=8, alpha=0.6, label=group_name)
+            if row == n - 1:
+                ax.set_xlabel(x_col)
+            if col == 0:
+                ax.set_ylabel(y_col)
+
+    if hue:
+        handles, labels = fig.axes[1 if n > 1 else 0].get_legend_handles_labels()
+        fig.legend(handles, labels, title=hue, loc='upper right')
+
+
+def _draw_binned_scatter_matrix(fig, spec):
+    # data: binned_pair_grid 결과 (구간 집계 격자)
+    draw_binned_scatter_matrix(fig, spec['data'], **spec['options'])
+
+
+RENDERERS = {
+    'bar': _draw_bar,
+    'stacked_bar': _draw_stacked_bar,
+    'box': _draw_box,
+    'violin': _draw_violin,
+    'grouped_bar': _draw_grouped_bar,
+    'heatmap': _draw_heatmap,
+    'scatter_panels': _draw_scatter_panels,
+    'scatter_matrix': _draw_scatter_matrix,
+    'binned_scatter_matrix': _draw_binned_scatter_matrix,
+}
+
+# 축 하나에 그리는 그림 종류 (제목/축 라벨/기준선을 공통 처리)
+_SINGLE_AXES_KINDS = {'bar', 'stacked_bar', 'box', 'violin', 'grouped_bar', 'heatmap'}
+
+
+# 함수: 그림 사양 하나를 Agg 캔버스에 그려 파일로 저장 (프로세스 풀 작업 단위)
+# pyplot 상태를 쓰지 않으므로 현재 세션의 백엔드와 무관하게 화면 없이 동작
+# 반환값: 매니페스트 항목 dict
+def render_figure(spec, output_dir, formats=DEFAULT_FORMATS, rc=None, dpi=100):
+    start = time.perf_counter()
+
+    with matplotlib.rc_context(dict(DEFAULT_RC, **(rc or {}))):
+        fig = Figure(figsize=spec['figsize'])
+        FigureCanvasAgg(fig)
+        RENDERERS[spec['kind']](fig, spec)
+
+        if spec['kind'] in _SINGLE_AXES_KINDS:
+            ax = fig.axes[0]
+            ax.set_title(spec['title'], fontsize=16)
+            if spec['xlabel'] is not None:
+                ax.set_xlabel(spec['xlabel'], fontsize=14)
+            if spec['ylabel'] is not None:
+                ax.set_ylabel(spec['ylabel'], fontsize=14)
+            for y, color, style, label in spec['hlines']:
+                ax.axhline(y=y, color=color, linestyle=style, label=label)
+            if spec['hlines']:
+                ax.legend(fontsize=12)
+        else:
+            fig.suptitle(spec['title'], fontsize=16)
+
+        fig.tight_layout()
+
+        files = []
+        for fmt in formats:
+            path = os.path.join(output_dir, f"{spec['name']}.{fmt}")
+            tmp_path = f"{path}.tmp"
+            fig.savefig(tmp_path, format=fmt, dpi=dpi)
+            os.replace(tmp_path, path)
+            files.append(os.path.basename(path))
+
+    return {
+        'name': spec['name'],
+        'kind': spec['kind'],
+        'title': spec['title'],
+        'files': files,
+        'seconds': round(time.perf_counter() - start, 4)
+    }
+
+
+# 함수: 그림 데이터 조각을 해시에 반영 (값, 순서, 인덱스, 컬럼명 모두 포함)
+def _update_data_hash(digest, data):
+    if isinstance(data, (pd.DataFrame, pd.Series)):
+        labels = list(data.columns) if isinstance(data, pd.DataFrame) else data.name
+        digest.update(repr((type(data).__name__, data.shape, labels, list(data.index.names))).encode('utf-8'))
+        digest.update(pd.util.hash_pandas_object(data, index=True).to_numpy().tobytes())
+    elif isinstance(data, np.ndarray):
+        digest.update(repr((data.dtype.str, data.shape)).encode('utf-8'))
+        digest.update(np.ascontiguousarray(data).tobytes())
+    elif isinstance(data, dict):
+        for key, value in data.items():
+            digest.update(repr(key).encode('utf-8'))
+            _update_data_hash(digest, value)
+    elif isinstance(data, (list, tuple)):
+        for value in data:
+            _update_data_hash(digest, value)
+    else:
+        digest.update(repr(data).encode('utf-8'))
+
+
+# 함수: 그림 캐시 키 (데이터 조각 + 그림 종류/제목/기준선/색상/크기 + 출력 형식)
+# 파일명(name)은 키에 포함하지 않으므로 같은 그림은 이름이 달라도 재사용
+def figure_cache_key(spec, formats=DEFAULT_FORMATS, rc=None, dpi=100):
+    settings = {
+        'version': RENDER_VERSION,
+        'kind': spec['kind'], 'title': spec['title'], 'xlabel': spec['xlabel'], 'ylabel': spec['ylabel'],
+        'figsize': spec['figsize'], 'hlines': spec['hlines'], 'options': spec['options'],
+        'formats': list(formats), 'rc': rc or {}, 'dpi': dpi,
+    }
+    digest = hashlib.sha256(json.dumps(settings, sort_keys=True, default=str).encode('utf-8'))
+    _update_data_hash(digest, spec['data'])
+    return digest.hexdigest()
+
+
+# 함수: 파일을 임시 파일로 복사한 뒤 교체
+def _copy_atomic(src, dst):
+    tmp_path = dst + '.tmp'
+    shutil.copyfile(src, tmp_path)
+    os.replace(tmp_path, dst)
+
+
+# 함수: 캐시에 있는 그림을 출력 폴더로 복사 (모든 형식이 있을 때만 적중)
+# 적중한 파일은 수정 시각을 갱신하여 LRU 정리 대상에서 뒤로 미룸
+def _load_cached_figure(spec, key, cache_dir, output_dir, formats):
+    cached_paths = [os.path.join(cache_dir, f"{key}.{fmt}") for fmt in formats]
+    if not all(os.path.exists(path) for path in cached_paths):
+        return None
+
+    start = time.perf_counter()
+    files = []
+    for fmt, cached_path in zip(formats, cached_paths):
+        path = os.path.join(output_dir, f"{spec['name']}.{fmt}")
+        _copy_atomic(cached_path, path)
+        os.utime(cached_path)
+        files.append(os.path.basename(path))
+
+    return {
+        'name': spec['name'],
+        'kind': spec['kind'],
+        'title': spec['title'],
+        'files': files,
+        'seconds': round(time.perf_counter() - start, 4)
+    }
+
+
+# 함수: 렌더링한 그림을 캐시에 저장
+def _store_cached_figure(entry, key, cache_dir, output_dir):
+    for file_name in entry['files']:
+        fmt = os.path.splitext(file_name)[1]
+        _copy_atomic(os.path.join(output_dir, file_name), os.path.join(cache_dir, f"{key}{fmt}"))
+
+
+# 함수: 그림 캐시 정리 (최근 사용 순으로 남기고 용량/개수 초과분 삭제)
+def prune_figure_cache(cache_dir=FIGURE_CACHE_DIR, max_bytes=FIGURE_CACHE_MAX_BYTES,
+                       max_entries=FIGURE_CACHE_MAX_ENTRIES):
+    if not os.path.isdir(cache_dir):
+        return 0
+
+    cached = []
+    for name in os.listdir(cache_dir):
+        path = os.path.join(cache_dir, name)
+        if name.endswith('.tmp') or not os.path.isfile(path):
+            continue
+        stat = os.stat(path)
+        cached.append((stat.st_mtime, stat.st_size, path))
+
+    cached.sort(reverse=True)
+    total_bytes = 0
+    removed = 0
+    for i, (_, size, path) in enumerate(cached):
+        total_bytes += size
+        if i >= max_entries or total_bytes > max_bytes:
+            os.remove(path)
+            removed += 1
+
+    return removed
+
+
+# 함수: 매니페스트 저장 (임시 파일에 쓴 뒤 교체)
+def write_manifest(output_dir, entries, formats, cache_stats=None):
+    manifest = {
+        'created_at': time.strftime('%Y-%m-%d %H:%M:%S'),
+        'formats': list(formats),
+        'figures': entries
+    }
+    if cache_stats is not None:
+        manifest['cache'] = cache_stats
+
+    path = os.path.join(output_dir, MANIFEST_NAME)
+    tmp_path = path + '.tmp'
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, ensure_ascii=False, indent=2)
+    os.replace(tmp_path, path)
+    return path
+
+
+# 함수: 그림 사양 목록을 프로세스 풀에서 병렬 렌더링한 뒤 매니페스트 작성
+# max_workers=None 이면 CPU 코어 수 사용, 1 이면 현재 프로세스에서 순차 실행
+# cache_dir 가 있으면 데이터/설정이 같은 그림은 다시 그리지 않고 캐시에서 복사 (None 이면 캐시 미사용)
+# 매니페스트 항목 순서는 사양 순서와 동일 (실행 순서와 무관)
+def render_figures(specs, output_dir, max_workers=None, formats=DEFAULT_FORMATS, rc=None, dpi=100,
+                   cache_dir=FIGURE_CACHE_DIR, max_cache_bytes=FIGURE_CACHE_MAX_BYTES):
+    if max_workers is None:
+        max_workers = os.cpu_count() or 1
+
+    names = [spec['name'] for spec in specs]
+    if len(set(names)) != len(names):
+        raise ValueError("그림 사양의 name 이 중복되었습니다.")
+
+    os.makedirs(output_dir, exist_ok=True)
+    start = time.perf_counter()
+
+    # 1. 캐시 조회
+    entries = [None] * len(specs)
+    keys = [None] * len(specs)
+    if cache_dir is not None:
+        os.makedirs(cache_dir, exist_ok=True)
+        for i, spec in enumerate(specs):
+            keys[i] = figure_cache_key(spec, formats, rc, dpi)
+            entries[i] = _load_cached_figure(spec, keys[i], cache_dir, output_dir, formats)
+            if entries[i] is not None:
+                entries[i]['cache'] = 'hit'
+
+    # 2. 캐시에 없는 그림만 렌더링
+    pending = [i for i, entry in enumerate(entries) if entry is None]
+    if max_workers == 1 or len(pending) <= 1:
+        rendered = [render_figure(specs[i], output_dir, formats, rc, dpi) for i in pending]
+    else:
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            futures = [executor.submit(render_figure, specs[i], output_dir, formats, rc, dpi) for i in pending]
+            rendered = [future.result() for future in futures]
+
+    for i, entry in zip(pending, rendered):
+        if cache_dir is not None:
+            _store_cached_figure(entry, keys[i], cache_dir, output_dir)
+            entry['cache'] = 'miss'
+        entries[i] = entry
+
+    cache_stats = None
+    if cache_dir is not None:
+        cache_stats = {'hits': len(specs) - len(pending), 'misses': len(pending),
+                       'evicted': prune_figure_cache(cache_dir, max_cache_bytes)}
+
+    write_manifest(output_dir, entries, formats, cache_stats)
+    print(f"그림 {len(entries)}개 렌더링 완료 ({time.perf_counter() - start:.2f}초): {output_dir}")
+    if cache_stats is not None:
+        print(f"그림 캐시: 적중 {cache_stats['hits']}개, 미적중 {cache_stats['misses']}개, "
+              f"정리 {cache_stats['evicted']}개")
+    return entries
+
+
+# 함수: visualize_district_analysis 의 그림 사양 목록
+def district_report_specs(results, regulation=DEFAULT_REGULATION):
+    district_counts = results['자치구'].value_counts()
+    valid_districts = district_counts[district_counts >= 3].index.tolist()
+    if len(valid_districts) < 2:
+        return []
+
+    filtered_results = results[results['자치구'].isin(valid_districts)]
+    cube = get_aggregation_cube(filtered_results)
+    district_means = cube[('자치구',)]
+    specs = []
+
+    # 1~2. 종합 점수/부적합 항목 수 평균
+    for name, col, metric, title, ylabel, cmap, cmap_range in [
+        ('district_01_score', '종합_점수', '종합점수_평균', '자치구별 공기질 종합 점수 평균 (점수가 높을수록 나쁨)',
+         '평균 종합 점수', 'RdYlBu_r', (0, 1)),
+        ('district_02_unsuitable', '부적합_항목수', '부적합항목_평균', '자치구별 평균 부적합 항목 수',
+         '평균 부적합 항목 수', 'Reds', (0.3, 0.9)),
+    ]:
+        seoul_avg = filtered_results[col].mean()
+        specs.append(make_spec(
+            name, 'bar', district_means[metric].sort_values(ascending=False), title, '자치구', ylabel,
+            hlines=[(seoul_avg, 'r', '--', f'서울시 평균: {seoul_avg:.2f}')],
+            cmap=cmap, cmap_range=cmap_range, annotate='.2f', annotate_offset=0.05))
+
+    # 3~5. 오염물질 평균 농도
+    for name, col, metric, pollutant, fmt, offset in [
+        ('district_03_pm10', 'PM10_교실_최대값', 'PM10_평균', 'PM10', '.1f', 1),
+        ('district_04_pm25', 'PM2.5_최대값', 'PM2.5_평균', 'PM2.5', '.1f', 0.5),
+        ('district_05_co2', 'CO2_최대값', 'CO2_평균', 'CO2', '.0f', 25),
+    ]:
+        standard = get_standard(pollutant, regulation)
+        specs.append(make_spec(
+            name, 'bar', district_means[metric].sort_values(ascending=False),
+            f"자치구별 {standard['name']} 평균 농도", '자치구', f"평균 농도({standard['unit']})",
+            hlines=_reference_lines(standard, filtered_results[col].mean(), '.0f' if pollutant == 'CO2' else '.2f'),
+            annotate=fmt, annotate_offset=offset))
+
+    # 6. 종합등급 분포
+    grade_order = [grade for grade in OVERALL_GRADE_LABELS + [OVERALL_GRADE_NO_DATA]
+                   if grade in set(filtered_results['종합_등급'].astype(object))]
+    district_grades = pd.crosstab(filtered_results['자치구'], filtered_results['종합_등급'].astype(object))
+    district_grades = district_grades[grade_order]
+    district_grades_pct = district_grades.div(district_grades.sum(axis=1), axis=0) * 100
+    district_order = district_means['종합점수_평균'].sort_values(ascending=False).index
+    specs.append(make_spec(
+        'district_06_grades', 'stacked_bar', district_grades_pct.reindex(district_order),
+        '자치구별 공기질 종합등급 분포', '자치구', '비율 (%)', figsize=(16, 10),
+        colormap='RdYlGn_r', legend_title='종합 등급'))
+
+    # 7. 학교유형별 자치구 히트맵
+    if '학교유형' in filtered_results.columns:
+        school_type_counts = filtered_results['학교유형'].value_counts()
+        valid_types = school_type_counts[school_type_counts >= 5].index.tolist()
+        if len(valid_types) >= 2:
+            specs.append(make_spec(
+                'district_07_type_score', 'heatmap',
+                cube_pivot(cube, '자치구', '학교유형', '종합점수_평균', cols=valid_types),
+                '학교유형별 자치구 공기질 종합점수 비교', figsize=(12, 10),
+                fmt='.2f', cmap='RdYlGn_r', cbar_label='평균 종합 점수'))
+            specs.append(make_spec(
+                'district_07_type_pm10', 'heatmap',
+                cube_pivot(cube, '자치구', '학교유형', 'PM10_평균', cols=valid_types),
+                '학교유형별 자치구 미세먼지(PM10) 농도 비교', figsize=(12, 10),
+                fmt='.1f', cmap='YlOrRd', cbar_label='평균 PM10 농도(μg/㎥)'))
+
+    # 8. 항목별 부적합률
+    unsuitable_rates = compliance_rate_matrix(filtered_results, '자치구', groups=valid_districts)
+    if not unsuitable_rates.empty:
+        specs.append(make_spec(
+            'district_08_unsuitable_rates', 'heatmap', unsuitable_rates,
+            '자치구별 항목별 부적합률 (%)', figsize=(14, 10), fmt='.1f', cmap='Reds', cbar_label='부적합률 (%)'))
+
+    return specs
+
+
+# 함수: visualize_pollutant_distribution_by_district 의 그림 사양 목록
+def pollutant_distribution_specs(results, regulation=DEFAULT_REGULATION):
+    district_counts = results['자치구'].value_counts()
+    valid_districts = [d for d in district_counts[district_counts >= 3].index if d != "정보 없음"]
+    if len(valid_districts) < 3:
+        return []
+
+    filtered_results = results[results['자치구'].isin(valid_districts)]
+    district_order = get_aggregation_cube(filtered_results)[('자치구',)]['종합점수_평균'] \
+        .sort_values(ascending=False).index
+    suitability_labels = dict(COMPLIANCE_ITEMS)
+    specs = []
+
+    for col, key, suitability_col in [('PM10_교실_최대값', 'PM10', 'PM10_교실_적합성'),
+                                      ('PM2.5_최대값', 'PM2.5', 'PM2.5_적합성'),
+                                      ('CO2_최대값', 'CO2', 'CO2_적합성'),
+                                      ('CO_최대값', 'CO', 'CO_적합성'),
+                                      ('NO2_최대값', 'NO2', 'NO2_적합성'),
+                                      ('O3_최대값', 'O3', 'O3_적합성')]:
+        valid_data = filtered_results.loc[filtered_results[col].notna(), ['자치구', col]]
+        if len(valid_data) < 10:
+            continue
+
+        standard = get_standard(key, regulation)
+        stem = f"pollutant_{key.replace('.', '')}"
+        ylabel = f"{standard['name']} 농도({standard['unit']})"
+
+        specs.append(make_spec(
+            f'{stem}_box', 'box', valid_data, f"자치구별 {standard['name']} 농도 분포", '자치구', ylabel,
+            hlines=_reference_lines(standard), x='자치구', y=col, palette='YlOrRd_r', rotate_xticks=True))
+
+        district_avg = valid_data.groupby('자치구')[col].mean().sort_values(ascending=False)
+        specs.append(make_spec(
+            f'{stem}_mean', 'bar', district_avg, f"자치구별 {standard['name']} 평균 농도", '자치구', ylabel,
+            hlines=_reference_lines(standard, valid_data[col].mean()),
+            annotate='.2f', annotate_offset=standard['thresholds']['limit'] * 0.02))
+
+        if suitability_col in filtered_results.columns:
+            counts = compliance_counts(filtered_results, '자치구', groups=list(district_order),
+                                       items=[(suitability_col, suitability_labels[suitability_col])])
+            shares = counts.set_index('자치구')[['적합', '부적합', '데이터 없음']]
+            shares = shares.div(shares.sum(axis=1), axis=0)[['적합', '부적합']] * 100
+            specs.append(make_spec(
+                f'{stem}_suitability', 'stacked_bar', shares, f"자치구별 {standard['name']} 적합/부적합 비율",
+                '자치구', '비율 (%)', colors=['lightgreen', 'red'], legend_title='적합 여부'))
+
+    return specs
+
+
+# 함수: analyze_by_school_type_and_district 의 그림 사양 목록
+def school_type_specs(results, regulation=DEFAULT_REGULATION):
+    if '학교유형' not in results.columns:
+        return []
+
+    type_counts = results['학교유형'].value_counts()
+    valid_types = type_counts[type_counts >= 5].index.tolist()
+    district_counts = results['자치구'].value_counts()
+    valid_districts = [d for d in district_counts[district_counts >= 3].index if d != "정보 없음"]
+    filtered_results = results[results['학교유형'].isin(valid_types) & results['자치구'].isin(valid_districts)]
+    if len(filtered_results) < 10:
+        return []
+
+    cube = get_aggregation_cube(filtered_results)
+    specs = [make_spec('type_01_score', 'box', filtered_results[['학교유형', '종합_점수']],
+                       '학교유형별 공기질 종합점수 분포', '학교유형', '종합 점수', figsize=(12, 8),
+                       x='학교유형', y='종합_점수', palette='Set3')]
+
+    for name, col, key in [('type_02_pm10', 'PM10_교실_최대값', 'PM10'), ('type_03_pm25', 'PM2.5_최대값', 'PM2.5')]:
+        standard = get_standard(key, regulation)
+        specs.append(make_spec(
+            name, 'violin', filtered_results[['학교유형', col]], f"학교유형별 {standard['name']} 농도 분포",
+            '학교유형', f"농도({standard['unit']})", figsize=(12, 8),
+            hlines=_reference_lines(standard), x='학교유형', y=col, palette='Set2'))
+
+    specs.append(make_spec(
+        'type_04_unsuitable', 'grouped_bar', compliance_counts(filtered_results, '학교유형', groups=valid_types),
+        '학교유형별 항목별 부적합률', '항목', '부적합률(%)', x='항목', y='부적합률(%)', hue='학교유형', palette='Set1'))
+    specs.append(make_spec(
+        'type_05_score_heatmap', 'heatmap', cube_pivot(cube, '자치구', '학교유형', '종합점수_평균'),
+        '학교유형별 자치구별 공기질 종합점수', figsize=(14, 10), fmt='.2f', cmap='RdYlGn_r', cbar_label='평균 종합 점수'))
+    specs.append(make_spec(
+        'type_06_pm10_heatmap', 'heatmap', cube_pivot(cube, '자치구', '학교유형', 'PM10_평균'),
+        '학교유형별 자치구별 미세먼지(PM10) 농도', figsize=(14, 10), fmt='.1f', cmap='YlOrRd',
+        cbar_label='평균 미세먼지 농도(μg/㎥)'))
+
+    return specs
+
+
+# 함수: analyze_air_quality_correlations 의 그림 사양 목록
+def correlation_specs(results):
+    numeric_cols = ['PM10_교실_최대값', 'PM10_체육관_최대값', 'PM2.5_최대값', 'CO2_최대값', 'CO_최대값',
+                    'NO2_최대값', 'O3_최대값', '종합_점수', '부적합_항목수']
+    valid_cols = [col for col in numeric_cols if col in results.columns and results[col].notna().sum() >= 10]
+    if len(valid_cols) < 3:
+        return []
+
+    heatmap_options = dict(fmt='.2f', cmap='coolwarm', vmin=-1, vmax=1, square=True, triangle=True)
+    specs = [make_spec('corr_01_all', 'heatmap', results[valid_cols].corr(), '공기질 지표 간 상관관계',
+                       figsize=(12, 10), **heatmap_options)]
+
+    scatter_cols = [col for col in ['PM10_교실_최대값', 'PM2.5_최대값', 'CO2_최대값', '종합_점수'] if col in valid_cols]
+    if len(scatter_cols) >= 3:
+        hue, hue_levels = None, None
+        scatter_data = results[scatter_cols]
+        if '자치구' in results.columns:
+            hue, hue_levels = '자치구', results['자치구'].value_counts().nlargest(5).index.tolist()
+            scatter_data = results.loc[results['자치구'].isin(hue_levels), scatter_cols + ['자치구']]
+        title = '주요 공기질 지표 간 관계' + (' (자치구별)' if hue else '')
+
+        if len(scatter_data) > BINNED_SCATTER_THRESHOLD:
+            # 행이 많으면 구간 집계 격자만 넘겨서 그리기 (사양 크기/렌더링 비용이 행 수와 무관)
+            specs.append(make_spec('corr_02_scatter_matrix', 'binned_scatter_matrix',
+                                   binned_pair_grid(scatter_data, scatter_cols, hue=hue, hue_levels=hue_levels),
+                                   title, figsize=(14, 12)))
+        else:
+            specs.append(make_spec('corr_02_scatter_matrix', 'scatter_matrix', scatter_data, title,
+                                   figsize=(14, 12), columns=scatter_cols, hue=hue))
+
+    if '학교유형' in results.columns:
+        type_counts = results['학교유형'].value_counts()
+        valid_types = type_counts[type_counts >= 10].index.tolist()
+        if len(valid_types) >= 2:
+            type_corrs = grouped_correlation(results[results['학교유형'].isin(valid_types)], valid_cols, by='학교유형')
+            for i, school_type in enumerate(valid_types):
+                specs.append(make_spec(
+                    f'corr_03_type_{i:02d}', 'heatmap', type_corrs.loc[school_type],
+                    f'{school_type} 공기질 지표 간 상관관계', figsize=(10, 8), **heatmap_options))
+
+    if '자치구' in results.columns and {'PM10_교실_최대값', 'PM2.5_최대값'} <= set(valid_cols):
+        district_counts = results['자치구'].value_counts()
+        main_districts = [d for d in district_counts[district_counts >= 15].index if d != "정보 없음"]
+        if len(main_districts) >= 3:
+            pairs = results.loc[results['자치구'].isin(main_districts), ['자치구', 'PM10_교실_최대값', 'PM2.5_최대값']]
+            district_corrs = bootstrap_correlation_ci(pairs, 'PM10_교실_최대값', 'PM2.5_최대값', by='자치구', min_count=10)
+            district_corrs = district_corrs.dropna(subset=['상관계수']).sort_values('상관계수', ascending=False)
+
+            for name, districts, title in [
+                ('corr_04_high', district_corrs.index[:3], '미세먼지(PM10)와 초미세먼지(PM2.5) 상관관계가 높은 자치구'),
+                ('corr_05_low', district_corrs.index[-3:], '미세먼지(PM10)와 초미세먼지(PM2.5) 상관관계가 낮은 자치구'),
+            ]:
+                panels = {}
+                for district in districts:
+                    district_data = pairs[pairs['자치구'] == district]
+                    corr, lower, upper = district_corrs.loc[district, ['상관계수', '하한', '상한']]
+                    panels[f'{district}\n상관계수: {corr:.2f} [{lower:.2f}, {upper:.2f}]'] = (
+                        district_data['PM10_교실_최대값'].to_numpy(dtype=float),
+                        district_data['PM2.5_최대값'].to_numpy(dtype=float))
+                if panels:
+                    specs.append(make_spec(name, 'scatter_panels', panels, title, 'PM10_교실_최대값', 'PM2.5_최대값',
+                                           figsize=(15, 5)))
+
+    return specs
+
+
+# 함수: 지역별 보고서 전체(자치구/오염물질/학교유형/상관관계 그림)를 화면 없이 병렬 렌더링
+# 반환값: 매니페스트 항목 목록 (output_dir/manifest.json 에도 저장)
+def render_district_report(results, output_dir, max_workers=None, formats=DEFAULT_FORMATS, rc=None,
+                           regulation=DEFAULT_REGULATION, cache_dir=FIGURE_CACHE_DIR):
+    specs = (district_report_specs(results, regulation)
+             + pollutant_distribution_specs(results, regulation)
+             + school_type_specs(results, regulation)
+             + correlation_specs(results))
+    return render_figures(specs, output_dir, max_workers=max_workers, formats=formats, rc=rc, cache_dir=cache_dir)
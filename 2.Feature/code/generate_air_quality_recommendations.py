@@ -1,5 +1,15 @@
+import numpy as np
+import pandas as pd
+
+from air_quality_standards import DEFAULT_REGULATION, get_standard
+
 # 학교별 권고사항 생성 함수
-def generate_recommendations(results):
+# 기준값은 air_quality_standards 에 등록된 규정(regulation)에서 가져옴
+def generate_recommendations(results, regulation=DEFAULT_REGULATION):
+    pm10_limits = get_standard('PM10', regulation)['thresholds']
+    pm25_limits = get_standard('PM2.5', regulation)['thresholds']
+    co2_limits = get_standard('CO2', regulation)['thresholds']
+
     recommendations = []
 
     for idx, row in results.iterrows():
@@ -9,27 +19,27 @@ def generate_recommendations(results):
         # PM10 교실 권고사항
         if not pd.isna(row['PM10_교실_최대값']):
             pm10 = float(row['PM10_교실_최대값'])
-            if pm10 > 75:
-                rec['권고사항'].append(f"교실 미세먼지(PM10)가 {pm10:.1f}μg/㎥로 기준치(75μg/㎥)를 초과함. 실외활동 제한 및 공기청정기 가동 필요")
-            elif pm10 > 65:
+            if pm10 > pm10_limits['limit']:
+                rec['권고사항'].append(f"교실 미세먼지(PM10)가 {pm10:.1f}μg/㎥로 기준치({pm10_limits['limit']}μg/㎥)를 초과함. 실외활동 제한 및 공기청정기 가동 필요")
+            elif pm10 > pm10_limits['caution']:
                 rec['권고사항'].append(f"교실 미세먼지(PM10)가 {pm10:.1f}μg/㎥로 주의 수준. 호흡기 질환자 실외활동 제한 권고")
-            elif pm10 > 50:
+            elif pm10 > pm10_limits['advisory']:
                 rec['권고사항'].append(f"교실 미세먼지(PM10)가 {pm10:.1f}μg/㎥로 민감군 주의 필요. 천식 등 민감군 학생 모니터링")
 
         # PM2.5 권고사항
         if not pd.isna(row['PM2.5_최대값']):
             pm25 = float(row['PM2.5_최대값'])
-            if pm25 > 35:
-                rec['권고사항'].append(f"초미세먼지(PM2.5)가 {pm25:.1f}μg/㎥로 기준치(35μg/㎥)를 초과함. 실내 활동 권고")
-            elif pm25 > 25:
+            if pm25 > pm25_limits['limit']:
+                rec['권고사항'].append(f"초미세먼지(PM2.5)가 {pm25:.1f}μg/㎥로 기준치({pm25_limits['limit']}μg/㎥)를 초과함. 실내 활동 권고")
+            elif pm25 > pm25_limits['advisory']:
                 rec['권고사항'].append(f"초미세먼지(PM2.5)가 {pm25:.1f}μg/㎥로 주의 수준. 민감군 학생 마스크 착용 권고")
 
         # CO2 권고사항
         if not pd.isna(row['CO2_최대값']):
             co2 = float(row['CO2_최대값'])
-            if co2 > 1500:
-                rec['권고사항'].append(f"이산화탄소(CO2)가 {co2:.0f}ppm으로 기준치(1500ppm)를 초과함. 환기 시스템 점검 및 환기 빈도 증가 필요")
-            elif co2 > 1000:
+            if co2 > co2_limits['limit']:
+                rec['권고사항'].append(f"이산화탄소(CO2)가 {co2:.0f}ppm으로 기준치({co2_limits['limit']}ppm)를 초과함. 환기 시스템 점검 및 환기 빈도 증가 필요")
+            elif co2 > co2_limits['advisory']:
                 rec['권고사항'].append(f"이산화탄소(CO2)가 {co2:.0f}ppm으로 주의 수준. 정기적인 환기 권고")
 
         # 종합 등급에 따른 권고사항
@@ -46,3 +56,116 @@ def generate_recommendations(results):
         recommendations.append(rec)
 
     return pd.DataFrame(recommendations)
+
+
+# 권고 규칙 테이블 생성 함수
+# - op: '>' (측정값이 threshold 초과) 또는 '==' (값이 threshold 와 일치)
+# - group: 같은 그룹 안에서는 먼저 발동한 규칙만 적용 (기존 if/elif 순서와 동일)
+def build_recommendation_rules(regulation=DEFAULT_REGULATION):
+    pm10_limits = get_standard('PM10', regulation)['thresholds']
+    pm25_limits = get_standard('PM2.5', regulation)['thresholds']
+    co2_limits = get_standard('CO2', regulation)['thresholds']
+
+    return [
+        {'rule_id': 'PM10_LIMIT', 'group': 'PM10', 'column': 'PM10_교실_최대값', 'op': '>',
+         'threshold': pm10_limits['limit'], 'severity': '높음',
+         'template': "교실 미세먼지(PM10)가 {value:.1f}μg/㎥로 기준치(" + f"{pm10_limits['limit']}" + "μg/㎥)를 초과함. 실외활동 제한 및 공기청정기 가동 필요"},
+        {'rule_id': 'PM10_CAUTION', 'group': 'PM10', 'column': 'PM10_교실_최대값', 'op': '>',
+         'threshold': pm10_limits['caution'], 'severity': '중간',
+         'template': "교실 미세먼지(PM10)가 {value:.1f}μg/㎥로 주의 수준. 호흡기 질환자 실외활동 제한 권고"},
+        {'rule_id': 'PM10_SENSITIVE', 'group': 'PM10', 'column': 'PM10_교실_최대값', 'op': '>',
+         'threshold': pm10_limits['advisory'], 'severity': '낮음',
+         'template': "교실 미세먼지(PM10)가 {value:.1f}μg/㎥로 민감군 주의 필요. 천식 등 민감군 학생 모니터링"},
+        {'rule_id': 'PM25_LIMIT', 'group': 'PM2.5', 'column': 'PM2.5_최대값', 'op': '>',
+         'threshold': pm25_limits['limit'], 'severity': '높음',
+         'template': "초미세먼지(PM2.5)가 {value:.1f}μg/㎥로 기준치(" + f"{pm25_limits['limit']}" + "μg/㎥)를 초과함. 실내 활동 권고"},
+        {'rule_id': 'PM25_CAUTION', 'group': 'PM2.5', 'column': 'PM2.5_최대값', 'op': '>',
+         'threshold': pm25_limits['advisory'], 'severity': '중간',
+         'template': "초미세먼지(PM2.5)가 {value:.1f}μg/㎥로 주의 수준. 민감군 학생 마스크 착용 권고"},
+        {'rule_id': 'CO2_LIMIT', 'group': 'CO2', 'column': 'CO2_최대값', 'op': '>',
+         'threshold': co2_limits['limit'], 'severity': '높음',
+         'template': "이산화탄소(CO2)가 {value:.0f}ppm으로 기준치(" + f"{co2_limits['limit']}" + "ppm)를 초과함. 환기 시스템 점검 및 환기 빈도 증가 필요"},
+        {'rule_id': 'CO2_CAUTION', 'group': 'CO2', 'column': 'CO2_최대값', 'op': '>',
+         'threshold': co2_limits['advisory'], 'severity': '중간',
+         'template': "이산화탄소(CO2)가 {value:.0f}ppm으로 주의 수준. 정기적인 환기 권고"},
+        {'rule_id': 'GRADE_DANGER', 'group': 'GRADE', 'column': '종합_등급', 'op': '==',
+         'threshold': "위험", 'severity': '높음',
+         'template': "공기질 종합 등급이 '위험'으로 평가됨. 즉각적인 조치 필요"},
+        {'rule_id': 'GRADE_CAUTION', 'group': 'GRADE', 'column': '종합_등급', 'op': '==',
+         'threshold': "주의 필요", 'severity': '중간',
+         'template': "공기질 종합 등급이 '주의 필요'로 평가됨. 환기 및 공기질 개선 조치 권고"},
+        {'rule_id': 'UNSUITABLE', 'group': None, 'column': '부적합_항목수', 'op': '>',
+         'threshold': 0, 'severity': '중간',
+         'template': "총 {value:.0f}개 항목이 부적합 판정. 공기질 개선 계획 수립 필요"},
+    ]
+
+# 학교별 권고사항 생성 함수 (규칙 테이블 기반 벡터 연산 버전)
+# 규칙마다 전체 학교에 대한 불리언 마스크를 계산하고, 발동한 행에 대해서만 메시지를 생성
+# 반환값: 학교 × 발동 규칙 한 행씩의 long-form 테이블 (행번호, 학교명, 학교코드, rule_id, severity, message)
+def generate_recommendations_long(results, regulation=DEFAULT_REGULATION):
+    rules = build_recommendation_rules(regulation)
+    n_rows = len(results)
+    school_codes = results['학교코드'] if '학교코드' in results.columns else pd.Series(results.index, index=results.index)
+
+    group_fired = {}
+    frames = []
+
+    for order, rule in enumerate(rules):
+        values = results[rule['column']]
+        if rule['op'] == '>':
+            values = pd.to_numeric(values, errors='coerce')
+            mask = (values > rule['threshold']).to_numpy()
+        else:
+            mask = (values == rule['threshold']).to_numpy()
+
+        # 같은 그룹에서 앞선 규칙이 이미 발동한 행은 제외
+        if rule['group'] is not None:
+            already_fired = group_fired.get(rule['group'], np.zeros(n_rows, dtype=bool))
+            mask = mask & ~already_fired
+            group_fired[rule['group']] = already_fired | mask
+
+        rows = np.flatnonzero(mask)
+        if len(rows) == 0:
+            continue
+
+        fired_values = values.iloc[rows]
+        if rule['op'] == '>':
+            messages = [rule['template'].format(value=float(value)) for value in fired_values]
+        else:
+            messages = [rule['template']] * len(rows)
+
+        frames.append(pd.DataFrame({
+            '행번호': rows,
+            '규칙순서': order,
+            '학교명': results['학교명'].iloc[rows].to_numpy(),
+            '학교코드': school_codes.iloc[rows].to_numpy(),
+            'rule_id': rule['rule_id'],
+            'severity': rule['severity'],
+            'message': messages
+        }))
+
+    columns = ['행번호', '학교명', '학교코드', 'rule_id', 'severity', 'message']
+    if len(frames) == 0:
+        return pd.DataFrame(columns=columns)
+
+    long_df = pd.concat(frames, ignore_index=True)
+    long_df = long_df.sort_values(['행번호', '규칙순서'], kind='stable').reset_index(drop=True)
+
+    return long_df[columns]
+
+# long-form 권고사항을 학교별 리스트 형식(학교명, 권고사항)으로 변환
+def recommendations_from_long(long_df, results):
+    # long-form 은 행번호 순으로 정렬되어 있으므로 행별 시작/끝 위치로 잘라서 리스트 구성
+    messages = long_df['message'].to_numpy()
+    bounds = np.searchsorted(long_df['행번호'].to_numpy(), np.arange(len(results) + 1))
+
+    return pd.DataFrame({
+        '학교명': results['학교명'].to_numpy(),
+        '권고사항': [messages[bounds[i]:bounds[i + 1]].tolist() for i in range(len(results))]
+    })
+
+# 학교별 권고사항 생성 함수 (호환 뷰)
+# generate_recommendations 와 같은 형식(학교명, 권고사항 리스트)으로 long-form 결과를 변환
+def generate_recommendations_fast(results, regulation=DEFAULT_REGULATION):
+    long_df = generate_recommendations_long(results, regulation)
+    return recommendations_from_long(long_df, results)
@@ -0,0 +1,168 @@
+import numpy as np
+import pandas as pd
+
+# 부트스트랩 기본 설정
+DEFAULT_N_BOOT = 1000
+DEFAULT_CI = 0.95
+BOOTSTRAP_BATCH_SIZE = 100
+
+
+# 함수: 그룹 키를 정수 코드로 변환 (by=None 이면 전체를 한 그룹으로)
+# 반환값: (행별 그룹 코드 배열, 그룹 값 Index), 키가 결측인 행의 코드는 -1
+def _group_codes(df, by):
+    if by is None:
+        return np.zeros(len(df), dtype=np.intp), pd.Index(['전체'])
+    codes, groups = pd.factorize(df[by], sort=True)
+    return codes, pd.Index(groups, name=by)
+
+
+# 함수: 그룹 안에서의 순위 (동순위는 평균 순위)
+def _group_rank(values, codes):
+    return pd.Series(values).groupby(codes).rank().to_numpy()
+
+
+# 함수: 그룹별 충분통계량 계산 (모든 그룹을 데이터 한 번 순회로 집계)
+# 두 컬럼 i, j 가 모두 있는 행(pairwise complete) 기준으로
+#   n[g, i, j]   = 행 수
+#   sx[g, i, j]  = Σ x_i,  sxx[g, i, j] = Σ x_i²  (j 가 함께 있는 행만)
+#   sxy[g, i, j] = Σ x_i x_j
+# rank=True 이면 각 컬럼 쌍마다 두 값이 모두 있는 행에서 그룹별 순위로 바꾼 뒤 집계 (spearman 용)
+# 충분통계량(rank=False)은 그룹/청크 단위로 더해서 합칠 수 있음
+def grouped_sufficient_statistics(df, columns, by=None, rank=False):
+    codes, groups = _group_codes(df, by)
+    values = df[columns].apply(pd.to_numeric, errors='coerce').to_numpy(dtype=float)
+
+    in_group = codes >= 0
+    codes = codes[in_group]
+    values = values[in_group]
+
+    valid = ~np.isnan(values)
+    filled = np.where(valid, values, 0.0)
+    n_groups, n_cols = len(groups), len(columns)
+
+    stats = {name: np.zeros((n_groups, n_cols, n_cols)) for name in ['n', 'sx', 'sxx', 'sxy']}
+    for i in range(n_cols):
+        for j in range(i, n_cols):
+            both = valid[:, i] & valid[:, j]
+            if rank:
+                x = np.zeros(len(codes))
+                y = np.zeros(len(codes))
+                x[both] = _group_rank(filled[both, i], codes[both])
+                y[both] = _group_rank(filled[both, j], codes[both])
+            else:
+                x = filled[:, i] * both
+                y = filled[:, j] * both
+
+            n = np.bincount(codes, weights=both, minlength=n_groups)
+            stats['n'][:, i, j] = stats['n'][:, j, i] = n
+            stats['sxy'][:, i, j] = stats['sxy'][:, j, i] = np.bincount(codes, weights=x * y, minlength=n_groups)
+            stats['sx'][:, i, j] = np.bincount(codes, weights=x, minlength=n_groups)
+            stats['sx'][:, j, i] = np.bincount(codes, weights=y, minlength=n_groups)
+            stats['sxx'][:, i, j] = np.bincount(codes, weights=x * x, minlength=n_groups)
+            stats['sxx'][:, j, i] = np.bincount(codes, weights=y * y, minlength=n_groups)
+
+    stats['groups'] = groups
+    stats['columns'] = list(columns)
+    return stats
+
+
+# 함수: 충분통계량에서 피어슨 상관계수 계산 (배열 모양은 그대로 유지)
+# r = (n Σxy - Σx Σy) / sqrt((n Σx² - (Σx)²) (n Σy² - (Σy)²)), 행 수가 min_periods 미만이거나 분산이 0 이면 NaN
+def correlation_from_statistics(n, sx, sxx, sxy, sy=None, syy=None, min_periods=2):
+    if sy is None:
+        # 행렬 형식: (i, j) 의 y 통계량은 (j, i) 위치의 x 통계량
+        sy, syy = np.swapaxes(sx, -1, -2), np.swapaxes(sxx, -1, -2)
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        cov = n * sxy - sx * sy
+        var_x = n * sxx - sx ** 2
+        var_y = n * syy - sy ** 2
+        r = cov / np.sqrt(var_x * var_y)
+
+    r = np.where((n >= max(min_periods, 2)) & (var_x > 0) & (var_y > 0), r, np.nan)
+    return np.clip(r, -1, 1)
+
+
+# 함수: 그룹별 상관계수 행렬 (pearson / spearman)
+# - spearman 은 컬럼 쌍마다 두 값이 모두 있는 행에서 그룹별 순위(동순위는 평균)를 매긴 뒤 피어슨 상관계수 계산
+# 반환값: by=None 이면 컬럼 × 컬럼 DataFrame,
+#         그 외에는 groupby(by)[columns].corr() 와 같은 (그룹, 컬럼) × 컬럼 DataFrame
+def grouped_correlation(df, columns, by=None, method='pearson', min_periods=2):
+    if method not in ('pearson', 'spearman'):
+        raise ValueError(f"지원하지 않는 상관계수 방식입니다: {method}")
+
+    columns = list(columns)
+    stats = grouped_sufficient_statistics(df, columns, by, rank=(method == 'spearman'))
+    corr = correlation_from_statistics(stats['n'], stats['sx'], stats['sxx'], stats['sxy'], min_periods=min_periods)
+
+    if by is None:
+        return pd.DataFrame(corr[0], index=columns, columns=columns)
+
+    index = pd.MultiIndex.from_product([stats['groups'], columns], names=[by, None])
+    return pd.DataFrame(corr.reshape(-1, len(columns)), index=index, columns=columns)
+
+
+# 함수: 그룹별 두 변수 상관계수의 부트스트랩 신뢰구간 (모든 그룹을 한 번에 재표본 추출)
+# - 그룹 안에서 복원추출한 행 인덱스 행렬(반복 × 행)을 만들고, np.add.reduceat 으로 그룹별 충분통계량을 계산
+# - 메모리 사용량을 제한하기 위해 반복을 batch_size 단위로 나누어 처리
+# 반환값: 그룹별 ['표본수', '상관계수', '하한', '상한', '표준오차'] DataFrame
+def bootstrap_correlation_ci(df, x, y, by=None, n_boot=DEFAULT_N_BOOT, ci=DEFAULT_CI, method='pearson',
+                             min_count=3, seed=0, batch_size=BOOTSTRAP_BATCH_SIZE):
+    data = df[[x, y]].apply(pd.to_numeric, errors='coerce')
+    codes, groups = _group_codes(df, by)
+
+    keep = (codes >= 0) & data.notna().all(axis=1).to_numpy()
+    counts = np.bincount(codes[keep], minlength=len(groups))
+    keep &= counts[np.where(codes >= 0, codes, 0)] >= min_count
+
+    order = np.argsort(codes[keep], kind='stable')
+    group_codes = codes[keep][order]
+    xs = data[x].to_numpy(dtype=float)[keep][order]
+    ys = data[y].to_numpy(dtype=float)[keep][order]
+
+    present = np.unique(group_codes)
+    sizes = counts[present]
+    starts = np.concatenate([[0], np.cumsum(sizes)[:-1]])
+    result = pd.DataFrame(index=groups[present])
+    result.index.name = by
+
+    if method == 'spearman':
+        xs, ys = _group_rank(xs, group_codes), _group_rank(ys, group_codes)
+    elif method != 'pearson':
+        raise ValueError(f"지원하지 않는 상관계수 방식입니다: {method}")
+
+    def group_correlations(xb, yb):
+        sums = [np.add.reduceat(values, starts, axis=-1) for values in (xb, yb, xb * xb, yb * yb, xb * yb)]
+        return correlation_from_statistics(sizes, sums[0], sums[2], sums[4], sums[1], sums[3])
+
+    result['표본수'] = sizes
+    result['상관계수'] = group_correlations(xs, ys)
+    if len(xs) == 0:
+        result['하한'] = result['상한'] = result['표준오차'] = np.nan
+        return result
+
+    # 행마다 같은 그룹 안의 임의 위치를 뽑는 복원추출
+    rng = np.random.default_rng(seed)
+    row_starts = np.repeat(starts, sizes)
+    row_sizes = np.repeat(sizes, sizes)
+
+    boot = []
+    for batch_start in range(0, n_boot, batch_size):
+        batch = min(batch_size, n_boot - batch_start)
+        idx = row_starts + (rng.random((batch, len(xs))) * row_sizes).astype(np.intp)
+        if method == 'spearman':
+            # 재표본마다 그룹 안에서 다시 순위를 매김
+            xb = pd.DataFrame(xs[idx].T).groupby(group_codes).rank().to_numpy().T
+            yb = pd.DataFrame(ys[idx].T).groupby(group_codes).rank().to_numpy().T
+        else:
+            xb, yb = xs[idx], ys[idx]
+        boot.append(group_correlations(xb, yb))
+    boot = np.concatenate(boot, axis=0)
+
+    alpha = (1 - ci) / 2
+    with np.errstate(invalid='ignore'):
+        result['하한'] = np.nanquantile(boot, alpha, axis=0)
+        result['상한'] = np.nanquantile(boot, 1 - alpha, axis=0)
+        result['표준오차'] = np.nanstd(boot, axis=0, ddof=1)
+
+    return result
@@ -0,0 +1,86 @@
+import numpy as np
+import pandas as pd
+
+NMVL_SUFFIX = '_RSLT_NMVL'
+NMVL_2_SUFFIX = '_RSLT_NMVL_2'
+MERGE_SUFFIX = '_merge'
+
+
+# 함수: 물질별 NMVL / NMVL_2 컬럼 쌍 찾기
+def find_substance_pairs(df):
+    substance_pairs = []
+    for nmvl_col in df.columns:
+        if not nmvl_col.endswith(NMVL_SUFFIX):
+            continue
+        nmvl_2_col = nmvl_col + '_2'
+        if nmvl_2_col in df.columns:
+            substance_pairs.append({
+                'substance': nmvl_col[:-len(NMVL_SUFFIX)],
+                'nmvl': nmvl_col,
+                'nmvl_2': nmvl_2_col,
+                'merged': nmvl_col + MERGE_SUFFIX
+            })
+    return substance_pairs
+
+
+# 함수: 물질별 NMVL 과 NMVL_2 컬럼을 병합하여 NMVL_merge 컬럼 생성 (3_data_nmvl.ipynb 의 행 단위 루프를 대체)
+# 모든 물질 쌍을 (행 × 물질) 배열로 쌓아 마스크 연산 한 번으로 처리
+#   1. 둘 다 있으면: 평균값
+#   2. NMVL 만 있으면: NMVL 값
+#   3. NMVL_2 만 있으면: NMVL_2 값
+#   4. 둘 다 없으면: 1~3 으로 채운 값들의 전체 평균
+# 반환값: (병합 컬럼이 추가된 DataFrame, 물질별 merge_statistics 목록)
+def merge_nmvl_columns(df, verbose=True):
+    df_merged = df.copy()
+    substance_pairs = find_substance_pairs(df)
+
+    if verbose:
+        print(f"병합할 물질별 컬럼 쌍: {len(substance_pairs)}개")
+    if not substance_pairs:
+        return df_merged, []
+
+    nmvl = df[[pair['nmvl'] for pair in substance_pairs]].to_numpy(dtype=float)
+    nmvl_2 = df[[pair['nmvl_2'] for pair in substance_pairs]].to_numpy(dtype=float)
+    has_nmvl = ~np.isnan(nmvl)
+    has_nmvl_2 = ~np.isnan(nmvl_2)
+    both = has_nmvl & has_nmvl_2
+
+    merged = np.where(both, (nmvl + nmvl_2) / 2, np.where(has_nmvl, nmvl, nmvl_2))
+
+    # 둘 다 없는 칸은 물질별 전체 평균으로 대체 (병합된 값이 하나도 없는 물질은 NaN 유지)
+    filled_counts = (has_nmvl | has_nmvl_2).sum(axis=0)
+    overall_means = np.nansum(merged, axis=0) / np.where(filled_counts > 0, filled_counts, np.nan)
+    merged = np.where(np.isnan(merged), overall_means, merged)
+
+    df_merged[[pair['merged'] for pair in substance_pairs]] = merged
+
+    counts = {
+        'both_available': both.sum(axis=0),
+        'only_nmvl': (has_nmvl & ~has_nmvl_2).sum(axis=0),
+        'only_nmvl_2': (~has_nmvl & has_nmvl_2).sum(axis=0),
+        'both_missing': (~has_nmvl & ~has_nmvl_2).sum(axis=0),
+    }
+
+    merge_statistics = []
+    for i, pair in enumerate(substance_pairs):
+        merge_stat = {'substance': pair['substance']}
+        merge_stat.update({key: int(values[i]) for key, values in counts.items()})
+        merge_stat['total'] = len(df)
+        merge_statistics.append(merge_stat)
+
+        if verbose:
+            print(f"\n=== {pair['substance']} 컬럼 병합 처리 ===")
+            print(f"{pair['nmvl']}: {int(has_nmvl[:, i].sum())}개 데이터 (결측: {int((~has_nmvl[:, i]).sum())}개)")
+            print(f"{pair['nmvl_2']}: {int(has_nmvl_2[:, i].sum())}개 데이터 (결측: {int((~has_nmvl_2[:, i]).sum())}개)")
+            if filled_counts[i] > 0:
+                print(f"전체 평균값: {overall_means[i]:.2f} (결측값 대체용)")
+            else:
+                print("⚠️ 병합할 데이터가 없어서 전체 평균을 계산할 수 없습니다.")
+            print(f"병합 결과:")
+            print(f"  - 둘 다 있음 (평균): {merge_stat['both_available']}건")
+            print(f"  - NMVL만 있음: {merge_stat['only_nmvl']}건")
+            print(f"  - NMVL_2만 있음: {merge_stat['only_nmvl_2']}건")
+            print(f"  - 둘 다 없음 (전체평균): {merge_stat['both_missing']}건")
+            print(f"  - 총 {len(df)}건 처리 완료")
+
+    return df_merged, merge_statistics
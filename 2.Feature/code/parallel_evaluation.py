@@ -0,0 +1,74 @@
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+from air_quality_standards import DEFAULT_REGULATION
+from evaluate_air_quality import evaluate_air_quality_fast
+from generate_air_quality_recommendations import generate_recommendations_long, recommendations_from_long
+
+# 샤드 분할에 사용할 연도/학기 컬럼 후보 (존재하는 컬럼만 사용)
+PERIOD_COLUMNS = ['연도', 'PBAN_YR', 'AY', 'SEM_STR']
+
+
+# 함수: 입력 데이터를 연도/학기 단위 샤드로 분할 (행 위치 배열 목록 반환)
+# 기간이 하나뿐이면 행 범위 기준으로 n_shards 개로 분할
+def make_shards(df, n_shards):
+    period_columns = [col for col in PERIOD_COLUMNS if col in df.columns]
+
+    if period_columns:
+        groups = df.groupby(period_columns, sort=True, dropna=False).indices
+        if len(groups) >= 2:
+            return [(key, positions) for key, positions in groups.items()]
+
+    positions = np.arange(len(df))
+    return [(f"rows_{chunk[0]}-{chunk[-1]}", chunk)
+            for chunk in np.array_split(positions, max(1, min(n_shards, len(df)))) if len(chunk) > 0]
+
+
+# 함수: 샤드 하나에 대한 평가 (프로세스 풀 작업 단위)
+def _evaluate_shard(shard_df, regulation):
+    results = evaluate_air_quality_fast(shard_df, regulation)
+    recommendations = generate_recommendations_long(results, regulation)
+    return results, recommendations
+
+
+# 함수: 샤드별 평가를 ProcessPoolExecutor 로 병렬 실행 후 원래 행 순서대로 결합
+# max_workers=None 이면 CPU 코어 수 사용, 1 이면 현재 프로세스에서 순차 실행
+def evaluate_in_parallel(df, max_workers=None, regulation=DEFAULT_REGULATION):
+    if max_workers is None:
+        max_workers = os.cpu_count() or 1
+
+    shards = make_shards(df, max_workers)
+    print(f"총 {len(shards)}개 샤드, 작업자 {max_workers}개로 평가 시작")
+
+    if max_workers == 1:
+        outputs = [_evaluate_shard(df.iloc[positions], regulation) for _, positions in shards]
+    else:
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            futures = [executor.submit(_evaluate_shard, df.iloc[positions], regulation)
+                       for _, positions in shards]
+            # 제출 순서대로 결과를 모아 실행 순서와 무관하게 결정적인 결과 보장
+            outputs = [future.result() for future in futures]
+
+    # 샤드 결과를 원래 행 순서로 복원
+    all_positions = np.concatenate([positions for _, positions in shards])
+    order = np.argsort(all_positions, kind='stable')
+
+    results = pd.concat([shard_results for shard_results, _ in outputs])
+    results = results.iloc[order]
+    results.index = df.index
+
+    # 권고사항의 행번호를 샤드 내 위치 → 전체 위치로 변환 (같은 행의 규칙 순서는 유지)
+    long_frames = []
+    for (_, positions), (_, shard_recommendations) in zip(shards, outputs):
+        shard_recommendations = shard_recommendations.copy()
+        shard_recommendations['행번호'] = positions[shard_recommendations['행번호'].to_numpy(dtype=int)]
+        long_frames.append(shard_recommendations)
+
+    recommendations_long = pd.concat(long_frames, ignore_index=True)
+    recommendations_long = recommendations_long.sort_values('행번호', kind='stable').reset_index(drop=True)
+    recommendations = recommendations_from_long(recommendations_long, results)
+
+    return results, recommendations, recommendations_long
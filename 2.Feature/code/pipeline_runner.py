@@ -0,0 +1,348 @@
+import argparse
+import hashlib
+import inspect
+import os
+import pickle
+import site
+import sysconfig
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+
+import pandas as pd
+
+from env_data_cache import DEFAULT_CACHE_DIR, file_content_hash
+
+PIPELINE_CACHE_DIR = os.path.join(DEFAULT_CACHE_DIR, 'pipeline')
+
+# 표준 라이브러리/설치된 패키지 위치 (단계 캐시 키의 소스 해시에서 제외)
+_LIBRARY_PATHS = tuple(sorted({os.path.realpath(sysconfig.get_paths()[key])
+                               for key in ('stdlib', 'platstdlib', 'purelib', 'platlib')}
+                              | ({os.path.realpath(site.USER_SITE)} if site.USER_SITE else set())))
+
+
+# 함수: 단계 정의
+# - func(**입력) 은 outputs 순서대로 값을 반환 (출력이 하나면 값 그대로, 없으면 None)
+# - cache=False 이면 출력 캐시 없이 선택될 때마다 실행 (시각화, 파일 저장 등 부수 효과 단계)
+# - exclusive=True 이면 스레드 풀이 아닌 메인 스레드에서 실행 (pyplot 처럼 스레드에 안전하지 않은 단계)
+# - version: 캐시 키에 포함되는 단계 버전 (코드 밖의 이유로 결과가 바뀔 때 직접 올림)
+# - depends: 캐시 키에 포함할 값 (기준 레지스트리, CLEANING_VERSION 등), 모듈을 주면 소스 파일 내용
+def make_stage(name, func, inputs=(), outputs=(), cache=True, exclusive=False, version=None, depends=()):
+    return {'name': name, 'func': func, 'inputs': list(inputs), 'outputs': list(outputs),
+            'cache': cache and bool(outputs), 'exclusive': exclusive,
+            'version': version, 'depends': list(depends)}
+
+
+# 함수: 단계 의존 관계 정리 및 위상 정렬 (입력이 없는 값이나 순환이 있으면 오류)
+# 반환값: (정렬된 단계 이름 목록, {단계: 선행 단계 집합}, {값 이름: 생산 단계})
+def resolve_stage_graph(stages, initial_names=()):
+    producers = {}
+    for stage in stages:
+        for output in stage['outputs']:
+            if output in producers or output in initial_names:
+                raise ValueError(f"'{output}' 값을 만드는 단계가 여러 개입니다.")
+            producers[output] = stage['name']
+
+    dependencies = {}
+    for stage in stages:
+        missing = [name for name in stage['inputs'] if name not in producers and name not in initial_names]
+        if missing:
+            raise ValueError(f"{stage['name']} 단계의 입력을 만드는 단계가 없습니다: {missing}")
+        dependencies[stage['name']] = {producers[name] for name in stage['inputs'] if name in producers}
+
+    order = []
+    visiting = set()
+
+    def visit(name):
+        if name in order:
+            return
+        if name in visiting:
+            raise ValueError(f"단계 의존 관계에 순환이 있습니다: {name}")
+        visiting.add(name)
+        for dependency in sorted(dependencies[name]):
+            visit(dependency)
+        visiting.discard(name)
+        order.append(name)
+
+    for stage in stages:
+        visit(stage['name'])
+
+    return order, dependencies, producers
+
+
+# 함수: 실행할 단계 선택
+# - only: 지정한 단계만 실행 (나머지 입력은 캐시에서 로드)
+# - from_stage: 지정한 단계와 그 하위(후속) 단계 전체 실행
+def select_stages(order, dependencies, from_stage=None, only=None):
+    if only:
+        unknown = [name for name in only if name not in dependencies]
+        if unknown:
+            raise ValueError(f"알 수 없는 단계입니다: {unknown}")
+        return [name for name in order if name in set(only)]
+
+    if from_stage:
+        if from_stage not in dependencies:
+            raise ValueError(f"알 수 없는 단계입니다: {from_stage}")
+        selected = {from_stage}
+        for name in order:
+            if dependencies[name] & selected:
+                selected.add(name)
+        return [name for name in order if name in selected]
+
+    return list(order)
+
+
+# 함수: 함수 코드 지문 (함수 본문이 바뀌면 단계 캐시 무효화)
+def _code_fingerprint(code, digest):
+    digest.update(code.co_code)
+    for const in code.co_consts:
+        if hasattr(const, 'co_code'):
+            _code_fingerprint(const, digest)
+        else:
+            digest.update(repr(const).encode('utf-8'))
+    digest.update(repr(code.co_names).encode('utf-8'))
+
+
+# 함수: 코드 객체가 참조하는 전역 이름 (중첩 함수 포함)
+def _global_names(code):
+    names = set(code.co_names)
+    for const in code.co_consts:
+        if hasattr(const, 'co_code'):
+            names |= _global_names(const)
+    return names
+
+
+# 함수: 객체가 정의된 프로젝트 소스 파일 (표준 라이브러리/설치된 패키지/파일 없는 모듈은 None)
+def _project_source_file(value):
+    module = inspect.getmodule(value)
+    path = getattr(module, '__file__', None)
+    if not path or not path.endswith('.py'):
+        return None
+    path = os.path.realpath(path)
+    return None if path.startswith(_LIBRARY_PATHS) else path
+
+
+# 함수: 모듈과 그 모듈이 참조하는 프로젝트 모듈의 소스 파일 수집
+def _collect_module_files(module, files):
+    path = _project_source_file(module)
+    if path is None or path in files:
+        return
+    files.add(path)
+    for value in list(vars(module).values()):
+        if inspect.ismodule(value) or inspect.isfunction(value) or inspect.isclass(value):
+            dependency = inspect.getmodule(value)
+            if dependency is not None:
+                _collect_module_files(dependency, files)
+
+
+# 함수: 함수가 호출하는 코드 수집
+# - 프로젝트 모듈에 정의된 함수/클래스/모듈 → 그 모듈(과 모듈이 참조하는 프로젝트 모듈)의 소스 파일
+# - 소스 파일이 없는 함수(노트북/exec 로 정의) → 함수 자체를 모으고 그 함수의 전역 이름/클로저도 따라감
+def _collect_dependencies(value, files, funcs):
+    if not (inspect.isfunction(value) or inspect.isclass(value) or inspect.ismodule(value)):
+        return
+    if _project_source_file(value) is not None:
+        _collect_module_files(inspect.getmodule(value), files)
+        return
+    if not inspect.isfunction(value) or value in funcs:
+        return
+
+    funcs.append(value)
+    namespace = value.__globals__
+    for name in sorted(_global_names(value.__code__)):
+        if name in namespace:
+            _collect_dependencies(namespace[name], files, funcs)
+    for cell in value.__closure__ or ():
+        try:
+            _collect_dependencies(cell.cell_contents, files, funcs)
+        except ValueError:  # 아직 값이 없는 클로저 변수
+            pass
+
+
+# 함수: 단계 코드 지문 (단계 함수 + 호출하는 함수 본문 + 프로젝트 모듈 소스 내용)
+# 단계 함수 본문이 같아도 evaluate_air_quality_fast, 기준 레지스트리 모듈 등 호출 대상이 바뀌면 키가 달라짐
+def _dependency_fingerprint(func, digest):
+    files, funcs = set(), []
+    _collect_dependencies(func, files, funcs)
+    if not funcs and hasattr(func, '__code__'):  # 프로젝트 모듈에 정의된 단계 함수도 본문은 포함
+        funcs.append(func)
+    for dependency in funcs:
+        digest.update(dependency.__qualname__.encode('utf-8'))
+        _code_fingerprint(dependency.__code__, digest)
+    _source_fingerprint(files, digest)
+
+
+# 함수: 소스 파일 내용 지문 (파일 이름 + 내용 해시, 프로젝트 위치가 바뀌어도 같은 값)
+def _source_fingerprint(files, digest):
+    for path in sorted(files):
+        digest.update(f"{os.path.basename(path)}={file_content_hash(path)}".encode('utf-8'))
+
+
+# 함수: 초기 입력 값 지문 (파일 경로는 파일 내용, DataFrame 은 내용 해시, 그 외는 pickle)
+def value_fingerprint(value):
+    if isinstance(value, str) and os.path.isfile(value):
+        return 'file:' + file_content_hash(value)
+
+    digest = hashlib.sha256()
+    if isinstance(value, (pd.DataFrame, pd.Series)):
+        digest.update(repr(list(value.columns) if isinstance(value, pd.DataFrame) else value.name).encode('utf-8'))
+        digest.update(pd.util.hash_pandas_object(value, index=True).to_numpy().tobytes())
+    else:
+        digest.update(pickle.dumps(value, protocol=4))
+    return digest.hexdigest()
+
+
+# 함수: 단계 캐시 키 (단계 이름 + 버전 + 함수/호출 대상 코드 + depends 값 + 입력 지문)
+# 단계 출력의 지문은 (단계 키, 출력 이름) 으로 정해지므로 큰 출력 값을 다시 해시할 필요가 없음
+def _stage_key(stage, fingerprints):
+    digest = hashlib.sha256(stage['name'].encode('utf-8'))
+    digest.update(f"version={stage['version']}".encode('utf-8'))
+    _dependency_fingerprint(stage['func'], digest)
+    for value in stage['depends']:
+        if inspect.ismodule(value):
+            files = set()
+            _collect_module_files(value, files)
+            _source_fingerprint(files, digest)
+        else:
+            digest.update(pickle.dumps(value, protocol=4))
+    for name in stage['inputs']:
+        digest.update(f"{name}={fingerprints[name]}".encode('utf-8'))
+    return digest.hexdigest()
+
+
+def _cache_path(cache_dir, stage_name, key):
+    return os.path.join(cache_dir, f"{stage_name}_{key[:16]}.pkl")
+
+
+# 함수: 단계 DAG 실행
+# - 단계별 출력은 입력 지문 기준으로 cache_dir 에 저장되고, 입력이 같으면 실행 없이 재사용
+# - 선행 단계가 끝난 단계들은 스레드 풀에서 동시에 실행 (예: 권고사항/자치구 통계), exclusive 단계는 호출한(메인) 스레드에서 실행
+# - from_stage/only 로 일부만 다시 실행, 선택한 단계는 캐시가 있어도 다시 실행 (force=False 로 변경 가능)
+# 반환값: {값 이름: 값} (실행하거나 캐시에서 읽은 값)
+def run_pipeline(stages, initial, cache_dir=PIPELINE_CACHE_DIR, from_stage=None, only=None,
+                 max_workers=None, force=None):
+    stage_by_name = {stage['name']: stage for stage in stages}
+    order, dependencies, producers = resolve_stage_graph(stages, list(initial))
+    selected = select_stages(order, dependencies, from_stage, only)
+    if force is None:
+        force = bool(from_stage or only)
+    if max_workers is None:
+        max_workers = min(4, os.cpu_count() or 1)
+
+    # 1. 모든 값의 지문과 단계 키를 실행 전에 계산
+    fingerprints = {name: value_fingerprint(value) for name, value in initial.items()}
+    keys = {}
+    for name in order:
+        stage = stage_by_name[name]
+        keys[name] = _stage_key(stage, fingerprints)
+        for output in stage['outputs']:
+            fingerprints[output] = hashlib.sha256(f"{keys[name]}:{output}".encode('utf-8')).hexdigest()
+
+    values = dict(initial)
+    values_lock = threading.Lock()
+    if cache_dir is not None:
+        os.makedirs(cache_dir, exist_ok=True)
+
+    def cached(name):
+        stage = stage_by_name[name]
+        return cache_dir is not None and stage['cache'] and os.path.exists(_cache_path(cache_dir, name, keys[name]))
+
+    # 2. 실제로 실행할 단계 결정 (선택되지 않았거나 캐시가 있는 단계는 건너뜀)
+    to_run = [name for name in selected if force or not cached(name)]
+    status = {name: '캐시' if name in selected else '건너뜀' for name in order}
+
+    def get_value(value_name):
+        with values_lock:
+            if value_name in values:
+                return values[value_name]
+
+            producer = producers[value_name]
+            if not cached(producer):
+                raise RuntimeError(f"'{value_name}' 값이 캐시에 없습니다. --from {producer} 로 다시 실행하세요.")
+            with open(_cache_path(cache_dir, producer, keys[producer]), 'rb') as f:
+                outputs = pickle.load(f)
+            values.update(outputs)
+            return values[value_name]
+
+    def execute(name):
+        stage = stage_by_name[name]
+        inputs = {value_name: get_value(value_name) for value_name in stage['inputs']}
+
+        start = time.perf_counter()
+        returned = stage['func'](**inputs)
+        elapsed = time.perf_counter() - start
+
+        if len(stage['outputs']) == 1:
+            returned = (returned,)
+        outputs = dict(zip(stage['outputs'], returned)) if stage['outputs'] else {}
+
+        if stage['cache'] and cache_dir is not None:
+            path = _cache_path(cache_dir, name, keys[name])
+            tmp_path = f"{path}.{threading.get_ident()}.tmp"
+            with open(tmp_path, 'wb') as f:
+                pickle.dump(outputs, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, path)
+
+        with values_lock:
+            values.update(outputs)
+        return elapsed
+
+    # 3. 선행 단계가 끝난 단계부터 동시에 실행
+    # exclusive 단계는 스레드 풀에 넣지 않고 메인 스레드에서 하나씩 실행 (그동안 다른 단계는 풀에서 계속 실행)
+    start = time.perf_counter()
+    pending = list(to_run)
+    finished = set(order) - set(to_run)
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        running = {}
+        while pending or running:
+            ready = [name for name in pending if dependencies[name] <= finished]
+            for name in ready:
+                if not stage_by_name[name]['exclusive']:
+                    running[executor.submit(execute, name)] = name
+                    pending.remove(name)
+
+            inline = [name for name in ready if stage_by_name[name]['exclusive']]
+            if inline:
+                name = inline[0]
+                pending.remove(name)
+                status[name] = f"실행 ({execute(name):.2f}초)"
+                finished.add(name)
+                continue
+
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in done:
+                name = running.pop(future)
+                status[name] = f"실행 ({future.result():.2f}초)"
+                finished.add(name)
+
+    print(f"===== 파이프라인 실행 결과 ({time.perf_counter() - start:.2f}초) =====")
+    for name in order:
+        print(f"  {name}: {status[name]}")
+
+    return values
+
+
+# 함수: 명령행 인자 파싱 (--from / --only / --list / --no-cache / --workers)
+def parse_pipeline_args(argv=None, description=None):
+    parser = argparse.ArgumentParser(description=description)
+    parser.add_argument('data_file', nargs='?', help='입력 CSV 경로')
+    parser.add_argument('--from', dest='from_stage', help='이 단계와 후속 단계만 다시 실행')
+    parser.add_argument('--only', action='append', help='지정한 단계만 다시 실행 (여러 번 지정 가능, 쉼표 구분 가능)')
+    parser.add_argument('--list', action='store_true', help='단계 목록만 출력')
+    parser.add_argument('--no-cache', action='store_true', help='단계 캐시 사용 안 함')
+    parser.add_argument('--workers', type=int, default=None, help='동시에 실행할 단계 수')
+    args = parser.parse_args(argv)
+
+    if args.only:
+        args.only = [name.strip() for value in args.only for name in value.split(',') if name.strip()]
+    return args
+
+
+# 함수: 단계 목록 출력 (입력 → 출력)
+def describe_pipeline(stages):
+    order, dependencies, _ = resolve_stage_graph(stages, [name for stage in stages for name in stage['inputs']
+                                                          if not any(name in s['outputs'] for s in stages)])
+    stage_by_name = {stage['name']: stage for stage in stages}
+    for name in order:
+        stage = stage_by_name[name]
+        print(f"  {name}: {', '.join(stage['inputs']) or '-'} → {', '.join(stage['outputs']) or '(저장/출력)'}")
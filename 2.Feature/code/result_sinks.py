@@ -0,0 +1,353 @@
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+try:
+    import pyarrow as pa
+    import pyarrow.ipc as pa_ipc
+    import pyarrow.parquet as pq
+except ImportError:  # pyarrow 가 없으면 parquet/arrow 형식 사용 불가
+    pa = None
+
+try:
+    from openpyxl import Workbook
+except ImportError:  # openpyxl 이 없으면 xlsx 형식 사용 불가
+    Workbook = None
+
+# DataFrame 을 나누어 쓸 때의 청크 크기 (행)
+DEFAULT_CHUNK_ROWS = 50000
+
+RESULTS_BASENAME = '학교별_공기질_평가_결과'
+RECOMMENDATIONS_BASENAME = '학교별_공기질_개선_권고사항'
+DISTRICT_WORKBOOK = '자치구별_공기질_분석결과.xlsx'
+# district_analysis 키 → 시트 이름 (save_district_results 와 같은 순서)
+DISTRICT_SHEETS = {
+    'district_stats': '자치구별_종합통계',
+    'district_grades': '자치구별_등급분포',
+    'top5_worst': '공기질_하위5개_자치구',
+    'top5_best': '공기질_상위5개_자치구',
+}
+
+
+# 함수: 임시 파일 경로 (같은 디렉터리에 만들어야 os.replace 가 원자적으로 동작)
+def _temp_path(path):
+    return f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+
+
+# 함수: DataFrame 또는 DataFrame 청크 iterable 을 청크 단위로 순회
+def iter_chunks(data, chunk_rows=DEFAULT_CHUNK_ROWS):
+    if isinstance(data, pd.DataFrame):
+        if len(data) == 0:
+            yield data
+        for start in range(0, len(data), chunk_rows):
+            yield data.iloc[start:start + chunk_rows]
+    else:
+        yield from data
+
+
+# 함수: 값 종류가 섞인 object 컬럼은 문자열로 맞춤 (Parquet/Arrow 저장용, 결측은 그대로)
+def normalize_object_columns(df):
+    df = df.copy()
+    for col in df.columns:
+        if df[col].dtype == object:
+            kinds = {type(value) for value in df[col].dropna()}
+            if len(kinds) > 1:
+                df[col] = df[col].where(df[col].isna(), df[col].astype(str))
+    return df
+
+
+# 결과 저장 싱크 공통 동작
+# - write(chunk) 를 여러 번 호출해 청크 단위로 저장 (파일 전체를 메모리에 만들지 않음)
+# - 임시 파일에 쓰고 close() 에서 최종 경로로 교체하므로, 중간에 실패해도 기존 파일이 깨지지 않음
+class ResultSink:
+    def __init__(self, path, index=False):
+        self.path = path
+        self.index = index
+        self.tmp_path = _temp_path(path)
+        self.rows = 0
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+    def write(self, chunk):
+        if self.index:
+            chunk = chunk.reset_index()
+        self._write(chunk)
+        self.rows += len(chunk)
+
+    def close(self):
+        self._close()
+        os.replace(self.tmp_path, self.path)
+
+    def abort(self):
+        try:
+            self._close()
+        finally:
+            if os.path.exists(self.tmp_path):
+                os.remove(self.tmp_path)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is None:
+            self.close()
+        else:
+            self.abort()
+
+
+# CSV 싱크 (사람이 보는 용도, 엑셀에서 한글이 깨지지 않도록 utf-8-sig)
+class CsvSink(ResultSink):
+    def __init__(self, path, index=False, encoding='utf-8-sig'):
+        super().__init__(path, index)
+        # utf-8-sig 인코더는 BOM 을 파일 맨 앞에 한 번만 씀
+        self.handle = open(self.tmp_path, 'w', encoding=encoding, newline='')
+        self.header = True
+
+    def _write(self, chunk):
+        chunk.to_csv(self.handle, index=False, header=self.header)
+        self.header = False
+
+    def _close(self):
+        if not self.handle.closed:
+            self.handle.close()
+
+
+# 함수: 타입 안에 null 타입이 있는지 확인 (list/large_list/struct 의 자식 타입까지 재귀적으로)
+def _has_null_type(arrow_type):
+    if pa.types.is_null(arrow_type):
+        return True
+    if pa.types.is_list(arrow_type) or pa.types.is_large_list(arrow_type):
+        return _has_null_type(arrow_type.value_type)
+    if pa.types.is_struct(arrow_type):
+        return any(_has_null_type(arrow_type.field(i).type) for i in range(arrow_type.num_fields))
+    return False
+
+
+# 함수: 두 타입 합치기 (left 의 null 부분을 right 의 같은 위치 타입으로 채움, 구조가 다르면 left 유지)
+def _merge_types(left, right):
+    if pa.types.is_null(left):
+        return right
+    if pa.types.is_list(left) and pa.types.is_list(right):
+        return pa.list_(left.value_field.with_type(_merge_types(left.value_type, right.value_type)))
+    if pa.types.is_large_list(left) and pa.types.is_large_list(right):
+        return pa.large_list(left.value_field.with_type(_merge_types(left.value_type, right.value_type)))
+    if pa.types.is_struct(left) and pa.types.is_struct(right):
+        children = {right.field(i).name: right.field(i).type for i in range(right.num_fields)}
+        return pa.struct([left.field(i).with_type(_merge_types(left.field(i).type,
+                                                               children.get(left.field(i).name, left.field(i).type)))
+                          for i in range(left.num_fields)])
+    return left
+
+
+# 함수: 끝까지 값이 없어 남은 null 타입을 문자열 타입으로 바꿈 (자식 타입까지 재귀적으로)
+def _resolve_null_types(arrow_type):
+    if pa.types.is_null(arrow_type):
+        return pa.string()
+    if pa.types.is_list(arrow_type):
+        return pa.list_(arrow_type.value_field.with_type(_resolve_null_types(arrow_type.value_type)))
+    if pa.types.is_large_list(arrow_type):
+        return pa.large_list(arrow_type.value_field.with_type(_resolve_null_types(arrow_type.value_type)))
+    if pa.types.is_struct(arrow_type):
+        return pa.struct([arrow_type.field(i).with_type(_resolve_null_types(arrow_type.field(i).type))
+                          for i in range(arrow_type.num_fields)])
+    return arrow_type
+
+
+# 함수: 청크별 스키마를 하나로 합침 (컬럼마다 앞 청크부터 타입을 합쳐 null 부분을 값이 있는 청크의 타입으로 채움)
+def _merge_schemas(schemas):
+    fields = []
+    for i, field in enumerate(schemas[0]):
+        arrow_type = field.type
+        for schema in schemas[1:]:
+            arrow_type = _merge_types(arrow_type, schema.field(i).type)
+        fields.append(field.with_type(arrow_type))
+    return pa.schema(fields, metadata=schemas[0].metadata)
+
+
+# Arrow 기반 싱크 공통 (파일 스키마를 정한 뒤 모든 청크를 그 스키마로 변환)
+# - schema 를 주면 그대로 사용
+# - 없으면 청크에서 추론하되, 모든 값이 결측인 컬럼(null 타입, 빈 리스트만 있는 list<null> 등 자식 타입 포함)은
+#   값이 나올 때까지 최대 max_buffer_rows 행을 모아 두고 결정 (그때까지 값이 없으면 문자열 타입)
+#   - 첫 청크의 null 타입으로 고정하면 이후 값이 있는 청크를 쓸 수 없음
+class _ArrowSink(ResultSink):
+    def __init__(self, path, index=False, schema=None, max_buffer_rows=DEFAULT_CHUNK_ROWS):
+        if pa is None:
+            raise ImportError("parquet/arrow 형식으로 저장하려면 pyarrow 가 필요합니다.")
+        super().__init__(path, index)
+        self.writer = None
+        self.schema = schema
+        self.max_buffer_rows = max_buffer_rows
+        self.pending = []  # 스키마가 정해지기 전의 청크 (Arrow Table)
+        self.pending_rows = 0
+
+    def _write(self, chunk):
+        table = pa.Table.from_pandas(chunk, preserve_index=False)
+        if self.writer is not None:
+            self.writer.write_table(table.cast(self.schema))
+            return
+
+        self.pending.append(table)
+        self.pending_rows += table.num_rows
+        if self.schema is None:
+            schema = _merge_schemas([pending.schema for pending in self.pending])
+            if any(_has_null_type(field.type) for field in schema) and self.pending_rows < self.max_buffer_rows:
+                return
+        self._flush_pending()
+
+    # 함수: 파일 스키마 확정 후 writer 를 열고 모아 둔 청크 저장
+    def _flush_pending(self):
+        if self.schema is None:
+            schema = _merge_schemas([pending.schema for pending in self.pending])
+            self.schema = pa.schema([field.with_type(_resolve_null_types(field.type)) for field in schema],
+                                    metadata=schema.metadata)
+        self.writer = self._open_writer(self.schema)
+        for table in self.pending:
+            self.writer.write_table(table.cast(self.schema))
+        self.pending = []
+
+    def close(self):
+        if self.writer is None and self.pending:
+            self._flush_pending()
+        super().close()
+
+    def _close(self):
+        if self.writer is not None:
+            self.writer.close()
+            self.writer = None
+
+
+# Parquet 싱크 (분석/기계 처리 용도, 청크마다 row group 하나)
+class ParquetSink(_ArrowSink):
+    def _open_writer(self, schema):
+        return pq.ParquetWriter(self.tmp_path, schema, compression='zstd')
+
+
+# Arrow IPC(Feather v2) 싱크 (pyarrow.feather / pd.read_feather 로 메모리 매핑 로드 가능)
+class ArrowSink(_ArrowSink):
+    def _open_writer(self, schema):
+        return pa_ipc.new_file(self.tmp_path, schema)
+
+
+# 고정 메모리 XLSX 싱크 (openpyxl write-only 모드: 행을 시트 XML 로 바로 흘려 씀)
+# 시트별로 write(chunk, sheet=...) 를 호출하며, 시트는 처음 쓰는 순서대로 생성
+class XlsxSink(ResultSink):
+    def __init__(self, path, index=False):
+        if Workbook is None:
+            raise ImportError("xlsx 형식으로 저장하려면 openpyxl 이 필요합니다.")
+        super().__init__(path, index)
+        self.workbook = Workbook(write_only=True)
+        self.sheets = {}
+
+    def write(self, chunk, sheet='Sheet1'):
+        if self.index:
+            chunk = chunk.reset_index()
+        self._write(chunk, sheet)
+        self.rows += len(chunk)
+
+    def _write(self, chunk, sheet='Sheet1'):
+        worksheet = self.sheets.get(sheet)
+        if worksheet is None:
+            worksheet = self.sheets[sheet] = self.workbook.create_sheet(title=sheet[:31])
+            worksheet.append([_header_label(col) for col in chunk.columns])
+
+        # NaN 은 빈 칸, numpy 스칼라는 파이썬 값으로 변환
+        values = chunk.astype(object).where(chunk.notna(), None).to_numpy()
+        for row in values:
+            worksheet.append([value.item() if isinstance(value, np.generic) else value for value in row])
+
+    def _close(self):
+        if self.workbook is not None:
+            workbook, self.workbook = self.workbook, None
+            if not self.sheets:
+                workbook.create_sheet()
+            workbook.save(self.tmp_path)
+
+
+# 함수: 컬럼 이름을 헤더 문자열로 변환 (다중 컬럼은 '_' 로 연결)
+def _header_label(col):
+    if isinstance(col, tuple):
+        return '_'.join(str(part) for part in col if str(part) != '')
+    return col if isinstance(col, str) else str(col)
+
+
+SINK_TYPES = {
+    'csv': CsvSink,
+    'parquet': ParquetSink,
+    'arrow': ArrowSink,
+    'xlsx': XlsxSink,
+}
+
+# 확장자 → 형식
+SINK_EXTENSIONS = {'.csv': 'csv', '.parquet': 'parquet', '.arrow': 'arrow', '.feather': 'arrow', '.xlsx': 'xlsx'}
+# 형식 → 저장할 때 쓰는 확장자 (SINK_EXTENSIONS 에서 형식별로 먼저 나온 확장자, arrow → .arrow)
+FORMAT_EXTENSIONS = {format: extension for extension, format in reversed(SINK_EXTENSIONS.items())}
+
+
+# 함수: 경로(확장자) 또는 형식 이름으로 싱크 열기
+def open_sink(path, format=None, index=False):
+    if format is None:
+        format = SINK_EXTENSIONS.get(os.path.splitext(path)[1].lower())
+    if format not in SINK_TYPES:
+        raise ValueError(f"지원하지 않는 저장 형식입니다: {format} ({path})")
+    return SINK_TYPES[format](path, index=index)
+
+
+# 함수: 표 하나를 청크 단위로 저장 (data 는 DataFrame 또는 DataFrame 청크 iterable)
+# 반환값: 저장된 행 수
+def write_table(data, path, format=None, index=False, chunk_rows=DEFAULT_CHUNK_ROWS):
+    with open_sink(path, format, index=index) as sink:
+        for chunk in iter_chunks(data, chunk_rows):
+            sink.write(chunk)
+    return sink.rows
+
+
+# 함수: 여러 시트를 고정 메모리 XLSX 통합 문서 하나로 저장 ({시트 이름: DataFrame})
+def write_workbook(sheets, path, index=True, chunk_rows=DEFAULT_CHUNK_ROWS):
+    with XlsxSink(path, index=index) as sink:
+        for sheet, data in sheets.items():
+            for chunk in iter_chunks(data, chunk_rows):
+                sink.write(chunk, sheet=sheet)
+    return sink.rows
+
+
+# 함수: 서로 독립인 저장 작업을 스레드 풀에서 동시에 실행 (파일 I/O, 압축은 GIL 을 놓음)
+# jobs: [(함수, 인자 tuple, 키워드 인자 dict)], 반환값: 작업 순서대로의 반환값 목록
+def write_sinks(jobs, max_workers=None):
+    if max_workers is None:
+        max_workers = min(len(jobs), 4) or 1
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = [executor.submit(func, *args, **(kwargs or {})) for func, args, kwargs in jobs]
+    return [future.result() for future in futures]
+
+
+# 함수: 학교별 결과/권고사항/자치구 통계 저장
+# - 학교별 결과와 권고사항은 formats 의 각 형식으로 저장 (csv: 사람용, parquet/arrow: 기계용)
+# - 자치구 통계는 workbook=True 이면 고정 메모리 XLSX, parquet/arrow 형식이면 시트별 파일로도 저장
+# 반환값: {경로: 저장된 행 수}
+def export_school_results(results, recommendations, district_analysis=None, output_dir='.',
+                          formats=('csv',), workbook=True, max_workers=None):
+    jobs = []
+    for format in formats:
+        extension = FORMAT_EXTENSIONS[format]
+        for data, basename in [(results, RESULTS_BASENAME), (recommendations, RECOMMENDATIONS_BASENAME)]:
+            if data is not None:
+                jobs.append((write_table, (data, os.path.join(output_dir, f"{basename}{extension}"), format), None))
+
+        if district_analysis is not None and format in ('parquet', 'arrow'):
+            for key, sheet in DISTRICT_SHEETS.items():
+                path = os.path.join(output_dir, f"{sheet}{extension}")
+                jobs.append((write_table, (district_analysis[key], path, format), {'index': True}))
+
+    if district_analysis is not None and workbook:
+        sheets = {sheet: district_analysis[key] for key, sheet in DISTRICT_SHEETS.items()}
+        jobs.append((write_workbook, (sheets, os.path.join(output_dir, DISTRICT_WORKBOOK)), None))
+
+    rows = write_sinks(jobs, max_workers)
+    written = {}
+    for (func, args, _), count in zip(jobs, rows):
+        written[args[1]] = count
+    return written
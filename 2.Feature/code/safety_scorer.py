@@ -0,0 +1,152 @@
+import numpy as np
+import pandas as pd
+
+# 물질별 기준값 (concat_all_env_data(수정).ipynb 의 standard_dict)
+STANDARD_DICT = {
+    # 조도 관련
+    'BLKB_ITENI': 300,  # 칠판면 조도
+    'DES_ITENI': 300,   # 책상면 조도
+    'ITENI': 3,         # 조도비 (최대/최소)
+
+    # 소음
+    'NSE': 55,          # 소음
+
+    # 미세먼지
+    'MNUT_DST': 75,     # 미세먼지 PM10 (일반)
+    'GMNSM_MNUT_DST': 150,  # 미세먼지 PM10 (황사시)
+    'ULTRA_DST': 35,    # 미세먼지 PM2.5
+
+    # 화학물질
+    'HCHO': 100,        # 폼알데하이드
+    'CO2_1500': 1500,   # 이산화탄소 1500ppm
+    'CO2_1000': 1000,   # 이산화탄소 1000ppm
+    'AIR_BACT': 800,    # 총부유세균
+    'RN': 148,          # 라돈
+    'O3': 0.06,         # 오존
+    'VOCS': 400,        # 총휘발성유기화합물
+    'BENZENE': 30,      # 벤젠
+    'TOLUENE': 1000,    # 톨루엔
+    'ETHY_BENZENE': 360, # 에틸벤젠
+    'XYLENE': 700,      # 자일렌
+    'STYLENE': 300,     # 스티렌
+    'ASBESTOS': 0.01,   # 석면
+    'CO': 10,           # 일산화탄소
+    'NO2': 0.05,        # 이산화질소
+    'FALL_BACT': 800,   # 낙하세균
+    'MITE': 100         # 진드기
+}
+
+# 물질별 가중치 (1급 발암물질 3.0, 2급 발암물질 2.0, 기타), 목록에 없는 물질은 DEFAULT_WEIGHT
+WEIGHT_DICT = {
+    # 1급 발암물질
+    'ASBESTOS': 3.0,    # 석면
+    'RN': 3.0,          # 라돈
+    'HCHO': 3.0,        # 폼알데하이드
+    'BENZENE': 3.0,     # 벤젠
+
+    # 2급 발암물질
+    'TOLUENE': 2.0,     # 톨루엔
+    'ETHY_BENZENE': 2.0, # 에틸벤젠
+    'XYLENE': 2.0,      # 자일렌
+    'STYLENE': 2.0,     # 스티렌
+
+    # 공기 관련 물질
+    'VOCS': 1.5,        # 총휘발성유기화합물
+    'MNUT_DST': 1.0,    # 미세먼지
+    'GMNSM_MNUT_DST': 1.0,
+    'ULTRA_DST': 1.0,
+    'CO': 1.0,          # 일산화탄소
+    'NO2': 1.0,         # 이산화질소
+    'O3': 1.0,          # 오존
+    'CO2_1500': 1.0,    # 이산화탄소
+    'CO2_1000': 1.0,
+    'AIR_BACT': 1.0,    # 세균
+    'FALL_BACT': 1.0,
+
+    # 기타
+    'BLKB_ITENI': 0.5,  # 조도
+    'DES_ITENI': 0.5,
+    'ITENI': 0.5,
+    'NSE': 1.0,         # 소음
+    'MITE': 1.0         # 진드기
+}
+DEFAULT_WEIGHT = 1.0
+
+# 안전등급 구간 (총점이 경계값 이하이면 해당 등급, get_grade 와 같은 규칙)
+SAFETY_GRADE_CUTS = np.array([0.4, 0.5, 0.55, 0.75])
+SAFETY_GRADE_LABELS = np.array(['A', 'B', 'C', 'D', 'E'], dtype=object)
+
+MAX_SUFFIX = '_MAX'
+
+
+# 함수: 기준값/가중치를 물질 순서의 벡터로 컴파일
+# - materials 를 주지 않으면 df 에 '{물질}_MAX' 컬럼이 있는 물질만 STANDARD_DICT 순서로 사용
+def compile_scorer(df=None, materials=None, standards=STANDARD_DICT, weights=WEIGHT_DICT):
+    if materials is None:
+        materials = [m for m in standards if df is None or f"{m}{MAX_SUFFIX}" in df.columns]
+    materials = list(materials)
+
+    return {
+        'materials': materials,
+        'standards': np.array([standards[m] for m in materials], dtype=float),
+        'weights': np.array([weights.get(m, DEFAULT_WEIGHT) for m in materials], dtype=float),
+    }
+
+
+# 함수: 가중치 묶음을 (가중치 조합 수 × 물질 수) 행렬로 변환
+# weight_batch: 행렬/배열, {물질: 가중치} 목록, 또는 물질 컬럼을 가진 DataFrame (빠진 물질은 기본 가중치)
+def weight_matrix(weight_batch, scorer):
+    if isinstance(weight_batch, pd.DataFrame):
+        return (weight_batch.reindex(columns=scorer['materials'])
+                .fillna(pd.Series(scorer['weights'], index=scorer['materials'])).to_numpy(dtype=float))
+    if len(weight_batch) and isinstance(weight_batch[0], dict):
+        return np.array([[weights.get(m, w) for m, w in zip(scorer['materials'], scorer['weights'])]
+                         for weights in weight_batch], dtype=float)
+    return np.atleast_2d(np.asarray(weight_batch, dtype=float))
+
+
+# 함수: 물질별 위험도 점수 행렬 (학교 × 물질) = 측정값 / 기준값, 결측이나 기준값 0 이면 0
+def score_matrix(df, scorer):
+    values = df[[f"{m}{MAX_SUFFIX}" for m in scorer['materials']]].to_numpy(dtype=float)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        scores = values / scorer['standards']
+    return np.where(np.isnan(values) | (scorer['standards'] == 0), 0.0, scores)
+
+
+# 함수: 총점 → 안전등급 (구간 경계값에 대한 np.searchsorted, NaN 은 E)
+def grade_scores(total_scores):
+    return SAFETY_GRADE_LABELS[np.searchsorted(SAFETY_GRADE_CUTS, total_scores, side='left')]
+
+
+# 함수: 학교별 점수/가중 점수/총점/안전등급 계산 (노트북의 _SCORE, _WEIGHTED, TOTAL_WEIGHTED_SCORE, SAFETY_GRADE)
+# 총점은 물질별 가중 점수의 평균 = 점수 행렬 @ 가중치 / 물질 수
+def score_schools(df, scorer=None):
+    if scorer is None:
+        scorer = compile_scorer(df)
+
+    scores = score_matrix(df, scorer)
+    weighted = scores * scorer['weights']
+    total = weighted.mean(axis=1) if len(scorer['materials']) else np.full(len(df), np.nan)
+
+    result = pd.concat([
+        pd.DataFrame(scores, index=df.index, columns=[f"{m}_SCORE" for m in scorer['materials']]),
+        pd.DataFrame(weighted, index=df.index, columns=[f"{m}_WEIGHTED" for m in scorer['materials']]),
+    ], axis=1)
+    result['TOTAL_WEIGHTED_SCORE'] = total
+    result['SAFETY_GRADE'] = grade_scores(total)
+    return result
+
+
+# 함수: 여러 가중치 조합을 한 번에 평가 (정책 시뮬레이션/민감도 분석용)
+# 반환값: (총점 DataFrame [학교 × 가중치 조합], 안전등급 DataFrame [학교 × 가중치 조합])
+def score_weight_batch(df, weight_batch, scorer=None):
+    if scorer is None:
+        scorer = compile_scorer(df)
+
+    weights = weight_matrix(weight_batch, scorer)
+    totals = score_matrix(df, scorer) @ weights.T / len(scorer['materials'])
+
+    columns = weight_batch.index if isinstance(weight_batch, pd.DataFrame) else pd.RangeIndex(len(weights))
+    total_df = pd.DataFrame(totals, index=df.index, columns=columns)
+    grade_df = pd.DataFrame(grade_scores(totals), index=df.index, columns=columns)
+    return total_df, grade_df
@@ -0,0 +1,381 @@
+import json
+import os
+import re
+
+import numpy as np
+import pandas as pd
+from matplotlib.path import Path
+
+# 환경위생 등급별 마커 색상 (기존 Folium 지도와 동일)
+SAFETY_GRADE_COLORS = {'A': 'green', 'B': 'blue', 'C': 'orange', 'D': 'red', 'E': 'purple'}
+NO_GRADE_COLOR = 'gray'
+SAFETY_GRADE_DESCRIPTIONS = {'A': '매우 안전', 'B': '양호', 'C': '보통', 'D': '위험', 'E': '매우 위험'}
+HIGH_RISK_GRADES = ['D', 'E']
+
+# 자치구 단계구분도 색상 (D/E 등급 학교 수, YlOrRd 6단계)
+CHOROPLETH_COLORS = ['#ffffb2', '#fed976', '#feb24c', '#fd8d3c', '#f03b20', '#bd0026']
+
+# 좌표 소수점 자릿수 (5자리 ≈ 1m) 및 경계 단순화 허용 오차 (도 단위, 0.0003 ≈ 30m)
+COORD_PRECISION = 5
+SIMPLIFY_TOLERANCE = 0.0003
+
+MAP_DATA_DIR = 'data'
+
+
+# 함수: Douglas-Peucker 선 단순화 (points: [n, 2] 배열, 시작/끝 점은 항상 유지)
+def simplify_line(points, tolerance=SIMPLIFY_TOLERANCE):
+    points = np.asarray(points, dtype=float)
+    if len(points) <= 2:
+        return points
+
+    keep = np.zeros(len(points), dtype=bool)
+    keep[[0, -1]] = True
+    stack = [(0, len(points) - 1)]
+
+    while stack:
+        start, end = stack.pop()
+        if end - start < 2:
+            continue
+
+        segment = points[end] - points[start]
+        inner = points[start + 1:end] - points[start]
+        length = np.hypot(*segment)
+        if length == 0:
+            distances = np.hypot(inner[:, 0], inner[:, 1])
+        else:
+            distances = np.abs(segment[0] * inner[:, 1] - segment[1] * inner[:, 0]) / length
+
+        farthest = int(np.argmax(distances))
+        if distances[farthest] > tolerance:
+            split = start + 1 + farthest
+            keep[split] = True
+            stack.extend([(start, split), (split, end)])
+
+    return points[keep]
+
+
+# 함수: 폴리곤 고리 단순화 (닫힌 고리는 최소 4개 점 유지, 너무 작아진 내부 고리는 제거)
+def _simplify_ring(ring, tolerance, precision, exterior):
+    ring = np.asarray(ring, dtype=float)
+    simplified = simplify_line(ring, tolerance)
+    if len(simplified) < 4:
+        if not exterior:
+            return None
+        # 외곽 고리는 없어지지 않도록 일정 간격으로 점을 남김
+        simplified = ring[np.unique(np.linspace(0, len(ring) - 1, min(len(ring), 5)).astype(int))]
+    return np.round(simplified, precision).tolist()
+
+
+# 함수: Polygon/MultiPolygon geometry 단순화 + 좌표 자릿수 축소
+def simplify_geometry(geometry, tolerance=SIMPLIFY_TOLERANCE, precision=COORD_PRECISION):
+    def simplify_polygon(rings):
+        simplified = [_simplify_ring(ring, tolerance, precision, exterior=(i == 0)) for i, ring in enumerate(rings)]
+        return [ring for ring in simplified if ring is not None]
+
+    if geometry['type'] == 'Polygon':
+        return {'type': 'Polygon', 'coordinates': simplify_polygon(geometry['coordinates'])}
+    if geometry['type'] == 'MultiPolygon':
+        return {'type': 'MultiPolygon', 'coordinates': [simplify_polygon(p) for p in geometry['coordinates']]}
+    raise ValueError(f"지원하지 않는 geometry 형식입니다: {geometry['type']}")
+
+
+# 함수: 자치구 경계 레이어 생성 (단순화된 경계 + 코드/이름 속성만 유지)
+def build_district_layer(geojson, code_field='SIG_CD', name_field='SIG_KOR_NM',
+                         tolerance=SIMPLIFY_TOLERANCE, precision=COORD_PRECISION):
+    features = []
+    for feature in geojson['features']:
+        features.append({
+            'type': 'Feature',
+            'properties': {'code': feature['properties'][code_field], 'name': feature['properties'][name_field]},
+            'geometry': simplify_geometry(feature['geometry'], tolerance, precision)
+        })
+    return {'type': 'FeatureCollection', 'features': features}
+
+
+# 함수: 학교 좌표가 속한 자치구 찾기 (경계 레이어 기준 point-in-polygon, 내부 고리는 구멍으로 처리)
+def assign_districts(lat, lon, district_layer):
+    points = np.column_stack([np.asarray(lon, dtype=float), np.asarray(lat, dtype=float)])
+    districts = np.full(len(points), None, dtype=object)
+
+    for feature in district_layer['features']:
+        polygons = feature['geometry']['coordinates']
+        if feature['geometry']['type'] == 'Polygon':
+            polygons = [polygons]
+
+        inside = np.zeros(len(points), dtype=bool)
+        for rings in polygons:
+            in_polygon = Path(rings[0]).contains_points(points)
+            for hole in rings[1:]:
+                in_polygon &= ~Path(hole).contains_points(points)
+            inside |= in_polygon
+
+        districts[inside & pd.isna(districts)] = feature['properties']['name']
+
+    return districts
+
+
+# 함수: 자치구별 D/E 등급 학교 수
+def district_risk_counts(schools, grade_col='SAFETY_GRADE', district_col='자치구'):
+    high_risk = schools[schools[grade_col].isin(HIGH_RISK_GRADES)]
+    return high_risk.groupby(district_col).size().sort_index()
+
+
+# 함수: 단계구분도 색상 (값 범위를 CHOROPLETH_COLORS 단계 수로 균등 분할)
+def choropleth_colors(values):
+    values = pd.Series(values, dtype=float)
+    if values.empty:
+        return {}
+
+    low, high = values.min(), values.max()
+    if high == low:
+        codes = np.zeros(len(values), dtype=int)
+    else:
+        codes = np.minimum(((values - low) / (high - low) * len(CHOROPLETH_COLORS)).astype(int),
+                           len(CHOROPLETH_COLORS) - 1)
+    return {name: CHOROPLETH_COLORS[code] for name, code in zip(values.index, np.asarray(codes))}
+
+
+# 함수: 학교 위치 레이어 생성 (속성은 짧은 키 n: 학교명, g: 등급, d: 자치구)
+# 자치구별 D/E 등급 학교 수와 단계구분도 색상을 district_stats 항목으로 함께 저장
+def build_school_layer(schools, lat_col='위도', lon_col='경도', name_col='학교명', grade_col='SAFETY_GRADE',
+                       district_col='자치구', precision=COORD_PRECISION):
+    schools = schools[schools[lat_col].notna() & schools[lon_col].notna()]
+
+    lat = np.round(schools[lat_col].to_numpy(dtype=float), precision)
+    lon = np.round(schools[lon_col].to_numpy(dtype=float), precision)
+    names = schools[name_col].astype(str).to_numpy()
+    grades = schools[grade_col].where(schools[grade_col].notna(), None).to_numpy()
+    districts = schools[district_col].where(schools[district_col].notna(), None).to_numpy()
+
+    features = [
+        {'type': 'Feature', 'geometry': {'type': 'Point', 'coordinates': [x, y]},
+         'properties': {'n': n, 'g': g, 'd': d}}
+        for x, y, n, g, d in zip(lon.tolist(), lat.tolist(), names, grades, districts)
+    ]
+
+    risk_counts = district_risk_counts(schools, grade_col, district_col)
+    colors = choropleth_colors(risk_counts)
+    district_stats = {name: {'high_risk': int(count), 'color': colors[name]} for name, count in risk_counts.items()}
+
+    return {'type': 'FeatureCollection', 'features': features, 'district_stats': district_stats}
+
+
+# 함수: 기존 Folium 지도 HTML 에서 자치구 경계와 학교 마커(좌표, 학교명, 등급) 추출
+# 반환값: (자치구 GeoJSON dict, 학교 DataFrame[학교명, SAFETY_GRADE, 위도, 경도])
+def extract_folium_map_data(html_path):
+    with open(html_path, encoding='utf-8') as f:
+        html = f.read()
+
+    match = re.search(r'geo_json_\w+_add\((\{.*?\})\);?\s*\n', html)
+    if match is None:
+        raise ValueError(f"자치구 경계 데이터를 찾을 수 없습니다: {html_path}")
+    geojson = json.loads(match.group(1))
+
+    marker_pattern = re.compile(
+        r'L\.marker\(\s*\[([-\d.]+),\s*([-\d.]+)\].*?'
+        r'<b>학교명:</b>\s*(.*?)<br><b>SAFETY GRADE:</b>\s*(.*?)</div>',
+        re.S)
+    rows = [(name.strip(), grade.strip() or None, float(lat), float(lon))
+            for lat, lon, name, grade in marker_pattern.findall(html)]
+    schools = pd.DataFrame(rows, columns=['학교명', 'SAFETY_GRADE', '위도', '경도'])
+
+    return geojson, schools
+
+
+# 함수: 데이터 파일 쓰기 (file:// 로 열어도 동작하도록 JSON 을 registerMapData 호출로 감싼 스크립트)
+def _write_data_script(path, key, payload):
+    body = json.dumps(payload, ensure_ascii=False, separators=(',', ':'))
+    tmp_path = path + '.tmp'
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        f.write(f"registerMapData({json.dumps(key, ensure_ascii=False)},{body});\n")
+    os.replace(tmp_path, path)
+    return os.path.getsize(path)
+
+
+# 함수: 지도 출력 (공용 HTML 껍데기 + 분리된 데이터 파일)
+# output_dir/
+#   index.html              공용 껍데기 (Leaflet + 마커 클러스터, 학기 전환)
+#   data/districts.js       단순화된 자치구 경계 (학기 공통)
+#   data/schools_<학기>.js  학교 위치/등급 + 자치구별 D/E 학교 수
+#   data/semesters.js       학기 목록 (학기를 추가해도 껍데기는 그대로)
+# semester_layers: {학기명: build_school_layer 결과}, 기존 학기 파일은 그대로 두고 목록만 갱신
+# 반환값: {파일 경로: 크기(byte)}
+def write_school_map(output_dir, district_layer, semester_layers, title='서울시 학교 환경위생 지도'):
+    data_dir = os.path.join(output_dir, MAP_DATA_DIR)
+    os.makedirs(data_dir, exist_ok=True)
+    sizes = {}
+
+    path = os.path.join(data_dir, 'districts.js')
+    sizes[path] = _write_data_script(path, 'districts', district_layer)
+
+    for semester, layer in semester_layers.items():
+        path = os.path.join(data_dir, f'schools_{semester}.js')
+        sizes[path] = _write_data_script(path, f'schools_{semester}', layer)
+
+    semesters = sorted(name[len('schools_'):-len('.js')] for name in os.listdir(data_dir)
+                       if name.startswith('schools_') and name.endswith('.js'))
+    path = os.path.join(data_dir, 'semesters.js')
+    sizes[path] = _write_data_script(path, 'semesters', semesters)
+
+    path = os.path.join(output_dir, 'index.html')
+    tmp_path = path + '.tmp'
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        f.write(MAP_SHELL_HTML.replace('{{TITLE}}', title).replace('{{DATA_DIR}}', MAP_DATA_DIR)
+                .replace('{{GRADE_COLORS}}', json.dumps(SAFETY_GRADE_COLORS))
+                .replace('{{GRADE_DESCRIPTIONS}}', json.dumps(SAFETY_GRADE_DESCRIPTIONS, ensure_ascii=False))
+                .replace('{{NO_GRADE_COLOR}}', NO_GRADE_COLOR))
+    os.replace(tmp_path, path)
+    sizes[path] = os.path.getsize(path)
+
+    return sizes
+
+
+# 함수: 기존 학기별 Folium 지도 HTML 을 분리형 지도로 변환
+# html_paths: {학기명: Folium HTML 경로}, 자치구 경계는 첫 번째 파일 기준
+def migrate_folium_maps(html_paths, output_dir, tolerance=SIMPLIFY_TOLERANCE):
+    district_layer = None
+    semester_layers = {}
+
+    for semester, html_path in html_paths.items():
+        geojson, schools = extract_folium_map_data(html_path)
+        if district_layer is None:
+            district_layer = build_district_layer(geojson, tolerance=tolerance)
+        schools['자치구'] = assign_districts(schools['위도'], schools['경도'], district_layer)
+        semester_layers[semester] = build_school_layer(schools)
+        print(f"{semester}: 학교 {len(schools)}개 추출")
+
+    sizes = write_school_map(output_dir, district_layer, semester_layers)
+    for path, size in sizes.items():
+        print(f"{path}: {size / 1024:.1f}KB")
+    return sizes
+
+
+MAP_SHELL_HTML = """<!DOCTYPE html>
+<html lang="ko">
+<head>
+<meta charset="utf-8">
+<meta name="viewport" content="width=device-width, initial-scale=1.0">
+<title>{{TITLE}}</title>
+<link rel="stylesheet" href="https://cdn.jsdelivr.net/npm/leaflet@1.9.3/dist/leaflet.css">
+<link rel="stylesheet" href="https://cdn.jsdelivr.net/npm/leaflet.markercluster@1.5.3/dist/MarkerCluster.css">
+<link rel="stylesheet" href="https://cdn.jsdelivr.net/npm/leaflet.markercluster@1.5.3/dist/MarkerCluster.Default.css">
+<script src="https://cdn.jsdelivr.net/npm/leaflet@1.9.3/dist/leaflet.js"></script>
+<script src="https://cdn.jsdelivr.net/npm/leaflet.markercluster@1.5.3/dist/leaflet.markercluster.js"></script>
+<style>
+html, body, #map { width: 100%; height: 100%; margin: 0; padding: 0; }
+.panel { background: white; padding: 8px 10px; border: 1px solid grey; border-radius: 4px; font-size: 12px; line-height: 1.5; }
+.panel b { font-size: 13px; }
+.panel .counts { max-height: 180px; overflow: auto; }
+.swatch { display: inline-block; width: 10px; height: 10px; border-radius: 50%; margin-right: 4px; }
+</style>
+</head>
+<body>
+<div id="map"></div>
+<script>
+var DATA_DIR = '{{DATA_DIR}}';
+var GRADE_COLORS = {{GRADE_COLORS}};
+var GRADE_DESCRIPTIONS = {{GRADE_DESCRIPTIONS}};
+var NO_GRADE_COLOR = '{{NO_GRADE_COLOR}}';
+
+var mapData = {};
+var pending = {};
+function registerMapData(key, payload) {
+  mapData[key] = payload;
+  if (pending[key]) { pending[key].forEach(function (resolve) { resolve(payload); }); delete pending[key]; }
+}
+function loadData(key) {
+  if (mapData[key]) { return Promise.resolve(mapData[key]); }
+  return new Promise(function (resolve, reject) {
+    (pending[key] = pending[key] || []).push(resolve);
+    var script = document.createElement('script');
+    script.src = DATA_DIR + '/' + encodeURIComponent(key) + '.js';
+    script.onerror = reject;
+    document.head.appendChild(script);
+  });
+}
+
+var map = L.map('map', { center: [37.5665, 126.978], zoom: 11, preferCanvas: true });
+L.tileLayer('https://tile.openstreetmap.org/{z}/{x}/{y}.png', {
+  maxZoom: 19,
+  attribution: '&copy; <a href="https://www.openstreetmap.org/copyright">OpenStreetMap</a> contributors'
+}).addTo(map);
+
+var districtLayer = null;
+var schoolLayer = L.markerClusterGroup({ chunkedLoading: true }).addTo(map);
+
+var countsControl = L.control({ position: 'bottomleft' });
+countsControl.onAdd = function () { this._div = L.DomUtil.create('div', 'panel'); return this._div; };
+countsControl.addTo(map);
+
+var legend = L.control({ position: 'bottomleft' });
+legend.onAdd = function () {
+  var div = L.DomUtil.create('div', 'panel');
+  var html = '<b>환경위생 등급 범례</b><br>';
+  Object.keys(GRADE_COLORS).forEach(function (grade) {
+    html += '<span class="swatch" style="background:' + GRADE_COLORS[grade] + '"></span>' + grade + ' - ' + GRADE_DESCRIPTIONS[grade] + '<br>';
+  });
+  div.innerHTML = html + '<span class="swatch" style="background:' + NO_GRADE_COLOR + '"></span>정보 없음';
+  return div;
+};
+legend.addTo(map);
+
+function escapeHtml(text) {
+  return String(text).replace(/[&<>"']/g, function (c) {
+    return { '&': '&amp;', '<': '&lt;', '>': '&gt;', '"': '&quot;', "'": '&#39;' }[c];
+  });
+}
+
+function showSemester(semester) {
+  Promise.all([loadData('districts'), loadData('schools_' + semester)]).then(function (loaded) {
+    var districts = loaded[0], schools = loaded[1], stats = schools.district_stats || {};
+
+    if (districtLayer) { map.removeLayer(districtLayer); }
+    districtLayer = L.geoJSON(districts, {
+      style: function (feature) {
+        var stat = stats[feature.properties.name];
+        return { color: 'black', weight: 1, opacity: 0.2, fillOpacity: 0.7, fillColor: stat ? stat.color : '#ffffff' };
+      },
+      onEachFeature: function (feature, layer) {
+        var stat = stats[feature.properties.name];
+        layer.bindTooltip(feature.properties.name + ': D/E 등급 ' + (stat ? stat.high_risk : 0) + '개');
+      }
+    }).addTo(map);
+    districtLayer.bringToBack();
+
+    schoolLayer.clearLayers();
+    schoolLayer.addLayers(schools.features.map(function (feature) {
+      var p = feature.properties, c = feature.geometry.coordinates;
+      var marker = L.circleMarker([c[1], c[0]], {
+        radius: 7, weight: 1, color: 'white', fillOpacity: 0.9, fillColor: GRADE_COLORS[p.g] || NO_GRADE_COLOR
+      });
+      marker.bindPopup(function () {
+        return '<b>학교명:</b> ' + escapeHtml(p.n) + '<br><b>SAFETY GRADE:</b> ' + escapeHtml(p.g || '정보 없음') +
+          (p.d ? '<br><b>자치구:</b> ' + escapeHtml(p.d) : '');
+      }, { maxWidth: 300 });
+      return marker;
+    }));
+
+    var html = '<b>' + escapeHtml(semester) + ' 자치구별 D,E등급 학교 수</b><div class="counts">';
+    Object.keys(stats).sort().forEach(function (name) { html += escapeHtml(name) + ': ' + stats[name].high_risk + '개<br>'; });
+    countsControl._div.innerHTML = html + '</div>';
+  });
+}
+
+loadData('semesters').then(function (semesters) {
+  var toggle = L.control({ position: 'topright' });
+  toggle.onAdd = function () {
+    var div = L.DomUtil.create('div', 'panel');
+    div.innerHTML = '<b>조사 학기</b><br>' + semesters.map(function (semester, i) {
+      return '<label><input type="radio" name="semester" value="' + escapeHtml(semester) + '"' + (i === 0 ? ' checked' : '') + '> ' + escapeHtml(semester) + '</label>';
+    }).join('<br>');
+    L.DomEvent.disableClickPropagation(div);
+    div.addEventListener('change', function (event) { showSemester(event.target.value); });
+    return div;
+  };
+  toggle.addTo(map);
+  if (semesters.length) { showSemester(semesters[0]); }
+});
+</script>
+</body>
+</html>
+"""
@@ -0,0 +1,159 @@
+import os
+
+import numpy as np
+import pandas as pd
+
+from district_resolver import UNKNOWN_LABEL, district_labels, resolve_regions
+from env_data_cache import DEFAULT_CACHE_DIR
+from result_sinks import normalize_object_columns, write_table
+
+try:
+    import pyarrow  # noqa: F401
+    MASTER_EXTENSION = '.parquet'
+except ImportError:  # pyarrow 가 없으면 CSV 로 저장
+    MASTER_EXTENSION = '.csv'
+
+# 학교 마스터 인덱스 저장 위치 (SCHUL_CODE → 고정 정수 ID)
+SCHOOL_MASTER_PATH = os.path.join(DEFAULT_CACHE_DIR, 'school_master', f"school_master{MASTER_EXTENSION}")
+
+SCHOOL_CODE_COLUMN = 'SCHUL_CODE'
+SCHOOL_ID_COLUMN = 'SCHOOL_ID'
+MISSING_ID = -1  # 마스터에 없는 학교
+
+# 마스터 정적 속성: {마스터 컬럼: 원본 후보 컬럼 (앞에 있는 것 우선)}
+MASTER_ATTRIBUTES = {
+    'SCHUL_NM': ['SCHUL_NM', '학교명'],
+    '자치구': ['자치구'],
+    'ADRCD_NM': ['ADRCD_NM'],
+    '학교급코드': ['학교급코드', 'SCHUL_KND_SC_CODE'],
+    'FOND_YMD': ['FOND_YMD', '설립일'],
+    'LTTUD': ['LTTUD', '위도'],
+    'LGTUD': ['LGTUD', '경도'],
+}
+# 자치구 컬럼이 없을 때 자치구를 뽑을 주소 컬럼 (앞에 있는 것 우선)
+ADDRESS_COLUMNS = ['SCHUL_ADRES', 'SCHUL_RDNMA', 'ADRCD_NM']
+
+
+# 함수: 학교 코드 정규화 (문자열 + 앞뒤 공백 제거, 결측/빈 문자열은 NaN)
+def normalize_school_codes(codes):
+    codes = pd.Series(codes, dtype=object)
+    normalized = codes.where(codes.isna(), codes.astype(str).str.strip())
+    return normalized.replace('', np.nan)
+
+
+# 함수: 데이터셋 하나의 학교별 정적 속성 (SCHUL_CODE 인덱스, 학교당 첫 행)
+def _source_attributes(df):
+    codes = normalize_school_codes(df[SCHOOL_CODE_COLUMN].to_numpy())
+    attributes = pd.DataFrame(index=pd.Index(codes, name=SCHOOL_CODE_COLUMN))
+    for column, candidates in MASTER_ATTRIBUTES.items():
+        source = next((c for c in candidates if c in df.columns), None)
+        if source is not None:
+            attributes[column] = df[source].to_numpy()
+
+    if '자치구' not in attributes.columns:
+        address = next((c for c in ADDRESS_COLUMNS if c in df.columns), None)
+        if address is not None:
+            # 분석 스크립트와 같은 district_resolver 규칙 (해석 실패는 다른 데이터셋 값으로 채울 수 있게 NaN)
+            labels = district_labels(resolve_regions(df, address_column=address))
+            attributes['자치구'] = labels.where(labels != UNKNOWN_LABEL).to_numpy()
+
+    attributes = attributes[attributes.index.notna()]
+    return attributes[~attributes.index.duplicated(keep='first')]
+
+
+# 함수: 학교 마스터 인덱스 생성
+# - sources: SCHUL_CODE 컬럼을 가진 DataFrame 들 (학교기본정보, 환경위생, 예산 등), 속성은 앞의 데이터셋 우선
+# - previous 를 주면 기존 학교의 ID 를 유지하고 새 학교만 뒤에 추가 (속성은 새 데이터 우선, 없으면 기존 값)
+# 반환값: ID(0..n-1) 인덱스의 DataFrame [SCHUL_CODE, 정적 속성...]
+def build_school_master(*sources, previous=None):
+    order = [] if previous is None else list(previous[SCHOOL_CODE_COLUMN])
+    known = set(order)
+    attributes = None
+    integer_columns = {}  # 모든 데이터셋에서 정수형인 속성은 NaN 이 섞여도 Int64 로 유지
+
+    for df in sources:
+        source_attributes = _source_attributes(df)
+        for column in source_attributes.columns:
+            is_integer = pd.api.types.is_integer_dtype(source_attributes[column])
+            integer_columns[column] = integer_columns.get(column, True) and is_integer
+        new_codes = [code for code in source_attributes.index if code not in known]
+        order.extend(new_codes)
+        known.update(new_codes)
+        attributes = source_attributes if attributes is None else attributes.combine_first(source_attributes)
+
+    if previous is not None:
+        previous_attributes = previous.set_index(SCHOOL_CODE_COLUMN)
+        for column in previous_attributes.columns:
+            is_integer = pd.api.types.is_integer_dtype(previous_attributes[column])
+            integer_columns[column] = integer_columns.get(column, True) and is_integer
+        attributes = previous_attributes if attributes is None else attributes.combine_first(previous_attributes)
+    if attributes is None:
+        attributes = pd.DataFrame(index=pd.Index([], name=SCHOOL_CODE_COLUMN))
+
+    columns = [column for column in MASTER_ATTRIBUTES if column in attributes.columns]
+    master = attributes.reindex(order)[columns].reset_index()
+    for column in columns:
+        if integer_columns.get(column):
+            master[column] = master[column].astype('Int64')
+    master.index = pd.RangeIndex(len(master), name=SCHOOL_ID_COLUMN)
+    return master
+
+
+# 함수: 저장된 마스터 인덱스 로드 (없으면 None)
+def load_school_master(path=SCHOOL_MASTER_PATH):
+    if not os.path.exists(path):
+        return None
+    if path.endswith('.parquet'):
+        master = pd.read_parquet(path)
+    else:
+        master = pd.read_csv(path, encoding='utf-8-sig', dtype={SCHOOL_CODE_COLUMN: str})
+    master.index = pd.RangeIndex(len(master), name=SCHOOL_ID_COLUMN)
+    return master
+
+
+# 함수: 마스터 인덱스 저장 (원자적 저장, 행 순서 = ID)
+def save_school_master(master, path=SCHOOL_MASTER_PATH):
+    os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+    write_table(normalize_object_columns(master), path)
+    return path
+
+
+# 함수: 저장된 마스터에 새 데이터셋의 학교를 추가하고 다시 저장 (기존 학교 ID 유지)
+def update_school_master(*sources, path=SCHOOL_MASTER_PATH):
+    master = build_school_master(*sources, previous=load_school_master(path))
+    save_school_master(master, path)
+    return master
+
+
+# 함수: 학교 코드 → 마스터 ID 배열 (마스터에 없거나 코드가 없으면 MISSING_ID)
+def school_ids(master, codes):
+    return pd.Index(master[SCHOOL_CODE_COLUMN]).get_indexer(normalize_school_codes(np.asarray(codes, dtype=object)))
+
+
+# 함수: 데이터셋에 SCHOOL_ID 컬럼 추가 (복사본)
+def align_to_master(df, master):
+    aligned = df.copy()
+    aligned[SCHOOL_ID_COLUMN] = school_ids(master, df[SCHOOL_CODE_COLUMN].to_numpy())
+    return aligned
+
+
+# 함수: ID 배열로 마스터 속성 조회 (pd.merge 대신 배열 인덱싱, MISSING_ID 는 결측, 컬럼 dtype 유지)
+def master_attribute(master, ids, column):
+    return master[column].array.take(np.asarray(ids), allow_fill=True)
+
+
+# 함수: 모든 ID 배열에 한 번 이상 나오는 학교 마스크 (set 교집합 대신, 길이 = 마스터 학교 수)
+def schools_in_all(master, *id_arrays):
+    mask = np.ones(len(master), dtype=bool)
+    for ids in id_arrays:
+        ids = np.asarray(ids)
+        present = np.zeros(len(master), dtype=bool)
+        present[ids[ids >= 0]] = True
+        mask &= present
+    return mask
+
+
+# 함수: 학교 마스크 → 행 마스크 (MISSING_ID 행은 제외)
+def rows_for_schools(ids, school_mask):
+    ids = np.asarray(ids)
+    return (ids >= 0) & school_mask[np.maximum(ids, 0)]
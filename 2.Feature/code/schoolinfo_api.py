@@ -0,0 +1,418 @@
+import hashlib
+import json
+import os
+import random
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qsl, urlparse
+
+import pandas as pd
+import requests
+import urllib3
+from requests.adapters import HTTPAdapter
+
+from env_data_cache import DEFAULT_CACHE_DIR
+
+# 학교알리미 openApi 설정 (예산데이터,학교기본정보_api통합.ipynb 와 같은 값)
+BASE_URL = "https://www.schoolinfo.go.kr/openApi.do"
+BUDGET_API_TYPE = "27"      # 학교회계 예결산서(국공립)
+BASIC_INFO_API_TYPE = "0"   # 학교기본정보
+
+YEARS = [2022, 2023, 2024]
+SCHOOL_TYPES = ["02", "03", "04"]  # 02: 초등, 03: 중등, 04: 고등
+DEPTH_NO2_LIST = ["1", "2"]  # 1: 세입(예산), 2: 세출(예산)
+DEPTH_NO = "10"  # 예산 (결산은 20)
+BUDGET_DIVISIONS = {"1": "세입", "2": "세출"}
+
+# 응답 캐시 위치 (요청 파라미터별 JSON 파일)
+API_CACHE_DIR = os.path.join(DEFAULT_CACHE_DIR, 'schoolinfo_api')
+# 캐시 키에서 제외하는 파라미터 (API 키가 바뀌어도 같은 응답)
+CACHE_EXCLUDED_PARAMS = ('apiKey',)
+
+# 동시성/속도 제한/재시도 기본값 (기존 노트북은 호출 사이 0.5초 대기 = 초당 2건)
+DEFAULT_MAX_WORKERS = 4
+DEFAULT_RATE = 2.0          # 초당 최대 요청 수
+MAX_RETRIES = 4
+BACKOFF_BASE = 0.5          # 재시도 대기: BACKOFF_BASE * 2^시도 (+ 지터)
+REQUEST_TIMEOUT = 30
+RETRY_STATUS = (429, 500, 502, 503, 504)
+
+
+# 재시도 대상 HTTP 상태 (429/5xx)
+class RetryableStatusError(requests.HTTPError):
+    pass
+
+
+# 함수: 요청 파라미터 → 캐시 키 (API 키 제외, 값은 문자열로 맞춘 뒤 정렬한 JSON 의 SHA-256)
+def request_cache_key(params):
+    key_source = {str(k): str(v) for k, v in params.items() if k not in CACHE_EXCLUDED_PARAMS}
+    return hashlib.sha256(json.dumps(key_source, sort_keys=True, ensure_ascii=False).encode('utf-8')).hexdigest()
+
+
+# 함수: JSON 원자적 저장 (임시 파일에 쓴 뒤 os.replace, 중간에 실패해도 기존 파일 유지)
+def write_json_atomic(data, path):
+    os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+    fd, temp_path = tempfile.mkstemp(dir=os.path.dirname(path) or '.', suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            json.dump(data, f, ensure_ascii=False)
+        os.replace(temp_path, path)
+    except BaseException:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+        raise
+
+
+# 함수: 연결 풀을 공유하는 세션 생성 (작업 스레드 수만큼 연결 유지)
+def make_session(pool_size=DEFAULT_MAX_WORKERS):
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    return session
+
+
+# 스레드 간 공유 속도 제한 (요청 시작 간격을 1 / rate 초 이상으로 유지)
+class RateLimiter:
+    def __init__(self, rate=DEFAULT_RATE):
+        self.interval = 1.0 / rate if rate else 0.0
+        self._next_time = 0.0
+        self._lock = threading.Lock()
+
+    # 다음 요청 슬롯을 예약하고 그 시각까지 대기 (대기는 잠금 밖에서)
+    def wait(self):
+        with self._lock:
+            now = time.monotonic()
+            start = max(now, self._next_time)
+            self._next_time = start + self.interval
+        if start > now:
+            time.sleep(start - now)
+
+
+# 학교알리미 openApi 클라이언트
+# - 하나의 풀링 세션을 스레드 풀(max_workers)이 공유
+# - 요청마다 RateLimiter 를 거치고, 연결 오류/타임아웃/429·5xx 는 지수 백오프로 재시도
+# - resultCode 가 success 인 응답만 요청 파라미터 키로 디스크에 캐시 (refresh=True 이면 다시 받음)
+class SchoolInfoClient:
+    def __init__(self, api_key, base_url=BASE_URL, max_workers=DEFAULT_MAX_WORKERS, rate=DEFAULT_RATE,
+                 max_retries=MAX_RETRIES, backoff=BACKOFF_BASE, timeout=REQUEST_TIMEOUT,
+                 cache_dir=API_CACHE_DIR, verify=False):
+        self.api_key = api_key
+        self.base_url = base_url
+        self.max_workers = max_workers
+        self.max_retries = max_retries
+        self.backoff = backoff
+        self.timeout = timeout
+        self.cache_dir = cache_dir
+        self.verify = verify
+        self.session = make_session(max_workers)
+        self.limiter = RateLimiter(rate)
+        self.stats = {'requests': 0, 'cache_hits': 0, 'retries': 0}
+        self._stats_lock = threading.Lock()
+
+        if not verify:
+            # SSL 경고 비활성화 (학교알리미 인증서 문제로 기존 노트북도 verify=False)
+            urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    def close(self):
+        self.session.close()
+
+    def _count(self, key):
+        with self._stats_lock:
+            self.stats[key] += 1
+
+    def cache_path(self, params):
+        if self.cache_dir is None:
+            return None
+        return os.path.join(self.cache_dir, f"apiType_{params.get('apiType', '')}",
+                            f"{request_cache_key(params)}.json")
+
+    # 함수: 재시도 대기 시간 (Retry-After 헤더가 있으면 우선)
+    def _retry_delay(self, attempt, error):
+        response = getattr(error, 'response', None)
+        retry_after = response.headers.get('Retry-After') if response is not None else None
+        if retry_after and retry_after.isdigit():
+            return float(retry_after)
+        return self.backoff * (2 ** attempt) * (1 + random.random() * 0.1)
+
+    # 함수: 한 번의 HTTP 요청 (재시도 포함), 응답 JSON 반환
+    def _request(self, params):
+        query = {'apiKey': self.api_key, **params}
+        for attempt in range(self.max_retries + 1):
+            self.limiter.wait()
+            self._count('requests')
+            try:
+                response = self.session.get(self.base_url, params=query, timeout=self.timeout, verify=self.verify)
+                if response.status_code in RETRY_STATUS:
+                    raise RetryableStatusError(f"{response.status_code} {response.reason}", response=response)
+                response.raise_for_status()
+                return response.json()
+            except (requests.ConnectionError, requests.Timeout, RetryableStatusError) as e:
+                if attempt == self.max_retries:
+                    raise
+                self._count('retries')
+                time.sleep(self._retry_delay(attempt, e))
+
+    # 함수: 요청 파라미터 하나에 대한 응답 JSON (캐시 우선)
+    def fetch(self, params, refresh=False):
+        path = self.cache_path(params)
+        if path is not None and not refresh and os.path.exists(path):
+            with open(path, encoding='utf-8') as f:
+                data = json.load(f)
+            self._count('cache_hits')
+            return data
+
+        data = self._request(params)
+        if path is not None and data.get('resultCode') == 'success':
+            write_json_atomic(data, path)
+        return data
+
+    # 함수: 여러 요청을 스레드 풀로 동시에 실행
+    # 반환값: param_list 순서의 결과 목록 (성공하면 응답 JSON, 실패하면 발생한 예외 객체)
+    def fetch_many(self, param_list, refresh=False):
+        def fetch_one(params):
+            try:
+                return self.fetch(params, refresh=refresh)
+            except Exception as e:
+                return e
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            return list(executor.map(fetch_one, param_list))
+
+    # 함수: 여러 요청 결과를 하나의 DataFrame 으로 결합
+    # to_frame(응답 JSON, 요청 파라미터) → DataFrame (요청 구분 컬럼 추가), 오류는 기존 노트북처럼 출력 후 건너뜀
+    def fetch_frames(self, param_list, to_frame, refresh=False):
+        frames = []
+        for params, data in zip(param_list, self.fetch_many(param_list, refresh=refresh)):
+            if isinstance(data, Exception):
+                print(f"Error occurred: {str(data)} ({describe_params(params)})")
+                continue
+            if data.get('resultCode') != 'success':
+                print(f"API Error: {data.get('resultMsg')} ({describe_params(params)})")
+                continue
+            df = to_frame(data, params)
+            if not df.empty:
+                frames.append(df)
+
+        if not frames:
+            return pd.DataFrame()
+        return pd.concat(frames, ignore_index=True)
+
+
+# 함수: 로그용 요청 구분 문자열 (API 키 제외)
+def describe_params(params):
+    return ', '.join(f"{k}: {v}" for k, v in params.items() if k not in CACHE_EXCLUDED_PARAMS)
+
+
+# 함수: 학교회계 예결산서 요청 파라미터 목록 (연도 × 학교급 × 세입/세출)
+def budget_params(years=YEARS, school_types=SCHOOL_TYPES, depth_no2_list=DEPTH_NO2_LIST, depth_no=DEPTH_NO):
+    return [
+        {"apiType": BUDGET_API_TYPE, "pbanYr": year, "schulKndCode": school_type,
+         "depthNo": depth_no, "depthNo2": depth_no2}
+        for year in years for school_type in school_types for depth_no2 in depth_no2_list
+    ]
+
+
+# 함수: 학교기본정보 요청 파라미터 목록 (학교급별)
+def basic_info_params(school_types=SCHOOL_TYPES):
+    return [{"apiType": BASIC_INFO_API_TYPE, "schulKndCode": school_type} for school_type in school_types]
+
+
+# 함수: 예결산서 응답 → DataFrame (연도, 학교급코드, 예산구분 컬럼 추가)
+def budget_frame(data, params):
+    df = pd.DataFrame(data['list'])
+    df['연도'] = int(params['pbanYr'])
+    df['학교급코드'] = params['schulKndCode']
+    df['예산구분'] = BUDGET_DIVISIONS.get(str(params['depthNo2']), str(params['depthNo2']))
+    return df
+
+
+# 함수: 학교기본정보 응답 → DataFrame (학교급코드 컬럼 추가)
+def basic_info_frame(data, params):
+    df = pd.DataFrame(data['list'])
+    df['학교급코드'] = params['schulKndCode']
+    return df
+
+
+# 함수: 학교회계 예결산서(국공립) 전체 수집 (apiType=27)
+def fetch_budget_data(client, years=YEARS, school_types=SCHOOL_TYPES, depth_no2_list=DEPTH_NO2_LIST,
+                      depth_no=DEPTH_NO, refresh=False):
+    return client.fetch_frames(budget_params(years, school_types, depth_no2_list, depth_no),
+                               budget_frame, refresh=refresh)
+
+
+# 함수: 학교기본정보 전체 수집 (apiType=0)
+def fetch_school_basic_info(client, school_types=SCHOOL_TYPES, refresh=False):
+    return client.fetch_frames(basic_info_params(school_types), basic_info_frame, refresh=refresh)
+
+
+# ============================================================
+# 오프라인 테스트용 가짜 openApi 서버
+# ============================================================
+
+# 가짜 응답의 시도교육청/설립구분 (서울/공립이 아닌 행도 섞어서 필터 확인 가능)
+FAKE_OFFICES = ['서울특별시교육청', '경기도교육청', '부산광역시교육청']
+FAKE_FOUNDATIONS = ['공립', '사립', '국립']
+# 시도교육청별 (시도, [(시군구 코드, 시군구)])
+FAKE_REGIONS = {
+    '서울특별시교육청': ('서울특별시', [('11680', '강남구'), ('11350', '노원구'), ('11440', '마포구'),
+                                   ('11710', '송파구'), ('11110', '종로구')]),
+    '경기도교육청': ('경기도', [('41111', '수원시 장안구'), ('41135', '성남시 분당구'), ('41285', '고양시 일산동구')]),
+    '부산광역시교육청': ('부산광역시', [('26350', '해운대구'), ('26230', '부산진구'), ('26380', '사하구')]),
+}
+
+
+# 함수: 요청 파라미터로 결정되는 합성 응답 (같은 파라미터 + revision 이면 항상 같은 내용)
+def fake_schoolinfo_response(params, rows=6, revision=0):
+    if not params.get('apiKey'):
+        return {'resultCode': 'fail', 'resultMsg': '인증키가 유효하지 않습니다.', 'list': []}
+
+    seed = int(request_cache_key(params)[:8], 16) + revision
+    rng = random.Random(seed)
+    school_type = str(params.get('schulKndCode', '02'))
+
+    records = []
+    for i in range(rows):
+        office = FAKE_OFFICES[i % len(FAKE_OFFICES)]
+        sido, districts = FAKE_REGIONS[office]
+        district_code, district = districts[rng.randrange(len(districts))]
+        record = {
+            'ATPT_OFCDC_ORG_NM': office,
+            'FOND_SC_CODE': FAKE_FOUNDATIONS[(i // len(FAKE_OFFICES)) % len(FAKE_FOUNDATIONS)],
+            'SCHUL_CODE': f"B{school_type}{i:06d}",
+            'SCHUL_NM': f"가짜{school_type}학교{i}",
+        }
+        if str(params.get('apiType')) == BUDGET_API_TYPE:
+            record['ACNT_AMT'] = rng.randrange(1_000_000, 500_000_000)
+        else:
+            record['ADRCD_CD'] = f"{district_code}10100"
+            record['ADRCD_NM'] = f"{sido} {district}"
+            record['SCHUL_RDNMA'] = f"{sido} {district} 가짜로 {i}"
+            record['FOND_YMD'] = f"{rng.randrange(1950, 2020)}0301"
+        records.append(record)
+
+    return {'resultCode': 'success', 'resultMsg': '정상 처리되었습니다.', 'list': records}
+
+
+# 로컬에서 학교알리미 openApi 를 흉내 내는 HTTP 서버 (with 문으로 시작/종료)
+# - fail_first: 요청 파라미터별로 처음 n 번은 503 응답 (재시도 확인용)
+# - latency: 응답 지연(초) (동시 요청 확인용)
+# - revision: 값을 바꾸면 같은 요청도 다른 내용을 반환 (변경 감지 확인용)
+# - responder(params) 를 주면 합성 응답 대신 사용
+class FakeSchoolInfoServer:
+    def __init__(self, fail_first=0, latency=0.0, rows=6, revision=0, responder=None):
+        self.fail_first = fail_first
+        self.latency = latency
+        self.rows = rows
+        self.revision = revision
+        self.responder = responder
+        self.request_log = []
+        self.max_in_flight = 0
+        self._in_flight = 0
+        self._attempts = {}
+        self._lock = threading.Lock()
+        self._server = None
+        self._thread = None
+
+    @property
+    def url(self):
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}/openApi.do"
+
+    @property
+    def request_count(self):
+        return len(self.request_log)
+
+    def _handle(self, handler):
+        params = dict(parse_qsl(urlparse(handler.path).query))
+        key = request_cache_key(params)
+        with self._lock:
+            self.request_log.append(params)
+            attempt = self._attempts[key] = self._attempts.get(key, 0) + 1
+            self._in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self._in_flight)
+
+        try:
+            if self.latency:
+                time.sleep(self.latency)
+            if attempt <= self.fail_first:
+                status, body = 503, b'{"resultCode": "fail", "resultMsg": "busy"}'
+            else:
+                data = (self.responder(params) if self.responder is not None
+                        else fake_schoolinfo_response(params, self.rows, self.revision))
+                status, body = 200, json.dumps(data, ensure_ascii=False).encode('utf-8')
+
+            handler.send_response(status)
+            handler.send_header('Content-Type', 'application/json; charset=utf-8')
+            handler.send_header('Content-Length', str(len(body)))
+            handler.end_headers()
+            handler.wfile.write(body)
+        finally:
+            with self._lock:
+                self._in_flight -= 1
+
+    def start(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                server._handle(self)
+
+            def log_message(self, format, *args):
+                pass
+
+        self._server = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+        self._server.daemon_threads = True
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._thread.join()
+            self._server = None
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc, tb):
+        self.stop()
+
+
+if __name__ == "__main__":
+    # 가짜 서버로 동시 요청/재시도/캐시 동작 확인
+    with tempfile.TemporaryDirectory() as cache_dir, \
+            FakeSchoolInfoServer(fail_first=1, latency=0.05) as server:
+        params = budget_params()
+
+        with SchoolInfoClient('test-key', base_url=server.url, rate=50, backoff=0.01, cache_dir=cache_dir) as client:
+            start = time.perf_counter()
+            budget = fetch_budget_data(client)
+            elapsed = time.perf_counter() - start
+            print(f"1차 수집: {len(budget)}행, {server.request_count}회 요청 "
+                  f"(재시도 {client.stats['retries']}회, 최대 동시 {server.max_in_flight}건), {elapsed:.2f}초")
+            assert len(budget) == len(params) * server.rows
+            assert client.stats['retries'] == len(params)
+
+            requests_before = server.request_count
+            cached = fetch_budget_data(client)
+            print(f"2차 수집: {len(cached)}행, 추가 요청 {server.request_count - requests_before}회 "
+                  f"(캐시 {client.stats['cache_hits']}건)")
+            assert server.request_count == requests_before
+            pd.testing.assert_frame_equal(budget, cached)
+
+        with SchoolInfoClient('', base_url=server.url, rate=50, cache_dir=None) as client:
+            assert fetch_school_basic_info(client).empty
+
+    print("가짜 서버 확인 완료")
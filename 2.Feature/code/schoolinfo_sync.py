@@ -0,0 +1,259 @@
+import argparse
+import hashlib
+import json
+import os
+from datetime import datetime
+
+import pandas as pd
+
+from env_data_cache import DEFAULT_CACHE_DIR
+from result_sinks import normalize_object_columns, write_table
+from schoolinfo_api import (BASE_URL, CACHE_EXCLUDED_PARAMS, DEFAULT_MAX_WORKERS, DEFAULT_RATE, SCHOOL_TYPES,
+                            YEARS, SchoolInfoClient, basic_info_frame, basic_info_params, budget_frame,
+                            budget_params, describe_params, write_json_atomic)
+
+try:
+    import pyarrow  # noqa: F401
+    PARTITION_EXTENSION = '.parquet'
+except ImportError:  # pyarrow 가 없으면 파티션을 CSV 로 저장
+    PARTITION_EXTENSION = '.csv'
+
+# 파티션 저장소 위치와 매니페스트 파일
+SYNC_STORE_DIR = os.path.join(DEFAULT_CACHE_DIR, 'schoolinfo_store')
+MANIFEST_FILE = 'manifest.json'
+MANIFEST_VERSION = 1
+
+# API 키 환경 변수 (명령행 --api-key 가 없을 때 사용)
+API_KEY_ENV = 'SCHOOLINFO_API_KEY'
+
+# 수집 단계 필터: 서울특별시교육청 + 공립 (기존 노트북의 filtered_df / filtered_school 과 같은 조건)
+SEOUL_OFFICE_NM = '서울특별시교육청'
+PUBLIC_FOND_SC = '공립'
+
+# 동기화 대상 데이터셋
+# - params(years, school_types): 파티션 요청 파라미터 목록, to_frame: 응답 → DataFrame
+# - output: 전체 파티션을 합쳐 내보낼 때의 파일 이름 (기존 노트북의 서울/공립 CSV)
+SYNC_DATASETS = {
+    'budget': {
+        'params': lambda years, school_types: budget_params(years, school_types),
+        'to_frame': budget_frame,
+        'output': '서울시_국공립_예산_세입세출.csv',
+    },
+    'basic_info': {
+        'params': lambda years, school_types: basic_info_params(school_types),
+        'to_frame': basic_info_frame,
+        'output': '서울시_국공립_학교기본정보.csv',
+    },
+}
+
+# 재확인 범위: 이미 저장된 파티션 중 다시 받아 내용 해시를 비교할 대상
+# - latest: 가장 최근 공시년도 파티션과 연도가 없는 파티션 (학교기본정보 등 수시로 바뀌는 현황)
+# - none: 없는 파티션만 받음, all: 모든 파티션 재확인
+RECHECK_MODES = ('latest', 'none', 'all')
+
+# 동기화 결과 상태
+STATUS_ADDED = '추가'
+STATUS_UPDATED = '갱신'
+STATUS_UNCHANGED = '변경없음'
+STATUS_SKIPPED = '건너뜀'
+STATUS_FAILED = '실패'
+
+
+# 함수: 서울특별시교육청 + 공립 학교만 남김
+def filter_seoul_public(df):
+    if df.empty:
+        return df
+    mask = (df['ATPT_OFCDC_ORG_NM'] == SEOUL_OFFICE_NM) & (df['FOND_SC_CODE'] == PUBLIC_FOND_SC)
+    return df[mask].reset_index(drop=True)
+
+
+# 함수: 파티션 이름 (요청 파라미터를 hive 형식 경로로, 예: budget/pbanYr=2024/schulKndCode=02/depthNo=10/depthNo2=1)
+def partition_key(dataset, params):
+    parts = [f"{k}={v}" for k, v in params.items() if k not in CACHE_EXCLUDED_PARAMS and k != 'apiType']
+    return '/'.join([dataset] + parts)
+
+
+# 함수: 파티션 내용 해시 (컬럼 이름 + 행 내용, 저장 형식과 무관)
+def frame_content_hash(df):
+    digest = hashlib.sha256(json.dumps([str(col) for col in df.columns], ensure_ascii=False).encode('utf-8'))
+    digest.update(pd.util.hash_pandas_object(df, index=False).to_numpy().tobytes())
+    return digest.hexdigest()
+
+
+# 함수: 매니페스트 로드 (없거나 버전이 다르면 빈 매니페스트)
+def load_manifest(store_dir=SYNC_STORE_DIR):
+    path = os.path.join(store_dir, MANIFEST_FILE)
+    if os.path.exists(path):
+        with open(path, encoding='utf-8') as f:
+            manifest = json.load(f)
+        if manifest.get('version') == MANIFEST_VERSION:
+            return manifest
+    return {'version': MANIFEST_VERSION, 'partitions': {}}
+
+
+# 함수: 매니페스트 원자적 저장
+def save_manifest(manifest, store_dir=SYNC_STORE_DIR):
+    write_json_atomic(manifest, os.path.join(store_dir, MANIFEST_FILE))
+
+
+# 함수: 파티션 파일 읽기
+def read_partition(path):
+    if path.endswith('.parquet'):
+        return pd.read_parquet(path)
+    return pd.read_csv(path, encoding='utf-8-sig')
+
+
+# 함수: 이 파티션을 다시 받아야 하는지 (없음 / 필터 변경 / 재확인 대상)
+def _needs_fetch(entry, params, store_dir, filter_name, recheck, latest_year):
+    if entry is None or entry.get('filter') != filter_name:
+        return True
+    if not os.path.exists(os.path.join(store_dir, entry['path'])):
+        return True
+    if recheck == 'all':
+        return True
+    if recheck == 'latest':
+        year = params.get('pbanYr')
+        return year is None or int(year) == latest_year
+    return False
+
+
+# 함수: 데이터셋 하나를 증분 동기화
+# - 매니페스트에 없는(또는 파일이 사라진) 파티션만 받아 저장, 재확인 대상은 응답 캐시를 건너뛰고 다시 받아
+#   내용 해시가 바뀐 경우에만 파티션 파일을 교체
+# - 필터(filter_func)는 저장 전에 적용되고, 필터가 바뀌면 기존 파티션은 새로 받음
+# - 매니페스트는 모든 파티션 처리 후 원자적으로 저장 (실패한 파티션은 기존 항목 유지)
+# 반환값: 파티션별 결과 DataFrame (파티션, 상태, 행수)
+def sync_dataset(client, dataset, store_dir=SYNC_STORE_DIR, years=YEARS, school_types=SCHOOL_TYPES,
+                 recheck='latest', filter_func=filter_seoul_public):
+    if recheck not in RECHECK_MODES:
+        raise ValueError(f"recheck 는 {RECHECK_MODES} 중 하나여야 합니다: {recheck}")
+
+    spec = SYNC_DATASETS[dataset]
+    manifest = load_manifest(store_dir)
+    entries = manifest['partitions']
+    filter_name = filter_func.__name__ if filter_func is not None else None
+    latest_year = max(int(year) for year in years) if years else None
+
+    partitions = spec['params'](years, school_types)
+    to_fetch = [params for params in partitions
+                if _needs_fetch(entries.get(partition_key(dataset, params)), params, store_dir, filter_name,
+                                recheck, latest_year)]
+    # 매니페스트에 없는 파티션은 응답 캐시 사용, 저장된 파티션의 재확인은 항상 새로 받음
+    new_params = [params for params in to_fetch if partition_key(dataset, params) not in entries]
+    recheck_params = [params for params in to_fetch if partition_key(dataset, params) in entries]
+    fetched = dict(zip([partition_key(dataset, params) for params in new_params + recheck_params],
+                       client.fetch_many(new_params) + client.fetch_many(recheck_params, refresh=True)))
+
+    rows = []
+    for params in partitions:
+        key = partition_key(dataset, params)
+        entry = entries.get(key)
+        if key not in fetched:
+            rows.append({'파티션': key, '상태': STATUS_SKIPPED, '행수': entry['rows']})
+            continue
+
+        data = fetched[key]
+        if isinstance(data, Exception) or data.get('resultCode') != 'success':
+            message = str(data) if isinstance(data, Exception) else data.get('resultMsg')
+            print(f"Error occurred: {message} ({describe_params(params)})")
+            rows.append({'파티션': key, '상태': STATUS_FAILED, '행수': None})
+            continue
+
+        df = spec['to_frame'](data, params)
+        if filter_func is not None:
+            df = filter_func(df)
+        df = normalize_object_columns(df)
+        content_hash = frame_content_hash(df)
+
+        if (entry is not None and entry.get('content_hash') == content_hash and entry.get('filter') == filter_name
+                and os.path.exists(os.path.join(store_dir, entry['path']))):
+            rows.append({'파티션': key, '상태': STATUS_UNCHANGED, '행수': entry['rows']})
+            continue
+
+        relative_path = f"{key}/part{PARTITION_EXTENSION}"
+        write_table(df, os.path.join(store_dir, relative_path))
+        entries[key] = {
+            'dataset': dataset,
+            'params': {k: v for k, v in params.items() if k not in CACHE_EXCLUDED_PARAMS},
+            'path': relative_path,
+            'content_hash': content_hash,
+            'rows': len(df),
+            'filter': filter_name,
+            'synced_at': datetime.now().isoformat(timespec='seconds'),
+        }
+        rows.append({'파티션': key, '상태': STATUS_UPDATED if entry is not None else STATUS_ADDED, '행수': len(df)})
+
+    save_manifest(manifest, store_dir)
+    return pd.DataFrame(rows, columns=['파티션', '상태', '행수'])
+
+
+# 함수: 저장소의 데이터셋 전체를 하나의 DataFrame 으로 (파티션 이름 순)
+def load_store(dataset, store_dir=SYNC_STORE_DIR):
+    entries = load_manifest(store_dir)['partitions']
+    frames = [read_partition(os.path.join(store_dir, entries[key]['path']))
+              for key in sorted(entries) if entries[key]['dataset'] == dataset]
+    if not frames:
+        return pd.DataFrame()
+    return pd.concat(frames, ignore_index=True)
+
+
+# 함수: 데이터셋 전체를 기존 노트북과 같은 CSV 로 내보내기 (반환값: 저장 경로)
+def export_store(dataset, store_dir=SYNC_STORE_DIR, output_dir='.'):
+    path = os.path.join(output_dir, SYNC_DATASETS[dataset]['output'])
+    write_table(load_store(dataset, store_dir), path)
+    return path
+
+
+# 함수: 동기화 결과 출력
+def print_sync_summary(dataset, summary):
+    counts = summary['상태'].value_counts()
+    print(f"===== {dataset} 동기화 결과 "
+          f"({', '.join(f'{status} {count}' for status, count in counts.items())}) =====")
+    for _, row in summary.iterrows():
+        if row['상태'] != STATUS_SKIPPED:
+            print(f"  {row['파티션']}: {row['상태']} ({row['행수']}행)")
+
+
+def parse_sync_args(argv=None):
+    parser = argparse.ArgumentParser(description='학교알리미 openApi 증분 동기화')
+    parser.add_argument('datasets', nargs='*', metavar='dataset',
+                        help=f"동기화할 데이터셋 ({', '.join(SYNC_DATASETS)}, 기본: 전체)")
+    parser.add_argument('--years', type=int, nargs='+', default=YEARS, help='공시년도 목록')
+    parser.add_argument('--school-types', nargs='+', default=SCHOOL_TYPES, help='학교급코드 목록')
+    parser.add_argument('--store', default=SYNC_STORE_DIR, help='파티션 저장소 경로')
+    parser.add_argument('--recheck', choices=RECHECK_MODES, default='latest', help='저장된 파티션 재확인 범위')
+    parser.add_argument('--no-filter', action='store_true', help='서울/공립 필터 없이 전체 저장')
+    parser.add_argument('--export', metavar='DIR', help='동기화 후 데이터셋별 CSV 를 이 폴더에 저장')
+    parser.add_argument('--api-key', default=os.environ.get(API_KEY_ENV), help=f'API 키 (기본: ${API_KEY_ENV})')
+    parser.add_argument('--base-url', default=BASE_URL, help=argparse.SUPPRESS)
+    parser.add_argument('--workers', type=int, default=DEFAULT_MAX_WORKERS, help='동시 요청 수')
+    parser.add_argument('--rate', type=float, default=DEFAULT_RATE, help='초당 최대 요청 수')
+    args = parser.parse_args(argv)
+
+    unknown = [dataset for dataset in args.datasets if dataset not in SYNC_DATASETS]
+    if unknown:
+        parser.error(f"알 수 없는 데이터셋입니다: {', '.join(unknown)}")
+    args.datasets = args.datasets or list(SYNC_DATASETS)
+    return args
+
+
+# 함수: 명령행 동기화 (python schoolinfo_sync.py budget --export . --years 2022 2023 2024 2025)
+def main(argv=None):
+    args = parse_sync_args(argv)
+    if not args.api_key:
+        raise SystemExit(f"API 키가 없습니다. --api-key 또는 환경 변수 {API_KEY_ENV} 를 지정하세요.")
+
+    filter_func = None if args.no_filter else filter_seoul_public
+    with SchoolInfoClient(args.api_key, base_url=args.base_url, max_workers=args.workers, rate=args.rate) as client:
+        for dataset in args.datasets:
+            summary = sync_dataset(client, dataset, args.store, args.years, args.school_types,
+                                   recheck=args.recheck, filter_func=filter_func)
+            print_sync_summary(dataset, summary)
+            if args.export:
+                print(f"✅ CSV 저장 완료: {export_store(dataset, args.store, args.export)}")
+        print(f"요청 {client.stats['requests']}회 (재시도 {client.stats['retries']}회), "
+              f"응답 캐시 사용 {client.stats['cache_hits']}건")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1 @@
+registerMapData("districts",{"type":"FeatureCollection","features":[{"type":"Feature","properties":{"code":"11110","name":"종로구"},"geometry":{"type":"Polygon","coordinates":[[[127.00864,37.58047],[127.01059,37.58025],[127.01176,37.58156],[127.0132,37.58142],[127.01481,37.58233],[127.01537,37.58182],[127.01668,37.58171],[127.01828,37.57903],[127.01769,37.57814],[127.01811,37.57758],[127.02141,37.57886],[127.02233,37.57863],[127.02276,37.57833],[127.02253,37.57808],[127.02314,37.57802],[127.02336,37.57191],[127.02075,37.57172],[127.01588,37.56976],[127.00226,37.56962],[126.99015,37.56814],[126.97638,37.56948],[126.97321,37.56932],[126.97259,37.56906],[126.97255,37.56847],[126.97118,37.56882],[126.9691,37.56825],[126.9667,37.56582],[126.95356,37.57875],[126.95568,37.57968],[126.9572,37.57982],[126.95722,37.58035],[126.95817,37.58098],[126.95755,37.5823],[126.95799,37.58443],[126.95737,37.58697],[126.95782,37.59146],[126.95752,37.59353],[126.95905,37.59503],[126.95804,37.59816],[126.95541,37.59927],[126.95351,37.59858],[126.95301,37.59894],[126.95336,37.60017],[126.95238,37.60248],[126.95406,37.60507],[126.9531,37.6055],[126.95145,37.60802],[126.9506,37.60836],[126.95038,37.61058],[126.94981,37.61166],[126.95071,37.61352],[126.9507,37.61553],[126.94984,37.61877],[126.9499,37.62092],[126.9489,37.62326],[126.949,37.62434],[126.95041,37.62642],[126.95638,37.62822],[126.95881,37.62959],[126.96377,37.62979],[126.96523,37.63077],[126.96824,37.63073],[126.97303,37.63237],[126.97539,37.63173],[126.97467,37.62981],[126.97496,37.629],[126.97842,37.62929],[126.97954,37.62889],[126.98019,37.62793],[126.9796,37.62638],[126.98183,37.62432],[126.98365,37.62115],[126.98316,37.61925],[126.98372,37.61777],[126.98454,37.616],[126.98658,37.61398],[126.98565,37.61138],[126.98587,37.60946],[126.98683,37.60887],[126.98611,37.60739],[126.98676,37.60609],[126.98679,37.60451],[126.98576,37.60345],[126.98398,37.60321],[126.98285,37.60214],[126.9785,37.601],[126.97768,37.60023],[126.97672,37.59791],[126.97795,37.59768],[126.97874,37.59663],[126.98149,37.59534],[126.98384,37.59444],[126.98543,37.59445],[126.9867,37.59275],[126.98922,37.59126],[126.99143,37.59141],[126.99216,37.59199],[126.99431,37.59145],[126.99536,37.59228],[127.00095,37.5923],[127.00173,37.59135],[127.00147,37.59015],[127.00222,37.58917],[127.00339,37.58857],[127.00425,37.58718],[127.00587,37.58697],[127.00663,37.58612],[127.00727,37.58333],[127.00675,37.58234],[127.00864,37.58047]]]}},{"type":"Feature","properties":{"code":"11140","name":"중구"},"geometry":{"type":"Polygon","coordinates":[[[127.02314,37.57196],[127.02358,37.56518],[127.02679,37.56504],[127.02651,37.56337],[127.02339,37.56073],[127.02241,37.55904],[127.02285,37.55898],[127.02289,37.55783],[127.02192,37.55748],[127.0209,37.55783],[127.01804,37.55685],[127.01686,37.55447],[127.01699,37.55366],[127.01616,37.55261],[127.01217,37.54942],[127.0116,37.54849],[127.00968,37.54789],[127.0091,37.54705],[127.00921,37.54638],[127.00815,37.54506],[127.00899,37.54413],[127.00727,37.54386],[127.00502,37.54617],[127.00613,37.54821],[127.00469,37.54869],[127.00434,37.55021],[127.00283,37.54963],[127.00168,37.55006],[126.99833,37.5497],[126.99675,37.54852],[126.99636,37.54745],[126.99522,37.54723],[126.99446,37.54749],[126.99237,37.55006],[126.99024,37.55128],[126.98756,37.55149],[126.98542,37.55371],[126.98403,37.55304],[126.98172,37.55386],[126.97873,37.5532],[126.9788,37.55409],[126.97655,37.55522],[126.97643,37.55309],[126.97435,37.55355],[126.97241,37.55488],[126.96917,37.55488],[126.96918,37.55566],[126.96571,37.55415],[126.96234,37.55155],[126.96178,37.55498],[126.96344,37.55685],[126.96308,37.5582],[126.96157,37.55842],[126.96167,37.55903],[126.96399,37.55946],[126.96684,37.56127],[126.96946,37.56198],[126.9667,37.56582],[126.9691,37.56825],[126.97118,37.56882],[126.97255,37.56847],[126.97259,37.56906],[126.97321,37.56932],[126.97638,37.56948],[126.98895,37.5681],[127.00226,37.56962],[127.0153,37.5697],[127.01737,37.57008],[127.02075,37.57172],[127.02314,37.57196]]]}},{"type":"Feature","properties":{"code":"11170","name":"용산구"},"geometry":{"type":"Polygon","coordinates":[[[126.96918,37.55566],[126.96917,37.55488],[126.97241,37.55488],[126.97435,37.55355],[126.97643,37.55309],[126.97655,37.55522],[126.9788,37.55409],[126.97873,37.5532],[126.98172,37.55386],[126.98403,37.55304],[126.98542,37.55371],[126.98756,37.55149],[126.99024,37.55128],[126.99237,37.55006],[126.99446,37.54749],[126.99522,37.54723],[126.99636,37.54745],[126.99675,37.54852],[126.99832,37.5497],[127.00168,37.55006],[127.00283,37.54963],[127.00434,37.55021],[127.00469,37.54869],[127.00613,37.54821],[127.00502,37.54617],[127.00727,37.54386],[127.009,37.54414],[127.00876,37.542],[127.00983,37.53945],[127.01387,37.53907],[127.01503,37.53827],[127.01753,37.53765],[127.01744,37.53399],[127.01334,37.53055],[127.00646,37.52344],[126.99068,37.5131],[126.98554,37.50654],[126.97819,37.50656],[126.97525,37.50702],[126.96686,37.5099],[126.96119,37.51346],[126.94989,37.51751],[126.94988,37.52703],[126.94459,37.53378],[126.94482,37.53452],[126.94641,37.53574],[126.94738,37.53522],[126.94749,37.53583],[126.94879,37.53558],[126.95129,37.53629],[126.95338,37.53755],[126.9541,37.53893],[126.95573,37.53947],[126.95699,37.54164],[126.95835,37.54276],[126.95741,37.54323],[126.95757,37.54422],[126.95811,37.54443],[126.95791,37.54546],[126.96005,37.54607],[126.96222,37.54813],[126.96224,37.54862],[126.96373,37.54879],[126.9639,37.54976],[126.96234,37.55155],[126.96571,37.55415],[126.96918,37.55566]]]}},{"type":"Feature","properties":{"code":"11200","name":"성동구"},"geometry":{"type":"Polygon","coordinates":[[[127.04341,37.57234],[127.04796,37.57038],[127.05876,37.56231],[127.07086,37.56058],[127.07374,37.55941],[127.05622,37.52832],[127.04601,37.53426],[127.04019,37.53577],[127.02117,37.53582],[127.01744,37.53399],[127.01753,37.53765],[127.01503,37.53827],[127.01387,37.53907],[127.00983,37.53945],[127.00876,37.542],[127.00892,37.54448],[127.00815,37.54506],[127.00921,37.54638],[127.00932,37.54748],[127.0116,37.54849],[127.01217,37.54942],[127.01616,37.55261],[127.01699,37.55366],[127.01686,37.55447],[127.01804,37.55685],[127.0209,37.55783],[127.02192,37.55748],[127.02289,37.55783],[127.02285,37.55898],[127.02241,37.55904],[127.02339,37.56073],[127.02594,37.56262],[127.02675,37.56389],[127.02679,37.56504],[127.02358,37.56518],[127.02339,37.57191],[127.02519,37.57085],[127.02616,37.57125],[127.02768,37.57041],[127.03096,37.56978],[127.03564,37.572],[127.03813,37.57227],[127.03818,37.57302],[127.04191,37.57297],[127.04341,37.57234]]]}},{"type":"Feature","properties":{"code":"11215","name":"광진구"},"geometry":{"type":"Polygon","coordinates":[[[127.10166,37.5724],[127.10313,37.57228],[127.10423,37.57139],[127.10346,37.57005],[127.1012,37.56158],[127.10186,37.55949],[127.10428,37.55756],[127.10493,37.55642],[127.1064,37.55646],[127.10854,37.55825],[127.10953,37.55855],[127.11035,37.55825],[127.1123,37.559],[127.11386,37.55843],[127.11331,37.55683],[127.11525,37.55676],[127.1141,37.55409],[127.11155,37.55051],[127.11147,37.54694],[127.10828,37.54141],[127.09014,37.52701],[127.08563,37.52476],[127.07998,37.52295],[127.07694,37.52252],[127.06866,37.52387],[127.05622,37.52832],[127.07374,37.55941],[127.07238,37.55996],[127.07409,37.56459],[127.07688,37.56793],[127.0782,37.57187],[127.08347,37.57135],[127.0905,37.56969],[127.09561,37.57062],[127.0959,37.57139],[127.09948,37.57275],[127.10089,37.57376],[127.10166,37.5724]]]}},{"type":"Feature","properties":{"code":"11230","name":"동대문구"},"geometry":{"type":"Polygon","coordinates":[[[127.07108,37.60732],[127.07153,37.60464],[127.07288,37.60107],[127.072,37.59963],[127.06949,37.59724],[127.06943,37.59512],[127.07072,37.59189],[127.0703,37.58953],[127.07264,37.58651],[127.07216,37.58496],[127.07618,37.5803],[127.07723,37.57292],[127.07823,37.57189],[127.07688,37.56793],[127.07409,37.56459],[127.07238,37.55996],[127.07086,37.56058],[127.05876,37.56231],[127.04796,37.57038],[127.04191,37.57297],[127.03818,37.57302],[127.03813,37.57227],[127.03564,37.572],[127.03096,37.56978],[127.02768,37.57041],[127.02616,37.57125],[127.02519,37.57085],[127.02337,37.57191],[127.02327,37.57838],[127.02955,37.58269],[127.03207,37.58586],[127.03554,37.58893],[127.03633,37.59013],[127.03622,37.59119],[127.03874,37.59128],[127.04064,37.59541],[127.04139,37.59549],[127.04184,37.59646],[127.04302,37.59697],[127.04371,37.59626],[127.04552,37.59662],[127.04731,37.59615],[127.05102,37.6011],[127.05208,37.60015],[127.05389,37.60042],[127.05508,37.60134],[127.0554,37.60102],[127.05733,37.60153],[127.05732,37.60117],[127.05916,37.60106],[127.06018,37.6017],[127.06017,37.60316],[127.06219,37.60513],[127.06498,37.60583],[127.06619,37.60558],[127.06977,37.60726],[127.07037,37.60704],[127.07106,37.60763],[127.07108,37.60732]]]}},{"type":"Feature","properties":{"code":"11260","name":"중랑구"},"geometry":{"type":"Polygon","coordinates":[[[127.11131,37.62069],[127.11572,37.61963],[127.1162,37.61893],[127.11587,37.61858],[127.11715,37.61789],[127.11668,37.61467],[127.11748,37.61177],[127.1167,37.60885],[127.11848,37.60761],[127.11805,37.6046],[127.11402,37.59997],[127.11688,37.5955],[127.11666,37.59402],[127.11334,37.59326],[127.11068,37.58916],[127.10897,37.58338],[127.10344,37.5806],[127.10289,37.57991],[127.10303,37.57891],[127.10114,37.57607],[127.10095,37.57382],[127.09948,37.57275],[127.0959,37.57139],[127.09561,37.57062],[127.0905,37.56969],[127.08359,37.57133],[127.07815,37.57193],[127.07723,37.57292],[127.07618,37.5803],[127.07216,37.58496],[127.07264,37.58651],[127.0703,37.58954],[127.07072,37.59189],[127.06943,37.59512],[127.06949,37.59724],[127.072,37.59963],[127.07288,37.60107],[127.07153,37.60464],[127.07108,37.60732],[127.07173,37.61351],[127.07019,37.61545],[127.07139,37.6164],[127.07554,37.61716],[127.08607,37.62029],[127.08823,37.61988],[127.08871,37.62024],[127.09321,37.61802],[127.09445,37.619],[127.0962,37.61902],[127.09882,37.62039],[127.10087,37.6194],[127.10168,37.61947],[127.10169,37.62002],[127.10339,37.62027],[127.10492,37.62004],[127.11052,37.62105],[127.11131,37.62069]]]}},{"type":"Feature","properties":{"code":"11290","name":"성북구"},"geometry":{"type":"Polygon","coordinates":[[[127.01059,37.58025],[127.00864,37.58047],[127.00675,37.58234],[127.00727,37.58333],[127.00663,37.58612],[127.00587,37.58697],[127.00425,37.58718],[127.00339,37.58857],[127.00222,37.58917],[127.00147,37.59015],[127.00173,37.59135],[127.00095,37.5923],[126.99536,37.59228],[126.99431,37.59145],[126.99216,37.59199],[126.99143,37.59141],[126.98922,37.59126],[126.9867,37.59275],[126.98543,37.59445],[126.98384,37.59444],[126.98149,37.59534],[126.97874,37.59663],[126.97795,37.59768],[126.97672,37.59791],[126.97768,37.60023],[126.9785,37.601],[126.98285,37.60214],[126.98398,37.60321],[126.98576,37.60345],[126.98679,37.60451],[126.98676,37.60609],[126.98611,37.60739],[126.98683,37.60887],[126.98587,37.60946],[126.98565,37.61138],[126.98658,37.61398],[126.98454,37.616],[126.98372,37.61777],[126.98316,37.61925],[126.98365,37.62115],[126.98183,37.62432],[126.9796,37.62638],[126.98019,37.62793],[126.97993,37.62856],[126.97842,37.62929],[126.97496,37.629],[126.97467,37.62974],[126.97537,37.6317],[126.9778,37.63391],[126.98151,37.63472],[126.98371,37.63646],[126.98592,37.63579],[126.98818,37.63449],[126.98857,37.63379],[126.98946,37.634],[126.98993,37.6328],[126.99137,37.63261],[126.99372,37.63145],[126.99927,37.62619],[127.00298,37.62527],[127.00488,37.62382],[127.00786,37.62402],[127.00721,37.62051],[127.01094,37.61629],[127.01181,37.61632],[127.01445,37.61468],[127.01756,37.61462],[127.0204,37.6126],[127.02191,37.61233],[127.02214,37.61138],[127.02574,37.61214],[127.02643,37.61269],[127.03018,37.61236],[127.03026,37.60897],[127.0375,37.61295],[127.03988,37.61543],[127.04005,37.61622],[127.04052,37.61615],[127.04395,37.61864],[127.04653,37.62233],[127.04974,37.62427],[127.05441,37.6198],[127.06067,37.61566],[127.06175,37.6145],[127.06329,37.61427],[127.06966,37.61573],[127.07145,37.61418],[127.07173,37.61351],[127.07106,37.60763],[127.07037,37.60704],[127.06977,37.60726],[127.06619,37.60558],[127.06498,37.60583],[127.06219,37.60513],[127.06017,37.60316],[127.06018,37.6017],[127.05916,37.60106],[127.05732,37.60117],[127.05733,37.60153],[127.0554,37.60102],[127.05508,37.60134],[127.05389,37.60042],[127.05208,37.60015],[127.05102,37.6011],[127.0473,37.59615],[127.04552,37.59662],[127.04371,37.59626],[127.04302,37.59697],[127.04184,37.59646],[127.04139,37.59549],[127.04064,37.59541],[127.03874,37.59128],[127.03622,37.59119],[127.03633,37.59013],[127.03554,37.58893],[127.03207,37.58586],[127.02955,37.58269],[127.02298,37.57783],[127.02148,37.57886],[127.01811,37.57758],[127.01769,37.57814],[127.01828,37.57903],[127.01668,37.58171],[127.01537,37.58182],[127.01481,37.58233],[127.0132,37.58142],[127.01176,37.58156],[127.01059,37.58025]]]}},{"type":"Feature","properties":{"code":"11305","name":"강북구"},"geometry":{"type":"Polygon","coordinates":[[[127.00457,37.68508],[127.00866,37.68445],[127.00842,37.68322],[127.00938,37.67959],[127.01213,37.6791],[127.01331,37.67783],[127.01391,37.67524],[127.01512,37.67415],[127.01622,37.67393],[127.01787,37.67088],[127.01871,37.67086],[127.01841,37.66889],[127.0166,37.66788],[127.01547,37.66608],[127.01579,37.66494],[127.01537,37.66367],[127.01694,37.66223],[127.01588,37.66132],[127.01452,37.66202],[127.01457,37.66046],[127.01244,37.65218],[127.01291,37.65075],[127.0143,37.6503],[127.01509,37.64928],[127.01731,37.64865],[127.02141,37.64889],[127.02264,37.64786],[127.02468,37.64734],[127.02589,37.64572],[127.03195,37.64217],[127.0332,37.6408],[127.03457,37.63778],[127.03782,37.63604],[127.03814,37.63426],[127.03976,37.6322],[127.04443,37.62882],[127.04706,37.62752],[127.04974,37.62427],[127.04653,37.62233],[127.04395,37.61864],[127.04052,37.61615],[127.04005,37.61622],[127.03988,37.61543],[127.0375,37.61295],[127.03026,37.60897],[127.03018,37.61236],[127.02643,37.61269],[127.02574,37.61214],[127.02214,37.61138],[127.02191,37.61233],[127.0204,37.6126],[127.01756,37.61462],[127.01445,37.61468],[127.01181,37.61632],[127.01094,37.61629],[127.00721,37.62051],[127.00786,37.62402],[127.00488,37.62382],[127.00298,37.62527],[126.99927,37.62619],[126.99372,37.63145],[126.99137,37.63261],[126.98993,37.6328],[126.98946,37.634],[126.98857,37.63379],[126.98743,37.63496],[126.9842,37.63634],[126.98486,37.63681],[126.98553,37.6397],[126.98613,37.64043],[126.98522,37.64164],[126.98426,37.64164],[126.98325,37.64368],[126.98572,37.64609],[126.98493,37.64607],[126.9846,37.64761],[126.98398,37.64818],[126.98394,37.64961],[126.9825,37.65054],[126.98168,37.65232],[126.98105,37.65271],[126.97966,37.65604],[126.98286,37.65645],[126.98301,37.657],[126.98654,37.65949],[126.98728,37.6606],[126.98827,37.66439],[126.99222,37.66523],[126.99402,37.66678],[126.99356,37.6678],[126.99436,37.66957],[126.9938,37.6702],[126.99407,37.67276],[126.99354,37.6741],[126.99398,37.67491],[126.99313,37.67583],[126.99325,37.67766],[126.9922,37.67963],[126.99408,37.68032],[126.99473,37.68124],[126.99674,37.68239],[126.99731,37.68347],[127.00169,37.68434],[127.00224,37.68359],[127.00457,37.68508]]]}},{"type":"Feature","properties":{"code":"11320","name":"도봉구"},"geometry":{"type":"Polygon","coordinates":[[[127.01509,37.64929],[127.0143,37.6503],[127.01314,37.65049],[127.01244,37.65218],[127.01457,37.66046],[127.01452,37.66202],[127.01588,37.66132],[127.01694,37.66223],[127.01618,37.66254],[127.01534,37.66375],[127.01576,37.66699],[127.01841,37.66889],[127.01871,37.67086],[127.01787,37.67088],[127.01622,37.67393],[127.01512,37.67415],[127.01391,37.67524],[127.01331,37.67783],[127.01213,37.6791],[127.00942,37.67957],[127.0089,37.68059],[127.00903,37.68164],[127.00842,37.68322],[127.00829,37.69011],[127.00762,37.69162],[127.00971,37.69336],[127.00967,37.6967],[127.01212,37.69738],[127.01388,37.6988],[127.01542,37.70146],[127.01983,37.70102],[127.02215,37.69972],[127.02339,37.70007],[127.02532,37.69958],[127.0269,37.70025],[127.02702,37.70112],[127.02929,37.69929],[127.02973,37.69627],[127.03103,37.69307],[127.03203,37.69295],[127.03241,37.69184],[127.0385,37.69329],[127.04111,37.6953],[127.04307,37.69523],[127.0434,37.6944],[127.04304,37.69362],[127.04482,37.69294],[127.0449,37.69241],[127.04675,37.69272],[127.04863,37.69406],[127.04997,37.69087],[127.04982,37.68798],[127.05092,37.68616],[127.0518,37.68581],[127.05207,37.68441],[127.05194,37.68295],[127.05123,37.682],[127.05092,37.68009],[127.04874,37.6748],[127.04819,37.67048],[127.04892,37.66758],[127.05141,37.66397],[127.05148,37.65988],[127.05341,37.65752],[127.05401,37.6553],[127.05395,37.65058],[127.05582,37.64705],[127.05499,37.64236],[127.05512,37.64133],[127.05578,37.64063],[127.05467,37.64018],[127.05286,37.6418],[127.05135,37.64482],[127.05047,37.64483],[127.05069,37.64381],[127.04972,37.64351],[127.04904,37.64215],[127.04781,37.6412],[127.04652,37.64105],[127.04667,37.63937],[127.046,37.6379],[127.04533,37.63749],[127.04414,37.63382],[127.04166,37.63147],[127.04266,37.63091],[127.04252,37.63041],[127.03976,37.6322],[127.03814,37.63426],[127.03782,37.63604],[127.03457,37.63778],[127.03242,37.64183],[127.02589,37.64572],[127.02468,37.64734],[127.02266,37.64785],[127.02113,37.649],[127.0177,37.64858],[127.01509,37.64929]]]}},{"type":"Feature","properties":{"code":"11350","name":"노원구"},"geometry":{"type":"Polygon","coordinates":[[[127.11085,37.63841],[127.11248,37.63649],[127.11241,37.63425],[127.1116,37.63385],[127.1122,37.63264],[127.11083,37.63078],[127.10591,37.62759],[127.10407,37.62165],[127.10491,37.62157],[127.10566,37.62042],[127.10492,37.62004],[127.10169,37.62002],[127.10167,37.61947],[127.10087,37.6194],[127.09882,37.62039],[127.0962,37.61902],[127.09445,37.619],[127.09321,37.61802],[127.08871,37.62024],[127.08823,37.61988],[127.08607,37.62029],[127.07554,37.61716],[127.07138,37.6164],[127.07016,37.6154],[127.06966,37.61573],[127.06325,37.61427],[127.06146,37.61464],[127.06067,37.61566],[127.05441,37.6198],[127.04966,37.62433],[127.04706,37.62752],[127.04443,37.62882],[127.04166,37.63147],[127.04414,37.63382],[127.04533,37.63749],[127.046,37.6379],[127.04667,37.63937],[127.04652,37.64105],[127.04781,37.6412],[127.04904,37.64215],[127.04972,37.64351],[127.05069,37.64381],[127.05047,37.64483],[127.05135,37.64482],[127.05286,37.6418],[127.05467,37.64018],[127.05578,37.64063],[127.05512,37.64133],[127.05499,37.64236],[127.05582,37.64705],[127.05395,37.65058],[127.05401,37.6553],[127.05341,37.65752],[127.05148,37.65988],[127.05141,37.66397],[127.04892,37.66758],[127.04819,37.6705],[127.04874,37.6748],[127.05092,37.68009],[127.05123,37.682],[127.05194,37.68295],[127.0518,37.68707],[127.05518,37.6892],[127.05839,37.68969],[127.05966,37.69033],[127.06221,37.69281],[127.06273,37.69468],[127.06339,37.69492],[127.06631,37.69444],[127.06783,37.69477],[127.06915,37.69369],[127.07266,37.6938],[127.07491,37.69522],[127.0811,37.69614],[127.08384,37.69427],[127.08391,37.69178],[127.08518,37.69039],[127.09055,37.68957],[127.09304,37.68997],[127.09429,37.68913],[127.096,37.68907],[127.09558,37.6884],[127.09608,37.68791],[127.09642,37.68564],[127.09292,37.68155],[127.09279,37.68005],[127.09195,37.67919],[127.09248,37.67764],[127.09385,37.67666],[127.09461,37.67354],[127.09575,37.67267],[127.09575,37.67062],[127.09645,37.66969],[127.09624,37.66883],[127.09498,37.6676],[127.09458,37.66617],[127.09468,37.66492],[127.09541,37.66389],[127.09414,37.6633],[127.09121,37.65933],[127.09113,37.65824],[127.09189,37.65743],[127.09307,37.65378],[127.09404,37.65254],[127.09247,37.64971],[127.09269,37.64858],[127.09383,37.64732],[127.09363,37.64663],[127.09447,37.64585],[127.09457,37.64457],[127.09756,37.64396],[127.10288,37.64541],[127.10658,37.64538],[127.10769,37.64497],[127.10929,37.64286],[127.1099,37.64249],[127.11075,37.64273],[127.11142,37.64209],[127.11135,37.6415],[127.11222,37.64038],[127.11057,37.63936],[127.11085,37.63841]]]}},{"type":"Feature","properties":{"code":"11380","name":"은평구"},"geometry":{"type":"Polygon","coordinates":[[[126.95172,37.65489],[126.95419,37.65521],[126.95435,37.6546],[126.95711,37.65284],[126.95784,37.64805],[126.95903,37.64678],[126.95927,37.64213],[126.9616,37.63799],[126.96333,37.63325],[126.95982,37.62976],[126.95747,37.62913],[126.95638,37.62822],[126.95521,37.62815],[126.95403,37.62736],[126.95041,37.62642],[126.949,37.62434],[126.9489,37.62325],[126.9499,37.62092],[126.94984,37.61877],[126.9507,37.61553],[126.95071,37.61352],[126.94981,37.61166],[126.95036,37.61062],[126.9482,37.60863],[126.94374,37.60621],[126.94367,37.60504],[126.94213,37.60494],[126.94124,37.60313],[126.93996,37.60308],[126.93984,37.60187],[126.94139,37.60065],[126.94088,37.59872],[126.93871,37.59752],[126.93754,37.59787],[126.93279,37.59631],[126.93025,37.59455],[126.92776,37.59158],[126.9276,37.58939],[126.928,37.58839],[126.92631,37.58729],[126.92386,37.5871],[126.92365,37.58615],[126.92185,37.58469],[126.92175,37.58346],[126.92086,37.58294],[126.91889,37.58338],[126.91594,37.5831],[126.91568,37.58499],[126.91637,37.58588],[126.91531,37.58542],[126.9157,37.58598],[126.91285,37.58722],[126.9119,37.58581],[126.90183,37.57654],[126.90264,37.57639],[126.90208,37.576],[126.88872,37.58475],[126.88203,37.59082],[126.88358,37.59185],[126.88514,37.59375],[126.88734,37.59392],[126.88547,37.5911],[126.88575,37.58957],[126.88716,37.58853],[126.88958,37.58913],[126.89144,37.58847],[126.89333,37.58907],[126.89686,37.58857],[126.89808,37.58954],[126.89975,37.58994],[126.8997,37.59136],[126.89896,37.59268],[126.90183,37.59514],[126.90101,37.59734],[126.90132,37.59937],[126.89998,37.60204],[126.90015,37.60312],[126.90211,37.60374],[126.9003,37.61119],[126.90173,37.61407],[126.90182,37.61575],[126.90313,37.6173],[126.90336,37.61884],[126.90523,37.61907],[126.90556,37.62062],[126.90712,37.62194],[126.90663,37.6245],[126.90861,37.62627],[126.9088,37.62909],[126.90729,37.63087],[126.9062,37.63322],[126.90912,37.63433],[126.91121,37.63591],[126.91009,37.63851],[126.91228,37.64432],[126.90771,37.64629],[126.9048,37.6492],[126.91372,37.64476],[126.92412,37.64611],[126.9297,37.65005],[126.93571,37.6512],[126.93716,37.65232],[126.93967,37.65624],[126.9427,37.65792],[126.94756,37.65922],[126.948,37.65857],[126.94788,37.65713],[126.9492,37.65677],[126.94979,37.65591],[126.95172,37.65489]]]}},{"type":"Feature","properties":{"code":"11410","name":"서대문구"},"geometry":{"type":"Polygon","coordinates":[[[126.95268,37.60274],[126.95247,37.60162],[126.95336,37.60017],[126.95306,37.59876],[126.95541,37.59927],[126.95771,37.59837],[126.95905,37.59503],[126.95752,37.59353],[126.95782,37.59146],[126.95737,37.58697],[126.95799,37.58443],[126.95755,37.5823],[126.95817,37.58098],[126.95722,37.58035],[126.9572,37.57982],[126.95568,37.57968],[126.95356,37.57875],[126.96669,37.56583],[126.96946,37.56198],[126.96684,37.56127],[126.96398,37.55946],[126.96167,37.55903],[126.95913,37.55724],[126.94137,37.55655],[126.93686,37.5551],[126.9266,37.55885],[126.92677,37.56109],[126.92828,37.56333],[126.92601,37.5651],[126.91844,37.56711],[126.91399,37.56905],[126.90879,37.57145],[126.90208,37.576],[126.90264,37.57639],[126.90183,37.57654],[126.9119,37.58581],[126.91285,37.58722],[126.9157,37.58598],[126.91531,37.58542],[126.91637,37.58588],[126.91568,37.58499],[126.91594,37.58309],[126.91889,37.58338],[126.92086,37.58294],[126.92175,37.58346],[126.92185,37.58469],[126.92365,37.58615],[126.92386,37.5871],[126.92631,37.58729],[126.928,37.58839],[126.9276,37.58939],[126.92776,37.59158],[126.93025,37.59455],[126.93279,37.59631],[126.93754,37.59787],[126.93871,37.59752],[126.94088,37.59872],[126.94139,37.60065],[126.93984,37.60187],[126.93996,37.60308],[126.94124,37.60313],[126.94213,37.60494],[126.94367,37.60504],[126.94374,37.60621],[126.9482,37.60863],[126.94989,37.61039],[126.95038,37.61061],[126.9506,37.60836],[126.95145,37.60801],[126.9531,37.6055],[126.95406,37.60507],[126.95268,37.60274]]]}},{"type":"Feature","properties":{"code":"11440","name":"마포구"},"geometry":{"type":"Polygon","coordinates":[[[126.88888,37.58464],[126.90879,37.57145],[126.91844,37.56711],[126.92601,37.5651],[126.92828,37.56333],[126.92677,37.56109],[126.9266,37.55885],[126.93686,37.5551],[126.94137,37.55655],[126.95913,37.55724],[126.96169,37.55898],[126.96157,37.55842],[126.96308,37.5582],[126.96343,37.55695],[126.96177,37.55479],[126.96235,37.55151],[126.9639,37.54976],[126.96373,37.54879],[126.96224,37.54862],[126.96222,37.54813],[126.96005,37.54607],[126.95791,37.54546],[126.95811,37.54443],[126.95757,37.54422],[126.95741,37.54323],[126.95835,37.54276],[126.95818,37.54231],[126.95699,37.54164],[126.95573,37.53947],[126.9541,37.53893],[126.95338,37.53755],[126.95129,37.53629],[126.94879,37.53558],[126.94749,37.53583],[126.94738,37.53522],[126.94628,37.53569],[126.9451,37.53496],[126.94459,37.53378],[126.93856,37.53783],[126.93033,37.54136],[126.9271,37.53903],[126.92308,37.54045],[126.92242,37.54143],[126.90483,37.54142],[126.89894,37.54801],[126.88826,37.55221],[126.86629,37.56305],[126.85607,37.56944],[126.85363,37.57179],[126.85363,37.5738],[126.85929,37.57492],[126.86494,37.57747],[126.87626,37.57818],[126.87626,37.57896],[126.87708,37.5789],[126.87763,37.57975],[126.87663,37.58138],[126.87733,37.58405],[126.87654,37.58444],[126.87719,37.58494],[126.87754,37.58625],[126.87913,37.58677],[126.88035,37.58951],[126.88206,37.59079],[126.88888,37.58464]]]}},{"type":"Feature","properties":{"code":"11470","name":"양천구"},"geometry":{"type":"Polygon","coordinates":[[[126.87405,37.54694],[126.87796,37.5471],[126.88026,37.54774],[126.87995,37.54813],[126.88081,37.54808],[126.88409,37.54464],[126.88425,37.54357],[126.88509,37.54331],[126.88653,37.53936],[126.89,37.53471],[126.89004,37.53371],[126.88869,37.53281],[126.88863,37.53212],[126.89068,37.53166],[126.88954,37.53],[126.88846,37.53041],[126.88715,37.53018],[126.88418,37.52867],[126.88343,37.52733],[126.88091,37.52771],[126.8806,37.5274],[126.88117,37.52652],[126.88094,37.52591],[126.87875,37.52535],[126.87943,37.5205],[126.8782,37.51878],[126.87874,37.51794],[126.87959,37.51764],[126.87856,37.51754],[126.879,37.5169],[126.87795,37.51614],[126.87758,37.51466],[126.87791,37.51334],[126.87665,37.51368],[126.8761,37.51242],[126.87518,37.51245],[126.87394,37.51117],[126.87468,37.51075],[126.87518,37.51183],[126.87684,37.51084],[126.87552,37.51107],[126.87518,37.51052],[126.87551,37.50955],[126.8738,37.50906],[126.87504,37.50771],[126.87421,37.50717],[126.87471,37.50667],[126.87358,37.50356],[126.87187,37.50413],[126.87145,37.50507],[126.87026,37.50585],[126.86901,37.50485],[126.86544,37.50557],[126.86455,37.50499],[126.86351,37.50501],[126.86258,37.50678],[126.86408,37.50834],[126.86032,37.50662],[126.85833,37.50992],[126.85561,37.50916],[126.85287,37.51069],[126.85009,37.51013],[126.84871,37.50888],[126.84729,37.50948],[126.84623,37.50898],[126.84605,37.50809],[126.84438,37.50649],[126.84468,37.50574],[126.84243,37.50548],[126.84074,37.50604],[126.83959,37.5045],[126.83849,37.50442],[126.83749,37.50328],[126.83525,37.50287],[126.83201,37.50468],[126.83057,37.50636],[126.83103,37.50803],[126.82811,37.5088],[126.82699,37.5085],[126.82705,37.50922],[126.82642,37.50945],[126.82707,37.51036],[126.82406,37.51048],[126.82426,37.51447],[126.8234,37.51495],[126.8231,37.51622],[126.8245,37.51772],[126.82562,37.52008],[126.82566,37.52224],[126.82516,37.52306],[126.82651,37.52493],[126.82884,37.52652],[126.82794,37.528],[126.82821,37.52903],[126.82531,37.52996],[126.82343,37.53262],[126.82355,37.53376],[126.8227,37.53375],[126.82187,37.5349],[126.82243,37.53654],[126.82159,37.53971],[126.82205,37.54066],[126.82539,37.54168],[126.82608,37.54297],[126.82574,37.5443],[126.82758,37.54768],[126.82976,37.54773],[126.83046,37.54577],[126.82968,37.5441],[126.83023,37.54263],[126.82999,37.54166],[126.8331,37.54185],[126.83516,37.53753],[126.83511,37.53673],[126.83441,37.53646],[126.84049,37.52648],[126.86397,37.52979],[126.86344,37.5361],[126.86378,37.54071],[126.86212,37.54436],[126.86421,37.55115],[126.871,37.54757],[126.87405,37.54694]]]}},{"type":"Feature","properties":{"code":"11500","name":"강서구"},"geometry":{"type":"Polygon","coordinates":[[[126.80645,37.60224],[126.81753,37.59533],[126.8193,37.59285],[126.82781,37.58748],[126.83176,37.58584],[126.84324,37.57888],[126.85352,37.5719],[126.85607,37.56944],[126.86383,37.56449],[126.88046,37.55627],[126.87924,37.55475],[126.87922,37.55315],[126.87793,37.55334],[126.87805,37.5517],[126.88079,37.54809],[126.87995,37.54813],[126.88026,37.54774],[126.87796,37.5471],[126.87243,37.54711],[126.86421,37.55115],[126.86212,37.54436],[126.86378,37.54071],[126.86344,37.5361],[126.86397,37.52979],[126.84048,37.52649],[126.83441,37.53646],[126.83511,37.53673],[126.83516,37.53753],[126.8331,37.54185],[126.82999,37.54166],[126.83023,37.54263],[126.82968,37.5441],[126.83046,37.54577],[126.82976,37.54773],[126.82758,37.54768],[126.82574,37.5443],[126.82608,37.54297],[126.82539,37.54168],[126.82212,37.54068],[126.81233,37.54074],[126.80624,37.54441],[126.80732,37.54359],[126.80185,37.54272],[126.79965,37.54139],[126.80055,37.54147],[126.80033,37.54086],[126.80081,37.54081],[126.79886,37.54029],[126.79874,37.5394],[126.79943,37.53902],[126.79946,37.53773],[126.79825,37.53771],[126.79835,37.53725],[126.79604,37.53675],[126.79443,37.53583],[126.79394,37.53942],[126.79326,37.5397],[126.79438,37.54023],[126.79494,37.54137],[126.79181,37.5419],[126.79182,37.54375],[126.78939,37.54446],[126.78726,37.54608],[126.78184,37.54607],[126.77756,37.54671],[126.77674,37.5482],[126.77529,37.54897],[126.77155,37.54832],[126.76992,37.55018],[126.77027,37.55109],[126.76747,37.55195],[126.76755,37.55417],[126.76637,37.55376],[126.76634,37.55487],[126.76449,37.55528],[126.76672,37.55632],[126.76628,37.55692],[126.76735,37.55662],[126.76987,37.55723],[126.77243,37.55701],[126.77318,37.55753],[126.77177,37.55863],[126.77319,37.55929],[126.77359,37.56006],[126.77429,37.55976],[126.77417,37.56016],[126.77493,37.5609],[126.77468,37.56132],[126.77576,37.56194],[126.77784,37.55993],[126.77751,37.56228],[126.77663,37.56237],[126.7771,37.56372],[126.77594,37.56521],[126.77534,37.56534],[126.77476,37.56771],[126.77553,37.56826],[126.7754,37.56732],[126.77633,37.56709],[126.77672,37.56605],[126.77781,37.56699],[126.779,37.56715],[126.77917,37.56832],[126.78032,37.5675],[126.78047,37.56829],[126.7819,37.56924],[126.78052,37.57046],[126.78149,37.57018],[126.78263,37.57055],[126.78137,37.57135],[126.78241,37.57361],[126.78761,37.57558],[126.78805,37.57617],[126.7892,37.57558],[126.78847,37.5768],[126.78934,37.57772],[126.79002,37.57735],[126.79059,37.57778],[126.79073,37.58061],[126.79135,37.58141],[126.79237,37.57973],[126.79274,37.57684],[126.79322,37.57689],[126.79285,37.58017],[126.79331,37.58025],[126.79391,37.58296],[126.79344,37.58452],[126.79422,37.58407],[126.7947,37.58262],[126.79493,37.5852],[126.79554,37.58515],[126.79572,37.58312],[126.7971,37.58427],[126.79629,37.5849],[126.79723,37.58539],[126.79877,37.58807],[126.80074,37.58783],[126.80077,37.58904],[126.80123,37.58935],[126.7988,37.59132],[126.79899,37.59243],[126.80005,37.59203],[126.8005,37.59241],[126.79749,37.5951],[126.79708,37.59774],[126.79754,37.59779],[126.79792,37.60001],[126.79993,37.60144],[126.79994,37.60254],[126.80258,37.60503],[126.80645,37.60224]]]}},{"type":"Feature","properties":{"code":"11530","name":"구로구"},"geometry":{"type":"Polygon","coordinates":[[[126.87948,37.51778],[126.88268,37.51581],[126.88271,37.51514],[126.88431,37.51436],[126.88442,37.51381],[126.88971,37.51223],[126.89067,37.51067],[126.89189,37.51012],[126.89397,37.50501],[126.89317,37.5046],[126.8933,37.50395],[126.89269,37.50331],[126.89313,37.50268],[126.89276,37.50084],[126.89404,37.49816],[126.89612,37.48934],[126.89815,37.48693],[126.90171,37.48523],[126.9032,37.485],[126.89976,37.48077],[126.89899,37.47915],[126.89509,37.4785],[126.88879,37.47979],[126.88616,37.48235],[126.88272,37.48475],[126.87846,37.48666],[126.87456,37.48537],[126.87514,37.48679],[126.87597,37.48691],[126.87679,37.48857],[126.87604,37.48905],[126.87519,37.48851],[126.87434,37.48886],[126.87275,37.48843],[126.87241,37.48933],[126.87284,37.49001],[126.87375,37.49048],[126.87411,37.48978],[126.87465,37.4899],[126.87445,37.49043],[126.87484,37.49075],[126.87413,37.49134],[126.87225,37.4906],[126.87157,37.49076],[126.87134,37.48983],[126.87023,37.4896],[126.86968,37.49043],[126.86999,37.49102],[126.8693,37.49185],[126.87002,37.49226],[126.86937,37.49272],[126.87002,37.49366],[126.86823,37.49513],[126.86679,37.49424],[126.86778,37.49408],[126.86737,37.49307],[126.8666,37.49289],[126.86456,37.49102],[126.86177,37.49033],[126.85797,37.48608],[126.85517,37.48517],[126.85386,37.48284],[126.85296,37.48248],[126.8527,37.48182],[126.8507,37.48153],[126.84813,37.4821],[126.84652,37.4816],[126.84599,37.4807],[126.84536,37.47381],[126.84496,37.47347],[126.84425,37.4746],[126.84278,37.47497],[126.84083,37.47466],[126.8383,37.47539],[126.83464,37.47436],[126.83487,37.47575],[126.83348,37.47716],[126.83175,37.47765],[126.82962,37.4769],[126.8292,37.4762],[126.82395,37.47647],[126.82172,37.47522],[126.82178,37.4762],[126.81942,37.47633],[126.81906,37.47594],[126.81941,37.47518],[126.81832,37.4753],[126.81863,37.47408],[126.81764,37.47319],[126.81463,37.47465],[126.8153,37.47636],[126.81721,37.47814],[126.81826,37.47816],[126.81937,37.47986],[126.81999,37.48164],[126.81929,37.48548],[126.82239,37.48672],[126.82359,37.48774],[126.82301,37.48815],[126.82276,37.48998],[126.81789,37.49154],[126.81549,37.4932],[126.81457,37.49319],[126.81435,37.49443],[126.81301,37.4964],[126.81404,37.49735],[126.81428,37.49827],[126.8161,37.49764],[126.81964,37.49921],[126.81942,37.50079],[126.82156,37.50216],[126.82183,37.50454],[126.82255,37.50569],[126.82222,37.50769],[126.82627,37.50877],[126.83065,37.50822],[126.83104,37.5079],[126.83057,37.50636],[126.8316,37.50511],[126.83525,37.50287],[126.83749,37.50328],[126.83849,37.50442],[126.83959,37.5045],[126.84074,37.50604],[126.84243,37.50548],[126.84468,37.50574],[126.84438,37.50649],[126.84605,37.50809],[126.84623,37.50898],[126.84729,37.50948],[126.84871,37.50888],[126.85009,37.51013],[126.85287,37.51069],[126.85561,37.50916],[126.85833,37.50992],[126.86032,37.50662],[126.86408,37.50834],[126.86258,37.50678],[126.86351,37.50501],[126.86455,37.50499],[126.86544,37.50557],[126.86901,37.50485],[126.87026,37.50585],[126.87145,37.50507],[126.87187,37.50413],[126.87357,37.50355],[126.87471,37.50667],[126.87421,37.50717],[126.87504,37.50771],[126.8738,37.50906],[126.87551,37.50955],[126.87518,37.51052],[126.87552,37.51107],[126.87684,37.51084],[126.87518,37.51183],[126.87468,37.51075],[126.87394,37.51117],[126.87518,37.51245],[126.8761,37.51242],[126.87665,37.51368],[126.87791,37.51334],[126.87758,37.51466],[126.87795,37.51614],[126.879,37.5169],[126.87856,37.51754],[126.87948,37.51778]]]}},{"type":"Feature","properties":{"code":"11545","name":"금천구"},"geometry":{"type":"Polygon","coordinates":[[[126.87456,37.48537],[126.87846,37.48666],[126.88272,37.48475],[126.88616,37.48235],[126.88879,37.47979],[126.89509,37.4785],[126.90979,37.48077],[126.90993,37.48025],[126.90898,37.48009],[126.90862,37.47908],[126.90948,37.47802],[126.91043,37.47836],[126.91182,37.47781],[126.91136,37.47448],[126.91075,37.4736],[126.9082,37.47268],[126.90959,37.47069],[126.91024,37.46924],[126.90996,37.46876],[126.91104,37.46808],[126.91238,37.46588],[126.91369,37.46543],[126.91289,37.46394],[126.91439,37.46158],[126.91403,37.45789],[126.91495,37.45731],[126.9169,37.45752],[126.91832,37.45693],[126.92219,37.45663],[126.92309,37.45451],[126.92479,37.45283],[126.9257,37.45291],[126.92731,37.45101],[126.92839,37.45099],[126.92828,37.44935],[126.92325,37.44577],[126.92276,37.44404],[126.92117,37.44255],[126.92027,37.44047],[126.91926,37.43985],[126.91612,37.44005],[126.91231,37.43858],[126.9112,37.4372],[126.91133,37.43617],[126.90941,37.43386],[126.90725,37.43352],[126.90611,37.43399],[126.90299,37.43407],[126.90275,37.43586],[126.89898,37.4387],[126.89881,37.43935],[126.89993,37.43956],[126.89727,37.44544],[126.89578,37.44563],[126.89465,37.4467],[126.895,37.44822],[126.89605,37.44804],[126.89398,37.45272],[126.89325,37.45276],[126.89259,37.45195],[126.88964,37.45232],[126.8892,37.45472],[126.88626,37.45636],[126.88587,37.45759],[126.88634,37.45896],[126.88538,37.45947],[126.88544,37.46012],[126.88613,37.4609],[126.88888,37.46095],[126.88712,37.4629],[126.88514,37.46247],[126.88432,37.46272],[126.88275,37.46439],[126.88287,37.46496],[126.88434,37.46546],[126.88462,37.46601],[126.88163,37.46846],[126.88159,37.46942],[126.87599,37.4771],[126.87338,37.48243],[126.87274,37.48242],[126.8733,37.48418],[126.87221,37.48443],[126.87176,37.48527],[126.8729,37.48625],[126.87394,37.48525],[126.87456,37.48537]]]}},{"type":"Feature","properties":{"code":"11560","name":"영등포구"},"geometry":{"type":"Polygon","coordinates":[[[126.88046,37.55627],[126.88826,37.55221],[126.89894,37.54801],[126.90483,37.54142],[126.92242,37.54143],[126.92308,37.54045],[126.9271,37.53903],[126.93033,37.54136],[126.93856,37.53783],[126.94422,37.53424],[126.94988,37.52703],[126.94989,37.51751],[126.93928,37.51608],[126.92686,37.51554],[126.92696,37.51321],[126.92679,37.5128],[126.92539,37.51252],[126.92029,37.50003],[126.91982,37.4978],[126.91213,37.49618],[126.9032,37.485],[126.89865,37.48664],[126.89612,37.48934],[126.89404,37.49816],[126.89276,37.50083],[126.89313,37.50268],[126.89269,37.50331],[126.8933,37.50395],[126.89317,37.5046],[126.89397,37.50501],[126.89189,37.51012],[126.89067,37.51067],[126.88971,37.51223],[126.88442,37.51381],[126.88431,37.51436],[126.88271,37.51514],[126.88268,37.51581],[126.87874,37.51794],[126.8782,37.51878],[126.87944,37.5206],[126.87861,37.52507],[126.87928,37.52572],[126.88094,37.52591],[126.88117,37.52652],[126.88067,37.52755],[126.88343,37.52733],[126.88418,37.52867],[126.88715,37.53018],[126.88846,37.53041],[126.88954,37.53],[126.89068,37.53166],[126.88863,37.53212],[126.88869,37.5328],[126.89004,37.53371],[126.88992,37.53486],[126.88653,37.53936],[126.88509,37.54331],[126.88425,37.54356],[126.88409,37.54464],[126.88036,37.54846],[126.87805,37.5517],[126.87795,37.55345],[126.87922,37.55315],[126.87924,37.55475],[126.88046,37.55627]]]}},{"type":"Feature","properties":{"code":"11590","name":"동작구"},"geometry":{"type":"Polygon","coordinates":[[[126.95471,37.51603],[126.96119,37.51346],[126.96692,37.50988],[126.97525,37.50702],[126.9804,37.50654],[126.9804,37.50459],[126.97983,37.50418],[126.98039,37.50286],[126.98539,37.49986],[126.98293,37.49699],[126.98169,37.47653],[126.97842,37.47665],[126.97052,37.47538],[126.97024,37.47652],[126.96883,37.4766],[126.96634,37.47892],[126.96479,37.47949],[126.96394,37.48102],[126.96107,37.48358],[126.96199,37.48518],[126.96167,37.48599],[126.96195,37.4886],[126.96078,37.49082],[126.9614,37.49148],[126.96138,37.49287],[126.96029,37.49374],[126.95932,37.4938],[126.95748,37.49198],[126.95371,37.49063],[126.95169,37.49218],[126.94881,37.49314],[126.94878,37.49382],[126.94697,37.49408],[126.94454,37.49314],[126.94444,37.4925],[126.94284,37.49216],[126.94158,37.49219],[126.94038,37.49296],[126.93924,37.49221],[126.93726,37.49193],[126.93438,37.49307],[126.93136,37.49322],[126.92788,37.49507],[126.92558,37.4928],[126.92416,37.48996],[126.91871,37.49014],[126.91422,37.48836],[126.91125,37.48626],[126.9061,37.48496],[126.9032,37.485],[126.91213,37.49618],[126.91982,37.4978],[126.92029,37.50003],[126.92539,37.51252],[126.92679,37.5128],[126.92696,37.51322],[126.92686,37.51554],[126.93928,37.51608],[126.94956,37.51762],[126.95471,37.51603]]]}},{"type":"Feature","properties":{"code":"11620","name":"관악구"},"geometry":{"type":"Polygon","coordinates":[[[126.92802,37.49502],[126.93136,37.49322],[126.93438,37.49307],[126.93726,37.49193],[126.93924,37.49221],[126.94038,37.49296],[126.94158,37.49219],[126.94284,37.49216],[126.94444,37.4925],[126.94454,37.49314],[126.94697,37.49408],[126.94878,37.49382],[126.94881,37.49314],[126.95169,37.49218],[126.95371,37.49063],[126.95748,37.49198],[126.95932,37.4938],[126.96029,37.49374],[126.96138,37.49287],[126.9614,37.49149],[126.96078,37.49082],[126.96195,37.4886],[126.96167,37.48599],[126.96199,37.48518],[126.96107,37.48358],[126.96394,37.48102],[126.96479,37.47949],[126.96634,37.47892],[126.96883,37.4766],[126.97024,37.47652],[126.97052,37.47538],[126.97842,37.47665],[126.98169,37.47653],[126.98216,37.47372],[126.98319,37.47161],[126.98727,37.46762],[126.9871,37.46723],[126.98793,37.46594],[126.98834,37.464],[126.98754,37.46022],[126.98864,37.45817],[126.98661,37.45721],[126.9819,37.45694],[126.9824,37.45589],[126.97848,37.45573],[126.97458,37.45441],[126.97175,37.45174],[126.97057,37.44945],[126.96766,37.44838],[126.96429,37.44627],[126.96393,37.44521],[126.96463,37.44204],[126.96294,37.44028],[126.96006,37.4404],[126.95897,37.43907],[126.95637,37.43875],[126.95241,37.43919],[126.95116,37.43844],[126.95093,37.43873],[126.94928,37.43825],[126.94836,37.43871],[126.94509,37.43709],[126.94142,37.4374],[126.94022,37.43571],[126.93862,37.43603],[126.93727,37.43863],[126.93786,37.4402],[126.93735,37.44087],[126.9349,37.44321],[126.93055,37.44547],[126.93017,37.44837],[126.9284,37.45021],[126.92839,37.45099],[126.92731,37.45101],[126.9257,37.45291],[126.92479,37.45283],[126.92309,37.45451],[126.92253,37.45633],[126.9169,37.45752],[126.91495,37.45731],[126.91403,37.45789],[126.91439,37.46158],[126.91289,37.46394],[126.91369,37.46543],[126.91238,37.46588],[126.91104,37.46808],[126.90996,37.46876],[126.91024,37.46924],[126.90959,37.47069],[126.9082,37.47268],[126.91075,37.4736],[126.91136,37.47448],[126.91182,37.47781],[126.91043,37.47836],[126.90948,37.47802],[126.90862,37.47908],[126.90898,37.48009],[126.90993,37.48025],[126.90979,37.48077],[126.89894,37.47894],[126.89971,37.4807],[126.9032,37.485],[126.9061,37.48496],[126.91125,37.48626],[126.91422,37.48836],[126.91871,37.49014],[126.92416,37.48996],[126.92558,37.4928],[126.92745,37.49499],[126.92802,37.49502]]]}},{"type":"Feature","properties":{"code":"11650","name":"서초구"},"geometry":{"type":"Polygon","coordinates":[[[127.01317,37.52259],[127.01522,37.52485],[127.01782,37.52181],[127.02052,37.5128],[127.03409,37.48437],[127.04175,37.48544],[127.04504,37.47732],[127.05083,37.47164],[127.04867,37.47006],[127.05103,37.46936],[127.05076,37.4673],[127.05421,37.46811],[127.05504,37.46885],[127.05608,37.46844],[127.05909,37.46919],[127.06381,37.469],[127.06857,37.47101],[127.06994,37.47093],[127.07268,37.47196],[127.07537,37.47349],[127.07691,37.47516],[127.07899,37.47477],[127.0845,37.47561],[127.08488,37.47551],[127.08417,37.47282],[127.08503,37.4712],[127.08671,37.47066],[127.08816,37.46832],[127.08904,37.46824],[127.09162,37.46563],[127.09203,37.46479],[127.09202,37.46227],[127.09319,37.46127],[127.09568,37.461],[127.0949,37.45848],[127.09544,37.45756],[127.09521,37.45632],[127.09354,37.45589],[127.09273,37.45363],[127.09113,37.45296],[127.08954,37.45017],[127.08882,37.44975],[127.08786,37.44489],[127.08386,37.44392],[127.08243,37.44158],[127.08125,37.44112],[127.07601,37.44214],[127.07214,37.44226],[127.07163,37.44152],[127.07201,37.43886],[127.07384,37.43741],[127.07302,37.43641],[127.07127,37.4356],[127.07152,37.43412],[127.07057,37.43242],[127.07121,37.43082],[127.07095,37.43021],[127.06987,37.43097],[127.06896,37.43043],[127.06827,37.43068],[127.0667,37.43013],[127.06568,37.42899],[127.06332,37.42975],[127.06114,37.42999],[127.05996,37.42957],[127.05807,37.43001],[127.05232,37.4283],[127.04987,37.43031],[127.04737,37.4307],[127.04722,37.43204],[127.04631,37.43345],[127.04463,37.43407],[127.04419,37.43506],[127.04109,37.43777],[127.04005,37.43824],[127.03707,37.43827],[127.03557,37.439],[127.03517,37.44094],[127.03748,37.44327],[127.03821,37.44586],[127.03725,37.44645],[127.03753,37.44736],[127.03716,37.44801],[127.03774,37.44942],[127.03578,37.4522],[127.03475,37.45262],[127.03559,37.45409],[127.03713,37.45521],[127.03674,37.45644],[127.03502,37.45789],[127.03492,37.46018],[127.03401,37.4603],[127.03373,37.46124],[127.03469,37.46415],[127.03192,37.46552],[127.02953,37.46537],[127.02961,37.46328],[127.02804,37.46125],[127.02836,37.45989],[127.02657,37.45964],[127.026,37.45782],[127.02279,37.45725],[127.0217,37.45632],[127.01969,37.45579],[127.01726,37.45606],[127.01506,37.45483],[127.01237,37.45555],[127.01082,37.45542],[127.01058,37.45617],[127.00871,37.45776],[127.00821,37.4591],[127.00447,37.46407],[127.00491,37.46584],[127.00368,37.46772],[127.00273,37.46712],[126.99675,37.46707],[126.99623,37.46661],[126.99662,37.46478],[126.99737,37.46369],[126.99677,37.46187],[126.99335,37.4615],[126.99266,37.46034],[126.9917,37.46052],[126.98865,37.45814],[126.98788,37.45927],[126.98752,37.46067],[126.98834,37.464],[126.98793,37.46594],[126.9871,37.46723],[126.98727,37.46762],[126.98319,37.47161],[126.98172,37.47568],[126.98293,37.49699],[126.98539,37.49986],[126.98039,37.50286],[126.97983,37.50418],[126.9804,37.50459],[126.9804,37.50654],[126.98554,37.50654],[126.99068,37.5131],[127.00646,37.52344],[127.00858,37.5256],[127.01317,37.52259]]]}},{"type":"Feature","properties":{"code":"11680","name":"강남구"},"geometry":{"type":"Polygon","coordinates":[[[127.03968,37.53584],[127.04601,37.53426],[127.05513,37.52867],[127.0675,37.52458],[127.06773,37.51932],[127.06982,37.50274],[127.07699,37.50207],[127.09479,37.49668],[127.10352,37.4927],[127.10701,37.49029],[127.12421,37.46652],[127.12186,37.46514],[127.12075,37.46389],[127.11747,37.4622],[127.11699,37.46148],[127.1169,37.45864],[127.1155,37.4587],[127.11396,37.45952],[127.11276,37.46053],[127.11333,37.46109],[127.11182,37.46164],[127.10667,37.46241],[127.10434,37.46217],[127.10478,37.46116],[127.10394,37.46005],[127.10263,37.45987],[127.10138,37.45897],[127.10106,37.45799],[127.09974,37.45735],[127.09889,37.45612],[127.09522,37.45639],[127.09544,37.45756],[127.0949,37.45848],[127.09568,37.461],[127.09319,37.46127],[127.09202,37.46227],[127.09203,37.46479],[127.09162,37.46563],[127.08904,37.46824],[127.08816,37.46832],[127.08671,37.47066],[127.08503,37.4712],[127.08417,37.47282],[127.08488,37.47551],[127.0845,37.47561],[127.07899,37.47477],[127.07691,37.47516],[127.07537,37.47349],[127.07268,37.47196],[127.06994,37.47093],[127.06857,37.47101],[127.06381,37.469],[127.05909,37.46919],[127.05608,37.46844],[127.05504,37.46885],[127.05421,37.46811],[127.05076,37.4673],[127.05103,37.46936],[127.04867,37.47006],[127.05083,37.47164],[127.04504,37.47732],[127.04175,37.48544],[127.03409,37.48437],[127.02052,37.5128],[127.01782,37.52181],[127.01522,37.52485],[127.01318,37.52259],[127.00858,37.5256],[127.01502,37.53213],[127.01775,37.53425],[127.02117,37.53582],[127.03968,37.53584]]]}},{"type":"Feature","properties":{"code":"11710","name":"송파구"},"geometry":{"type":"Polygon","coordinates":[[[127.11311,37.54317],[127.11895,37.54112],[127.12344,37.53864],[127.12061,37.53063],[127.11909,37.52796],[127.14533,37.51661],[127.14544,37.51606],[127.1446,37.51561],[127.14061,37.51559],[127.14343,37.51388],[127.14353,37.51266],[127.14144,37.5124],[127.14122,37.51082],[127.14034,37.51022],[127.13993,37.50852],[127.14152,37.50671],[127.14081,37.50598],[127.14105,37.50541],[127.14455,37.50422],[127.14595,37.50323],[127.14769,37.50321],[127.1502,37.50474],[127.15211,37.50297],[127.15644,37.50186],[127.15773,37.50318],[127.15887,37.50239],[127.1594,37.50136],[127.1605,37.50109],[127.16139,37.5002],[127.16057,37.49755],[127.15978,37.49682],[127.15976,37.49364],[127.15865,37.49243],[127.15824,37.49061],[127.15728,37.48995],[127.15851,37.48967],[127.15043,37.48525],[127.14909,37.48388],[127.14868,37.48404],[127.14753,37.48201],[127.14715,37.47722],[127.14437,37.47733],[127.14353,37.47393],[127.13286,37.47463],[127.13282,37.4712],[127.13198,37.4698],[127.1328,37.46839],[127.13083,37.46775],[127.12667,37.46863],[127.12488,37.4696],[127.1252,37.46783],[127.12421,37.46652],[127.10701,37.49029],[127.10352,37.4927],[127.09479,37.49668],[127.07699,37.50207],[127.06982,37.50274],[127.06773,37.51932],[127.0675,37.52458],[127.06866,37.52387],[127.07695,37.52251],[127.07998,37.52295],[127.08563,37.52476],[127.09014,37.52701],[127.10828,37.54141],[127.10914,37.54317],[127.11311,37.54317]]]}},{"type":"Feature","properties":{"code":"11740","name":"강동구"},"geometry":{"type":"Polygon","coordinates":[[[127.17834,37.57058],[127.17922,37.56892],[127.17967,37.56528],[127.182,37.56099],[127.18134,37.55297],[127.18293,37.55175],[127.18272,37.5467],[127.18379,37.54557],[127.18354,37.54517],[127.1822,37.54572],[127.18169,37.54644],[127.17933,37.54657],[127.17679,37.54575],[127.17664,37.54534],[127.17598,37.54564],[127.17572,37.54521],[127.17431,37.5453],[127.17414,37.54571],[127.16976,37.54481],[127.16698,37.5452],[127.16689,37.54427],[127.16316,37.54499],[127.15765,37.53927],[127.15402,37.53451],[127.15357,37.53367],[127.15393,37.53192],[127.15338,37.53133],[127.15316,37.52911],[127.14946,37.52575],[127.14948,37.52502],[127.1478,37.52215],[127.14567,37.52193],[127.14479,37.51962],[127.14509,37.51684],[127.13831,37.51935],[127.11909,37.52796],[127.12061,37.53063],[127.12344,37.53864],[127.11895,37.54112],[127.11311,37.54317],[127.10914,37.54317],[127.11147,37.54694],[127.11156,37.55051],[127.11427,37.55438],[127.11565,37.5577],[127.11734,37.55946],[127.12296,37.56349],[127.12861,37.56616],[127.13427,37.56795],[127.13767,37.56842],[127.14895,37.56843],[127.16675,37.57898],[127.17184,37.57926],[127.17715,37.5812],[127.17706,37.57954],[127.17544,37.57836],[127.17533,37.57724],[127.1757,37.57483],[127.17782,37.57206],[127.17834,37.57058]]]}}]});
@@ -0,0 +1 @@
+registerMapData("schools_상반기",{"type":"FeatureCollection","features":[{"type":"Feature","geometry":{"type":"Point","coordinates":[127.05774,37.48621]},"properties":{"n":"서울개일초등학교","g":"C","d":"강남구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.05175,37.48119]},"properties":{"n":"서울구룡초등학교","g":"D","d":"강남구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.02603,37.50817]},"properties":{"n":"서울논현초등학교","g":"B","d":"강남구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.06503,37.49471]},"properties":{"n":"서울대곡초등학교","g":"B","d":"강남구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.05335,37.49277]},"properties":{"n":"서울대도초등학교","g":"C","d":"강남구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.08656,37.48154]},"properties":{"n":"서울대모초등학교","g":"B","d":"강남구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.10559,37.46462]},"properties":{"n":"서울대왕초등학교","g":"A","d":"강남구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.07808,37.49701]},"properties":{"n":"서울대진초등학교","g":"C","d":"강남구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.08779,37.49313]},"properties":{"n":"서울대청초등학교","g":"C","d":"강남구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.06197,37.49131]},"properties":{"n":"서울대치초등학교","g":"C","d":"강남구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.06332,37.50329]},"properties":{"n":"서울대현초등학교","g":"C","d":"강남구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.05445,37.49951]},"properties":{"n":"서울도곡초등학교","g":"B","d":"강남구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.04887,37.50146]},"properties":{"n":"서울도성초등학교","g":"C","d":"강남구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.0039,37.51021]},"properties":{"n":"서울반원초등학교","g":"B","d":"서초구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[126.99106,37.50292]},"properties":{"n":"서울반포초등학교","g":"B","d":"서초구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[126.98714,37.48676]},"properties":{"n":"서울방배초등학교","g":"A","d":"서초구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[126.9983,37.48543]},"properties":{"n":"서울방일초등학교","g":"B","d":"서초구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[126.99018,37.47637]},"properties":{"n":"서울방현초등학교","g":"A","d":"서초구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.06093,37.52008]},"properties":{"n":"서울봉은초등학교","g":"C","d":"강남구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.04695,37.51326]},"properties":{"n":"서울삼릉초등학교","g":"B","d":"강남구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[126.9893,37.49623]},"properties":{"n":"서울서래초등학교","g":"A","d":"서초구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.01462,37.50244]},"properties":{"n":"서울서원초등학교","g":"A","d":"서초구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.02593,37.4913]},"properties":{"n":"서울서이초등학교","g":"D","d":"서초구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.02216,37.4853]},"properties":{"n":"서울서일초등학교","g":"B","d":"서초구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.02406,37.49931]},"properties":{"n":"서울서초초등학교","g":"A","d":"서초구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.1014,37.49094]},"properties":{"n":"서울수서초등학교","g":"B","d":"강남구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.02399,37.52336]},"properties":{"n":"서울신구초등학교","g":"B","d":"강남구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.01139,37.51713]},"properties":{"n":"서울신동초등학교","g":"A","d":"서초구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.00962,37.48001]},"properties":{"n":"서울신중초등학교","g":"B","d":"서초구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.03116,37.53167]},"properties":{"n":"서울압구정초등학교","g":"B","d":"강남구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.03189,37.47416]},"properties":{"n":"서울양재초등학교","g":"B","d":"서초구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.06938,37.49029]},"properties":{"n":"서울양전초등학교","g":"A","d":"강남구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.0617,37.45414]},"properties":{"n":"서울언남초등학교","g":"B","d":"서초구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.0451,37.51993]},"properties":{"n":"서울언북초등학교","g":"C","d":"강남구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.03716,37.48666]},"properties":{"n":"서울언주초등학교","g":"A","d":"강남구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.0326,37.49316]},"properties":{"n":"서울역삼초등학교","g":"B","d":"강남구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.08113,37.4923]},"properties":{"n":"서울영희초등학교","g":"A","d":"강남구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.08604,37.48644]},"properties":{"n":"서울왕북초등학교","g":"B","d":"강남구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.02372,37.4723]},"properties":{"n":"서울우암초등학교","g":"B","d":"서초구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.01671,37.50078]},"properties":{"n":"서울원명초등학교","g":"B","d":"서초구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.01246,37.50619]},"properties":{"n":"서울원촌초등학교","g":"C","d":"서초구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[126.98442,37.47837]},"properties":{"n":"서울이수초등학교","g":"B","d":"서초구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.07633,37.48979]},"properties":{"n":"서울일원초등학교","g":"B","d":"강남구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[126.99767,37.50188]},"properties":{"n":"서울잠원초등학교","g":"B","d":"서초구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.04527,37.52797]},"properties":{"n":"서울청담초등학교","g":"A","d":"강남구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.05208,37.47596]},"properties":{"n":"서울포이초등학교","g":"B","d":"강남구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.03981,37.51207]},"properties":{"n":"서울학동초등학교","g":"C","d":"강남구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.13002,37.49741]},"properties":{"n":"서울가동초등학교","g":"B","d":"송파구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.1076,37.50002]},"properties":{"n":"서울가락초등학교","g":"A","d":"송파구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.11103,37.48944]},"properties":{"n":"서울가원초등학교","g":"A","d":"송파구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.12929,37.49657]},"properties":{"n":"서울가주초등학교","g":"B","d":"송파구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.16048,37.55955]},"properties":{"n":"서울강덕초등학교","g":"B","d":"강동구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.13019,37.54636]},"properties":{"n":"서울강동초등학교","g":"B","d":"강동구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.17733,37.56535]},"properties":{"n":"서울강일초등학교","g":"B","d":"강동구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.14097,37.50517]},"properties":{"n":"서울거여초등학교","g":"B","d":"송파구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.14467,37.4876]},"properties":{"n":"서울거원초등학교","g":"B","d":"송파구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.16656,37.56072]},"properties":{"n":"서울고덕초등학교","g":"A","d":"강동구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.14744,37.55297]},"properties":{"n":"서울고명초등학교","g":"A","d":"강동구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.16941,37.55154]},"properties":{"n":"서울고일초등학교","g":"A","d":"강동구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.14497,37.53859]},"properties":{"n":"서울길동초등학교","g":"A","d":"강동구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.15073,37.50118]},"properties":{"n":"서울남천초등학교","g":"D","d":"송파구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.15324,37.54729]},"properties":{"n":"서울대명초등학교","g":"B","d":"강동구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.15263,37.49551]},"properties":{"n":"서울마천초등학교","g":"B","d":"송파구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.14508,37.55676]},"properties":{"n":"서울명덕초등학교","g":"A","d":"강동구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.1505,37.55129]},"properties":{"n":"서울명원초등학교","g":"B","d":"강동구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.14257,37.55454]},"properties":{"n":"서울명일초등학교","g":"A","d":"강동구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.15323,37.5582]},"properties":{"n":"서울묘곡초등학교","g":"B","d":"강동구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.1274,37.48533]},"properties":{"n":"서울문덕초등학교","g":"B","d":"송파구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.12901,37.48907]},"properties":{"n":"서울문정초등학교","g":"B","d":"송파구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.12107,37.50949]},"properties":{"n":"서울방산초등학교","g":"A","d":"송파구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.12094,37.51355]},"properties":{"n":"서울방이초등학교","g":"E","d":"송파구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.09247,37.50162]},"properties":{"n":"서울삼전초등학교","g":"A","d":"송파구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.17266,37.54757]},"properties":{"n":"서울상일초등학교","g":"A","d":"강동구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.10487,37.50276]},"properties":{"n":"서울석촌초등학교","g":"B","d":"송파구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.14579,37.52921]},"properties":{"n":"서울선린초등학교","g":"B","d":"강동구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.1282,37.55585]},"properties":{"n":"서울선사초등학교","g":"D","d":"강동구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.1225,37.53136]},"properties":{"n":"서울성내초등학교","g":"A","d":"강동구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.12836,37.52918]},"properties":{"n":"서울성일초등학교","g":"B","d":"강동구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.13356,37.51863]},"properties":{"n":"서울세륜초등학교","g":"B","d":"송파구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.09513,37.50882]},"properties":{"n":"서울송전초등학교","g":"B","d":"송파구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.11112,37.50714]},"properties":{"n":"서울송파초등학교","g":"B","d":"송파구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.11988,37.50036]},"properties":{"n":"서울신가초등학교","g":"C","d":"송파구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.14999,37.54094]},"properties":{"n":"서울신명초등학교","g":"D","d":"강동구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.1244,37.55002]},"properties":{"n":"서울신암초등학교","g":"A","d":"강동구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.09504,37.514]},"properties":{"n":"서울신천초등학교","g":"B","d":"송파구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.07577,37.50583]},"properties":{"n":"서울아주초등학교","g":"A","d":"송파구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.14301,37.49622]},"properties":{"n":"서울영풍초등학교","g":"B","d":"송파구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.13157,37.50939]},"properties":{"n":"서울오금초등학교","g":"A","d":"송파구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.13451,37.51242]},"properties":{"n":"서울오륜초등학교","g":"B","d":"송파구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.10004,37.51852]},"properties":{"n":"서울잠동초등학교","g":"A","d":"송파구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.08795,37.51415]},"properties":{"n":"서울잠신초등학교","g":"A","d":"송파구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.1115,37.52017]},"properties":{"n":"서울잠실초등학교","g":"B","d":"송파구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.08164,37.51474]},"properties":{"n":"서울잠일초등학교","g":"B","d":"송파구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.08385,37.50734]},"properties":{"n":"서울잠전초등학교","g":"A","d":"송파구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.1136,37.49981]},"properties":{"n":"서울중대초등학교","g":"A","d":"송파구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.13783,37.54102]},"properties":{"n":"서울천동초등학교","g":"A","d":"강동구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.13344,37.54436]},"properties":{"n":"서울천일초등학교","g":"A","d":"강동구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.13659,37.54772]},"properties":{"n":"서울천호초등학교","g":"B","d":"강동구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.11563,37.53188]},"properties":{"n":"서울토성초등학교","g":"A","d":"송파구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.12267,37.49159]},"properties":{"n":"서울평화초등학교","g":"A","d":"송파구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.11787,37.53509]},"properties":{"n":"서울풍납초등학교","g":"A","d":"송파구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.11349,37.52629]},"properties":{"n":"서울풍성초등학교","g":"B","d":"송파구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.14143,37.52801]},"properties":{"n":"서울한산초등학교","g":"E","d":"강동구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[126.8361,37.55571]},"properties":{"n":"서울가곡초등학교","g":"B","d":"강서구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[126.85852,37.56222]},"properties":{"n":"서울가양초등학교","g":"A","d":"강서구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[126.8698,37.51199]},"properties":{"n":"서울갈산초등학교","g":"E","d":"양천구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[126.84099,37.52241]},"properties":{"n":"서울강서초등학교","g":"C","d":"양천구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[126.82927,37.54302]},"properties":{"n":"서울강신초등학교","g":"C","d":"양천구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[126.83343,37.51634]},"properties":{"n":"서울강월초등학교","g":"B","d":"양천구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[126.80434,37.57367]},"properties":{"n":"서울개화초등학교","g":"B","d":"강서구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[126.8857,37.53287]},"properties":{"n":"서울경인초등학교","g":"D","d":"양천구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[126.86002,37.51017]},"properties":{"n":"서울계남초등학교","g":"C","d":"양천구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[126.82261,37.55783]},"properties":{"n":"서울공진초등학교","g":"B","d":"강서구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[126.82165,37.56309]},"properties":{"n":"서울공항초등학교","g":"B","d":"강서구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[126.85408,37.51568]},"properties":{"n":"서울남명초등학교","g":"D","d":"양천구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[126.8379,37.55156]},"properties":{"n":"서울내발산초등학교","g":"B","d":"강서구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[126.84233,37.56088]},"properties":{"n":"서울등명초등학교","g":"A","d":"강서구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[126.85504,37.55188]},"properties":{"n":"서울등서초등학교","g":"A","d":"강서구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[126.84466,37.5648]},"properties":{"n":"서울등양초등학교","g":"B","d":"강서구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[126.85007,37.56033]},"properties":{"n":"서울등원초등학교","g":"B","d":"강서구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[126.85794,37.54761]},"properties":{"n":"서울등촌초등학교","g":"B","d":"강서구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[126.84804,37.56137]},"properties":{"n":"서울등현초등학교","g":"D","d":"강서구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[126.87212,37.52281]},"properties":{"n":"서울목동초등학교","g":"A","d":"양천구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[126.88245,37.54294]},"properties":{"n":"서울목원초등학교","g":"B","d":"양천구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[126.83108,37.55035]},"properties":{"n":"서울발산초등학교","g":"C","d":"강서구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[126.80688,37.56885]},"properties":{"n":"서울방화초등학교","g":"A","d":"강서구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[126.86221,37.55357]},"properties":{"n":"서울백석초등학교","g":"B","d":"강서구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[126.81049,37.58051]},"properties":{"n":"서울삼정초등학교","g":"A","d":"강서구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[126.86724,37.52345]},"properties":{"n":"서울서정초등학교","g":"B","d":"양천구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[126.8109,37.56218]},"properties":{"n":"서울송정초등학교","g":"D","d":"강서구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[126.81803,37.56815]},"properties":{"n":"서울송화초등학교","g":"B","d":"강서구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[126.84165,37.52609]},"properties":{"n":"서울신강초등학교","g":"C","d":"양천구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[126.85585,37.53858]},"properties":{"n":"서울신곡초등학교","g":"B","d":"강서구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[126.84471,37.5159]},"properties":{"n":"서울신남초등학교","g":"D","d":"양천구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[126.8729,37.51683]},"properties":{"n":"서울신목초등학교","g":"A","d":"양천구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[126.86233,37.52056]},"properties":{"n":"서울신서초등학교","g":"B","d":"양천구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[126.82986,37.52952]},"properties":{"n":"서울신원초등학교","g":"B","d":"양천구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[126.83903,37.53999]},"properties":{"n":"서울신월초등학교","g":"C","d":"강서구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[126.85236,37.53207]},"properties":{"n":"서울신정초등학교","g":"A","d":"강서구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[126.84748,37.5236]},"properties":{"n":"서울양강초등학교","g":"B","d":"양천구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[126.85111,37.52615]},"properties":{"n":"서울양동초등학교","g":"A","d":"양천구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[126.85663,37.51638]},"properties":{"n":"서울양명초등학교","g":"A","d":"양천구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[126.86147,37.52392]},"properties":{"n":"서울양목초등학교","g":"B","d":"양천구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[126.82311,37.53822]},"properties":{"n":"서울양원초등학교","g":"B","d":"양천구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[126.83955,37.57013]},"properties":{"n":"서울양천초등학교","g":"A","d":"강서구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[126.87399,37.54367]},"properties":{"n":"서울양화초등학교","g":"B","d":"양천구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[126.87235,37.55209]},"properties":{"n":"서울염동초등학교","g":"C","d":"강서구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[126.8676,37.55322]},"properties":{"n":"서울염창초등학교","g":"B","d":"강서구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[126.87201,37.5358]},"properties":{"n":"서울영도초등학교","g":"B","d":"양천구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[126.84598,37.54964]},"properties":{"n":"서울우장초등학교","g":"C","d":"강서구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[126.83619,37.53431]},"properties":{"n":"서울월정초등학교","g":"B","d":"강서구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[126.87626,37.5407]},"properties":{"n":"서울월촌초등학교","g":"B","d":"양천구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[126.86705,37.51113]},"properties":{"n":"서울은정초등학교","g":"D","d":"양천구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[126.81893,37.57696]},"properties":{"n":"서울정곡초등학교","g":"B","d":"강서구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[126.87005,37.53653]},"properties":{"n":"서울정목초등학교","g":"A","d":"양천구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[126.83739,37.51332]},"properties":{"n":"서울지향초등학교","g":"C","d":"양천구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[126.81464,37.57592]},"properties":{"n":"서울치현초등학교","g":"B","d":"강서구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[126.85237,37.56702]},"properties":{"n":"서울탑산초등학교","g":"B","d":"강서구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[126.84647,37.54367]},"properties":{"n":"서울화곡초등학교","g":"A","d":"강서구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[126.89644,37.47812]},"properties":{"n":"서울가산초등학교","g":"D","d":"금천구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[126.85027,37.483]},"properties":{"n":"서울개명초등학교","g":"C","d":"구로구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[126.85797,37.48952]},"properties":{"n":"서울개봉초등학교","g":"B","d":"구로구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[126.84998,37.48857]},"properties":{"n":"서울개웅초등학교","g":"A","d":"구로구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[126.86531,37.49886]},"properties":{"n":"서울고산초등학교","g":"B","d":"구로구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[126.85698,37.50095]},"properties":{"n":"서울고척초등학교","g":"B","d":"구로구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[126.89097,37.48544]},"properties":{"n":"서울구로남초등학교","g":"B","d":"구로구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[126.88624,37.49706]},"properties":{"n":"서울구로초등학교","g":"A","d":"구로구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[126.87347,37.49319]},"properties":{"n":"서울구일초등학교","g":"D","d":"구로구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[126.90794,37.4413]},"properties":{"n":"서울금산초등학교","g":"B","d":"금천구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[126.91277,37.45498]},"properties":{"n":"서울금천초등학교","g":"B","d":"금천구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[126.89624,37.54012]},"properties":{"n":"서울당산초등학교","g":"C","d":"영등포구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[126.89981,37.53203]},"properties":{"n":"서울당서초등학교","g":"B","d":"영등포구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[126.89001,37.52619]},"properties":{"n":"서울당중초등학교","g":"A","d":"영등포구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[126.91345,37.4982]},"properties":{"n":"서울대길초등학교","g":"B","d":"영등포구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[126.90012,37.4937]},"properties":{"n":"서울대동초등학교","g":"B","d":"영등포구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[126.91945,37.5031]},"properties":{"n":"서울대방초등학교","g":"E","d":"영등포구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[126.90594,37.50265]},"properties":{"n":"서울대영초등학교","g":"B","d":"영등포구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[126.8568,37.50628]},"properties":{"n":"서울덕의초등학교","g":"D","d":"구로구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[126.90712,37.50868]},"properties":{"n":"서울도림초등학교","g":"C","d":"영등포구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[126.90071,37.49927]},"properties":{"n":"서울도신초등학교","g":"A","d":"영등포구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[126.89996,37.46536]},"properties":{"n":"서울독산초등학교","g":"B","d":"금천구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[126.89277,37.49487]},"properties":{"n":"서울동구로초등학교","g":"B","d":"구로구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[126.89095,37.46755]},"properties":{"n":"서울두산초등학교","g":"B","d":"금천구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[126.8444,37.50479]},"properties":{"n":"서울매봉초등학교","g":"B","d":"구로구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[126.90888,37.46657]},"properties":{"n":"서울문교초등학교","g":"B","d":"금천구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[126.89323,37.51847]},"properties":{"n":"서울문래초등학교","g":"A","d":"영등포구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[126.8987,37.44708]},"properties":{"n":"서울문백초등학교","g":"B","d":"금천구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[126.89928,37.47449]},"properties":{"n":"서울문성초등학교","g":"B","d":"금천구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[126.88808,37.50511]},"properties":{"n":"서울미래초등학교","g":"A","d":"구로구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[126.90492,37.44703]},"properties":{"n":"서울백산초등학교","g":"B","d":"금천구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[126.84912,37.50506]},"properties":{"n":"서울세곡초등학교","g":"A","d":"구로구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[126.90464,37.45534]},"properties":{"n":"서울시흥초등학교","g":"A","d":"금천구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[126.88977,37.49966]},"properties":{"n":"서울신구로초등학교","g":"B","d":"구로구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[126.90576,37.49182]},"properties":{"n":"서울신대림초등학교","g":"A","d":"영등포구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[126.8834,37.51233]},"properties":{"n":"서울신도림초등학교","g":"B","d":"구로구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[126.87955,37.50714]},"properties":{"n":"서울신미림초등학교","g":"B","d":"구로구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[126.8961,37.50101]},"properties":{"n":"서울신영초등학교","g":"A","d":"영등포구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[126.90935,37.45935]},"properties":{"n":"서울신흥초등학교","g":"C","d":"금천구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[126.88847,37.4586]},"properties":{"n":"서울안천초등학교","g":"A","d":"금천구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[126.9368,37.52321]},"properties":{"n":"서울여의도초등학교","g":"B","d":"영등포구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[126.90986,37.47543]},"properties":{"n":"서울영남초등학교","g":"C","d":"금천구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[126.90742,37.52653]},"properties":{"n":"서울영동초등학교","g":"D","d":"영등포구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[126.89826,37.51295]},"properties":{"n":"서울영등포초등학교","g":"B","d":"영등포구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[126.90265,37.48744]},"properties":{"n":"서울영림초등학교","g":"B","d":"영등포구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[126.89473,37.4884]},"properties":{"n":"서울영서초등학교","g":"B","d":"구로구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[126.91843,37.50981]},"properties":{"n":"서울영신초등학교","g":"A","d":"영등포구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[126.90219,37.51089]},"properties":{"n":"서울영원초등학교","g":"A","d":"영등포구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[126.88381,37.48564]},"properties":{"n":"서울영일초등학교","g":"A","d":"구로구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[126.90393,37.5238]},"properties":{"n":"서울영중초등학교","g":"B","d":"영등포구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[126.83911,37.48969]},"properties":{"n":"서울오류남초등학교","g":"B","d":"구로구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[126.84219,37.49825]},"properties":{"n":"서울오류초등학교","g":"A","d":"구로구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[126.8262,37.4897]},"properties":{"n":"서울오정초등학교","g":"A","d":"구로구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[126.82602,37.49417]},"properties":{"n":"서울온수초등학교","g":"B","d":"구로구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[126.91178,37.50926]},"properties":{"n":"서울우신초등학교","g":"B","d":"영등포구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[126.92315,37.51934]},"properties":{"n":"서울윤중초등학교","g":"B","d":"영등포구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[126.90821,37.47199]},"properties":{"n":"서울정심초등학교","g":"C","d":"금천구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[126.91537,37.45252]},"properties":{"n":"서울탑동초등학교","g":"B","d":"금천구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.06052,37.56412]},"properties":{"n":"서울군자초등학교","g":"B","d":"동대문구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.05562,37.56867]},"properties":{"n":"서울답십리초등학교","g":"D","d":"동대문구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.06403,37.5715]},"properties":{"n":"서울동답초등학교","g":"A","d":"동대문구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.10449,37.60458]},"properties":{"n":"서울동원초등학교","g":"A","d":"중랑구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.10358,37.59834]},"properties":{"n":"서울망우초등학교","g":"A","d":"중랑구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.08816,37.57704]},"properties":{"n":"서울면남초등학교","g":"B","d":"중랑구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.08659,37.58535]},"properties":{"n":"서울면동초등학교","g":"A","d":"중랑구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.08729,37.5907]},"properties":{"n":"서울면목초등학교","g":"A","d":"중랑구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.10355,37.59442]},"properties":{"n":"서울면북초등학교","g":"B","d":"중랑구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.0998,37.59204]},"properties":{"n":"서울면일초등학교","g":"B","d":"중랑구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.09655,37.58244]},"properties":{"n":"서울면중초등학교","g":"A","d":"중랑구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.08083,37.60336]},"properties":{"n":"서울묵동초등학교","g":"A","d":"중랑구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.06597,37.58015]},"properties":{"n":"서울배봉초등학교","g":"C","d":"동대문구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.09239,37.61351]},"properties":{"n":"서울봉화초등학교","g":"A","d":"중랑구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.08317,37.59798]},"properties":{"n":"서울상봉초등학교","g":"A","d":"중랑구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.10013,37.60493]},"properties":{"n":"서울신내초등학교","g":"C","d":"중랑구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.04296,37.57271]},"properties":{"n":"서울신답초등학교","g":"B","d":"동대문구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.07584,37.60652]},"properties":{"n":"서울신묵초등학교","g":"A","d":"중랑구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.09366,37.60567]},"properties":{"n":"서울신현초등학교","g":"A","d":"중랑구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.07203,37.56597]},"properties":{"n":"서울안평초등학교","g":"B","d":"동대문구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.02839,37.57641]},"properties":{"n":"서울용두초등학교","g":"A","d":"동대문구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.08681,37.61775]},"properties":{"n":"서울원묵초등학교","g":"B","d":"중랑구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.06434,37.6022]},"properties":{"n":"서울이문초등학교","g":"B","d":"동대문구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.07331,37.57378]},"properties":{"n":"서울장평초등학교","g":"B","d":"동대문구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.05645,37.58052]},"properties":{"n":"서울전곡초등학교","g":"B","d":"동대문구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.05423,37.57455]},"properties":{"n":"서울전농초등학교","g":"A","d":"동대문구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.06081,37.57908]},"properties":{"n":"서울전동초등학교","g":"B","d":"동대문구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.03186,37.58231]},"properties":{"n":"서울종암초등학교","g":"B","d":"동대문구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.0835,37.57472]},"properties":{"n":"서울중곡초등학교","g":"A","d":"중랑구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.0755,37.58966]},"properties":{"n":"서울중랑초등학교","g":"A","d":"중랑구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.07937,37.59009]},"properties":{"n":"서울중목초등학교","g":"A","d":"중랑구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.09407,37.60292]},"properties":{"n":"서울중화초등학교","g":"A","d":"중랑구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.08414,37.60167]},"properties":{"n":"서울중흥초등학교","g":"A","d":"중랑구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.05591,37.59231]},"properties":{"n":"서울청량초등학교","g":"A","d":"동대문구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.04719,37.59159]},"properties":{"n":"서울홍릉초등학교","g":"A","d":"동대문구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.03952,37.5862]},"properties":{"n":"서울홍파초등학교","g":"B","d":"동대문구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.05812,37.58576]},"properties":{"n":"서울휘경초등학교","g":"E","d":"동대문구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[126.95315,37.50589]},"properties":{"n":"서울강남초등학교","g":"A","d":"동작구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[126.94332,37.4807]},"properties":{"n":"서울관악초등학교","g":"A","d":"관악구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[126.94692,37.48921]},"properties":{"n":"서울구암초등학교","g":"B","d":"관악구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[126.91634,37.46913]},"properties":{"n":"서울난곡초등학교","g":"B","d":"관악구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[126.91752,37.47712]},"properties":{"n":"서울난우초등학교","g":"D","d":"관악구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[126.91807,37.46241]},"properties":{"n":"서울난향초등학교","g":"A","d":"관악구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[126.92218,37.48512]},"properties":{"n":"서울남부초등학교","g":"B","d":"관악구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[126.97884,37.48252]},"properties":{"n":"서울남사초등학교","g":"B","d":"동작구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[126.97549,37.4846]},"properties":{"n":"서울남성초등학교","g":"B","d":"동작구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[126.94082,37.51175]},"properties":{"n":"서울노량진초등학교","g":"C","d":"동작구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[126.92991,37.4901]},"properties":{"n":"서울당곡초등학교","g":"B","d":"관악구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[126.92524,37.50082]},"properties":{"n":"서울대림초등학교","g":"D","d":"동작구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[126.97651,37.49411]},"properties":{"n":"서울동작초등학교","g":"C","d":"동작구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[126.91484,37.48898]},"properties":{"n":"서울문창초등학교","g":"B","d":"동작구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[126.91266,37.47814]},"properties":{"n":"서울미성초등학교","g":"B","d":"관악구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[126.95385,37.50993]},"properties":{"n":"서울본동초등학교","g":"B","d":"동작구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[126.95792,37.48289]},"properties":{"n":"서울봉천초등학교","g":"B","d":"관악구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[126.97335,37.47384]},"properties":{"n":"서울사당초등학교","g":"B","d":"관악구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[126.941,37.46829]},"properties":{"n":"서울삼성초등학교","g":"B","d":"관악구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[126.93727,37.50035]},"properties":{"n":"서울상도초등학교","g":"A","d":"동작구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[126.92629,37.51008]},"properties":{"n":"서울신길초등학교","g":"C","d":"동작구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[126.96503,37.48902]},"properties":{"n":"서울신남성초등학교","g":"A","d":"동작구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[126.92726,37.4773]},"properties":{"n":"서울신림초등학교","g":"A","d":"관악구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[126.94939,37.48558]},"properties":{"n":"서울신봉초등학교","g":"C","d":"관악구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[126.94397,37.50032]},"properties":{"n":"서울신상도초등학교","g":"C","d":"동작구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[126.93695,37.47156]},"properties":{"n":"서울신성초등학교","g":"A","d":"관악구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[126.93254,37.46327]},"properties":{"n":"서울신우초등학교","g":"C","d":"관악구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[126.94847,37.51117]},"properties":{"n":"서울영본초등학교","g":"B","d":"동작구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[126.93298,37.50891]},"properties":{"n":"서울영화초등학교","g":"D","d":"동작구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[126.95625,37.48128]},"properties":{"n":"서울원당초등학교","g":"A","d":"관악구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[126.92733,37.46729]},"properties":{"n":"서울원신초등학교","g":"B","d":"관악구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[126.96074,37.50376]},"properties":{"n":"서울은로초등학교","g":"B","d":"동작구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[126.94268,37.48659]},"properties":{"n":"서울은천초등학교","g":"B","d":"관악구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[126.95987,37.47675]},"properties":{"n":"서울인헌초등학교","g":"D","d":"관악구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[126.95128,37.47672]},"properties":{"n":"서울청룡초등학교","g":"B","d":"관악구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[126.96453,37.48302]},"properties":{"n":"서울행림초등학교","g":"B","d":"동작구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[126.96513,37.50829]},"properties":{"n":"서울흑석초등학교","g":"A","d":"동작구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.06868,37.6622]},"properties":{"n":"서울계상초등학교","g":"C","d":"노원구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.07463,37.61861]},"properties":{"n":"서울공릉초등학교","g":"B","d":"노원구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.07487,37.62737]},"properties":{"n":"서울공연초등학교","g":"A","d":"노원구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.05836,37.67323]},"properties":{"n":"서울노원초등학교","g":"B","d":"노원구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.05497,37.67376]},"properties":{"n":"서울노일초등학교","g":"C","d":"노원구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.06312,37.62851]},"properties":{"n":"서울녹천초등학교","g":"A","d":"노원구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.04927,37.68723]},"properties":{"n":"서울누원초등학교","g":"B","d":"도봉구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.05821,37.64826]},"properties":{"n":"서울당현초등학교","g":"B","d":"노원구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.03829,37.67996]},"properties":{"n":"서울도봉초등학교","g":"C","d":"도봉구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.05417,37.66481]},"properties":{"n":"서울동일초등학교","g":"A","d":"노원구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.03202,37.6641]},"properties":{"n":"서울방학초등학교","g":"C","d":"도봉구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.01399,37.6532]},"properties":{"n":"서울백운초등학교","g":"A","d":"도봉구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.0806,37.65078]},"properties":{"n":"서울불암초등학교","g":"B","d":"노원구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.05167,37.67055]},"properties":{"n":"서울상경초등학교","g":"A","d":"노원구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.06649,37.65963]},"properties":{"n":"서울상계초등학교","g":"B","d":"노원구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.06208,37.6629]},"properties":{"n":"서울상곡초등학교","g":"B","d":"노원구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.06485,37.65199]},"properties":{"n":"서울상수초등학교","g":"A","d":"노원구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.05983,37.66719]},"properties":{"n":"서울상원초등학교","g":"C","d":"노원구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.05698,37.65865]},"properties":{"n":"서울상월초등학교","g":"A","d":"노원구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.05781,37.64628]},"properties":{"n":"서울상천초등학교","g":"A","d":"노원구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.05804,37.61841]},"properties":{"n":"서울선곡초등학교","g":"E","d":"노원구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.05518,37.6845]},"properties":{"n":"서울수락초등학교","g":"B","d":"노원구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.08154,37.64843]},"properties":{"n":"서울수암초등학교","g":"A","d":"노원구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.02794,37.65102]},"properties":{"n":"서울숭미초등학교","g":"C","d":"도봉구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.0529,37.6305]},"properties":{"n":"서울신계초등학교","g":"A","d":"노원구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.02892,37.66668]},"properties":{"n":"서울신방학초등학교","g":"B","d":"도봉구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.07574,37.66743]},"properties":{"n":"서울신상계초등학교","g":"A","d":"노원구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.04186,37.63657]},"properties":{"n":"서울신창초등학교","g":"A","d":"도봉구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.02572,37.66122]},"properties":{"n":"서울신학초등학교","g":"B","d":"도봉구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.04088,37.6332]},"properties":{"n":"서울신화초등학교","g":"E","d":"도봉구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.02442,37.6489]},"properties":{"n":"서울쌍문초등학교","g":"B","d":"도봉구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.05954,37.63319]},"properties":{"n":"서울연지초등학교","g":"C","d":"노원구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.07251,37.63442]},"properties":{"n":"서울연촌초등학교","g":"B","d":"노원구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.04048,37.67224]},"properties":{"n":"서울오봉초등학교","g":"A","d":"도봉구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.06591,37.66754]},"properties":{"n":"서울온곡초등학교","g":"D","d":"노원구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.06908,37.64109]},"properties":{"n":"서울용동초등학교","g":"D","d":"노원구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.06894,37.62992]},"properties":{"n":"서울용원초등학교","g":"C","d":"노원구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.07492,37.65431]},"properties":{"n":"서울원광초등학교","g":"B","d":"노원구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.05019,37.62762]},"properties":{"n":"서울월계초등학교","g":"A","d":"노원구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.05175,37.64805]},"properties":{"n":"서울월천초등학교","g":"D","d":"도봉구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.07309,37.65059]},"properties":{"n":"서울을지초등학교","g":"B","d":"노원구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.04668,37.65801]},"properties":{"n":"서울자운초등학교","g":"B","d":"도봉구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.07331,37.65784]},"properties":{"n":"서울중계초등학교","g":"B","d":"노원구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.06277,37.64398]},"properties":{"n":"서울중원초등학교","g":"A","d":"노원구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.06396,37.63753]},"properties":{"n":"서울중평초등학교","g":"B","d":"노원구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.06643,37.63241]},"properties":{"n":"서울중현초등학교","g":"B","d":"노원구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.03497,37.65655]},"properties":{"n":"서울창경초등학교","g":"A","d":"도봉구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.04879,37.66414]},"properties":{"n":"서울창도초등학교","g":"B","d":"도봉구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.04483,37.65536]},"properties":{"n":"서울창동초등학교","g":"A","d":"도봉구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.04161,37.64324]},"properties":{"n":"서울창림초등학교","g":"A","d":"도봉구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.04056,37.65252]},"properties":{"n":"서울창원초등학교","g":"A","d":"도봉구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.04763,37.64766]},"properties":{"n":"서울창일초등학교","g":"C","d":"도봉구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.06614,37.64503]},"properties":{"n":"서울청계초등학교","g":"B","d":"노원구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.02238,37.65842]},"properties":{"n":"서울초당초등학교","g":"A","d":"도봉구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.0906,37.62625]},"properties":{"n":"서울태랑초등학교","g":"A","d":"노원구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.08506,37.6231]},"properties":{"n":"서울태릉초등학교","g":"B","d":"노원구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.06904,37.62017]},"properties":{"n":"서울한천초등학교","g":"B","d":"노원구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[126.91651,37.61931]},"properties":{"n":"서울갈현초등학교","g":"B","d":"은평구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[126.94398,37.585]},"properties":{"n":"서울고은초등학교","g":"A","d":"서대문구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[126.95482,37.5458]},"properties":{"n":"서울공덕초등학교","g":"B","d":"마포구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[126.9091,37.6123]},"properties":{"n":"서울구산초등학교","g":"B","d":"은평구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[126.96332,37.56827]},"properties":{"n":"서울금화초등학교","g":"A","d":"서대문구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[126.92575,37.60459]},"properties":{"n":"서울녹번초등학교","g":"D","d":"은평구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[126.94804,37.5577]},"properties":{"n":"서울대신초등학교","g":"A","d":"서대문구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[126.92591,37.61212]},"properties":{"n":"서울대은초등학교","g":"B","d":"은평구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[126.91954,37.61322]},"properties":{"n":"서울대조초등학교","g":"A","d":"은평구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[126.90254,37.55843]},"properties":{"n":"서울동교초등학교","g":"C","d":"마포구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[126.94982,37.5386]},"properties":{"n":"서울마포초등학교","g":"D","d":"마포구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[126.90076,37.56089]},"properties":{"n":"서울망원초등학교","g":"B","d":"마포구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[126.96579,37.56327]},"properties":{"n":"서울미동초등학교","g":"D","d":"서대문구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[126.90766,37.57785]},"properties":{"n":"서울북가좌초등학교","g":"B","d":"서대문구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[126.95184,37.55963]},"properties":{"n":"서울북성초등학교","g":"A","d":"서대문구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[126.95046,37.65363]},"properties":{"n":"서울북한산초등학교","g":"B","d":"은평구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[126.93072,37.61343]},"properties":{"n":"서울불광초등학교","g":"B","d":"은평구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[126.9052,37.59795]},"properties":{"n":"서울상신초등학교","g":"B","d":"은평구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[126.89234,37.57634]},"properties":{"n":"서울상암초등학교","g":"B","d":"마포구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[126.9269,37.5487]},"properties":{"n":"서울서강초등학교","g":"B","d":"마포구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[126.9249,37.55494]},"properties":{"n":"서울서교초등학교","g":"B","d":"마포구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[126.91116,37.55355]},"properties":{"n":"서울성산초등학교","g":"A","d":"마포구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[126.91145,37.56062]},"properties":{"n":"서울성서초등학교","g":"E","d":"마포구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[126.90509,37.56698]},"properties":{"n":"서울성원초등학교","g":"B","d":"마포구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[126.96066,37.55278]},"properties":{"n":"서울소의초등학교","g":"B","d":"마포구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[126.89601,37.58517]},"properties":{"n":"서울수색초등학교","g":"A","d":"은평구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[126.9292,37.63294]},"properties":{"n":"서울신도초등학교","g":"B","d":"은평구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[126.90536,37.5711]},"properties":{"n":"서울신북초등학교","g":"C","d":"마포구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[126.91236,37.59284]},"properties":{"n":"서울신사초등학교","g":"B","d":"은평구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[126.93782,37.54392]},"properties":{"n":"서울신석초등학교","g":"A","d":"마포구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[126.95624,37.55583]},"properties":{"n":"서울아현초등학교","g":"D","d":"마포구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[126.95221,37.57917]},"properties":{"n":"서울안산초등학교","g":"A","d":"서대문구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[126.91393,37.60159]},"properties":{"n":"서울역촌초등학교","g":"A","d":"은평구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[126.91733,37.57956]},"properties":{"n":"서울연가초등학교","g":"C","d":"서대문구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[126.92855,37.62668]},"properties":{"n":"서울연신초등학교","g":"B","d":"은평구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[126.92522,37.59033]},"properties":{"n":"서울연은초등학교","g":"B","d":"은평구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[126.92992,37.62135]},"properties":{"n":"서울연천초등학교","g":"A","d":"은평구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[126.93396,37.56917]},"properties":{"n":"서울연희초등학교","g":"D","d":"서대문구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[126.94582,37.54256]},"properties":{"n":"서울염리초등학교","g":"B","d":"마포구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[126.94404,37.5491]},"properties":{"n":"서울용강초등학교","g":"C","d":"마포구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[126.93449,37.60194]},"properties":{"n":"서울은평초등학교","g":"A","d":"은평구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[126.92164,37.58862]},"properties":{"n":"서울응암초등학교","g":"B","d":"은평구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[126.94519,37.59034]},"properties":{"n":"서울인왕초등학교","g":"A","d":"서대문구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[126.91128,37.56662]},"properties":{"n":"서울중동초등학교","g":"A","d":"마포구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[126.90428,37.58256]},"properties":{"n":"서울증산초등학교","g":"A","d":"은평구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[126.93348,37.55814]},"properties":{"n":"서울창서초등학교","g":"A","d":"서대문구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[126.93964,37.55488]},"properties":{"n":"서울창천초등학교","g":"B","d":"마포구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[126.94978,37.55365]},"properties":{"n":"서울한서초등학교","g":"A","d":"마포구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[126.93079,37.58208]},"properties":{"n":"서울홍연초등학교","g":"A","d":"서대문구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[126.94946,37.59754]},"properties":{"n":"서울홍은초등학교","g":"C","d":"서대문구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[126.94542,37.59351]},"properties":{"n":"서울홍제초등학교","g":"B","d":"서대문구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.05007,37.54382]},"properties":{"n":"서울경동초등학교","g":"A","d":"성동구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.05807,37.54044]},"properties":{"n":"서울경수초등학교","g":"B","d":"성동구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.0466,37.54094]},"properties":{"n":"서울경일초등학교","g":"A","d":"성동구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.10066,37.54079]},"properties":{"n":"서울광남초등학교","g":"C","d":"광진구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.10106,37.54851]},"properties":{"n":"서울광장초등학교","g":"B","d":"광진구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.09229,37.53709]},"properties":{"n":"서울구남초등학교","g":"D","d":"광진구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.08031,37.54301]},"properties":{"n":"서울구의초등학교","g":"D","d":"광진구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.02356,37.55749]},"properties":{"n":"서울금북초등학교","g":"B","d":"성동구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.01765,37.5463]},"properties":{"n":"서울금옥초등학교","g":"B","d":"성동구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.02076,37.5519]},"properties":{"n":"서울금호초등학교","g":"C","d":"성동구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.03537,37.56856]},"properties":{"n":"서울동명초등학교","g":"A","d":"성동구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.09905,37.55342]},"properties":{"n":"서울동의초등학교","g":"B","d":"광진구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.07218,37.53506]},"properties":{"n":"서울동자초등학교","g":"B","d":"광진구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.02944,37.56309]},"properties":{"n":"서울무학초등학교","g":"A","d":"성동구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.04777,37.56282]},"properties":{"n":"서울사근초등학교","g":"B","d":"성동구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.06338,37.54431]},"properties":{"n":"서울성수초등학교","g":"A","d":"성동구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.08315,37.53116]},"properties":{"n":"서울성자초등학교","g":"B","d":"광진구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.06999,37.53468]},"properties":{"n":"서울신양초등학교","g":"A","d":"광진구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.07559,37.53024]},"properties":{"n":"서울신자초등학교","g":"C","d":"광진구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.0895,37.5336]},"properties":{"n":"서울양남초등학교","g":"D","d":"광진구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.02219,37.54592]},"properties":{"n":"서울옥수초등학교","g":"A","d":"성동구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.01579,37.54231]},"properties":{"n":"서울옥정초등학교","g":"B","d":"성동구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.08845,37.56711]},"properties":{"n":"서울용곡초등학교","g":"B","d":"광진구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.05376,37.56073]},"properties":{"n":"서울용답초등학교","g":"B","d":"성동구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.0841,37.55811]},"properties":{"n":"서울용마초등학교","g":"A","d":"광진구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.03383,37.55025]},"properties":{"n":"서울응봉초등학교","g":"A","d":"성동구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.07974,37.53699]},"properties":{"n":"서울자양초등학교","g":"B","d":"광진구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.0724,37.54988]},"properties":{"n":"서울장안초등학교","g":"C","d":"광진구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.0827,37.56524]},"properties":{"n":"서울중광초등학교","g":"B","d":"광진구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.08006,37.56614]},"properties":{"n":"서울중마초등학교","g":"B","d":"광진구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.03487,37.55702]},"properties":{"n":"서울행당초등학교","g":"B","d":"성동구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.02758,37.60182]},"properties":{"n":"서울개운초등학교","g":"B","d":"성북구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.01666,37.61363]},"properties":{"n":"서울길음초등학교","g":"B","d":"성북구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.01314,37.59332]},"properties":{"n":"서울돈암초등학교","g":"D","d":"성북구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.01706,37.58329]},"properties":{"n":"서울동신초등학교","g":"D","d":"성북구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.02155,37.61065]},"properties":{"n":"서울미아초등학교","g":"D","d":"성북구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.0137,37.62122]},"properties":{"n":"서울미양초등학교","g":"B","d":"강북구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.04004,37.62903]},"properties":{"n":"서울번동초등학교","g":"B","d":"강북구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.01447,37.61616]},"properties":{"n":"서울삼각산초등학교","g":"A","d":"강북구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.01267,37.58714]},"properties":{"n":"서울삼선초등학교","g":"A","d":"성북구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.01615,37.62329]},"properties":{"n":"서울삼양초등학교","g":"A","d":"강북구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.05835,37.61102]},"properties":{"n":"서울석관초등학교","g":"C","d":"성북구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[126.99832,37.59384]},"properties":{"n":"서울성북초등학교","g":"A","d":"성북구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.03147,37.617]},"properties":{"n":"서울송중초등학교","g":"A","d":"강북구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.0234,37.61572]},"properties":{"n":"서울송천초등학교","g":"A","d":"강북구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.03321,37.63732]},"properties":{"n":"서울수송초등학교","g":"C","d":"강북구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.02037,37.6308]},"properties":{"n":"서울수유초등학교","g":"B","d":"강북구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.03282,37.60843]},"properties":{"n":"서울숭곡초등학교","g":"B","d":"성북구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.01329,37.60382]},"properties":{"n":"서울숭덕초등학교","g":"B","d":"성북구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.03515,37.59475]},"properties":{"n":"서울숭례초등학교","g":"B","d":"성북구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.03823,37.60916]},"properties":{"n":"서울숭인초등학교","g":"B","d":"성북구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.02263,37.5872]},"properties":{"n":"서울안암초등학교","g":"C","d":"성북구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.04665,37.6236]},"properties":{"n":"서울오현초등학교","g":"C","d":"강북구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.01501,37.63871]},"properties":{"n":"서울우이초등학교","g":"B","d":"강북구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.04608,37.61002]},"properties":{"n":"서울월곡초등학교","g":"A","d":"성북구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.01142,37.63235]},"properties":{"n":"서울유현초등학교","g":"B","d":"강북구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.00914,37.64305]},"properties":{"n":"서울인수초등학교","g":"B","d":"강북구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.04018,37.59881]},"properties":{"n":"서울일신초등학교","g":"D","d":"성북구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.04816,37.61683]},"properties":{"n":"서울장곡초등학교","g":"B","d":"성북구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.05001,37.61144]},"properties":{"n":"서울장위초등학교","g":"B","d":"성북구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.01362,37.59777]},"properties":{"n":"서울정덕초등학교","g":"A","d":"성북구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.00526,37.6198]},"properties":{"n":"서울정릉초등학교","g":"A","d":"성북구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.00772,37.60378]},"properties":{"n":"서울정수초등학교","g":"A","d":"성북구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.00034,37.61203]},"properties":{"n":"서울청덕초등학교","g":"D","d":"성북구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.02971,37.62389]},"properties":{"n":"서울화계초등학교","g":"B","d":"강북구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.01569,37.5673]},"properties":{"n":"서울광희초등학교","g":"B","d":"중구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[126.98812,37.57487]},"properties":{"n":"서울교동초등학교","g":"D","d":"종로구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[126.96183,37.54094]},"properties":{"n":"서울금양초등학교","g":"B","d":"용산구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[126.98664,37.55994]},"properties":{"n":"서울남산초등학교","g":"D","d":"중구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[126.96499,37.53606]},"properties":{"n":"서울남정초등학교","g":"A","d":"용산구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[126.97466,37.56909]},"properties":{"n":"서울덕수초등학교","g":"B","d":"중구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[126.95997,37.57422]},"properties":{"n":"서울독립문초등학교","g":"B","d":"종로구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[126.96689,37.57735]},"properties":{"n":"서울매동초등학교","g":"B","d":"종로구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.01462,37.58145]},"properties":{"n":"서울명신초등학교","g":"B","d":"종로구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[126.99639,37.53254]},"properties":{"n":"서울보광초등학교","g":"B","d":"용산구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[126.96525,37.55641]},"properties":{"n":"서울봉래초등학교","g":"C","d":"중구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[126.9768,37.54739]},"properties":{"n":"서울삼광초등학교","g":"B","d":"용산구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[126.99166,37.52142]},"properties":{"n":"서울서빙고초등학교","g":"B","d":"용산구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[126.96097,37.60347]},"properties":{"n":"서울세검정초등학교","g":"B","d":"종로구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.02771,37.56792]},"properties":{"n":"서울숭신초등학교","g":"B","d":"성동구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[126.97537,37.52063]},"properties":{"n":"서울신용산초등학교","g":"D","d":"용산구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[126.97255,37.53561]},"properties":{"n":"서울용산초등학교","g":"B","d":"용산구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[126.98916,37.54487]},"properties":{"n":"서울용암초등학교","g":"A","d":"용산구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[126.95155,37.53616]},"properties":{"n":"서울원효초등학교","g":"B","d":"용산구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[126.988,37.53598]},"properties":{"n":"서울이태원초등학교","g":"D","d":"용산구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.0117,37.55997]},"properties":{"n":"서울장충초등학교","g":"C","d":"중구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[126.98518,37.58003]},"properties":{"n":"서울재동초등학교","g":"D","d":"종로구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.0143,37.57621]},"properties":{"n":"서울창신초등학교","g":"B","d":"종로구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.01392,37.55849]},"properties":{"n":"서울청구초등학교","g":"B","d":"중구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[126.96933,37.58594]},"properties":{"n":"서울청운초등학교","g":"D","d":"종로구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[126.96417,37.5475]},"properties":{"n":"서울청파초등학교","g":"B","d":"용산구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.00124,37.56195]},"properties":{"n":"서울충무초등학교","g":"B","d":"중구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[126.9651,37.52523]},"properties":{"n":"서울한강초등학교","g":"B","d":"용산구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.0056,37.5392]},"properties":{"n":"서울한남초등학교","g":"B","d":"용산구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.00025,37.58864]},"properties":{"n":"서울혜화초등학교","g":"B","d":"종로구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.00349,37.57269]},"properties":{"n":"서울효제초등학교","g":"B","d":"종로구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[126.98173,37.55137]},"properties":{"n":"서울후암초등학교","g":"A","d":"용산구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.0143,37.56043]},"properties":{"n":"서울흥인초등학교","g":"B","d":"중구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[126.85421,37.51131]},"properties":{"n":"서울신기초등학교","g":"A","d":"양천구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[126.9164,37.44774]},"properties":{"n":"서울금동초등학교","g":"C","d":"금천구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.08146,37.66662]},"properties":{"n":"서울덕암초등학교","g":"A","d":"노원구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[126.95559,37.49124]},"properties":{"n":"서울봉현초등학교","g":"B","d":"관악구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.09133,37.54761]},"properties":{"n":"서울광진초등학교","g":"A","d":"광진구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[126.92391,37.62365]},"properties":{"n":"서울연광초등학교","g":"B","d":"은평구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[126.8658,37.49761]},"properties":{"n":"서울고원초등학교","g":"B","d":"구로구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.04316,37.65991]},"properties":{"n":"서울가인초등학교","g":"C","d":"도봉구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.07369,37.60908]},"properties":{"n":"서울묵현초등학교","g":"B","d":"중랑구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.09821,37.5443]},"properties":{"n":"서울양진초등학교","g":"A","d":"광진구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.04252,37.56782]},"properties":{"n":"서울마장초등학교","g":"B","d":"성동구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[126.90744,37.59231]},"properties":{"n":"서울서신초등학교","g":"A","d":"은평구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.06973,37.60882]},"properties":{"n":"서울석계초등학교","g":"B","d":"성북구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[126.91615,37.49585]},"properties":{"n":"서울보라매초등학교","g":"B","d":"동작구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[126.87132,37.55507]},"properties":{"n":"서울염경초등학교","g":"B","d":"강서구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[126.88766,37.51969]},"properties":{"n":"서울영문초등학교","g":"B","d":"영등포구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[126.90951,37.48413]},"properties":{"n":"서울조원초등학교","g":"B","d":"관악구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[126.84749,37.54056]},"properties":{"n":"서울화일초등학교","g":"B","d":"강서구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.02926,37.55754]},"properties":{"n":"서울행현초등학교","g":"B","d":"성동구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.0168,37.60907]},"properties":{"n":"서울길원초등학교","g":"B","d":"성북구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[126.84515,37.513]},"properties":{"n":"서울장수초등학교","g":"B","d":"양천구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.04708,37.62208]},"properties":{"n":"서울장월초등학교","g":"B","d":"성북구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.0701,37.5862]},"properties":{"n":"서울휘봉초등학교","g":"B","d":"동대문구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[126.88208,37.57975]},"properties":{"n":"서울상지초등학교","g":"B","d":"마포구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[126.89278,37.53288]},"properties":{"n":"서울선유초등학교","g":"B","d":"영등포구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.02367,37.56363]},"properties":{"n":"서울신당초등학교","g":"A","d":"중구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.0891,37.51039]},"properties":{"n":"서울버들초등학교","g":"A","d":"송파구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.1302,37.48302]},"properties":{"n":"서울문현초등학교","g":"A","d":"송파구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[126.97507,37.48822]},"properties":{"n":"서울삼일초등학교","g":"B","d":"동작구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.04206,37.47126]},"properties":{"n":"서울매헌초등학교","g":"A","d":"서초구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[126.82388,37.55277]},"properties":{"n":"서울수명초등학교","g":"B","d":"강서구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[126.91827,37.59768]},"properties":{"n":"서울은명초등학교","g":"A","d":"은평구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.13989,37.49736]},"properties":{"n":"서울개롱초등학교","g":"B","d":"송파구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.10475,37.52218]},"properties":{"n":"서울잠현초등학교","g":"B","d":"송파구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[126.92947,37.6451]},"properties":{"n":"서울진관초등학교","g":"A","d":"은평구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[126.87294,37.5267]},"properties":{"n":"서울목운초등학교","g":"B","d":"양천구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.06957,37.55412]},"properties":{"n":"서울송원초등학교","g":"B","d":"성동구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.17328,37.55477]},"properties":{"n":"서울강명초등학교","g":"A","d":"강동구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[126.86164,37.5419]},"properties":{"n":"서울등마초등학교","g":"B","d":"강서구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[126.83203,37.51399]},"properties":{"n":"서울신은초등학교","g":"A","d":"양천구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.02392,37.46486]},"properties":{"n":"서울우면초등학교","g":"A","d":"서초구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.0101,37.54655]},"properties":{"n":"서울동호초등학교","g":"A","d":"성동구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[126.83749,37.48159]},"properties":{"n":"서울천왕초등학교","g":"A","d":"구로구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[126.88075,37.58566]},"properties":{"n":"서울하늘초등학교","g":"A","d":"마포구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[126.91908,37.64266]},"properties":{"n":"서울은빛초등학교","g":"A","d":"은평구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[126.93417,37.62041]},"properties":{"n":"서울수리초등학교","g":"A","d":"은평구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[126.95267,37.49488]},"properties":{"n":"서울상현초등학교","g":"A","d":"동작구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[126.90557,37.60963]},"properties":{"n":"서울구현초등학교","g":"A","d":"은평구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[126.921,37.63304]},"properties":{"n":"서울은진초등학교","g":"B","d":"은평구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[126.91858,37.57365]},"properties":{"n":"서울가재울초등학교","g":"B","d":"서대문구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.15056,37.48656]},"properties":{"n":"서울위례솔초등학교","g":"B","d":"송파구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.16593,37.55415]},"properties":{"n":"서울고현초등학교","g":"C","d":"강동구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[126.93507,37.60658]},"properties":{"n":"서울어울초등학교","g":"B","d":"은평구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.11133,37.61795]},"properties":{"n":"서울새솔초등학교","g":"B","d":"중랑구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.10832,37.47455]},"properties":{"n":"서울율현초등학교","g":"A","d":"강남구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.01895,37.45675]},"properties":{"n":"서울우솔초등학교","g":"A","d":"서초구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.09985,37.47251]},"properties":{"n":"서울자곡초등학교","g":"B","d":"강남구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.09091,37.46871]},"properties":{"n":"서울세명초등학교","g":"C","d":"강남구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.13844,37.47789]},"properties":{"n":"서울송례초등학교","g":"A","d":"송파구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.14503,37.47908]},"properties":{"n":"서울위례별초등학교","g":"B","d":"송파구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.18019,37.56231]},"properties":{"n":"서울강솔초등학교","g":"B","d":"강동구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[126.8965,37.4585]},"properties":{"n":"서울금나래초등학교","g":"B","d":"금천구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[126.8417,37.4848]},"properties":{"n":"서울하늘숲초등학교","g":"B","d":"구로구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[126.82393,37.47673]},"properties":{"n":"서울항동초등학교","g":"A","d":"구로구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.10196,37.49836]},"properties":{"n":"서울해누리초등학교","g":"B","d":"송파구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.10554,37.60889]},"properties":{"n":"서울양원숲초등학교","g":"D","d":"중랑구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.17094,37.57417]},"properties":{"n":"서울강빛초등학교","g":"B","d":"강동구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.07141,37.49164]},"properties":{"n":"개원중학교","g":"B","d":"강남구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.00888,37.511]},"properties":{"n":"경원중학교","g":"B","d":"서초구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.05612,37.48615]},"properties":{"n":"구룡중학교","g":"A","d":"강남구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.03299,37.53024]},"properties":{"n":"압구정중학교","g":"E","d":"강남구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.06106,37.50606]},"properties":{"n":"대명중학교","g":"B","d":"강남구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.08734,37.48346]},"properties":{"n":"대왕중학교","g":"B","d":"강남구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.05835,37.49043]},"properties":{"n":"대청중학교","g":"D","d":"강남구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.04728,37.48457]},"properties":{"n":"대치중학교","g":"B","d":"강남구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.04509,37.49235]},"properties":{"n":"도곡중학교","g":"B","d":"강남구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[126.99185,37.50307]},"properties":{"n":"반포중학교","g":"A","d":"서초구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[126.99843,37.49445]},"properties":{"n":"방배중학교","g":"B","d":"서초구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.06212,37.51894]},"properties":{"n":"봉은중학교","g":"C","d":"강남구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.02469,37.49373]},"properties":{"n":"서운중학교","g":"A","d":"서초구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.02322,37.49853]},"properties":{"n":"서일중학교","g":"B","d":"서초구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.00852,37.48554]},"properties":{"n":"서초중학교","g":"B","d":"서초구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.10238,37.4912]},"properties":{"n":"수서중학교","g":"A","d":"강남구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.03216,37.52728]},"properties":{"n":"신구중학교","g":"A","d":"강남구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.01319,37.5167]},"properties":{"n":"신동중학교","g":"B","d":"서초구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[126.99583,37.50596]},"properties":{"n":"신반포중학교","g":"B","d":"서초구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.02119,37.5247]},"properties":{"n":"신사중학교","g":"C","d":"강남구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.04441,37.47241]},"properties":{"n":"언남중학교","g":"C","d":"서초구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.03313,37.51943]},"properties":{"n":"언북중학교","g":"A","d":"강남구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.0465,37.5144]},"properties":{"n":"언주중학교","g":"C","d":"강남구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.04889,37.49593]},"properties":{"n":"역삼중학교","g":"A","d":"강남구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.02521,37.46593]},"properties":{"n":"영동중학교","g":"B","d":"서초구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.01358,37.5059]},"properties":{"n":"원촌중학교","g":"B","d":"서초구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[126.9903,37.48096]},"properties":{"n":"이수중학교","g":"B","d":"서초구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.04535,37.52878]},"properties":{"n":"청담중학교","g":"B","d":"강남구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.11875,37.50249]},"properties":{"n":"가락중학교","g":"A","d":"송파구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.12317,37.491]},"properties":{"n":"가원중학교","g":"B","d":"송파구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.13828,37.55515]},"properties":{"n":"강일중학교","g":"B","d":"강동구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.14653,37.48749]},"properties":{"n":"거원중학교","g":"A","d":"송파구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.16164,37.56037]},"properties":{"n":"고덕중학교","g":"A","d":"강동구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.14649,37.53063]},"properties":{"n":"둔촌중학교","g":"A","d":"강동구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.14798,37.55738]},"properties":{"n":"명일중학교","g":"A","d":"강동구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.13002,37.48848]},"properties":{"n":"문정중학교","g":"A","d":"송파구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.1219,37.50915]},"properties":{"n":"방산중학교","g":"B","d":"송파구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.11324,37.51501]},"properties":{"n":"방이중학교","g":"E","d":"송파구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.12076,37.5012]},"properties":{"n":"석촌중학교","g":"A","d":"송파구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.12912,37.52906]},"properties":{"n":"성내중학교","g":"B","d":"강동구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.13149,37.50859]},"properties":{"n":"세륜중학교","g":"D","d":"송파구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.12993,37.49592]},"properties":{"n":"송파중학교","g":"E","d":"송파구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.1493,37.54183]},"properties":{"n":"신명중학교","g":"A","d":"강동구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.13361,37.55637]},"properties":{"n":"신암중학교","g":"A","d":"강동구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.07771,37.51644]},"properties":{"n":"신천중학교","g":"A","d":"송파구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.07655,37.50523]},"properties":{"n":"아주중학교","g":"A","d":"송파구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.1288,37.50527]},"properties":{"n":"오금중학교","g":"E","d":"송파구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.13887,37.51615]},"properties":{"n":"오륜중학교","g":"B","d":"송파구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.13627,37.50151]},"properties":{"n":"오주중학교","g":"A","d":"송파구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.0878,37.51617]},"properties":{"n":"잠신중학교","g":"B","d":"송파구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.09866,37.51782]},"properties":{"n":"잠실중학교","g":"B","d":"송파구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.12764,37.54591]},"properties":{"n":"천일중학교","g":"C","d":"강동구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.1397,37.54652]},"properties":{"n":"천호중학교","g":"A","d":"강동구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.11594,37.52554]},"properties":{"n":"풍납중학교","g":"A","d":"송파구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.11288,37.52544]},"properties":{"n":"풍성중학교","g":"B","d":"송파구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.1403,37.5289]},"properties":{"n":"한산중학교","g":"B","d":"강동구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[126.83816,37.51514]},"properties":{"n":"강신중학교","g":"A","d":"양천구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[126.85776,37.56124]},"properties":{"n":"경서중학교","g":"B","d":"강서구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[126.81497,37.56218]},"properties":{"n":"공항중학교","g":"A","d":"강서구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[126.84418,37.51029]},"properties":{"n":"금옥중학교","g":"B","d":"양천구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[126.8433,37.56019]},"properties":{"n":"등명중학교","g":"B","d":"강서구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[126.85168,37.55972]},"properties":{"n":"등원중학교","g":"A","d":"강서구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[126.87144,37.52096]},"properties":{"n":"목동중학교","g":"D","d":"양천구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[126.87418,37.51337]},"properties":{"n":"목일중학교","g":"A","d":"양천구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[126.80871,37.57598]},"properties":{"n":"방원중학교","g":"C","d":"강서구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[126.80711,37.56433]},"properties":{"n":"방화중학교","g":"C","d":"강서구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[126.85891,37.54849]},"properties":{"n":"백석중학교","g":"A","d":"강서구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[126.8107,37.58156]},"properties":{"n":"삼정중학교","g":"B","d":"강서구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[126.84529,37.56945]},"properties":{"n":"성재중학교","g":"B","d":"강서구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[126.81524,37.55316]},"properties":{"n":"송정중학교","g":"B","d":"강서구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[126.84783,37.52078]},"properties":{"n":"신남중학교","g":"A","d":"양천구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[126.87287,37.53711]},"properties":{"n":"신목중학교","g":"A","d":"양천구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[126.85554,37.51591]},"properties":{"n":"신서중학교","g":"A","d":"양천구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[126.82431,37.53667]},"properties":{"n":"신원중학교","g":"B","d":"양천구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[126.82849,37.54173]},"properties":{"n":"신월중학교","g":"A","d":"양천구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[126.8299,37.54082]},"properties":{"n":"신화중학교","g":"B","d":"양천구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[126.84962,37.52491]},"properties":{"n":"양강중학교","g":"C","d":"양천구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[126.86872,37.54837]},"properties":{"n":"양동중학교","g":"C","d":"양천구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[126.8295,37.53291]},"properties":{"n":"양서중학교","g":"B","d":"양천구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[126.8307,37.51972]},"properties":{"n":"양천중학교","g":"D","d":"양천구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[126.87161,37.55389]},"properties":{"n":"염창중학교","g":"A","d":"강서구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[126.883,37.53766]},"properties":{"n":"월촌중학교","g":"B","d":"양천구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[126.84254,37.53697]},"properties":{"n":"화원중학교","g":"B","d":"강서구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[126.89427,37.46782]},"properties":{"n":"가산중학교","g":"A","d":"금천구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[126.8424,37.50353]},"properties":{"n":"개봉중학교","g":"A","d":"구로구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[126.85107,37.48753]},"properties":{"n":"개웅중학교","g":"A","d":"구로구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[126.86216,37.50033]},"properties":{"n":"고척중학교","g":"A","d":"구로구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[126.8909,37.49471]},"properties":{"n":"구로중학교","g":"B","d":"구로구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[126.87377,37.4953]},"properties":{"n":"구일중학교","g":"C","d":"구로구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[126.91079,37.47805]},"properties":{"n":"난곡중학교","g":"B","d":"금천구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[126.89883,37.53249]},"properties":{"n":"당산서중학교","g":"A","d":"영등포구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[126.90762,37.53203]},"properties":{"n":"당산중학교","g":"A","d":"영등포구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[126.90747,37.49232]},"properties":{"n":"대림중학교","g":"B","d":"영등포구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[126.90521,37.50344]},"properties":{"n":"대영중학교","g":"B","d":"영등포구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[126.88414,37.52042]},"properties":{"n":"문래중학교","g":"A","d":"영등포구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[126.90802,37.47642]},"properties":{"n":"문성중학교","g":"A","d":"금천구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[126.89569,37.4745]},"properties":{"n":"세일중학교","g":"E","d":"금천구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[126.90508,37.4463]},"properties":{"n":"시흥중학교","g":"B","d":"금천구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[126.88481,37.51074]},"properties":{"n":"신도림중학교","g":"C","d":"구로구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[126.88737,37.45954]},"properties":{"n":"안천중학교","g":"B","d":"금천구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[126.89436,37.53282]},"properties":{"n":"선유중학교","g":"B","d":"영등포구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[126.89599,37.51966]},"properties":{"n":"양화중학교","g":"B","d":"영등포구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[126.93575,37.52398]},"properties":{"n":"여의도중학교","g":"B","d":"영등포구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[126.89625,37.49754]},"properties":{"n":"영남중학교","g":"A","d":"영등포구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[126.89069,37.49722]},"properties":{"n":"영림중학교","g":"B","d":"구로구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[126.89441,37.48925]},"properties":{"n":"영서중학교","g":"B","d":"구로구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[126.91365,37.51497]},"properties":{"n":"영원중학교","g":"A","d":"영등포구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[126.83653,37.48748]},"properties":{"n":"오남중학교","g":"B","d":"구로구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[126.85367,37.49847]},"properties":{"n":"경인중학교","g":"B","d":"구로구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[126.84621,37.50786]},"properties":{"n":"오류중학교","g":"A","d":"구로구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[126.92412,37.51893]},"properties":{"n":"윤중중학교","g":"A","d":"영등포구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[126.90721,37.46226]},"properties":{"n":"한울중학교","g":"B","d":"금천구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.05209,37.57451]},"properties":{"n":"동대문중학교","g":"A","d":"동대문구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.1095,37.60382]},"properties":{"n":"동원중학교","g":"B","d":"중랑구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.09631,37.58322]},"properties":{"n":"면목중학교","g":"A","d":"중랑구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.10397,37.59624]},"properties":{"n":"봉화중학교","g":"B","d":"중랑구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.09,37.60134]},"properties":{"n":"상봉중학교","g":"B","d":"중랑구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.03385,37.58185]},"properties":{"n":"성일중학교","g":"B","d":"동대문구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.04406,37.57392]},"properties":{"n":"숭인중학교","g":"B","d":"동대문구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.09153,37.60446]},"properties":{"n":"신현중학교","g":"C","d":"중랑구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.08627,37.57451]},"properties":{"n":"용마중학교","g":"D","d":"중랑구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.08452,37.61785]},"properties":{"n":"원묵중학교","g":"C","d":"중랑구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.08073,37.60062]},"properties":{"n":"장안중학교","g":"A","d":"중랑구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.07048,37.56686]},"properties":{"n":"장평중학교","g":"B","d":"동대문구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.05928,37.58204]},"properties":{"n":"전농중학교","g":"B","d":"동대문구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.07093,37.58582]},"properties":{"n":"전동중학교","g":"B","d":"동대문구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.05846,37.58182]},"properties":{"n":"전일중학교","g":"B","d":"동대문구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.08109,37.60536]},"properties":{"n":"중랑중학교","g":"B","d":"중랑구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.09522,37.58415]},"properties":{"n":"중화중학교","g":"B","d":"중랑구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.05062,37.58822]},"properties":{"n":"청량중학교","g":"C","d":"동대문구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.08344,37.61253]},"properties":{"n":"태릉중학교","g":"A","d":"중랑구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.06222,37.58697]},"properties":{"n":"휘경중학교","g":"B","d":"동대문구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[126.92249,37.50277]},"properties":{"n":"강남중학교","g":"C","d":"동작구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[126.93075,37.50311]},"properties":{"n":"강현중학교","g":"B","d":"동작구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[126.96191,37.48126]},"properties":{"n":"관악중학교","g":"B","d":"관악구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[126.94406,37.49353]},"properties":{"n":"국사봉중학교","g":"B","d":"동작구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[126.92281,37.46668]},"properties":{"n":"난우중학교","g":"C","d":"관악구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[126.92142,37.48177]},"properties":{"n":"남서울중학교","g":"B","d":"관악구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[126.97241,37.47901]},"properties":{"n":"남성중학교","g":"C","d":"동작구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[126.93268,37.49236]},"properties":{"n":"당곡중학교","g":"A","d":"관악구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[126.91381,37.49512]},"properties":{"n":"대방중학교","g":"A","d":"동작구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[126.9778,37.49546]},"properties":{"n":"동작중학교","g":"A","d":"동작구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[126.92241,37.49586]},"properties":{"n":"문창중학교","g":"C","d":"동작구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[126.91222,37.47541]},"properties":{"n":"미성중학교","g":"B","d":"관악구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[126.9382,37.48068]},"properties":{"n":"봉림중학교","g":"D","d":"관악구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[126.95825,37.48392]},"properties":{"n":"봉원중학교","g":"B","d":"관악구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[126.96854,37.48776]},"properties":{"n":"사당중학교","g":"A","d":"동작구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[126.96148,37.49092]},"properties":{"n":"상도중학교","g":"D","d":"동작구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[126.96039,37.49407]},"properties":{"n":"상현중학교","g":"B","d":"동작구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[126.93429,37.48022]},"properties":{"n":"신관중학교","g":"B","d":"관악구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[126.94251,37.46761]},"properties":{"n":"삼성중학교","g":"C","d":"관악구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[126.94495,37.47042]},"properties":{"n":"신림중학교","g":"B","d":"관악구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[126.93352,37.50743]},"properties":{"n":"영등포중학교","g":"C","d":"동작구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[126.96883,37.4726]},"properties":{"n":"인헌중학교","g":"C","d":"관악구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[126.94083,37.50315]},"properties":{"n":"장승중학교","g":"B","d":"동작구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.0836,37.62223]},"properties":{"n":"공릉중학교","g":"A","d":"노원구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.05354,37.6488]},"properties":{"n":"노곡중학교","g":"A","d":"도봉구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.05973,37.64908]},"properties":{"n":"노원중학교","g":"B","d":"노원구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.05379,37.67341]},"properties":{"n":"노일중학교","g":"B","d":"노원구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.06228,37.63181]},"properties":{"n":"녹천중학교","g":"A","d":"노원구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.04587,37.67088]},"properties":{"n":"도봉중학교","g":"B","d":"도봉구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.03086,37.66545]},"properties":{"n":"방학중학교","g":"A","d":"도봉구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.03591,37.65641]},"properties":{"n":"백운중학교","g":"A","d":"도봉구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.04294,37.68124]},"properties":{"n":"북서울중학교","g":"D","d":"도봉구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.07346,37.64574]},"properties":{"n":"불암중학교","g":"D","d":"노원구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.05371,37.66715]},"properties":{"n":"상경중학교","g":"A","d":"노원구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.07808,37.66107]},"properties":{"n":"상계제일중학교","g":"B","d":"노원구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.06892,37.65222]},"properties":{"n":"상계중학교","g":"A","d":"노원구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.05956,37.67154]},"properties":{"n":"상원중학교","g":"C","d":"노원구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.05481,37.68314]},"properties":{"n":"수락중학교","g":"A","d":"노원구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.03316,37.6492]},"properties":{"n":"신도봉중학교","g":"A","d":"도봉구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.02947,37.66418]},"properties":{"n":"신방학중학교","g":"A","d":"도봉구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.06352,37.6516]},"properties":{"n":"신상중학교","g":"B","d":"노원구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.04783,37.62824]},"properties":{"n":"신창중학교","g":"B","d":"노원구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.06471,37.65999]},"properties":{"n":"온곡중학교","g":"B","d":"노원구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.05216,37.63057]},"properties":{"n":"월계중학교","g":"C","d":"노원구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.0752,37.6551]},"properties":{"n":"중계중학교","g":"B","d":"노원구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.06807,37.64404]},"properties":{"n":"중원중학교","g":"A","d":"노원구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.06234,37.63698]},"properties":{"n":"중평중학교","g":"C","d":"노원구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.04964,37.66273]},"properties":{"n":"창동중학교","g":"B","d":"도봉구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.03884,37.64911]},"properties":{"n":"창북중학교","g":"A","d":"도봉구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.04713,37.64811]},"properties":{"n":"창일중학교","g":"A","d":"도봉구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.09129,37.62699]},"properties":{"n":"태랑중학교","g":"A","d":"노원구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.07157,37.64078]},"properties":{"n":"하계중학교","g":"A","d":"노원구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.07244,37.63131]},"properties":{"n":"한천중학교","g":"D","d":"노원구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[126.90972,37.60976]},"properties":{"n":"구산중학교","g":"B","d":"은평구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[126.90438,37.60201]},"properties":{"n":"덕산중학교","g":"B","d":"은평구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[126.93164,37.62332]},"properties":{"n":"불광중학교","g":"B","d":"은평구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[126.90643,37.58978]},"properties":{"n":"상신중학교","g":"B","d":"은평구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[126.9275,37.56833]},"properties":{"n":"서연중학교","g":"B","d":"서대문구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[126.94839,37.5486]},"properties":{"n":"서울여자중학교","g":"B","d":"마포구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[126.91268,37.56809]},"properties":{"n":"성사중학교","g":"A","d":"마포구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[126.91586,37.54728]},"properties":{"n":"성산중학교","g":"B","d":"마포구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[126.90795,37.56279]},"properties":{"n":"성서중학교","g":"C","d":"마포구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[126.93413,37.54592]},"properties":{"n":"신수중학교","g":"C","d":"마포구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[126.93984,37.58272]},"properties":{"n":"신연중학교","g":"A","d":"서대문구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[126.95709,37.5562]},"properties":{"n":"아현중학교","g":"B","d":"마포구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[126.93848,37.57758]},"properties":{"n":"연북중학교","g":"A","d":"서대문구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[126.90963,37.58724]},"properties":{"n":"연서중학교","g":"B","d":"은평구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[126.92485,37.62389]},"properties":{"n":"연신중학교","g":"A","d":"은평구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[126.92583,37.62753]},"properties":{"n":"연천중학교","g":"C","d":"은평구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[126.91879,37.57959]},"properties":{"n":"연희중학교","g":"A","d":"서대문구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[126.90912,37.61099]},"properties":{"n":"은평중학교","g":"A","d":"은평구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[126.90359,37.57243]},"properties":{"n":"중암중학교","g":"A","d":"마포구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[126.90494,37.58381]},"properties":{"n":"증산중학교","g":"C","d":"은평구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[126.93513,37.59269]},"properties":{"n":"홍은중학교","g":"D","d":"서대문구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.05927,37.53951]},"properties":{"n":"경수중학교","g":"A","d":"성동구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.1014,37.54026]},"properties":{"n":"광남중학교","g":"C","d":"광진구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.08602,37.53026]},"properties":{"n":"광양중학교","g":"D","d":"광진구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.10193,37.54718]},"properties":{"n":"광장중학교","g":"B","d":"광진구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.0896,37.532]},"properties":{"n":"광진중학교","g":"A","d":"광진구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.03382,37.55111]},"properties":{"n":"광희중학교","g":"A","d":"성동구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.07884,37.54285]},"properties":{"n":"구의중학교","g":"A","d":"광진구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.04035,37.5628]},"properties":{"n":"동마중학교","g":"B","d":"성동구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.03199,37.5577]},"properties":{"n":"무학중학교","g":"B","d":"성동구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.03898,37.5471]},"properties":{"n":"성수중학교","g":"B","d":"성동구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.05138,37.53945]},"properties":{"n":"성원중학교","g":"A","d":"성동구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.06343,37.53365]},"properties":{"n":"신양중학교","g":"B","d":"광진구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.01299,37.54167]},"properties":{"n":"옥정중학교","g":"A","d":"성동구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.08909,37.56595]},"properties":{"n":"용곡중학교","g":"A","d":"광진구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.07438,37.5354]},"properties":{"n":"자양중학교","g":"B","d":"광진구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.042,37.5546]},"properties":{"n":"행당중학교","g":"A","d":"성동구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.02537,37.64492]},"properties":{"n":"강북중학교","g":"C","d":"강북구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.03654,37.63257]},"properties":{"n":"번동중학교","g":"A","d":"강북구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.00169,37.60692]},"properties":{"n":"북악중학교","g":"B","d":"성북구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.00787,37.59175]},"properties":{"n":"삼선중학교","g":"C","d":"성북구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.06644,37.60819]},"properties":{"n":"석관중학교","g":"B","d":"성북구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.03392,37.6368]},"properties":{"n":"수송중학교","g":"A","d":"강북구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.01049,37.63157]},"properties":{"n":"수유중학교","g":"D","d":"강북구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.04826,37.60698]},"properties":{"n":"월곡중학교","g":"A","d":"성북구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.00992,37.64387]},"properties":{"n":"인수중학교","g":"A","d":"강북구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.04084,37.61129]},"properties":{"n":"장위중학교","g":"B","d":"성북구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.03199,37.59311]},"properties":{"n":"종암중학교","g":"D","d":"성북구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.00971,37.63252]},"properties":{"n":"화계중학교","g":"C","d":"강북구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.02046,37.55804]},"properties":{"n":"금호여자중학교","g":"B","d":"중구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[126.99719,37.56503]},"properties":{"n":"덕수중학교","g":"A","d":"중구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[126.96503,37.54275]},"properties":{"n":"선린중학교","g":"B","d":"용산구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[126.97548,37.52158]},"properties":{"n":"용강중학교","g":"B","d":"용산구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[126.98093,37.54607]},"properties":{"n":"용산중학교","g":"B","d":"용산구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.00604,37.55397]},"properties":{"n":"장원중학교","g":"B","d":"중구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[126.96921,37.56643]},"properties":{"n":"창덕여자중학교","g":"C","d":"중구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[126.97109,37.58917]},"properties":{"n":"청운중학교","g":"D","d":"종로구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[126.99279,37.52361]},"properties":{"n":"한강중학교","g":"A","d":"용산구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.12993,37.52175]},"properties":{"n":"서울체육중학교","g":"A","d":"송파구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.0155,37.61617]},"properties":{"n":"삼각산중학교","g":"B","d":"강북구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.07176,37.64971]},"properties":{"n":"을지중학교","g":"A","d":"노원구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[126.9486,37.49277]},"properties":{"n":"구암중학교","g":"B","d":"관악구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.04838,37.54335]},"properties":{"n":"경일중학교","g":"A","d":"성동구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.04213,37.56831]},"properties":{"n":"마장중학교","g":"A","d":"성동구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.02484,37.59463]},"properties":{"n":"개운중학교","g":"A","d":"성북구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.09831,37.54458]},"properties":{"n":"양진중학교","g":"A","d":"광진구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[126.87053,37.55454]},"properties":{"n":"염경중학교","g":"A","d":"강서구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.0184,37.65226]},"properties":{"n":"효문중학교","g":"A","d":"도봉구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[126.88787,37.57885]},"properties":{"n":"상암중학교","g":"A","d":"마포구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[126.8236,37.5488]},"properties":{"n":"수명중학교","g":"C","d":"강서구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[126.92573,37.64426]},"properties":{"n":"진관중학교","g":"A","d":"은평구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[126.8727,37.52722]},"properties":{"n":"목운중학교","g":"A","d":"양천구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.01221,37.62356]},"properties":{"n":"솔샘중학교","g":"B","d":"강북구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[126.95178,37.59272]},"properties":{"n":"인왕중학교","g":"B","d":"서대문구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.12798,37.48096]},"properties":{"n":"문현중학교","g":"B","d":"송파구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.1749,37.55559]},"properties":{"n":"강명중학교","g":"A","d":"강동구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.17784,37.56965]},"properties":{"n":"강동중학교","g":"A","d":"강동구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[126.93088,37.63298]},"properties":{"n":"신도중학교","g":"A","d":"은평구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[126.93906,37.55498]},"properties":{"n":"창천중학교","g":"D","d":"마포구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[126.83733,37.48266]},"properties":{"n":"천왕중학교","g":"A","d":"구로구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[126.90995,37.57517]},"properties":{"n":"가재울중학교","g":"B","d":"서대문구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.15026,37.48725]},"properties":{"n":"위례솔중학교","g":"A","d":"송파구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.01746,37.61409]},"properties":{"n":"길음중학교","g":"C","d":"성북구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[126.8214,37.56798]},"properties":{"n":"마곡중학교","g":"A","d":"강서구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.03132,37.60862]},"properties":{"n":"숭곡중학교","g":"A","d":"성북구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.0922,37.47154]},"properties":{"n":"세곡중학교","g":"A","d":"강남구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.1396,37.47788]},"properties":{"n":"송례중학교","g":"B","d":"송파구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.0543,37.45255]},"properties":{"n":"내곡중학교","g":"A","d":"서초구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[126.82024,37.48275]},"properties":{"n":"항동중학교","g":"B","d":"구로구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[126.91552,37.50189]},"properties":{"n":"신길중학교","g":"C","d":"영등포구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[126.82086,37.55801]},"properties":{"n":"마곡하늬중학교","g":"A","d":"강서구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.10196,37.49836]},"properties":{"n":"해누리중학교","g":"B","d":"송파구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.1709,37.57394]},"properties":{"n":"강빛중학교","g":"A","d":"강동구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.11694,37.50164]},"properties":{"n":"가락고등학교","g":"B","d":"송파구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.05941,37.48496]},"properties":{"n":"개포고등학교","g":"D","d":"강남구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.05607,37.51757]},"properties":{"n":"경기고등학교","g":"B","d":"강남구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.06557,37.48689]},"properties":{"n":"경기여자고등학교","g":"D","d":"강남구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.01466,37.5862]},"properties":{"n":"경동고등학교","g":"A","d":"성북구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[126.97143,37.58742]},"properties":{"n":"경복고등학교","g":"B","d":"종로구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[126.86543,37.49599]},"properties":{"n":"경인고등학교","g":"B","d":"구로구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[126.84987,37.50805]},"properties":{"n":"고척고등학교","g":"B","d":"구로구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[126.81842,37.57012]},"properties":{"n":"공항고등학교","g":"C","d":"강서구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[126.88292,37.52179]},"properties":{"n":"관악고등학교","g":"B","d":"영등포구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.10121,37.54151]},"properties":{"n":"광남고등학교","g":"A","d":"광진구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.08524,37.52945]},"properties":{"n":"광양고등학교","g":"B","d":"광진구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[126.89031,37.49884]},"properties":{"n":"구로고등학교","g":"B","d":"구로구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[126.87394,37.49441]},"properties":{"n":"구일고등학교","g":"C","d":"구로구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.03265,37.53097]},"properties":{"n":"압구정고등학교","g":"B","d":"강남구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[126.84458,37.51093]},"properties":{"n":"금옥여자고등학교","g":"B","d":"양천구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[126.90569,37.44502]},"properties":{"n":"금천고등학교","g":"B","d":"금천구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.05329,37.66281]},"properties":{"n":"노원고등학교","g":"A","d":"노원구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[126.93464,37.49169]},"properties":{"n":"당곡고등학교","g":"B","d":"관악구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[126.90598,37.50315]},"properties":{"n":"대영고등학교","g":"B","d":"영등포구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[126.91101,37.47671]},"properties":{"n":"독산고등학교","g":"A","d":"금천구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[126.96523,37.48243]},"properties":{"n":"동작고등학교","g":"B","d":"동작구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.14381,37.53143]},"properties":{"n":"둔촌고등학교","g":"A","d":"강동구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.09672,37.58478]},"properties":{"n":"면목고등학교","g":"B","d":"중랑구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.14958,37.54978]},"properties":{"n":"명일여자고등학교","g":"A","d":"강동구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.0336,37.55677]},"properties":{"n":"무학여자고등학교","g":"A","d":"성동구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.01651,37.5027]},"properties":{"n":"반포고등학교","g":"A","d":"서초구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[126.94367,37.46914]},"properties":{"n":"삼성고등학교","g":"B","d":"관악구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.05545,37.65273]},"properties":{"n":"상계고등학교","g":"B","d":"노원구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.0049,37.48429]},"properties":{"n":"서울고등학교","g":"B","d":"서초구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[126.94819,37.54808]},"properties":{"n":"서울여자고등학교","g":"B","d":"마포구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.13059,37.52176]},"properties":{"n":"서울체육고등학교","g":"A","d":"송파구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.00538,37.48961]},"properties":{"n":"서초고등학교","g":"C","d":"서초구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.06672,37.60959]},"properties":{"n":"석관고등학교","g":"B","d":"성북구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.02239,37.56416]},"properties":{"n":"성동고등학교","g":"A","d":"중구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[126.91541,37.49338]},"properties":{"n":"수도여자고등학교","g":"C","d":"동작구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.05356,37.68273]},"properties":{"n":"수락고등학교","g":"A","d":"노원구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[126.91664,37.47838]},"properties":{"n":"신림고등학교","g":"C","d":"관악구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[126.87362,37.51276]},"properties":{"n":"신목고등학교","g":"A","d":"양천구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.03208,37.48242]},"properties":{"n":"양재고등학교","g":"B","d":"서초구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.043,37.47233]},"properties":{"n":"언남고등학교","g":"A","d":"서초구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[126.93422,37.52505]},"properties":{"n":"여의도고등학교","g":"A","d":"영등포구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[126.93509,37.52289]},"properties":{"n":"여의도여자고등학교","g":"B","d":"영등포구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[126.93395,37.50844]},"properties":{"n":"영등포고등학교","g":"B","d":"동작구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[126.91536,37.51539]},"properties":{"n":"영등포여자고등학교","g":"D","d":"영등포구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[126.90952,37.49748]},"properties":{"n":"영신고등학교","g":"B","d":"영등포구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.12954,37.50453]},"properties":{"n":"오금고등학교","g":"A","d":"송파구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[126.98033,37.54587]},"properties":{"n":"용산고등학교","g":"C","d":"용산구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[126.97049,37.47231]},"properties":{"n":"인헌고등학교","g":"A","d":"관악구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.07299,37.53575]},"properties":{"n":"자양고등학교","g":"A","d":"광진구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.08826,37.51471]},"properties":{"n":"잠신고등학교","g":"B","d":"송파구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.10629,37.52262]},"properties":{"n":"잠실고등학교","g":"B","d":"송파구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[126.97564,37.51768]},"properties":{"n":"중경고등학교","g":"B","d":"용산구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.08289,37.60474]},"properties":{"n":"중화고등학교","g":"B","d":"중랑구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.14028,37.51624]},"properties":{"n":"창덕여자고등학교","g":"A","d":"송파구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.03882,37.65104]},"properties":{"n":"창동고등학교","g":"B","d":"도봉구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.0437,37.528]},"properties":{"n":"청담고등학교","g":"B","d":"강남구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.05131,37.58889]},"properties":{"n":"청량고등학교","g":"C","d":"동대문구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.08556,37.61916]},"properties":{"n":"태릉고등학교","g":"A","d":"중랑구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[126.89726,37.53929]},"properties":{"n":"한강미디어고등학교","g":"B","d":"영등포구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.01305,37.63124]},"properties":{"n":"혜화여자고등학교","g":"A","d":"강북구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[126.99847,37.59156]},"properties":{"n":"서울과학고등학교","g":"B","d":"종로구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[126.95279,37.57602]},"properties":{"n":"한성과학고등학교","g":"D","d":"서대문구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.08433,37.48068]},"properties":{"n":"서울로봇고등학교","g":"A","d":"강남구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[126.81618,37.57603]},"properties":{"n":"서울디지털콘텐츠고등학교","g":"B","d":"강서구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.07493,37.63224]},"properties":{"n":"경기기계공업고등학교","g":"A","d":"노원구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.01104,37.54777]},"properties":{"n":"서울방송고등학교","g":"B","d":"성동구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[126.92236,37.5019]},"properties":{"n":"서울공업고등학교","g":"C","d":"동작구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.03304,37.60781]},"properties":{"n":"서울도시과학기술고등학교","g":"D","d":"성북구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.01728,37.56936]},"properties":{"n":"성동공업고등학교","g":"C","d":"중구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.14253,37.49148]},"properties":{"n":"서울인공지능고등학교","g":"B","d":"송파구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[126.96736,37.52434]},"properties":{"n":"용산철도고등학교","g":"A","d":"용산구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.06973,37.58522]},"properties":{"n":"서울반도체고등학교","g":"D","d":"동대문구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[126.9697,37.58925]},"properties":{"n":"경기상업고등학교","g":"B","d":"종로구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.01352,37.56585]},"properties":{"n":"성동글로벌경영고등학교","g":"A","d":"중구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.14685,37.48537]},"properties":{"n":"덕수고등학교","g":"D","d":"송파구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.04728,37.66413]},"properties":{"n":"서울문화고등학교","g":"B","d":"도봉구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[126.82566,37.53762]},"properties":{"n":"서울금융고등학교","g":"B","d":"양천구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[126.98836,37.46972]},"properties":{"n":"서울웹툰애니메이션고등학교","g":"B","d":"서초구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[126.96649,37.54298]},"properties":{"n":"선린인터넷고등학교","g":"B","d":"용산구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.04993,37.68557]},"properties":{"n":"누원고등학교","g":"B","d":"도봉구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.12047,37.5084]},"properties":{"n":"방산고등학교","g":"A","d":"송파구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.09295,37.60525]},"properties":{"n":"신현고등학교","g":"A","d":"중랑구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.05069,37.65905]},"properties":{"n":"자운고등학교","g":"A","d":"도봉구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[126.84505,37.56295]},"properties":{"n":"등촌고등학교","g":"A","d":"강서구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.04787,37.54383]},"properties":{"n":"경일고등학교","g":"B","d":"성동구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[126.89487,37.53392]},"properties":{"n":"선유고등학교","g":"B","d":"영등포구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.04871,37.63173]},"properties":{"n":"월계고등학교","g":"A","d":"노원구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.0803,37.64916]},"properties":{"n":"불암고등학교","g":"A","d":"노원구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[126.86346,37.56042]},"properties":{"n":"세현고등학교","g":"B","d":"강서구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[126.86017,37.52396]},"properties":{"n":"신서고등학교","g":"B","d":"양천구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.0184,37.6527]},"properties":{"n":"효문고등학교","g":"A","d":"도봉구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.0862,37.61551]},"properties":{"n":"원묵고등학교","g":"A","d":"중랑구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[126.8834,37.58134]},"properties":{"n":"상암고등학교","g":"B","d":"마포구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[126.996,37.59154]},"properties":{"n":"서울국제고등학교","g":"B","d":"종로구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.12669,37.48518]},"properties":{"n":"문정고등학교","g":"B","d":"송파구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[126.82758,37.49716]},"properties":{"n":"세종과학고등학교","g":"A","d":"구로구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[126.87442,37.50228]},"properties":{"n":"구현고등학교","g":"A","d":"구로구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.02011,37.61629]},"properties":{"n":"삼각산고등학교","g":"A","d":"강북구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[126.88226,37.51377]},"properties":{"n":"신도림고등학교","g":"B","d":"구로구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.17791,37.56383]},"properties":{"n":"강일고등학교","g":"B","d":"강동구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.03825,37.54734]},"properties":{"n":"성수고등학교","g":"A","d":"성동구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.12899,37.48124]},"properties":{"n":"문현고등학교","g":"B","d":"송파구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[126.92443,37.64361]},"properties":{"n":"진관고등학교","g":"B","d":"은평구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[126.95006,37.49246]},"properties":{"n":"구암고등학교","g":"A","d":"관악구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[126.91845,37.62938]},"properties":{"n":"신도고등학교","g":"B","d":"은평구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.01211,37.62402]},"properties":{"n":"솔샘고등학교","g":"B","d":"강북구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.13569,37.55655]},"properties":{"n":"선사고등학교","g":"A","d":"강동구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.08242,37.51443]},"properties":{"n":"잠일고등학교","g":"A","d":"송파구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.069,37.58651]},"properties":{"n":"휘봉고등학교","g":"A","d":"동대문구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[126.82475,37.54976]},"properties":{"n":"수명고등학교","g":"B","d":"강서구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[126.90604,37.60921]},"properties":{"n":"은평고등학교","g":"A","d":"은평구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[126.9095,37.5743]},"properties":{"n":"가재울고등학교","g":"B","d":"서대문구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.02362,37.55325]},"properties":{"n":"금호고등학교","g":"A","d":"성동구"}},{"type":"Feature","geometry":{"type":"Point","coordinates":[127.02681,37.56713]},"properties":{"n":"도선고등학교","g":"A","d":"성동구"}}],"district_stats":{"강남구":{"high_risk":5,"color":"#f03b20"},"강동구":{"high_risk":3,"color":"#feb24c"},"강북구":{"high_risk":1,"color":"#ffffb2"},"강서구":{"high_risk":2,"color":"#fed976"},"관악구":{"high_risk":3,"color":"#feb24c"},"광진구":{"high_risk":4,"color":"#fd8d3c"},"구로구":{"high_risk":2,"color":"#fed976"},"금천구":{"high_risk":2,"color":"#fed976"},"노원구":{"high_risk":5,"color":"#f03b20"},"도봉구":{"high_risk":3,"color":"#feb24c"},"동대문구":{"high_risk":3,"color":"#feb24c"},"동작구":{"high_risk":3,"color":"#feb24c"},"마포구":{"high_risk":4,"color":"#fd8d3c"},"서대문구":{"high_risk":4,"color":"#fd8d3c"},"서초구":{"high_risk":1,"color":"#ffffb2"},"성북구":{"high_risk":7,"color":"#bd0026"},"송파구":{"high_risk":7,"color":"#bd0026"},"양천구":{"high_risk":7,"color":"#bd0026"},"영등포구":{"high_risk":3,"color":"#feb24c"},"용산구":{"high_risk":2,"color":"#fed976"},"은평구":{"high_risk":1,"color":"#ffffb2"},"종로구":{"high_risk":4,"color":"#fd8d3c"},"중구":{"high_risk":1,"color":"#ffffb2"},"중랑구":{"high_risk":2,"color":"#fed976"}}});
@@ -0,0 +1 @@
+registerMapData("semesters",["상반기","하반기"]);
@@ -14,6 +14,9 @@ def analyze_by_period(results, df):
         if len(valid_periods) >= 2:  # 비교 가능한 기간이 있는 경우
             filtered_results = results[results['조사기간'].isin(valid_periods)]
 
+            # 기간별/자치구×기간별 통계를 한 번에 집계
+            cube = get_aggregation_cube(filtered_results)
+
             # 1. 기간별 공기질 종합점수 비교 (박스플롯)
             plt.figure(figsize=(12, 8))
             sns.boxplot(x='조사기간', y='종합_점수', data=filtered_results, palette='Set3')
@@ -43,15 +46,8 @@ def analyze_by_period(results, df):
             valid_districts = district_counts[district_counts >= 3].index.tolist()
             valid_districts = [d for d in valid_districts if d != "정보 없음"]
 
-            district_period_data = filtered_results[filtered_results['자치구'].isin(valid_districts)]
-
             if len(valid_districts) >= 3:  # 충분한 자치구 데이터가 있는 경우
-                pivot_period_pm10 = district_period_data.pivot_table(
-                    values='PM10_교실_최대값',
-                    index='자치구',
-                    columns='조사기간',
-                    aggfunc='mean'
-                )
+                pivot_period_pm10 = cube_pivot(cube, '자치구', '조사기간', 'PM10_평균', rows=valid_districts)
 
                 plt.figure(figsize=(12, len(valid_districts) * 0.5 + 4))
                 sns.heatmap(pivot_period_pm10, annot=True, fmt='.1f', cmap='YlOrRd',
@@ -62,12 +58,7 @@ def analyze_by_period(results, df):
                 plt.show()
 
                 # 4. 기간별 초미세먼지 농도 비교 (히트맵)
-                pivot_period_pm25 = district_period_data.pivot_table(
-                    values='PM2.5_최대값',
-                    index='자치구',
-                    columns='조사기간',
-                    aggfunc='mean'
-                )
+                pivot_period_pm25 = cube_pivot(cube, '자치구', '조사기간', 'PM2.5_평균', rows=valid_districts)
 
                 plt.figure(figsize=(12, len(valid_districts) * 0.5 + 4))
                 sns.heatmap(pivot_period_pm25, annot=True, fmt='.1f', cmap='YlOrRd',
@@ -78,22 +69,7 @@ def analyze_by_period(results, df):
                 plt.show()
 
             # 5. 기간별 통계 요약
-            period_stats = filtered_results.groupby('조사기간').agg({
-                '종합_점수': ['mean', 'median', 'std', 'count'],
-                'PM10_교실_최대값': ['mean', 'median', 'max'],
-                'PM2.5_최대값': ['mean', 'median', 'max'],
-                'CO2_최대값': ['mean', 'median', 'max'],
-                '부적합_항목수': ['mean', 'sum']
-            })
-
-            # 컬럼명 정리
-            period_stats.columns = [
-                '종합점수_평균', '종합점수_중앙값', '종합점수_표준편차', '학교수',
-                'PM10_평균', 'PM10_중앙값', 'PM10_최대값',
-                'PM2.5_평균', 'PM2.5_중앙값', 'PM2.5_최대값',
-                'CO2_평균', 'CO2_중앙값', 'CO2_최대값',
-                '부적합항목_평균', '부적합항목_총합'
-            ]
+            period_stats = cube[('조사기간',)]
 
             print("\n===== 기간별 공기질 통계 =====")
             print(period_stats)
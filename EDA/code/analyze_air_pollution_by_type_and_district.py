@@ -38,6 +38,9 @@ def analyze_by_school_type_and_district(results):
         print("학교유형별, 지역별 분석을 위한 충분한 데이터가 없습니다.")
         return
 
+    # 학교유형별/자치구×학교유형별 통계를 한 번에 집계
+    cube = get_aggregation_cube(filtered_results)
+
     # 1. 학교유형별 공기질 종합점수 비교 (박스플롯)
     plt.figure(figsize=(12, 8))
     sns.boxplot(x='학교유형', y='종합_점수', data=filtered_results, palette='Set3')
@@ -75,32 +78,8 @@ def analyze_by_school_type_and_district(results):
     plt.show()
 
     # 4. 학교유형별 부적합률 비교 (막대 그래프)
-    unsuitable_columns = ['PM10_교실_적합성', 'PM10_체육관_적합성', 'PM2.5_적합성',
-                         'CO2_적합성', 'CO_적합성', 'NO2_적합성', 'O3_적합성']
-
-    # 학교유형별 항목별 부적합률 계산
-    unsuitable_by_type = []
-
-    for school_type in valid_types:
-        type_data = filtered_results[filtered_results['학교유형'] == school_type]
-
-        for col in unsuitable_columns:
-            item_name = col.split('_')[0]
-            unsuitable_count = sum(type_data[col] == "부적합")
-            total = sum((type_data[col] == "부적합") | (type_data[col] == "적합"))
-
-            if total > 0:
-                rate = (unsuitable_count / total) * 100
-            else:
-                rate = 0
-
-            unsuitable_by_type.append({
-                '학교유형': school_type,
-                '항목': item_name,
-                '부적합률(%)': rate
-            })
-
-    unsuitable_df = pd.DataFrame(unsuitable_by_type)
+    # 학교유형별 항목별 부적합률 계산 (적합성 컬럼 7개를 한 번에 집계)
+    unsuitable_df = compliance_counts(filtered_results, '학교유형', groups=valid_types)
 
     plt.figure(figsize=(14, 8))
     sns.barplot(x='항목', y='부적합률(%)', hue='학교유형', data=unsuitable_df, palette='Set1')
@@ -113,12 +92,7 @@ def analyze_by_school_type_and_district(results):
     plt.show()
 
     # 5. 학교유형별 자치구별 공기질 히트맵
-    pivot_data = filtered_results.pivot_table(
-        values='종합_점수',
-        index='자치구',
-        columns='학교유형',
-        aggfunc='mean'
-    )
+    pivot_data = cube_pivot(cube, '자치구', '학교유형', '종합점수_평균')
 
     plt.figure(figsize=(14, 10))
     sns.heatmap(pivot_data, annot=True, fmt='.2f', cmap='RdYlGn_r',
@@ -129,12 +103,7 @@ def analyze_by_school_type_and_district(results):
     plt.show()
 
     # 6. 학교유형별 자치구별 미세먼지(PM10) 히트맵
-    pivot_pm10 = filtered_results.pivot_table(
-        values='PM10_교실_최대값',
-        index='자치구',
-        columns='학교유형',
-        aggfunc='mean'
-    )
+    pivot_pm10 = cube_pivot(cube, '자치구', '학교유형', 'PM10_평균')
 
     plt.figure(figsize=(14, 10))
     sns.heatmap(pivot_pm10, annot=True, fmt='.1f', cmap='YlOrRd',
@@ -145,22 +114,7 @@ def analyze_by_school_type_and_district(results):
     plt.show()
 
     # 7. 학교유형별 통계 요약
-    type_stats = filtered_results.groupby('학교유형').agg({
-        '종합_점수': ['mean', 'median', 'std', 'count'],
-        'PM10_교실_최대값': ['mean', 'median', 'max'],
-        'PM2.5_최대값': ['mean', 'median', 'max'],
-        'CO2_최대값': ['mean', 'median', 'max'],
-        '부적합_항목수': ['mean', 'sum']
-    })
-
-    # 컬럼명 정리
-    type_stats.columns = [
-        '종합점수_평균', '종합점수_중앙값', '종합점수_표준편차', '학교수',
-        'PM10_평균', 'PM10_중앙값', 'PM10_최대값',
-        'PM2.5_평균', 'PM2.5_중앙값', 'PM2.5_최대값',
-        'CO2_평균', 'CO2_중앙값', 'CO2_최대값',
-        '부적합항목_평균', '부적합항목_총합'
-    ]
+    type_stats = cube[('학교유형',)]
 
     # 종합점수 기준으로 정렬
     type_stats = type_stats.sort_values('종합점수_평균', ascending=False)
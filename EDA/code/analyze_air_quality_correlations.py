@@ -49,13 +49,23 @@ def analyze_air_quality_correlations(results):
         plt.figure(figsize=(14, 12))
         scatter_data = results[scatter_cols].copy()
 
-        # 자치구 정보가 있으면 색상 구분
         if '자치구' in results.columns:
             # 데이터가 충분한 상위 5개 자치구만 선택
             top_districts = results['자치구'].value_counts().nlargest(5).index.tolist()
             scatter_data = results[scatter_cols + ['자치구']].copy()
             scatter_data = scatter_data[scatter_data['자치구'].isin(top_districts)]
 
+        if len(scatter_data) > BINNED_SCATTER_THRESHOLD:
+            # 행이 많으면 점 대신 구간별 밀도로 산점도 행렬 그리기 (그리는 비용이 행 수와 무관)
+            hue = '자치구' if '자치구' in scatter_data.columns else None
+            grid = binned_pair_grid(scatter_data, scatter_cols, hue=hue,
+                                    hue_levels=top_districts if hue else None)
+            draw_binned_scatter_matrix(plt.gcf(), grid)
+            plt.suptitle('주요 공기질 지표 간 관계' + (' (자치구별)' if hue else '') + f' - 구간 밀도, {len(scatter_data):,}개 학교',
+                         fontsize=16)
+
+        # 자치구 정보가 있으면 색상 구분
+        elif '자치구' in results.columns:
             # 산점도 행렬 그리기 (자치구별 색상 구분)
             sns.pairplot(
                 scatter_data,
@@ -84,13 +94,13 @@ def analyze_air_quality_correlations(results):
         valid_types = school_types[school_types >= 10].index.tolist()
 
         if len(valid_types) >= 2:
-            # 학교유형별 상관관계 분석
-            for school_type in valid_types:
-                type_data = results[results['학교유형'] == school_type][valid_cols]
+            # 학교유형별 상관관계 분석 (모든 학교유형의 상관계수 행렬을 한 번에 계산)
+            type_corrs = grouped_correlation(results[results['학교유형'].isin(valid_types)], valid_cols, by='학교유형')
 
-                if len(type_data) >= 10:  # 충분한 데이터가 있는 경우에만
+            for school_type in valid_types:
+                if school_types[school_type] >= 10:  # 충분한 데이터가 있는 경우에만
                     plt.figure(figsize=(10, 8))
-                    type_corr = type_data.corr()
+                    type_corr = type_corrs.loc[school_type]
                     mask = np.triu(np.ones_like(type_corr, dtype=bool))
                     sns.heatmap(
                         type_corr,
@@ -113,24 +123,22 @@ def analyze_air_quality_correlations(results):
         main_districts = district_counts[district_counts >= 15].index.tolist()
         main_districts = [d for d in main_districts if d != "정보 없음"]
 
-        if len(main_districts) >= 3:
-            # 상관관계가 가장 높은/낮은 자치구 찾기
-            district_corrs = {}
-
-            for district in main_districts:
-                district_data = results[results['자치구'] == district][valid_cols]
-                if len(district_data) >= 10:  # 충분한 데이터가 있는 경우
-                    # PM10과 PM2.5 간 상관관계 계산
-                    if 'PM10_교실_최대값' in valid_cols and 'PM2.5_최대값' in valid_cols:
-                        corr = district_data['PM10_교실_최대값'].corr(district_data['PM2.5_최대값'])
-                        district_corrs[district] = corr
+        if len(main_districts) >= 3 and 'PM10_교실_최대값' in valid_cols and 'PM2.5_최대값' in valid_cols:
+            # 자치구별 PM10-PM2.5 상관계수와 부트스트랩 신뢰구간을 한 번에 계산
+            district_corrs = bootstrap_correlation_ci(
+                results[results['자치구'].isin(main_districts)],
+                'PM10_교실_최대값', 'PM2.5_최대값', by='자치구', min_count=10
+            )
 
             # 상관관계 기준 정렬
-            sorted_districts = sorted(district_corrs.items(), key=lambda x: x[1], reverse=True)
+            district_corrs = district_corrs.dropna(subset=['상관계수']).sort_values('상관계수', ascending=False)
+
+            print("\n===== 자치구별 PM10-PM2.5 상관계수 (95% 부트스트랩 신뢰구간) =====")
+            print(district_corrs)
 
             # 상관관계가 가장 높은 3개, 가장 낮은 3개 자치구 시각화
-            top_districts = [d[0] for d in sorted_districts[:3]]
-            bottom_districts = [d[0] for d in sorted_districts[-3:]]
+            top_districts = district_corrs.index[:3].tolist()
+            bottom_districts = district_corrs.index[-3:].tolist()
 
             # 상관관계가 높은 자치구들의 산점도
             if len(top_districts) > 0:
@@ -154,9 +162,9 @@ def analyze_air_quality_correlations(results):
                         line_kws={"color": "red"}
                     )
 
-                    # 상관계수 표시
-                    corr = district_data['PM10_교실_최대값'].corr(district_data['PM2.5_최대값'])
-                    plt.title(f'{district}\n상관계수: {corr:.2f}', fontsize=12)
+                    # 상관계수 및 신뢰구간 표시
+                    corr, lower, upper = district_corrs.loc[district, ['상관계수', '하한', '상한']]
+                    plt.title(f'{district}\n상관계수: {corr:.2f} [{lower:.2f}, {upper:.2f}]', fontsize=12)
                     plt.grid(True, alpha=0.3)
 
                 plt.suptitle('미세먼지(PM10)와 초미세먼지(PM2.5) 상관관계가 높은 자치구', fontsize=16)
@@ -186,9 +194,9 @@ def analyze_air_quality_correlations(results):
                         line_kws={"color": "red"}
                     )
 
-                    # 상관계수 표시
-                    corr = district_data['PM10_교실_최대값'].corr(district_data['PM2.5_최대값'])
-                    plt.title(f'{district}\n상관계수: {corr:.2f}', fontsize=12)
+                    # 상관계수 및 신뢰구간 표시
+                    corr, lower, upper = district_corrs.loc[district, ['상관계수', '하한', '상한']]
+                    plt.title(f'{district}\n상관계수: {corr:.2f} [{lower:.2f}, {upper:.2f}]', fontsize=12)
                     plt.grid(True, alpha=0.3)
 
                 plt.suptitle('미세먼지(PM10)와 초미세먼지(PM2.5) 상관관계가 낮은 자치구', fontsize=16)
@@ -11,9 +11,13 @@ def visualize_district_analysis(results):
 
     filtered_results = results[results['자치구'].isin(valid_districts)]
 
+    # 자치구별/학교유형×자치구별 평균을 한 번에 집계
+    cube = get_aggregation_cube(filtered_results)
+    district_means = cube[('자치구',)]
+
     # 1. 자치구별 공기질 종합 점수 평균 비교
     plt.figure(figsize=(14, 8))
-    district_scores = filtered_results.groupby('자치구')['종합_점수'].mean().sort_values(ascending=False)
+    district_scores = district_means['종합점수_평균'].sort_values(ascending=False)
 
     # 색상 맵 설정 (점수가 높을수록 빨간색, 낮을수록 파란색)
     colors = plt.cm.RdYlBu_r(np.linspace(0, 1, len(district_scores)))
@@ -41,7 +45,7 @@ def visualize_district_analysis(results):
     plt.figure(figsize=(14, 8))
 
     # 자치구별 부적합 항목 수 및 비율 계산
-    district_unsuitable = filtered_results.groupby('자치구')['부적합_항목수'].mean().sort_values(ascending=False)
+    district_unsuitable = district_means['부적합항목_평균'].sort_values(ascending=False)
 
     ax = district_unsuitable.plot(kind='bar', color=plt.cm.Reds(np.linspace(0.3, 0.9, len(district_unsuitable))))
     plt.title('자치구별 평균 부적합 항목 수', fontsize=16)
@@ -67,7 +71,7 @@ def visualize_district_analysis(results):
     plt.figure(figsize=(14, 8))
 
     # 자치구별 미세먼지 농도 평균 계산
-    district_pm10 = filtered_results.groupby('자치구')['PM10_교실_최대값'].mean().sort_values(ascending=False)
+    district_pm10 = district_means['PM10_평균'].sort_values(ascending=False)
 
     # 색상 맵 설정 (농도가 높을수록 빨간색)
     colors = plt.cm.YlOrRd(np.linspace(0.3, 0.9, len(district_pm10)))
@@ -101,7 +105,7 @@ def visualize_district_analysis(results):
     plt.figure(figsize=(14, 8))
 
     # 자치구별 초미세먼지 농도 평균 계산
-    district_pm25 = filtered_results.groupby('자치구')['PM2.5_최대값'].mean().sort_values(ascending=False)
+    district_pm25 = district_means['PM2.5_평균'].sort_values(ascending=False)
 
     # 색상 맵 설정 (농도가 높을수록 빨간색)
     colors = plt.cm.YlOrRd(np.linspace(0.3, 0.9, len(district_pm25)))
@@ -135,7 +139,7 @@ def visualize_district_analysis(results):
     plt.figure(figsize=(14, 8))
 
     # 자치구별 이산화탄소 농도 평균 계산
-    district_co2 = filtered_results.groupby('자치구')['CO2_최대값'].mean().sort_values(ascending=False)
+    district_co2 = district_means['CO2_평균'].sort_values(ascending=False)
 
     # 색상 맵 설정 (농도가 높을수록 빨간색)
     colors = plt.cm.YlOrRd(np.linspace(0.3, 0.9, len(district_co2)))
@@ -184,7 +188,7 @@ def visualize_district_analysis(results):
     district_grades_pct = district_grades.div(district_grades.sum(axis=1), axis=0) * 100
 
     # 자치구를 종합점수 평균 순으로 정렬
-    district_order = filtered_results.groupby('자치구')['종합_점수'].mean().sort_values(ascending=False).index
+    district_order = district_means['종합점수_평균'].sort_values(ascending=False).index
     district_grades_pct = district_grades_pct.reindex(district_order)
 
     # 스택 바 차트 그리기
@@ -207,15 +211,8 @@ def visualize_district_analysis(results):
         valid_types = school_type_counts[school_type_counts >= 5].index.tolist()
 
         if len(valid_types) >= 2:  # 최소 2개 이상의 유효한 학교유형이 있을 때
-            type_district_data = filtered_results[filtered_results['학교유형'].isin(valid_types)]
-
             # 학교유형별 자치구별 평균 종합점수 계산
-            pivot_data = type_district_data.pivot_table(
-                values='종합_점수',
-                index='자치구',
-                columns='학교유형',
-                aggfunc='mean'
-            )
+            pivot_data = cube_pivot(cube, '자치구', '학교유형', '종합점수_평균', cols=valid_types)
 
             # 히트맵 그리기
             plt.figure(figsize=(12, 10))
@@ -227,12 +224,7 @@ def visualize_district_analysis(results):
             plt.show()
 
             # 학교유형별 자치구별 미세먼지(PM10) 평균 농도 계산
-            pivot_pm10 = type_district_data.pivot_table(
-                values='PM10_교실_최대값',
-                index='자치구',
-                columns='학교유형',
-                aggfunc='mean'
-            )
+            pivot_pm10 = cube_pivot(cube, '자치구', '학교유형', 'PM10_평균', cols=valid_types)
 
             # 히트맵 그리기
             plt.figure(figsize=(12, 10))
@@ -244,50 +236,8 @@ def visualize_district_analysis(results):
             plt.show()
 
     # 8. 자치구별 부적합률 히트맵
-    unsuitable_columns = ['PM10_교실_적합성', 'PM10_체육관_적합성', 'PM2.5_적합성',
-                         'CO2_적합성', 'CO_적합성', 'NO2_적합성', 'O3_적합성']
-
-    # 자치구별 항목별 부적합률 계산
-    unsuitable_rates = pd.DataFrame(index=valid_districts)
-
-    for col in unsuitable_columns:
-        item_name = col.split('_')[0]
-        district_data = filtered_results.groupby('자치구')[col]
-
-        for district in valid_districts:
-            if district in district_data.groups:  # 해당 자치구 데이터가 있는지 확인
-                district_col_data = district_data.get_group(district)
-                unsuitable_count = sum(district_col_data == "부적합")
-                total = sum((district_col_data == "부적합") | (district_col_data == "적합"))
-
-                if total > 0:
-                    rate = (unsuitable_count / total) * 100
-                else:
-                    rate = 0
-
-                unsuitable_rates.loc[district, item_name] = rate
-
-    # 실제 생성된 컬럼에 맞게 컬럼명 지정
-    actual_columns = unsuitable_rates.columns.tolist()
-    column_mapping = {
-        'PM10': 'PM10(교실)',
-        'GMNSM_MNUT_DST': 'PM10(체육관)',
-        'ULTRA_DST': 'PM2.5',
-        'CO2': 'CO2',
-        'CO': 'CO',
-        'NO2': 'NO2',
-        'O3': 'O3'
-    }
-
-    # 실제 존재하는 컬럼에 대해서만 이름 변경
-    renamed_columns = []
-    for col in actual_columns:
-        if col in column_mapping:
-            renamed_columns.append(column_mapping[col])
-        else:
-            renamed_columns.append(col)
-
-    unsuitable_rates.columns = renamed_columns
+    # 자치구별 항목별 부적합률 계산 (적합성 컬럼 7개를 한 번에 집계)
+    unsuitable_rates = compliance_rate_matrix(filtered_results, '자치구', groups=valid_districts)
 
     # 데이터가 충분한 경우에만 히트맵 그리기
     if not unsuitable_rates.empty and unsuitable_rates.shape[1] > 0:
@@ -302,7 +252,7 @@ def visualize_district_analysis(results):
         print("자치구별 항목별 부적합률을 표시할 충분한 데이터가 없습니다.")
 
 # 추가: 공기질 항목별 지역 분포 시각화 함수
-def visualize_pollutant_distribution_by_district(results):
+def visualize_pollutant_distribution_by_district(results, regulation=DEFAULT_REGULATION):
     """공기질 항목별 지역 분포를 시각화하는 함수"""
 
     # 유효한 자치구 필터링
@@ -316,21 +266,14 @@ def visualize_pollutant_distribution_by_district(results):
 
     filtered_results = results[results['자치구'].isin(valid_districts)]
 
-    # 분석할 오염물질 및 설명
-    pollutants = [
-        {'col': 'PM10_교실_최대값', 'name': '미세먼지(PM10)', 'unit': 'μg/㎥',
-         'limit': 75, 'who_limit': 50, 'cmap': 'YlOrRd'},
-        {'col': 'PM2.5_최대값', 'name': '초미세먼지(PM2.5)', 'unit': 'μg/㎥',
-         'limit': 35, 'who_limit': 25, 'cmap': 'YlOrRd'},
-        {'col': 'CO2_최대값', 'name': '이산화탄소(CO2)', 'unit': 'ppm',
-         'limit': 1500, 'who_limit': 1000, 'cmap': 'YlOrRd'},
-        {'col': 'CO_최대값', 'name': '일산화탄소(CO)', 'unit': 'ppm',
-         'limit': 10, 'who_limit': 5, 'cmap': 'YlOrRd'},
-        {'col': 'NO2_최대값', 'name': '이산화질소(NO2)', 'unit': 'ppm',
-         'limit': 0.05, 'who_limit': 0.03, 'cmap': 'YlOrRd'},
-        {'col': 'O3_최대값', 'name': '오존(O3)', 'unit': 'ppm',
-         'limit': 0.06, 'who_limit': 0.03, 'cmap': 'YlOrRd'}
-    ]
+    # 분석할 오염물질 (기준값은 air_quality_standards 의 get_standard 에서 조회)
+    pollutants = []
+    for col, key in [('PM10_교실_최대값', 'PM10'), ('PM2.5_최대값', 'PM2.5'), ('CO2_최대값', 'CO2'),
+                     ('CO_최대값', 'CO'), ('NO2_최대값', 'NO2'), ('O3_최대값', 'O3')]:
+        standard = get_standard(key, regulation)
+        pollutants.append({'col': col, 'name': standard['name'], 'unit': standard['unit'],
+                           'limit': standard['thresholds']['limit'],
+                           'advisory_limit': standard['thresholds']['advisory'], 'cmap': 'YlOrRd'})
 
     # 각 오염물질에 대해 지역별 분포 시각화
     for pollutant in pollutants:
@@ -348,9 +291,10 @@ def visualize_pollutant_distribution_by_district(results):
         plt.xlabel('자치구', fontsize=14)
         plt.ylabel(f'{pollutant["name"]} 농도({pollutant["unit"]})', fontsize=14)
         plt.axhline(y=pollutant['limit'], color='red', linestyle='--',
-                   label=f'적합 기준({pollutant["limit"]}{pollutant["unit"]})')
-        plt.axhline(y=pollutant['who_limit'], color='orange', linestyle='--',
-                   label=f'권고 기준({pollutant["who_limit"]}{pollutant["unit"]})')
+                   label=f'{regulation} 적합 기준({pollutant["limit"]}{pollutant["unit"]})')
+        if pollutant['advisory_limit'] != pollutant['limit']:
+            plt.axhline(y=pollutant['advisory_limit'], color='orange', linestyle='--',
+                       label=f'{regulation} 권고 기준({pollutant["advisory_limit"]}{pollutant["unit"]})')
         plt.legend(fontsize=12)
         plt.xticks(rotation=45, ha='right')
         plt.grid(axis='y', linestyle='--', alpha=0.7)
@@ -370,9 +314,10 @@ def visualize_pollutant_distribution_by_district(results):
         plt.xlabel('자치구', fontsize=14)
         plt.ylabel(f'{pollutant["name"]} 농도({pollutant["unit"]})', fontsize=14)
         plt.axhline(y=pollutant['limit'], color='red', linestyle='--',
-                   label=f'적합 기준({pollutant["limit"]}{pollutant["unit"]})')
-        plt.axhline(y=pollutant['who_limit'], color='orange', linestyle='--',
-                   label=f'권고 기준({pollutant["who_limit"]}{pollutant["unit"]})')
+                   label=f'{regulation} 적합 기준({pollutant["limit"]}{pollutant["unit"]})')
+        if pollutant['advisory_limit'] != pollutant['limit']:
+            plt.axhline(y=pollutant['advisory_limit'], color='orange', linestyle='--',
+                       label=f'{regulation} 권고 기준({pollutant["advisory_limit"]}{pollutant["unit"]})')
 
         # 서울시 평균 표시
         seoul_avg = valid_data[col].mean()